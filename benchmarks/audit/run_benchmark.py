@@ -0,0 +1,225 @@
+"""
+Transcript Audit Benchmark
+
+Times the rule-based audit checks (garbled text, repetition, formatting,
+content quality) on synthetic transcripts and compares them with the
+original line-by-line implementations kept below as a reference. Every run
+also checks that both report exactly the same issues.
+
+Transcript shapes:
+
+- captions: auto-caption style, short lines, blank-line paragraphs,
+  stutters and [Music] tags
+- prose: long paragraphs of book-like text
+- unique: one paragraph with no repeated phrase at all, the worst case for
+  the reference repeated-phrase scan (skipped for the reference above
+  --reference-limit words)
+
+Usage:
+    python benchmarks/audit/run_benchmark.py
+    python benchmarks/audit/run_benchmark.py --words 100000 --repeat 5 --output audit.json
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from council.knowledge.audit import (  # noqa: E402
+    TranscriptIssue,
+    check_content_quality,
+    check_formatting,
+    check_garbled_text,
+    check_repetition,
+)
+
+WORDS = (
+    "the a of to and in is it that you we what for be this not are with as on "
+    "life death time mind virtue nature fortune anger fear reason wisdom habit "
+    "soul body friend letter city power pleasure pain duty freedom truth good "
+    "remember consider accept endure choose suffer learn teach live die return "
+    "always never only perhaps indeed therefore because whenever although"
+).split()
+
+
+# --- Reference implementations (before the single-pass rewrite) -----------
+
+def reference_garbled_text(content):
+    issues = []
+    for i, line in enumerate(content.split('\n'), 1):
+        special_ratio = len(re.findall(r'[^\w\s.,!?\'"-]', line)) / max(len(line), 1)
+        if special_ratio > 0.3 and len(line) > 20:
+            issues.append(TranscriptIssue("warning", "garbled_text", "High ratio of special characters detected", i, line[:80]))
+        if re.search(r'(.)\1{5,}', line):
+            issues.append(TranscriptIssue("warning", "garbled_text", "Repeated character sequence detected", i, line[:80]))
+        if re.search(r'\b[a-z]{1,2}\b\s+\b[a-z]{1,2}\b\s+\b[a-z]{1,2}\b', line.lower()):
+            if len(re.findall(r'\b[a-z]{1,2}\b', line.lower())) > 5:
+                issues.append(TranscriptIssue("info", "possible_fragmentation", "Multiple short word fragments detected", i, line[:80]))
+    return issues
+
+
+def reference_repetition(content):
+    issues = []
+    seen_lines = {}
+    for i, line in enumerate(content.split('\n'), 1):
+        clean_line = line.strip().lower()
+        if len(clean_line) > 20:
+            if clean_line in seen_lines:
+                issues.append(TranscriptIssue("warning", "duplicate_line", f"Duplicate of line {seen_lines[clean_line]}", i, line[:80]))
+            else:
+                seen_lines[clean_line] = i
+    for para in content.split('\n\n'):
+        words = para.lower().split()
+        if len(words) > 10:
+            for i in range(len(words) - 6):
+                phrase = ' '.join(words[i:i+3])
+                if phrase in ' '.join(words[i+3:]) and len(phrase) > 10:
+                    issues.append(TranscriptIssue("info", "repeated_phrase", f"Phrase repeated: '{phrase}'", None, para[:100]))
+                    break
+    return issues
+
+
+def reference_formatting_timestamps(content):
+    issues = []
+    for i, line in enumerate(content.split('\n'), 1):
+        for pattern in (r'\d{2}:\d{2}:\d{2}', r'\[\d+:\d+\]', r'^\d+$'):
+            if re.match(pattern, line.strip()):
+                issues.append(i)
+                break
+    return issues
+
+
+def reference_content_quality(content):
+    found = []
+    for pattern in (r'\[.*transcript.*\]', r'\[.*unavailable.*\]', r'\[.*error.*\]', r'transcript not available'):
+        if re.search(pattern, content.lower()):
+            found.append(re.search(pattern, content.lower()).group()[:80])
+    return found, len(re.findall(r'\[([^\]]+)\]', content))
+
+
+# --- Fixtures ----------------------------------------------------------------
+
+def captions(rng: random.Random, words: int) -> str:
+    lines, count = ["# Talk", "Source: synthetic"], 0
+    while count < words:
+        size = rng.randint(4, 14)
+        line = [rng.choice(WORDS) for _ in range(size)]
+        if rng.random() < 0.02:
+            line.insert(rng.randrange(size), "sooooooo")
+        if rng.random() < 0.03:
+            line.append("[Music]")
+        if rng.random() < 0.01:
+            line.append("00:01:02")
+        lines.append(" ".join(line))
+        if rng.random() < 0.08:
+            lines.append("")
+        count += size
+    return "\n".join(lines)
+
+
+def prose(rng: random.Random, words: int) -> str:
+    paragraphs, count = ["# Letters\n\nSource: synthetic"], 0
+    while count < words:
+        size = rng.randint(200, 2000)
+        sentences, remaining = [], size
+        while remaining > 0:
+            n = min(remaining, rng.randint(8, 30))
+            sentences.append(" ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + ".")
+            remaining -= n
+        paragraphs.append(" ".join(sentences))
+        count += size
+    return "\n\n".join(paragraphs)
+
+
+def unique(rng: random.Random, words: int) -> str:
+    return " ".join(f"{rng.choice(WORDS)}{i}" for i in range(words))
+
+
+SHAPES = {"captions": captions, "prose": prose, "unique": unique}
+
+
+def _best(fn, content: str, repeat: int) -> tuple[float, object]:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def _audit(content):
+    return (
+        check_garbled_text(content),
+        check_repetition(content),
+        [i.line_number for i in check_formatting(content, "youtube") if i.category == "timestamp_artifact"],
+        check_content_quality(content),
+    )
+
+
+def _reference_audit(content):
+    return (
+        reference_garbled_text(content),
+        reference_repetition(content),
+        reference_formatting_timestamps(content),
+        reference_content_quality(content),
+    )
+
+
+def _same(new, old) -> bool:
+    quality = new[3]
+    placeholders = [i.sample for i in quality if i.category == "placeholder_content"]
+    tags = next((int(re.search(r"\((\d+)\)", i.description).group(1)) for i in quality if i.category == "excessive_tags"), None)
+    old_placeholders, old_tags = old[3]
+    return (
+        new[:3] == old[:3]
+        and placeholders == old_placeholders
+        and (tags == old_tags if old_tags > 20 else tags is None)
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=100_000, help="Words per transcript")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per check (best is reported)")
+    parser.add_argument("--shape", choices=sorted(SHAPES), action="append", help="Shapes to run (default: all)")
+    parser.add_argument("--reference-limit", type=int, default=20_000,
+                        help="Largest 'unique' transcript to run the quadratic reference on")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    report = {"words": args.words, "repeat": args.repeat, "shapes": {}}
+    for shape in args.shape or list(SHAPES):
+        content = SHAPES[shape](random.Random(args.seed), args.words)
+        new_seconds, new = _best(_audit, content, args.repeat)
+        entry = {
+            "chars": len(content),
+            "lines": content.count("\n") + 1,
+            "issues": len(new[0]) + len(new[1]),
+            "seconds": round(new_seconds, 4),
+            "words_per_second": round(args.words / new_seconds),
+        }
+        if shape == "unique" and args.words > args.reference_limit:
+            entry["reference"] = f"skipped above {args.reference_limit} words"
+        else:
+            old_seconds, old = _best(_reference_audit, content, args.repeat)
+            entry["reference_seconds"] = round(old_seconds, 4)
+            entry["speedup"] = round(old_seconds / new_seconds, 1)
+            entry["identical"] = _same(new, old)
+        report["shapes"][shape] = entry
+        print(f"{shape:>9}: {json.dumps(entry)}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+    return 0 if all(e.get("identical", True) for e in report["shapes"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
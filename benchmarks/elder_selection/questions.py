@@ -0,0 +1,59 @@
+"""Question set for the elder selection evaluation.
+
+Three questions per profile.CATEGORY_KEYWORDS category, plus a few that
+classify as "general". LLM reference selections are recorded separately
+(see run_eval.py --record), because they depend on the configured model.
+"""
+
+QUESTIONS = {
+    "career": [
+        "Should I quit a stable job to start my own company?",
+        "My boss keeps taking credit for my work. How do I handle it?",
+        "How do I negotiate a higher salary without burning bridges?",
+    ],
+    "investing": [
+        "Is it wise to put most of my savings into index funds?",
+        "How should I think about risk when the market is falling?",
+        "When is it worth paying off debt instead of investing?",
+    ],
+    "relationships": [
+        "My partner and I keep having the same argument. What should we do?",
+        "How do I reconnect with a friend I hurt years ago?",
+        "How do I set boundaries with a controlling parent?",
+    ],
+    "philosophy": [
+        "How do I find meaning in work that feels pointless?",
+        "Is it ever right to lie to protect someone?",
+        "How should I think about my own death?",
+    ],
+    "emotional": [
+        "I feel overwhelmed and anxious most mornings. Where do I start?",
+        "How do I deal with grief after losing a parent?",
+        "I'm burned out but can't afford to stop working.",
+    ],
+    "creative": [
+        "How do I finish the novel I have been writing for years?",
+        "How do I get past creative block when designing something new?",
+        "Should I pursue music even though it may never pay?",
+    ],
+    "strategy": [
+        "A larger competitor is copying our product. How do we respond?",
+        "How do I win a negotiation when the other side holds more leverage?",
+        "How do I plan a multi-year campaign with an uncertain outcome?",
+    ],
+    "health": [
+        "How do I build an exercise habit that lasts?",
+        "I can't sleep because my mind races at night.",
+        "How do I stay disciplined with my diet when stressed?",
+    ],
+    "general": [
+        "What does it take to lead people through a crisis?",
+        "How do I decide which of two cities to move to?",
+        "What should I teach my children about courage?",
+    ],
+}
+
+
+def all_questions() -> list[tuple[str, str]]:
+    """(category, question) pairs in a stable order."""
+    return [(category, q) for category, questions in QUESTIONS.items() for q in questions]
@@ -0,0 +1,217 @@
+"""
+Elder Selection Evaluation
+
+Compares the index-based elder selector (council.knowledge.elder_index)
+with the LLM selector it replaces, over the question set in questions.py:
+
+- agreement: overlap@k, Jaccard and how often each method's first pick is
+  in the other's panel
+- latency: index selection percentiles next to the recorded LLM latencies
+- diversity: mean pairwise similarity of the chosen elders' index vectors
+  (lower is more diverse)
+
+LLM selections depend on the configured model, so they are recorded once
+with --record into a JSON file and replayed on later runs. Without
+recorded selections only latency and diversity are reported.
+
+Usage:
+    python benchmarks/elder_selection/run_eval.py --record          # needs an LLM
+    python benchmarks/elder_selection/run_eval.py --output after.json
+    python benchmarks/elder_selection/run_eval.py --embedding-dim 256 --no-centroids  # fully offline
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from itertools import combinations
+from pathlib import Path
+
+from questions import all_questions
+
+DEFAULT_REFERENCES = Path(__file__).parent / "llm_selections.json"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of *values*."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def _latency(values: list[float]) -> dict:
+    return {
+        "p50": round(_percentile(values, 50), 3),
+        "p90": round(_percentile(values, 90), 3),
+        "max": round(max(values), 3) if values else 0.0,
+        "samples": len(values),
+    }
+
+
+def _load_references(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def record_references(path: Path, k: int) -> dict:
+    """Ask the LLM selector for every question that has no recorded panel."""
+    from council.knowledge.elder_index import llm_select_elders
+
+    references = _load_references(path)
+    for category, question in all_questions():
+        if question in references:
+            continue
+        start = time.perf_counter()
+        elder_ids = llm_select_elders(question, k, category=category)
+        references[question] = {
+            "elder_ids": elder_ids,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+        path.write_text(json.dumps(references, indent=2))
+        print(f"  recorded {category}: {', '.join(elder_ids)}", file=sys.stderr)
+    return references
+
+
+def _diversity(index, elder_ids: list[str]) -> float | None:
+    """Mean pairwise cosine similarity of the elders' index vectors."""
+    rows = [index.elder_ids.index(eid) for eid in elder_ids if eid in index.elder_ids]
+    pairs = list(combinations(rows, 2))
+    if not pairs:
+        return None
+    vectors = index._vectors
+    return float(sum(vectors[a] @ vectors[b] for a, b in pairs) / len(pairs))
+
+
+def _mean(values: list[float | None]) -> float | None:
+    values = [v for v in values if v is not None]
+    return round(sum(values) / len(values), 4) if values else None
+
+
+def run_eval(args) -> dict:
+    """Select a panel for every question with the index and score it."""
+    from council.elders import ElderRegistry
+    from council.knowledge.elder_index import ElderIndex
+
+    embedding_function = None
+    if args.embedding_dim:
+        from council.knowledge.embeddings import HashingEmbeddingFunction
+
+        embedding_function = HashingEmbeddingFunction(dim=args.embedding_dim)
+
+    references = _load_references(args.references)
+    elders = ElderRegistry.get_all()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        index = ElderIndex(
+            path=Path(tmp) / "elder_index.npz", embedding_function=embedding_function
+        ).build(elders, centroids=not args.no_centroids)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Warm the query path so the first question isn't an outlier
+        index.select("warm up", k=args.k, tie_margin=0)
+
+        rows = []
+        index_latencies: list[float] = []
+        for category, question in all_questions():
+            for _ in range(args.repeat):
+                selection = index.select(
+                    question, k=args.k, lambda_mult=args.lambda_mult, tie_margin=0
+                )
+                index_latencies.append(selection.latency_ms["total"])
+
+            picked = selection.elder_ids
+            row = {
+                "category": category,
+                "question": question,
+                "index": picked,
+                "index_diversity": _diversity(index, picked),
+            }
+            reference = references.get(question)
+            if reference:
+                llm = reference["elder_ids"][:args.k]
+                common = set(picked) & set(llm)
+                row.update(
+                    llm=llm,
+                    overlap=len(common) / args.k,
+                    jaccard=len(common) / len(set(picked) | set(llm)),
+                    index_first_in_llm=bool(picked) and picked[0] in llm,
+                    llm_first_in_index=bool(llm) and llm[0] in picked,
+                    llm_diversity=_diversity(index, llm),
+                )
+            rows.append(row)
+
+        centroids = len(index._centroids)
+
+    scored = [r for r in rows if "llm" in r]
+    llm_latencies = [references[r["question"]]["latency_ms"] for r in scored
+                     if references[r["question"]].get("latency_ms") is not None]
+
+    report = {
+        "config": {
+            "k": args.k,
+            "lambda_mult": args.lambda_mult,
+            "embedding": f"hashing-{args.embedding_dim}" if args.embedding_dim else "configured",
+            "centroids": centroids,
+            "elders": len(elders),
+            "questions": len(rows),
+            "references": str(args.references),
+        },
+        "index_build_ms": round(build_ms, 1),
+        "latency_ms": {
+            "index": _latency(index_latencies),
+            "llm": _latency(llm_latencies) if llm_latencies else None,
+        },
+        "diversity": {
+            "index": _mean([r["index_diversity"] for r in rows]),
+            "llm": _mean([r.get("llm_diversity") for r in scored]),
+        },
+        "agreement": None,
+        "questions": rows,
+    }
+    if scored:
+        report["agreement"] = {
+            "questions": len(scored),
+            "overlap_at_k": _mean([r["overlap"] for r in scored]),
+            "jaccard": _mean([r["jaccard"] for r in scored]),
+            "index_first_in_llm": _mean([float(r["index_first_in_llm"]) for r in scored]),
+            "llm_first_in_index": _mean([float(r["llm_first_in_index"]) for r in scored]),
+            "random_overlap_at_k": round(args.k / len(elders), 4),
+        }
+    return report
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Evaluate index-based elder selection against the LLM selector")
+    parser.add_argument("--k", type=int, default=5, help="Panel size (the web UI default is 5)")
+    parser.add_argument("--lambda-mult", type=float, default=0.7, help="MMR relevance/diversity trade-off")
+    parser.add_argument("--embedding-dim", type=int, default=0,
+                        help="Use offline hashing embeddings of this size (default: the configured model)")
+    parser.add_argument("--no-centroids", action="store_true",
+                        help="Ignore knowledge-base centroids (descriptors only)")
+    parser.add_argument("--references", type=Path, default=DEFAULT_REFERENCES,
+                        help="Recorded LLM selections (JSON)")
+    parser.add_argument("--record", action="store_true",
+                        help="Call the LLM selector for questions without a recorded panel first")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed selections per question")
+    parser.add_argument("--output", "-o", type=Path, help="Write the JSON report here as well")
+    args = parser.parse_args()
+
+    if args.record:
+        record_references(args.references, args.k)
+
+    report = run_eval(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Kindle Extraction Benchmark
+
+Writes a library of synthetic ePub books and measures how fast they are
+turned into text, the CPU-bound part of ``python -m council.knowledge.kindle
+<directory>``:
+
+- serial, html.parser: the original loop (one book after another, with
+  BeautifulSoup's pure-Python parser)
+- serial, lxml: the same loop, parsing with lxml directly
+- pool, lxml: extract_book in a process pool of --workers processes
+
+Throughput is reported in pages/s (a page being 300 words) and in MB/s of
+ePub file. Nothing is stored, so no embedding model or knowledge base is
+needed.
+
+Usage:
+    python benchmarks/kindle/run_benchmark.py
+    python benchmarks/kindle/run_benchmark.py --books 50 --chapters 30 --workers 8 --output kindle.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import council.knowledge.kindle as kindle  # noqa: E402
+
+WORDS_PER_PAGE = 300
+
+WORDS = (
+    "the a of to and in is it that you we what for be this not are with as on "
+    "life death time mind virtue nature fortune anger fear reason wisdom habit "
+    "soul body friend letter city power pleasure pain duty freedom truth good "
+    "remember consider accept endure choose suffer learn teach live die return "
+    "always never only perhaps indeed therefore because whenever although"
+).split()
+
+
+def make_library(directory: Path, books: int, chapters: int, words: int, seed: int) -> list[Path]:
+    """Write *books* ePubs of *chapters* chapters of about *words* words."""
+    from ebooklib import epub
+
+    rng = random.Random(seed)
+    paths = []
+    for b in range(books):
+        book = epub.EpubBook()
+        book.set_identifier(f"bench-{b}")
+        book.set_title(f"Benchmark Book {b}")
+        book.set_language("en")
+        items = []
+        for c in range(chapters):
+            paragraphs, remaining = [], words
+            while remaining > 0:
+                n = min(remaining, rng.randint(40, 160))
+                text = " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+                paragraphs.append(f"<p class=\"body\">{text}. <em>{rng.choice(WORDS)}</em></p>")
+                remaining -= n
+            item = epub.EpubHtml(title=f"Chapter {c + 1}", file_name=f"chap_{c}.xhtml", lang="en")
+            item.content = (
+                f"<html><head><style>p {{ margin: 0 }}</style></head><body>"
+                f"<h1>Chapter {c + 1}</h1><div class=\"chapter\">{''.join(paragraphs)}</div>"
+                f"</body></html>"
+            )
+            book.add_item(item)
+            items.append(item)
+        book.toc = items
+        book.spine = ["nav", *items]
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        path = directory / f"book_{b:03d}.epub"
+        epub.write_epub(str(path), book)
+        paths.append(path)
+    return paths
+
+
+def extract_with(parser: str, path: Path) -> list[str]:
+    kindle._html_parser = lambda: parser
+    return kindle.extract_book(path)
+
+
+def run_serial(paths: list[Path], parser: str) -> list[list[str]]:
+    return [extract_with(parser, path) for path in paths]
+
+
+def run_pool(paths: list[Path], parser: str, workers: int) -> list[list[str]]:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract_with, [parser] * len(paths), paths))
+
+
+def best_of(repeat: int, fn, *args) -> tuple[float, list]:
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Kindle ePub extraction")
+    parser.add_argument("--books", type=int, default=20)
+    parser.add_argument("--chapters", type=int, default=20)
+    parser.add_argument("--chapter-words", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    try:
+        import lxml  # noqa: F401
+        has_lxml = True
+    except ImportError:
+        has_lxml = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_library(Path(tmp), args.books, args.chapters, args.chapter_words, args.seed)
+        megabytes = sum(p.stat().st_size for p in paths) / 1e6
+
+        runs = [("serial, html.parser", run_serial, ("html.parser",))]
+        if has_lxml:
+            runs.append(("serial, lxml", run_serial, ("lxml",)))
+        best = "lxml" if has_lxml else "html.parser"
+        runs.append((f"pool ({args.workers}), {best}", run_pool, (best, args.workers)))
+
+        rows, expected = [], None
+        for name, fn, extra in runs:
+            seconds, books = best_of(args.repeat, fn, paths, *extra)
+            words = sum(len(section.split()) for book in books for section in book)
+            texts = ["\n\n".join(book) for book in books]
+            if expected is None:
+                expected = texts
+            elif texts != expected:
+                print(f"ERROR: {name} extracted different text than the baseline")
+                sys.exit(1)
+            pages = words / WORDS_PER_PAGE
+            rows.append({
+                "run": name,
+                "seconds": round(seconds, 3),
+                "pages_per_s": round(pages / seconds, 1),
+                "mb_per_s": round(megabytes / seconds, 2),
+                "speedup": round(rows[0]["seconds"] / seconds, 2) if rows else 1.0,
+            })
+
+    print(f"{args.books} books, {pages:,.0f} pages, {megabytes:.1f} MB (best of {args.repeat})")
+    print(f"{'run':<28} {'seconds':>8} {'pages/s':>9} {'MB/s':>7} {'speedup':>8}")
+    for row in rows:
+        print(f"{row['run']:<28} {row['seconds']:>8.2f} {row['pages_per_s']:>9,.0f} "
+              f"{row['mb_per_s']:>7.2f} {row['speedup']:>7.1f}×")
+
+    if args.output:
+        args.output.write_text(json.dumps({
+            "books": args.books,
+            "chapters": args.chapters,
+            "chapter_words": args.chapter_words,
+            "workers": args.workers,
+            "pages": round(pages),
+            "megabytes": round(megabytes, 2),
+            "runs": rows,
+        }, indent=2))
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Fixture corpus and labelled queries for the knowledge retrieval benchmark.
+
+Passages are short excerpts of the public domain translations listed in
+council.knowledge.sources.PUBLIC_SOURCES, bundled here so the benchmark runs
+offline. Each query is labelled with an ``answer`` phrase that appears
+verbatim in exactly one passage of that elder's corpus; a retrieved chunk is
+relevant if it contains the phrase, which keeps labels valid when chunking
+parameters change.
+"""
+
+import random
+import re
+
+FIXTURE_SOURCES = {
+    "aurelius": [
+        {
+            "title": "Meditations - George Long Translation (Book II)",
+            "type": "gutenberg",
+            "text": """\
+Begin the morning by saying to thyself, I shall meet with the busy-body, the
+ungrateful, arrogant, deceitful, envious, unsocial. All these things happen to
+them by reason of their ignorance of what is good and evil. But I who have seen
+the nature of the good that it is beautiful, and of the bad that it is ugly,
+and the nature of him who does wrong, that it is akin to me, not only of the
+same blood or seed, but that it participates in the same intelligence and the
+same portion of the divinity, I can neither be injured by any of them, for no
+one can fix on me what is ugly, nor can I be angry with my kinsman, nor hate
+him. For we are made for co-operation, like feet, like hands, like eyelids,
+like the rows of the upper and lower teeth. To act against one another then is
+contrary to nature; and it is acting against one another to be vexed and to
+turn away.
+
+Every moment think steadily as a Roman and a man to do what thou hast in hand
+with perfect and simple dignity, and feeling of affection, and freedom, and
+justice; and to give thyself relief from all other thoughts. And thou wilt give
+thyself relief, if thou doest every act of thy life as if it were the last,
+laying aside all carelessness and passionate aversion from the commands of
+reason, and all hypocrisy, and self-love, and discontent with the portion which
+has been given to thee.
+
+Though thou shouldst be going to live three thousand years, and as many times
+ten thousand years, still remember that no man loses any other life than this
+which he now lives, nor lives any other than this which he now loses. The
+longest and shortest are thus brought to the same. For the present is the same
+to all, though that which perishes is not the same; and so that which is lost
+appears to be a mere moment.
+""",
+        },
+        {
+            "title": "Meditations - George Long Translation (Books IV-VIII)",
+            "type": "gutenberg",
+            "text": """\
+Men seek retreats for themselves, houses in the country, sea-shores, and
+mountains; and thou too art wont to desire such things very much. But this is
+altogether a mark of the most common sort of men, for it is in thy power
+whenever thou shalt choose to retire into thyself. For nowhere either with more
+quiet or more freedom from trouble does a man retire than into his own soul.
+Constantly then give to thyself this retreat, and renew thyself. The universe
+is transformation: life is opinion.
+
+Do not act as if thou wert going to live ten thousand years. Death hangs over
+thee. While thou livest, while it is in thy power, be good.
+
+In the morning when thou risest unwillingly, let this thought be present: I am
+rising to the work of a human being. Why then am I dissatisfied if I am going
+to do the things for which I exist and for which I was brought into the world?
+Or have I been made for this, to lie in the bed-clothes and keep myself warm?
+
+If thou art pained by any external thing, it is not this thing that disturbs
+thee, but thy own judgement about it. And it is in thy power to wipe out this
+judgement now. But if anything in thy own disposition gives thee pain, who
+hinders thee from correcting thy opinion?
+""",
+        },
+    ],
+    "seneca": [
+        {
+            "title": "Moral Letters to Lucilius - Gummere Translation (Letters I-II)",
+            "type": "gutenberg",
+            "text": """\
+Continue to act thus, my dear Lucilius: set yourself free for your own sake;
+gather and save your time, which till lately has been forced from you, or
+filched away, or has merely slipped from your hands. Make yourself believe the
+truth of my words, that certain moments are torn from us, that some are gently
+removed, and that others glide beyond our reach. The most disgraceful kind of
+loss, however, is that due to carelessness. What man can you show me who
+places any value on his time, who reckons the worth of each day, who
+understands that he is dying daily? Nothing, Lucilius, is ours, except time.
+
+Be careful, however, lest this reading of many authors and books of every sort
+may tend to make you discursive and unsteady. You must linger among a limited
+number of master-thinkers, and digest their works, if you would derive ideas
+which shall win firm hold in your mind. Everywhere means nowhere. When a person
+spends all his time in foreign travel, he ends by having many acquaintances,
+but no friends. It is not the man who has too little, but the man who craves
+more, that is poor.
+""",
+        },
+        {
+            "title": "Moral Letters to Lucilius - Gummere Translation (Letters VII-XVIII)",
+            "type": "gutenberg",
+            "text": """\
+Do you ask me what you should regard as especially to be avoided? I say,
+crowds; for as yet you cannot trust yourself to them with safety. Nothing is so
+damaging to good character as the habit of lounging at the games.
+
+There are more things, Lucilius, likely to frighten us than there are to crush
+us; we suffer more often in imagination than in reality. What I advise you to
+do is, not to be unhappy before the crisis comes; since it may be that the
+dangers before which you paled as if they were threatening you, will never come
+upon you.
+
+Set aside a certain number of days, during which you shall be content with the
+scantiest and cheapest fare, with coarse and rough dress, saying to yourself
+the while: Is this the condition that I feared? It is precisely in times of
+immunity from care that the soul should toughen itself beforehand for
+occasions of greater stress.
+""",
+        },
+    ],
+    "franklin": [
+        {
+            "title": "The Way to Wealth",
+            "type": "gutenberg",
+            "text": """\
+It would be thought a hard government that should tax its people one-tenth
+part of their time, to be employed in its service. But idleness taxes many of
+us much more. Sloth, like rust, consumes faster than labour wears, while the
+used key is always bright. But dost thou love life, then do not squander time,
+for that's the stuff life is made of. Early to bed, and early to rise, makes a
+man healthy, wealthy, and wise.
+
+Industry need not wish, and he that lives upon hope will die fasting. He that
+hath a trade hath an estate, and he that hath a calling hath an office of
+profit and honour. At the working man's house hunger looks in, but dares not
+enter. One to-day is worth two to-morrows.
+
+Beware of little expenses; a small leak will sink a great ship. Buy what thou
+hast no need of, and ere long thou shalt sell thy necessaries. Experience keeps
+a dear school, but fools will learn in no other, and scarce in that.
+""",
+        },
+        {
+            "title": "The Autobiography of Benjamin Franklin",
+            "type": "gutenberg",
+            "text": """\
+It was about this time I conceived the bold and arduous project of arriving at
+moral perfection. I included under thirteen names of virtues all that at that
+time occurred to me as necessary or desirable. Temperance: eat not to
+dullness; drink not to elevation. Silence: speak not but what may benefit
+others or yourself; avoid trifling conversation. Order: let all your things
+have their places; let each part of your business have its time. Resolution:
+resolve to perform what you ought; perform without fail what you resolve.
+Frugality: make no expense but to do good to others or yourself; waste
+nothing. Industry: lose no time; be always employed in something useful; cut
+off all unnecessary actions.
+
+Tranquillity: be not disturbed at trifles, or at accidents common or
+unavoidable. Humility: imitate Jesus and Socrates. I made a little book, in
+which I allotted a page for each of the virtues, and I determined to give a
+week's strict attention to each of the virtues successively.
+""",
+        },
+    ],
+    "sun_tzu": [
+        {
+            "title": "The Art of War - Lionel Giles Translation (Chapters I-III)",
+            "type": "gutenberg",
+            "text": """\
+Sun Tzu said: The art of war is of vital importance to the State. It is a
+matter of life and death, a road either to safety or to ruin. All warfare is
+based on deception. Hence, when able to attack, we must seem unable; when using
+our forces, we must seem inactive; when we are near, we must make the enemy
+believe we are far away; when far away, we must make him believe we are near.
+
+There is no instance of a country having benefited from prolonged warfare. In
+war, then, let your great object be victory, not lengthy campaigns.
+
+Hence to fight and conquer in all your battles is not supreme excellence;
+supreme excellence consists in breaking the enemy's resistance without
+fighting. If you know the enemy and know yourself, you need not fear the
+result of a hundred battles. If you know yourself but not the enemy, for every
+victory gained you will also suffer a defeat.
+""",
+        },
+        {
+            "title": "The Art of War - Lionel Giles Translation (Chapters IV-VI)",
+            "type": "gutenberg",
+            "text": """\
+The good fighters of old first put themselves beyond the possibility of
+defeat, and then waited for an opportunity of defeating the enemy. To secure
+ourselves against defeat lies in our own hands, but the opportunity of
+defeating the enemy is provided by the enemy himself.
+
+Military tactics are like unto water; for water in its natural course runs
+away from high places and hastens downwards. So in war, the way is to avoid
+what is strong and to strike at what is weak. Water shapes its course
+according to the nature of the ground over which it flows; the soldier works
+out his victory in relation to the foe whom he is facing.
+""",
+        },
+    ],
+    "laotzu": [
+        {
+            "title": "Tao Te Ching - James Legge Translation",
+            "type": "gutenberg",
+            "text": """\
+The Tao that can be trodden is not the enduring and unchanging Tao. The name
+that can be named is not the enduring and unchanging name.
+
+The highest excellence is like that of water. The excellence of water appears
+in its benefiting all things, and in its occupying, without striving to the
+contrary, the low place which all men dislike. Hence its way is near to that
+of the Tao.
+
+The thirty spokes unite in the one nave; but it is on the empty space for the
+axle, that the use of the wheel depends. Clay is fashioned into vessels; but it
+is on their empty hollowness, that their use depends.
+
+He who knows other men is discerning; he who knows himself is intelligent. He
+who overcomes others is strong; he who overcomes himself is mighty. He who is
+satisfied with his lot is rich.
+
+The journey of a thousand li commenced with a single step. Man at his birth is
+supple and weak; at his death, firm and strong. Hence firmness and strength
+are the concomitants of death; softness and weakness, the concomitants of life.
+""",
+        },
+    ],
+}
+
+# Each answer must occur verbatim in exactly one passage of that elder
+QUERIES = {
+    "aurelius": [
+        {"query": "How should I deal with rude, ungrateful and envious people I meet?", "answer": "we are made for co-operation"},
+        {"query": "Act as if each action of your life were your last", "answer": "every act of thy life as if it were the last"},
+        {"query": "How long a life do we really lose when we die?", "answer": "no man loses any other life"},
+        {"query": "Where can I retreat to find quiet and freedom from trouble?", "answer": "retire into thyself"},
+        {"query": "I do not want to get out of bed in the morning", "answer": "work of a human being"},
+        {"query": "Is it the external thing or my judgement of it that disturbs me?", "answer": "thy own judgement about it"},
+    ],
+    "seneca": [
+        {"query": "How do I stop wasting my time?", "answer": "Nothing, Lucilius, is ours, except time"},
+        {"query": "Should I read many authors and books or a few master-thinkers?", "answer": "Everywhere means nowhere"},
+        {"query": "Who is truly poor?", "answer": "the man who craves more, that is poor"},
+        {"query": "What should I avoid, the crowds and the games?", "answer": "I say, crowds"},
+        {"query": "I suffer from fear and anxiety about things in my imagination", "answer": "suffer more often in imagination than in reality"},
+        {"query": "Practise poverty with cheap fare and rough dress", "answer": "Is this the condition that I feared"},
+    ],
+    "franklin": [
+        {"query": "Why is idleness and sloth so costly?", "answer": "Sloth, like rust"},
+        {"query": "Is waking early good for health and wealth?", "answer": "Early to bed, and early to rise"},
+        {"query": "Do small expenses really matter?", "answer": "a small leak will sink a great ship"},
+        {"query": "What are the virtues of temperance, silence and order?", "answer": "eat not to dullness"},
+        {"query": "How did you track your progress on each virtue in a little book?", "answer": "allotted a page for each of the virtues"},
+    ],
+    "sun_tzu": [
+        {"query": "Is warfare based on deception?", "answer": "All warfare is based on deception"},
+        {"query": "Can a long, prolonged war benefit a country?", "answer": "benefited from prolonged warfare"},
+        {"query": "How to win without fighting any battles", "answer": "breaking the enemy's resistance without fighting"},
+        {"query": "Know the enemy and know yourself", "answer": "need not fear the result of a hundred battles"},
+        {"query": "Avoid what is strong and strike at what is weak, like water", "answer": "strike at what is weak"},
+    ],
+    "laotzu": [
+        {"query": "Can the Tao be named?", "answer": "The name that can be named"},
+        {"query": "Why is water the highest excellence?", "answer": "The highest excellence is like that of water"},
+        {"query": "What is the use of empty space in a wheel or vessel?", "answer": "thirty spokes unite in the one nave"},
+        {"query": "Is knowing yourself better than knowing other men?", "answer": "he who knows himself is intelligent"},
+        {"query": "How does a long journey begin?", "answer": "journey of a thousand li"},
+    ],
+}
+
+
+def normalize_space(text: str) -> str:
+    """Collapse whitespace so answers match across line wrapping and chunking."""
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def synthetic_distractors(elder_id: str, count: int, seed: int = 0) -> list[dict]:
+    """Build *count* distractor documents for an elder from other elders' text.
+
+    Sentences are sampled from the rest of the fixture corpus, skipping any
+    that contain one of this elder's answers, so distractors scale the index
+    without changing which chunks are relevant.
+    """
+    answers = [normalize_space(q["answer"]).lower() for q in QUERIES.get(elder_id, [])]
+    sentences = [
+        normalize_space(sentence)
+        for other_id, sources in FIXTURE_SOURCES.items()
+        if other_id != elder_id
+        for source in sources
+        for sentence in re.split(r"(?<=[.;?])\s+", source["text"])
+        if sentence.strip()
+    ]
+    sentences = [s for s in sentences if not any(a in s.lower() for a in answers)]
+
+    rng = random.Random(f"{seed}:{elder_id}")
+    return [
+        {
+            "title": f"Synthetic distractor {i + 1}",
+            "type": "synthetic",
+            "text": " ".join(rng.choice(sentences) for _ in range(40)),
+        }
+        for i in range(count)
+    ]
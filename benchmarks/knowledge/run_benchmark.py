@@ -0,0 +1,233 @@
+"""
+Knowledge Retrieval Benchmark
+
+Builds a throwaway knowledge store from the fixture corpus, runs the labelled
+query set and writes a JSON report to diff between commits:
+
+- retrieval quality: recall@k and MRR per elder and overall
+- query latency percentiles
+- ingestion throughput (chunks/s)
+- index size on disk and peak process RSS
+
+Everything runs offline: embeddings come from HashingEmbeddingFunction and
+all state lives in a temporary HOME that is deleted afterwards.
+
+Usage:
+    python benchmarks/knowledge/run_benchmark.py --output before.json
+    python benchmarks/knowledge/run_benchmark.py --method query --output after.json
+    python benchmarks/knowledge/run_benchmark.py --backend quantized --quantized-dtype int8
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from corpus import FIXTURE_SOURCES, QUERIES, normalize_space, synthetic_distractors
+
+RECALL_AT = (1, 3, 5)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of *values*."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def _dir_size(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).parent,
+        )
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _first_relevant_rank(results: list[dict], answer: str) -> int | None:
+    """1-based rank of the first result containing *answer*, or None."""
+    needle = normalize_space(answer).lower()
+    for rank, result in enumerate(results, 1):
+        if needle in normalize_space(result["content"]).lower():
+            return rank
+    return None
+
+
+def _retrieve(store, method: str, elder_id: str, query: str, args) -> list[dict]:
+    if method == "query":
+        return store.query(elder_id, query, n_results=args.k)
+    if method == "diverse":
+        return store.query_diverse(elder_id, query, n_results=args.k, fetch_k=args.fetch_k)
+    return store.query_tiered(elder_id, query, n_results=args.k, fetch_k=args.fetch_k)
+
+
+def _quality(ranks: list[int | None], k: int) -> dict:
+    cutoffs = sorted(set(RECALL_AT) | {k})
+    return {
+        **{
+            f"recall@{c}": round(sum(1 for r in ranks if r is not None and r <= c) / len(ranks), 4)
+            for c in cutoffs
+        },
+        "mrr": round(sum(1 / r for r in ranks if r is not None) / len(ranks), 4),
+        "queries": len(ranks),
+    }
+
+
+def run_benchmark(args) -> dict:
+    """Ingest the fixture corpus into a fresh store and score the queries."""
+    from council.knowledge.embeddings import HashingEmbeddingFunction
+    from council.knowledge.store import KnowledgeStore
+
+    knowledge_dir = Path.home() / ".council" / "knowledge"
+    store = KnowledgeStore(embedding_function=HashingEmbeddingFunction(dim=args.embedding_dim))
+
+    # ---- Ingestion ---------------------------------------------------------
+    documents = 0
+    chars = 0
+    chunks = 0
+    start = time.perf_counter()
+    for elder_id, sources in FIXTURE_SOURCES.items():
+        corpus = sources + synthetic_distractors(elder_id, args.distractors, seed=args.seed)
+        for source in corpus:
+            chunks += store.add_document(
+                elder_id,
+                source["text"],
+                metadata={"source": source["title"], "title": source["title"], "type": source["type"]},
+                chunk_size=args.chunk_size,
+                chunk_overlap=args.chunk_overlap,
+            )
+            documents += 1
+            chars += len(source["text"])
+    ingest_seconds = time.perf_counter() - start
+
+    # ---- Retrieval ---------------------------------------------------------
+    latencies_ms: list[float] = []
+    all_ranks: list[int | None] = []
+    per_elder: dict[str, dict] = {}
+
+    for elder_id, queries in QUERIES.items():
+        # Warm the collection handle so the first query isn't an outlier
+        _retrieve(store, args.method, elder_id, queries[0]["query"], args)
+
+        ranks = []
+        for item in queries:
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                results = _retrieve(store, args.method, elder_id, item["query"], args)
+                latencies_ms.append((time.perf_counter() - t0) * 1000)
+            ranks.append(_first_relevant_rank(results, item["answer"]))
+        per_elder[elder_id] = _quality(ranks, args.k)
+        all_ranks.extend(ranks)
+
+    return {
+        "commit": _git_commit(),
+        "config": {
+            "method": args.method,
+            "k": args.k,
+            "fetch_k": args.fetch_k,
+            "chunk_size": args.chunk_size,
+            "chunk_overlap": args.chunk_overlap,
+            "distractors_per_elder": args.distractors,
+            "dedup": not args.no_dedup,
+            "embedding": f"hashing-{args.embedding_dim}",
+            "backend": args.backend,
+            "quantized_dtype": args.quantized_dtype if args.backend == "quantized" else None,
+            "seed": args.seed,
+        },
+        "corpus": {
+            "elders": len(FIXTURE_SOURCES),
+            "documents": documents,
+            "chars": chars,
+        },
+        "ingestion": {
+            "chunks": chunks,
+            "seconds": round(ingest_seconds, 3),
+            "chunks_per_s": round(chunks / ingest_seconds, 1) if ingest_seconds else None,
+        },
+        "index_bytes": {
+            "chromadb": _dir_size(knowledge_dir / "chromadb"),
+            "quantized": _dir_size(knowledge_dir / "quantized"),
+            "embedding_cache": _dir_size(knowledge_dir / "embeddings"),
+            "dedup": _dir_size(knowledge_dir / "dedup"),
+        },
+        "latency_ms": {
+            "p50": round(_percentile(latencies_ms, 50), 3),
+            "p90": round(_percentile(latencies_ms, 90), 3),
+            "p99": round(_percentile(latencies_ms, 99), 3),
+            "mean": round(sum(latencies_ms) / len(latencies_ms), 3),
+            "samples": len(latencies_ms),
+        },
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "quality": _quality(all_ranks, args.k),
+        "per_elder": per_elder,
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark knowledge retrieval quality and latency (offline)"
+    )
+    parser.add_argument("--method", choices=["query", "diverse", "tiered"], default="tiered",
+                        help="Retrieval method (tiered is what get_elder_knowledge uses)")
+    parser.add_argument("--k", type=int, default=8, help="Results per query")
+    parser.add_argument("--fetch-k", type=int, default=30, help="Candidates re-ranked per query")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--distractors", type=int, default=20,
+                        help="Synthetic distractor documents per elder")
+    parser.add_argument("--no-dedup", action="store_true", help="Disable near-duplicate suppression")
+    parser.add_argument("--backend", choices=["chroma", "quantized"], default="chroma",
+                        help="Knowledge storage backend")
+    parser.add_argument("--quantized-dtype", choices=["int8", "float16"], default="int8")
+    parser.add_argument("--embedding-dim", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per query")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    original_home = os.environ.get("HOME")
+    with tempfile.TemporaryDirectory(prefix="council-bench-") as home:
+        os.environ["HOME"] = home
+        try:
+            config_dir = Path(home) / ".council"
+            config_dir.mkdir()
+            (config_dir / "config.yaml").write_text(yaml.safe_dump({
+                "dedup_enabled": not args.no_dedup,
+                "knowledge_backend": args.backend,
+                "quantized_dtype": args.quantized_dtype,
+            }))
+            report = run_benchmark(args)
+        finally:
+            if original_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = original_home
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
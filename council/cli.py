@@ -614,6 +614,100 @@ def web(
     run_server(host=host, port=port, debug=debug)
 
 
+knowledge_app = typer.Typer(help="Manage elder knowledge bases.", no_args_is_help=True)
+app.add_typer(knowledge_app, name="knowledge")
+
+
+@knowledge_app.command("export")
+def knowledge_export(
+    elders: Optional[list[str]] = typer.Argument(None, help="Elder IDs to export (default: all with knowledge)"),
+    output: str = typer.Option("knowledge-snapshots", "--output", "-o", help="Directory for snapshot files"),
+    dtype: str = typer.Option("int8", "--dtype", help="Embedding storage: int8, float16 or float32"),
+):
+    """Export elder knowledge bases as compact, portable snapshots."""
+    from pathlib import Path
+
+    from council.knowledge.snapshot import DTYPES, export_elder
+    from council.knowledge.store import get_knowledge_store
+
+    if dtype not in DTYPES:
+        print_error(f"Unsupported dtype '{dtype}'. Choose from: {', '.join(DTYPES)}")
+        raise typer.Exit(1)
+
+    store = get_knowledge_store()
+    if not elders:
+        from council.knowledge.versions import parse_collection_name
+
+        parsed = (parse_collection_name(c.name) for c in store.client.list_collections())
+        elders = sorted({p[0] for p in parsed if p})
+    if not elders:
+        print_info("No knowledge to export.")
+        return
+
+    for elder_id in elders:
+        path = export_elder(store, elder_id, Path(output).expanduser(), dtype=dtype)
+        size_kb = path.stat().st_size / 1024
+        console.print(f"  [green]✓[/green] {elder_id}: [dim]{path} ({size_kb:,.0f} KB)[/dim]")
+
+
+@knowledge_app.command("import")
+def knowledge_import(
+    snapshots: list[str] = typer.Argument(..., help="Snapshot files to import"),
+    elder: Optional[str] = typer.Option(None, "--elder", "-e", help="Import into this elder instead of the snapshot's"),
+    replace: bool = typer.Option(False, "--replace", help="Clear existing knowledge first"),
+    force: bool = typer.Option(False, "--force", help="Import even if the embedding model differs"),
+):
+    """Import knowledge snapshots without re-embedding."""
+    import time
+
+    from council.knowledge.snapshot import SnapshotError, import_snapshot
+    from council.knowledge.store import get_knowledge_store
+
+    store = get_knowledge_store()
+    failed = False
+    for snapshot in snapshots:
+        start = time.perf_counter()
+        try:
+            # This process exits before a scheduled digest rebuild would fire
+            result = import_snapshot(
+                store, snapshot, elder_id=elder, replace=replace, force=force, digest_now=True
+            )
+        except SnapshotError as e:
+            print_error(str(e))
+            failed = True
+            continue
+        elapsed = time.perf_counter() - start
+        console.print(
+            f"  [green]✓[/green] {result['elder_id']}: "
+            f"{result['imported']:,} new of {result['count']:,} chunks "
+            f"[dim]({elapsed:.1f}s)[/dim]"
+        )
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@knowledge_app.command("digest")
+def knowledge_digest(
+    elders: Optional[list[str]] = typer.Argument(None, help="Elder IDs to rebuild (default: all with knowledge)"),
+):
+    """Rebuild the per-category knowledge digests served to the first speaker."""
+    from council.knowledge.store import get_knowledge_store
+    from council.knowledge.versions import parse_collection_name
+
+    store = get_knowledge_store()
+    if not elders:
+        parsed = (parse_collection_name(c.name) for c in store.client.list_collections())
+        elders = sorted({p[0] for p in parsed if p})
+    if not elders:
+        print_info("No knowledge to digest.")
+        return
+
+    for elder_id in elders:
+        categories = store.build_digest(elder_id)
+        console.print(f"  [green]✓[/green] {elder_id}: [dim]{categories} categories[/dim]")
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -36,6 +36,40 @@ DEFAULT_CONFIG = {
     "amazon_affiliate_tag": "",  # Amazon Associates tag for book links
     "enrichment_enabled": True,  # auto-enrich nominated elders in background
     "enrichment_youtube_max": 5,  # max YouTube videos per enrichment run
+    "enrichment_video_workers": 3,  # videos processed concurrently during enrichment
+    "enrichment_step_timeout": 300,  # seconds per biography/search/books attempt before retrying
+    "biography_cache_enabled": True,  # keep fetched biographies on disk
+    "biography_cache_ttl": 2592000,  # seconds before a cached biography is fetched again
+    "fetch_workers": 8,  # concurrent public-source downloads
+    "fetch_per_host": 4,  # max concurrent downloads from one host
+    "youtube_download_workers": 4,  # concurrent yt-dlp downloads in the transcript pipeline
+    "youtube_clean_workers": 2,  # transcript cleaning workers
+    "youtube_vet_workers": 2,  # concurrent LLM vetting calls
+    "youtube_save_workers": 1,  # transcript save/index workers
+    "youtube_cache_enabled": True,  # cache yt-dlp metadata, subtitles and searches on disk
+    "youtube_search_ttl": 86400,  # seconds before a cached YouTube search is repeated
+    "youtube_metadata_ttl": 604800,  # seconds before cached video metadata is refreshed
+    "audit_workers": 0,  # processes for rule-based transcript audits (0 = one per CPU core)
+    "audit_llm_workers": 2,  # concurrent LLM transcript assessments
+    "kindle_workers": 0,  # processes extracting books in a Kindle directory import (0 = one per CPU core)
+    "embedding_cache_enabled": True,  # reuse chunk embeddings across re-ingests
+    "embedding_cache_dtype": "float16",  # "float16" or "int8"
+    "embedding_backend": "chroma",  # "chroma", "ollama" or "sentence-transformers"
+    "embedding_model": "",  # model for the ollama / sentence-transformers backends ("" = default)
+    "embedding_batch_size": 64,  # texts per embedding batch
+    "embedding_threads": 0,  # embedding threads (0 = one per CPU core)
+    "knowledge_backend": "chroma",  # "chroma" or "quantized" (memory-mapped, lower RSS)
+    "quantized_dtype": "int8",  # "int8" or "float16" for the quantized backend
+    "dedup_enabled": True,  # drop near-duplicate chunks at ingest
+    "dedup_threshold": 0.8,  # estimated Jaccard similarity to count as duplicate
+    "auto_index_enabled": True,  # web server indexes new/changed knowledge files
+    "auto_index_interval": 10,  # seconds between knowledge directory scans
+    "auto_index_debounce": 30,  # seconds a file must be unchanged before indexing
+    "knowledge_digests_enabled": True,  # first speaker uses precomputed per-category digests
+    "knowledge_digest_delay": 30,  # seconds after the last write before digests rebuild
+    "elder_selection": "index",  # "index" (embedding shortlist) or "llm" (full LLM call)
+    "elder_selection_llm_tiebreak": True,  # ask the LLM only when the cut-off is a near-tie
+    "elder_selection_tie_margin": 0.02,  # relevance gap that counts as a tie
     "tts_provider": "macos",  # "macos" or "elevenlabs"
     "elevenlabs_api_key": "",  # BYOK key for ElevenLabs
     "elevenlabs_model": "eleven_multilingual_v2",  # or "eleven_flash_v2_5"
@@ -70,11 +70,18 @@ class ElderRegistry:
     """Registry of all available elders."""
 
     _elders: ClassVar[dict[str, Elder]] = {}
+    _version: ClassVar[int] = 0
 
     @classmethod
     def register(cls, elder: Elder) -> None:
         """Register an elder."""
         cls._elders[elder.id] = elder
+        cls._version += 1
+
+    @classmethod
+    def version(cls) -> int:
+        """Counter bumped by every register() and unregister()."""
+        return cls._version
 
     @classmethod
     def get(cls, elder_id: str) -> Elder | None:
@@ -101,6 +108,7 @@ class ElderRegistry:
         """Remove an elder from the registry."""
         if elder_id in cls._elders:
             del cls._elders[elder_id]
+            cls._version += 1
             return True
         return False
 
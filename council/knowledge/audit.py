@@ -8,12 +8,19 @@ Thoroughly audits all knowledge base transcripts for:
 - Readability assessment
 """
 
+import hashlib
+import json
+import os
 import re
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import accumulate
 from pathlib import Path
 from typing import Literal
 
-from council.config import get_knowledge_dir
+from council.config import get_config_value, get_knowledge_dir
 from council.llm import chat
 
 
@@ -49,50 +56,167 @@ class TranscriptAudit:
     def warning_count(self) -> int:
         return sum(1 for i in self.issues if i.severity == "warning")
 
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["filepath"] = str(self.filepath)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TranscriptAudit":
+        data = dict(data)
+        data["filepath"] = Path(data["filepath"])
+        data["issues"] = [TranscriptIssue(**issue) for issue in data.get("issues", [])]
+        return cls(**data)
+
+
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?\'"-]+')
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{5,}')
+# Three short words in a row. Whitespace excludes "\n" so a run can't span
+# two lines when the whole text is searched at once.
+_SHORT_WORD_RUN_RE = re.compile(r'\b[a-z]{1,2}\b[^\S\n]+\b[a-z]{1,2}\b[^\S\n]+\b[a-z]{1,2}\b')
+_SHORT_WORD_RE = re.compile(r'\b[a-z]{1,2}\b')
+
+_TIMESTAMP_RE = re.compile(
+    r'\d{2}:\d{2}:\d{2}'
+    r'|\[\d+:\d+\]'
+    r'|\d+$'  # Standalone numbers (SRT sequence)
+)
+_PLACEHOLDER_PATTERNS = [
+    re.compile(r'\[.*transcript.*\]'),
+    re.compile(r'\[.*unavailable.*\]'),
+    re.compile(r'\[.*error.*\]'),
+    re.compile(r'transcript not available'),
+]
+_BRACKET_TAG_RE = re.compile(r'\[([^\]]+)\]')
+
+# Repeated phrases are word trigrams of more than this many characters
+_MIN_PHRASE_CHARS = 10
+# Phrases near the start of a paragraph are looked up directly in the text
+# before the trigram index is built; most repeats are found among them
+_DIRECT_PHRASES = 16
+
+
+def _matched_chars_by_line(pattern: re.Pattern, text: str) -> dict[int, int]:
+    """Characters matched by *pattern* on each line of *text* that has a match.
+
+    Lines are 0-based. The pattern must not match across a newline.
+    """
+    counts: dict[int, int] = {}
+    line, offset = 0, 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        line += text.count('\n', offset, start)
+        offset = start
+        counts[line] = counts.get(line, 0) + match.end() - start
+    return counts
+
 
 def check_garbled_text(content: str) -> list[TranscriptIssue]:
-    """Check for garbled/corrupted text patterns."""
+    """Check for garbled/corrupted text patterns.
+
+    Each pattern is searched once over the whole text instead of once per
+    line, so clean lines cost nothing beyond that scan; only lines with a
+    hit are looked at individually.
+    """
     issues = []
     lines = content.split('\n')
+    specials = _matched_chars_by_line(_SPECIAL_CHARS_RE, content)
+    repeated = _matched_chars_by_line(_REPEATED_CHAR_RE, content)
+    runs = _matched_chars_by_line(_SHORT_WORD_RUN_RE, content.lower())
+
+    for i in sorted(specials.keys() | repeated.keys() | runs.keys()):
+        line = lines[i]
 
-    for i, line in enumerate(lines, 1):
         # Check for excessive special characters
-        special_ratio = len(re.findall(r'[^\w\s.,!?\'"-]', line)) / max(len(line), 1)
-        if special_ratio > 0.3 and len(line) > 20:
+        if len(line) > 20 and specials.get(i, 0) / len(line) > 0.3:
             issues.append(TranscriptIssue(
                 severity="warning",
                 category="garbled_text",
                 description="High ratio of special characters detected",
-                line_number=i,
+                line_number=i + 1,
                 sample=line[:80]
             ))
 
         # Check for repeated characters (stutter in auto-captions)
-        if re.search(r'(.)\1{5,}', line):
+        if i in repeated:
             issues.append(TranscriptIssue(
                 severity="warning",
                 category="garbled_text",
                 description="Repeated character sequence detected",
-                line_number=i,
+                line_number=i + 1,
                 sample=line[:80]
             ))
 
-        # Check for word fragments typical of bad auto-captions
-        if re.search(r'\b[a-z]{1,2}\b\s+\b[a-z]{1,2}\b\s+\b[a-z]{1,2}\b', line.lower()):
-            # Multiple short words in a row might be fragmented speech
-            short_words = re.findall(r'\b[a-z]{1,2}\b', line.lower())
-            if len(short_words) > 5:
-                issues.append(TranscriptIssue(
-                    severity="info",
-                    category="possible_fragmentation",
-                    description="Multiple short word fragments detected",
-                    line_number=i,
-                    sample=line[:80]
-                ))
+        # Multiple short words in a row might be fragmented speech
+        if i in runs and len(_SHORT_WORD_RE.findall(line.lower())) > 5:
+            issues.append(TranscriptIssue(
+                severity="info",
+                category="possible_fragmentation",
+                description="Multiple short word fragments detected",
+                line_number=i + 1,
+                sample=line[:80]
+            ))
 
     return issues
 
 
+def _first_repeated_phrase(words: list[str]) -> str | None:
+    """The first three-word phrase that occurs again later in *words*.
+
+    "Occurs again" is a substring test against the rest of the paragraph
+    joined with spaces, so the repeat's first word may be the tail of a
+    longer word and its last word the head of one ("in the end" is found
+    in "within the endless"); only the middle word must match exactly.
+    Phrases must start before the last six words and be longer than
+    _MIN_PHRASE_CHARS.
+
+    Rather than rescanning the rest of the paragraph for every phrase,
+    one pass records, for every (suffix, middle word, prefix) trigram that
+    could match a phrase, the last position of its middle word; a phrase
+    at *i* repeats if that position is past its own end. Hashing trigrams
+    keeps this linear in the paragraph length.
+    """
+    n = len(words)
+    text = ' '.join(words)
+    offsets = list(accumulate((len(word) + 1 for word in words), initial=0))
+    for i in range(min(n - 6, _DIRECT_PHRASES)):
+        phrase = ' '.join(words[i:i + 3])
+        if len(phrase) > _MIN_PHRASE_CHARS and text.find(phrase, offsets[i + 3]) != -1:
+            return phrase
+    if n - 6 <= _DIRECT_PHRASES:
+        return None
+
+    starts = set(words[:n - 6])
+    # Where each word is first a phrase's middle word; a later word can
+    # only repeat a phrase if it comes at least three words after that
+    first_middle = {word: m for m, word in reversed(list(enumerate(words[1:n - 5], 1)))}
+    ends = set(words[2:n - 4])
+    # Suffixes of each word that start a phrase, prefixes that end one
+    heads: dict[str, list[str]] = {}
+    tails: dict[str, list[str]] = {}
+
+    last_seen: dict[tuple[str, str, str], int] = {}
+    for k in range(4, n - 1):
+        middle = words[k]
+        if first_middle.get(middle, n) > k - 3:
+            continue
+        before, after = words[k - 1], words[k + 1]
+        if before not in heads:
+            heads[before] = [before[j:] for j in range(len(before)) if before[j:] in starts]
+        if after not in tails:
+            tails[after] = [after[:j] for j in range(len(after), 0, -1) if after[:j] in ends]
+        for head in heads[before]:
+            for tail in tails[after]:
+                if len(head) + len(middle) + len(tail) + 2 > _MIN_PHRASE_CHARS:
+                    last_seen[(head, middle, tail)] = k
+
+    for i in range(_DIRECT_PHRASES, n - 6):
+        trigram = (words[i], words[i + 1], words[i + 2])
+        if last_seen.get(trigram, -1) >= i + 4:
+            return ' '.join(trigram)
+    return None
+
+
 def check_repetition(content: str) -> list[TranscriptIssue]:
     """Check for excessive repetition (common in auto-captions)."""
     issues = []
@@ -114,24 +238,19 @@ def check_repetition(content: str) -> list[TranscriptIssue]:
             else:
                 seen_lines[clean_line] = i
 
-    # Check for repeated phrases within paragraphs
-    paragraphs = content.split('\n\n')
-    for para_idx, para in enumerate(paragraphs):
+    # Check for repeated phrases within paragraphs (reported once each)
+    for para in content.split('\n\n'):
         words = para.lower().split()
         if len(words) > 10:
-            # Check for 3+ word phrases repeated
-            for i in range(len(words) - 6):
-                phrase = ' '.join(words[i:i+3])
-                remaining = ' '.join(words[i+3:])
-                if phrase in remaining and len(phrase) > 10:
-                    issues.append(TranscriptIssue(
-                        severity="info",
-                        category="repeated_phrase",
-                        description=f"Phrase repeated: '{phrase}'",
-                        line_number=None,
-                        sample=para[:100]
-                    ))
-                    break  # Only report once per paragraph
+            phrase = _first_repeated_phrase(words)
+            if phrase is not None:
+                issues.append(TranscriptIssue(
+                    severity="info",
+                    category="repeated_phrase",
+                    description=f"Phrase repeated: '{phrase}'",
+                    line_number=None,
+                    sample=para[:100]
+                ))
 
     return issues
 
@@ -177,23 +296,15 @@ def check_formatting(content: str, source_type: str) -> list[TranscriptIssue]:
         ))
 
     # Check for leftover timestamp artifacts
-    timestamp_patterns = [
-        r'\d{2}:\d{2}:\d{2}',
-        r'\[\d+:\d+\]',
-        r'^\d+$',  # Standalone numbers (SRT sequence)
-    ]
-
     for i, line in enumerate(lines, 1):
-        for pattern in timestamp_patterns:
-            if re.match(pattern, line.strip()):
-                issues.append(TranscriptIssue(
-                    severity="warning",
-                    category="timestamp_artifact",
-                    description="Leftover timestamp or sequence number",
-                    line_number=i,
-                    sample=line[:80]
-                ))
-                break
+        if _TIMESTAMP_RE.match(line.strip()):
+            issues.append(TranscriptIssue(
+                severity="warning",
+                category="timestamp_artifact",
+                description="Leftover timestamp or sequence number",
+                line_number=i,
+                sample=line[:80]
+            ))
 
     return issues
 
@@ -214,25 +325,20 @@ def check_content_quality(content: str) -> list[TranscriptIssue]:
         ))
 
     # Check for placeholder content
-    placeholder_patterns = [
-        r'\[.*transcript.*\]',
-        r'\[.*unavailable.*\]',
-        r'\[.*error.*\]',
-        r'transcript not available',
-    ]
-
-    for pattern in placeholder_patterns:
-        if re.search(pattern, content.lower()):
+    lowered = content.lower()
+    for pattern in _PLACEHOLDER_PATTERNS:
+        match = pattern.search(lowered)
+        if match:
             issues.append(TranscriptIssue(
                 severity="error",
                 category="placeholder_content",
                 description="Contains placeholder or error text",
                 line_number=None,
-                sample=re.search(pattern, content.lower()).group()[:80]
+                sample=match.group()[:80]
             ))
 
     # Check for [Music] [Applause] etc. spam
-    bracket_tags = re.findall(r'\[([^\]]+)\]', content)
+    bracket_tags = _BRACKET_TAG_RE.findall(content)
     if len(bracket_tags) > 20:
         issues.append(TranscriptIssue(
             severity="warning",
@@ -305,10 +411,9 @@ Be strict - only high quality, readable transcripts should score above 70."""
         return 50, f"LLM assessment failed: {e}"
 
 
-def audit_transcript(filepath: Path, use_llm: bool = True) -> TranscriptAudit:
-    """Perform complete audit on a single transcript."""
-    # Determine elder and source type from path
-    parts = filepath.relative_to(get_knowledge_dir()).parts
+def _classify(filepath: Path, knowledge_dir: Path) -> tuple[str, str]:
+    """(elder_id, source_type) for a transcript, from its path."""
+    parts = filepath.relative_to(knowledge_dir).parts
     elder_id = parts[0] if parts else "unknown"
 
     if len(parts) > 1 and parts[1] in ["youtube", "letters", "podcasts"]:
@@ -317,16 +422,21 @@ def audit_transcript(filepath: Path, use_llm: bool = True) -> TranscriptAudit:
         source_type = "wisdom"
     else:
         source_type = "books"
+    return elder_id, source_type
+
+
+def rule_based_audit(filepath: Path, knowledge_dir: Path | None = None) -> TranscriptAudit:
+    """Audit a transcript with the rule-based checks only (no LLM).
+
+    The result has the default score of a run without LLM assessment;
+    apply_llm_assessment() replaces it. Safe to run in a worker process.
+    """
+    elder_id, source_type = _classify(filepath, knowledge_dir or get_knowledge_dir())
 
     # Read content
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Basic stats
-    file_size = filepath.stat().st_size
-    line_count = len(content.split('\n'))
-    word_count = len(content.split())
-
     # Collect all issues
     issues = []
     issues.extend(check_garbled_text(content))
@@ -334,99 +444,336 @@ def audit_transcript(filepath: Path, use_llm: bool = True) -> TranscriptAudit:
     issues.extend(check_formatting(content, source_type))
     issues.extend(check_content_quality(content))
 
-    # LLM assessment
-    if use_llm:
-        quality_score, llm_assessment = assess_with_llm(content, elder_id, filepath)
-    else:
-        quality_score = 70  # Default if no LLM
-        llm_assessment = "LLM assessment skipped"
-
-    # Determine pass/fail
-    error_count = sum(1 for i in issues if i.severity == "error")
-    passed = error_count == 0 and quality_score >= 50
-
-    return TranscriptAudit(
+    audit = TranscriptAudit(
         filepath=filepath,
         elder_id=elder_id,
         source_type=source_type,
-        file_size=file_size,
-        line_count=line_count,
-        word_count=word_count,
+        file_size=filepath.stat().st_size,
+        line_count=len(content.split('\n')),
+        word_count=len(content.split()),
         issues=issues,
-        quality_score=quality_score,
-        llm_assessment=llm_assessment,
-        passed=passed
     )
+    _set_score(audit, 70, "LLM assessment skipped")  # Default if no LLM
+    return audit
+
+
+def _set_score(audit: TranscriptAudit, quality_score: int, llm_assessment: str) -> None:
+    """Record the quality score and decide pass/fail."""
+    audit.quality_score = quality_score
+    audit.llm_assessment = llm_assessment
+    audit.passed = audit.error_count == 0 and quality_score >= 50
+
+
+def apply_llm_assessment(audit: TranscriptAudit) -> TranscriptAudit:
+    """Score *audit*'s transcript with the LLM, in place."""
+    content = audit.filepath.read_text(encoding='utf-8')
+    _set_score(audit, *assess_with_llm(content, audit.elder_id, audit.filepath))
+    return audit
+
+
+def audit_transcript(filepath: Path, use_llm: bool = True) -> TranscriptAudit:
+    """Perform complete audit on a single transcript."""
+    audit = rule_based_audit(filepath)
+    if use_llm:
+        apply_llm_assessment(audit)
+    return audit
+
+
+# Bump when the rule-based checks change so cached results are redone
+AUDIT_RULES_VERSION = 1
+AUDIT_CACHE_FILENAME = "audit_cache.json"
+REPORT_FILENAME = "audit_report.txt"
+
+
+def file_digest(filepath: Path) -> str:
+    """Content hash identifying a version of a transcript."""
+    return hashlib.sha1(filepath.read_bytes()).hexdigest()
+
+
+class AuditCache:
+    """Audit results per transcript, persisted as JSON in the knowledge dir.
+
+    Entries are keyed by path relative to the knowledge directory and hold
+    the content hash the result was computed for, so a file is only audited
+    again when its content (or AUDIT_RULES_VERSION) changes. An entry also
+    records whether the LLM assessment ran, so a later LLM run can reuse the
+    rule-based issues and only ask the LLM.
+    """
+
+    def __init__(self, path: Path | None = None, knowledge_dir: Path | None = None):
+        self.knowledge_dir = knowledge_dir or get_knowledge_dir()
+        self.path = path or self.knowledge_dir / AUDIT_CACHE_FILENAME
+        self.entries: dict[str, dict] = {}
+        self.last_run: float | None = None
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+                self.entries = data.get("entries", {})
+                self.last_run = data.get("last_run")
+            except (OSError, ValueError):
+                pass  # Start over rather than fail the audit
+
+    def _key(self, filepath: Path) -> str:
+        return filepath.relative_to(self.knowledge_dir).as_posix()
+
+    def get(self, filepath: Path, digest: str | None = None) -> tuple[TranscriptAudit, bool] | None:
+        """(audit, llm_assessed) cached for *filepath*.
+
+        Args:
+            filepath: Transcript path
+            digest: Current content hash; None accepts whatever is cached
+
+        Returns:
+            None if nothing usable is cached
+        """
+        entry = self.entries.get(self._key(filepath))
+        if entry is None or entry.get("rules") != AUDIT_RULES_VERSION:
+            return None
+        if digest is not None and entry.get("digest") != digest:
+            return None
+        audit = TranscriptAudit.from_dict(entry["audit"])
+        audit.filepath = filepath
+        return audit, entry.get("llm", False)
+
+    def put(self, audit: TranscriptAudit, digest: str, llm_assessed: bool) -> None:
+        data = audit.to_dict()
+        data["filepath"] = self._key(audit.filepath)
+        self.entries[self._key(audit.filepath)] = {
+            "digest": digest,
+            "rules": AUDIT_RULES_VERSION,
+            "llm": llm_assessed,
+            "audited_at": time.time(),
+            "audit": data,
+        }
+
+    def prune(self) -> int:
+        """Drop entries for files that no longer exist; returns how many."""
+        gone = [key for key in self.entries if not (self.knowledge_dir / key).exists()]
+        for key in gone:
+            del self.entries[key]
+        return len(gone)
+
+    def results(self, elder_ids: list[str] | None = None) -> list[TranscriptAudit]:
+        """All cached audits of existing files, sorted by path."""
+        results = []
+        for key in sorted(self.entries):
+            filepath = self.knowledge_dir / key
+            if elder_ids and key.split("/", 1)[0] not in elder_ids:
+                continue
+            if filepath.exists():
+                cached = self.get(filepath)
+                if cached is not None:
+                    results.append(cached[0])
+        return results
+
+    def save(self, last_run: float | None = None) -> None:
+        if last_run is not None:
+            self.last_run = last_run
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"last_run": self.last_run, "entries": self.entries}))
+        os.replace(tmp, self.path)
+
+
+_SINCE_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_since(value: str, last_run: float | None = None) -> float:
+    """Turn a --since value into a timestamp.
+
+    Accepts "last" (the previous audit run), a relative age such as "30m",
+    "12h", "7d" or "2w", or an ISO date/datetime.
+
+    Raises:
+        ValueError: If the value isn't understood, or "last" is given
+            before any audit has run
+    """
+    value = value.strip()
+    if value == "last":
+        if last_run is None:
+            raise ValueError("No previous audit run to compare against")
+        return last_run
+    match = re.fullmatch(r'(\d+)([mhdw])', value)
+    if match:
+        return time.time() - int(match.group(1)) * _SINCE_UNITS[match.group(2)]
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid --since value: {value!r} (use 'last', e.g. '2d', or an ISO date)") from None
+
+
+def _audit_workers(workers: int | None) -> int:
+    workers = workers if workers is not None else get_config_value("audit_workers", 0)
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def _print_audit(audit: TranscriptAudit, rel_path: Path, use_llm: bool, label: str) -> None:
+    print(f"\n{label} {rel_path}")
+    status = "✓ PASS" if audit.passed else "✗ FAIL"
+    print(f"  {status} | Score: {audit.quality_score}/100 | "
+          f"Words: {audit.word_count:,} | "
+          f"Errors: {audit.error_count} | Warnings: {audit.warning_count}")
+
+    if audit.llm_assessment and use_llm:
+        print(f"  Assessment: {audit.llm_assessment[:100]}...")
+
+    # Show critical issues
+    for issue in audit.issues:
+        if issue.severity == "error":
+            print(f"  ❌ ERROR: {issue.category} - {issue.description}")
+        elif issue.severity == "warning":
+            print(f"  ⚠️  WARNING: {issue.category} - {issue.description}")
 
 
 def run_full_audit(
     elder_ids: list[str] | None = None,
     use_llm: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    since: float | None = None,
+    workers: int | None = None,
+    llm_workers: int | None = None,
+    use_cache: bool = True,
 ) -> list[TranscriptAudit]:
-    """Run audit on all transcripts in knowledge base."""
+    """Run audit on all transcripts in knowledge base.
+
+    Files whose content hash matches the audit cache are not audited again.
+    The rule-based checks for the rest run in a process pool, and each file
+    goes on to a smaller thread pool for the LLM assessment as soon as its
+    checks are done.
+
+    Args:
+        elder_ids: Only audit these elders' transcripts
+        use_llm: Score transcripts with the LLM
+        verbose: Print progress and the summary report
+        since: Only look at files modified after this timestamp; older
+            files keep their cached result (see parse_since())
+        workers: Processes for the rule-based checks (default: audit_workers
+            config, 0 = one per CPU core)
+        llm_workers: Concurrent LLM assessments (default: audit_llm_workers)
+        use_cache: Reuse and update the audit cache
+
+    Returns:
+        Audits of every matching transcript, cached or new, sorted by path
+    """
     knowledge_dir = get_knowledge_dir()
 
     if not knowledge_dir.exists():
         print("Knowledge directory not found!")
         return []
 
-    # Find all transcript files
-    all_files = list(knowledge_dir.glob("**/*.txt"))
+    started = time.time()
+    cache = AuditCache(knowledge_dir=knowledge_dir) if use_cache else None
+
+    # Find all transcript files (elder files live in per-elder directories)
+    all_files = [f for f in knowledge_dir.glob("**/*.txt") if len(f.relative_to(knowledge_dir).parts) > 1]
 
     if elder_ids:
-        all_files = [f for f in all_files if any(
-            f.relative_to(knowledge_dir).parts[0] == eid for eid in elder_ids
-        )]
+        all_files = [f for f in all_files if f.relative_to(knowledge_dir).parts[0] in elder_ids]
+
+    # Split into cached results and files to (re)audit
+    results: dict[Path, TranscriptAudit] = {}
+    to_check: list[tuple[Path, str]] = []
+    to_assess: list[tuple[TranscriptAudit, str]] = []
+    for filepath in sorted(all_files):
+        if since is not None and filepath.stat().st_mtime < since:
+            cached = cache.get(filepath) if cache else None
+            if cached is not None:
+                results[filepath] = cached[0]
+            continue
+        digest = file_digest(filepath)
+        cached = cache.get(filepath, digest) if cache else None
+        if cached is None:
+            to_check.append((filepath, digest))
+        elif use_llm and not cached[1]:
+            to_assess.append((cached[0], digest))
+        else:
+            results[filepath] = cached[0]
 
     if verbose:
         print("\n" + "=" * 70)
         print("TRANSCRIPT AUDIT")
         print("=" * 70)
-        print(f"\nFound {len(all_files)} transcript files to audit")
+        print(f"\nFound {len(all_files)} transcript files: {len(to_check)} to audit, "
+              f"{len(to_assess)} to assess, {len(results)} unchanged")
         print("-" * 70)
 
-    results = []
-
-    for i, filepath in enumerate(sorted(all_files)):
-        rel_path = filepath.relative_to(knowledge_dir)
+    done = [0]
+    pending = len(to_check) + len(to_assess)
+    llm_workers = llm_workers or get_config_value("audit_llm_workers", 2)
 
+    def finish(audit: TranscriptAudit, digest: str, llm_assessed: bool) -> None:
+        results[audit.filepath] = audit
+        if cache is not None:
+            cache.put(audit, digest, llm_assessed)
+        done[0] += 1
         if verbose:
-            print(f"\n[{i+1}/{len(all_files)}] Auditing: {rel_path}")
+            _print_audit(audit, audit.filepath.relative_to(knowledge_dir), use_llm, f"[{done[0]}/{pending}]")
 
-        try:
-            audit = audit_transcript(filepath, use_llm=use_llm)
-            results.append(audit)
-
-            if verbose:
-                status = "✓ PASS" if audit.passed else "✗ FAIL"
-                print(f"  {status} | Score: {audit.quality_score}/100 | "
-                      f"Words: {audit.word_count:,} | "
-                      f"Errors: {audit.error_count} | Warnings: {audit.warning_count}")
-
-                if audit.llm_assessment and use_llm:
-                    print(f"  Assessment: {audit.llm_assessment[:100]}...")
+    def failed(filepath: Path, error: Exception) -> None:
+        done[0] += 1
+        if verbose:
+            print(f"\n[{done[0]}/{pending}] {filepath.relative_to(knowledge_dir)}")
+            print(f"  ❌ Failed to audit: {error}")
 
-                # Show critical issues
-                for issue in audit.issues:
-                    if issue.severity == "error":
-                        print(f"  ❌ ERROR: {issue.category} - {issue.description}")
-                    elif issue.severity == "warning" and verbose:
-                        print(f"  ⚠️  WARNING: {issue.category} - {issue.description}")
+    with ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="audit-llm") as llm_pool:
+        llm_futures = {llm_pool.submit(apply_llm_assessment, audit): (audit, digest) for audit, digest in to_assess}
 
-        except Exception as e:
-            if verbose:
-                print(f"  ❌ Failed to audit: {e}")
+        def checked(audit: TranscriptAudit, digest: str) -> None:
+            if use_llm:
+                llm_futures[llm_pool.submit(apply_llm_assessment, audit)] = (audit, digest)
+            else:
+                finish(audit, digest, False)
+
+        workers = min(_audit_workers(workers), len(to_check))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(rule_based_audit, filepath, knowledge_dir): (filepath, digest)
+                    for filepath, digest in to_check
+                }
+                for future in as_completed(futures):
+                    filepath, digest = futures[future]
+                    try:
+                        checked(future.result(), digest)
+                    except Exception as e:
+                        failed(filepath, e)
+        else:
+            for filepath, digest in to_check:
+                try:
+                    checked(rule_based_audit(filepath, knowledge_dir), digest)
+                except Exception as e:
+                    failed(filepath, e)
+
+        for future in as_completed(llm_futures):
+            audit, digest = llm_futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed(audit.filepath, e)
+                continue
+            # A failed LLM call is scored 50 by assess_with_llm; try again next run
+            finish(audit, digest, not audit.llm_assessment.startswith("LLM assessment failed"))
+
+    if cache is not None:
+        cache.prune()
+        cache.save(last_run=started)
+
+    results_list = [results[f] for f in sorted(results)]
 
     # Summary report
     if verbose:
-        generate_summary_report(results)
+        generate_summary_report(results_list)
 
-    return results
+    return results_list
 
 
-def generate_summary_report(results: list[TranscriptAudit]) -> str:
-    """Generate a summary report of the audit."""
+def generate_summary_report(results: list[TranscriptAudit] | None = None) -> str:
+    """Generate a summary report of the audit.
+
+    Args:
+        results: Audits to report on (default: everything in the audit cache)
+    """
+    if results is None:
+        results = AuditCache().results()
     report_lines = []
 
     report_lines.append("\n" + "=" * 70)
@@ -523,7 +870,7 @@ def generate_summary_report(results: list[TranscriptAudit]) -> str:
     print(report)
 
     # Save report
-    report_path = get_knowledge_dir() / "audit_report.txt"
+    report_path = get_knowledge_dir() / REPORT_FILENAME
     with open(report_path, 'w') as f:
         f.write(report)
     print(f"\nReport saved to: {report_path}")
@@ -578,16 +925,45 @@ def fix_common_issues(filepath: Path, dry_run: bool = True) -> list[str]:
     return fixes_made
 
 
-if __name__ == "__main__":
-    import sys
-
-    # Parse simple command line args
-    use_llm = "--no-llm" not in sys.argv
-    elder_filter = None
+def main():
+    """CLI entry point."""
+    import argparse
 
-    for i, arg in enumerate(sys.argv):
-        if arg == "--elder" and i + 1 < len(sys.argv):
-            elder_filter = [sys.argv[i + 1]]
+    parser = argparse.ArgumentParser(description="Audit knowledge base transcripts")
+    parser.add_argument("--elder", action="append", help="Only audit this elder (repeatable)")
+    parser.add_argument("--no-llm", action="store_true", help="Skip the LLM quality assessment")
+    parser.add_argument(
+        "--since",
+        help="Only audit files modified since: 'last' (previous run), an age like '2d' or '12h', or an ISO date",
+    )
+    parser.add_argument("--workers", type=int, help="Processes for the rule-based checks")
+    parser.add_argument("--llm-workers", type=int, help="Concurrent LLM assessments")
+    parser.add_argument("--no-cache", action="store_true", help="Re-audit every file and leave the cache alone")
+    parser.add_argument("--report", action="store_true", help="Print the summary report from cached results only")
+    args = parser.parse_args()
+
+    if args.report:
+        generate_summary_report()
+        return
+
+    since = None
+    if args.since:
+        try:
+            since = parse_since(args.since, AuditCache().last_run)
+        except ValueError as e:
+            parser.error(str(e))
 
+    use_llm = not args.no_llm
     print(f"Running audit (LLM: {'enabled' if use_llm else 'disabled'})...")
-    run_full_audit(elder_ids=elder_filter, use_llm=use_llm)
+    run_full_audit(
+        elder_ids=args.elder,
+        use_llm=use_llm,
+        since=since,
+        workers=args.workers,
+        llm_workers=args.llm_workers,
+        use_cache=not args.no_cache,
+    )
+
+
+if __name__ == "__main__":
+    main()
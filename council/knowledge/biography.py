@@ -1,11 +1,34 @@
-"""Biography fetcher -- Wikipedia REST API with LLM fallback."""
+"""Biography fetcher -- Wikipedia REST API with LLM fallback.
 
+Wikipedia biographies are cached on disk by name (``biographies.json`` in
+the knowledge directory) for ``biography_cache_ttl`` seconds, so
+nominations, enrichment and ``/api/biography`` share one lookup per person.
+LLM-written biographies are focused on the expertise asked for, so they
+are not cached.
+get_biography_async runs the lookup on a background thread, for callers
+such as the live discussion streams that must not wait on the network.
+"""
+
+import json
+import os
+import threading
+import time
 import urllib.parse
 import urllib.request
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
 
+from council.config import get_config_value, get_knowledge_dir
 from council.llm import chat
 
+try:
+    import fcntl
+except ImportError:  # Windows: only the in-process lock applies
+    fcntl = None
+
+CACHE_FILENAME = "biographies.json"
+
 
 def fetch_wikipedia_summary(name: str) -> dict | None:
     """Fetch a summary from the Wikipedia REST API.
@@ -56,14 +79,165 @@ def generate_llm_biography(name: str, expertise: str) -> str:
     return "".join(chat(messages, stream=True))
 
 
-def get_biography(name: str, expertise: str = "") -> dict:
-    """Get a biography for a person -- Wikipedia first, then LLM fallback."""
-    wiki = fetch_wikipedia_summary(name)
-    if wiki:
-        return wiki
+def _cache_key(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+class BiographyCache:
+    """JSON file of biographies by (normalised) name.
+
+    Safe to share between threads and processes: each write re-reads the
+    file under a lock, so entries saved by other instances are kept.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_knowledge_dir() / CACHE_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._read()
+
+    def get(self, name: str, max_age: float | None = None) -> dict | None:
+        """Cached biography, or None if missing or older than *max_age* seconds."""
+        with self._lock:
+            entry = self._entries.get(_cache_key(name))
+        if entry is None:
+            return None
+        if max_age is not None and time.time() - entry["fetched_at"] > max_age:
+            return None
+        return dict(entry["biography"])
+
+    def put(self, name: str, biography: dict) -> None:
+        with self._lock, self._file_lock():
+            self._entries = self._read()
+            self._entries[_cache_key(name)] = {"biography": biography, "fetched_at": time.time()}
+            self._save()
+
+    def clear(self) -> int:
+        """Delete every entry; returns how many were removed."""
+        with self._lock, self._file_lock():
+            count = len(self._read())
+            self._entries = {}
+            self._save()
+        return count
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared with other instances and processes."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._entries), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+_cache: BiographyCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_biography_cache() -> BiographyCache | None:
+    """The shared cache, or None if biography_cache_enabled is off."""
+    global _cache
+    if not get_config_value("biography_cache_enabled", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = BiographyCache()
+    return _cache
+
 
-    summary = generate_llm_biography(name, expertise)
-    return {
-        "summary": summary,
-        "source": "llm",
-    }
+def _cached(cache: BiographyCache, name: str, max_age: float) -> dict | None:
+    """A cached Wikipedia biography (older files may also hold LLM ones)."""
+    cached = cache.get(name, max_age)
+    if cached is not None and cached.get("source") == "wikipedia":
+        return cached
+    return None
+
+
+def get_biography(name: str, expertise: str = "", max_age: float | None = None) -> dict:
+    """Get a biography for a person -- cache, then Wikipedia, then LLM fallback.
+
+    Args:
+        name: The person's name
+        expertise: Used to focus an LLM-written biography
+        max_age: Oldest cached biography to accept, in seconds
+            (default: biography_cache_ttl)
+
+    Returns:
+        Dict with 'summary' and 'source', plus 'url' and 'thumbnail' from Wikipedia
+    """
+    cache = get_biography_cache()
+    if cache is not None:
+        if max_age is None:
+            max_age = get_config_value("biography_cache_ttl", 2592000)
+        cached = _cached(cache, name, max_age)
+        if cached is not None:
+            return cached
+
+    biography = fetch_wikipedia_summary(name)
+    if not biography:
+        biography = {
+            "summary": generate_llm_biography(name, expertise),
+            "source": "llm",
+        }
+
+    if cache is not None and biography["source"] == "wikipedia":
+        cache.put(name, biography)
+    return biography
+
+
+_executor: ThreadPoolExecutor | None = None
+_in_flight: dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def get_biography_async(name: str, expertise: str = "") -> Future:
+    """Look up a biography in the background.
+
+    A cached biography comes back as an already completed future, and
+    concurrent requests for the same person share one lookup.
+
+    Returns:
+        Future resolving to the get_biography() result
+    """
+    global _executor
+    cache = get_biography_cache()
+    if cache is not None:
+        cached = _cached(cache, name, get_config_value("biography_cache_ttl", 2592000))
+        if cached is not None:
+            future: Future = Future()
+            future.set_result(cached)
+            return future
+
+    key = _cache_key(name)
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="biography")
+        future = _executor.submit(get_biography, name, expertise)
+        _in_flight[key] = future
+
+    def _forget(done: Future) -> None:
+        with _in_flight_lock:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+    future.add_done_callback(_forget)
+    return future
@@ -11,6 +11,7 @@ from pathlib import Path
 from html.parser import HTMLParser
 
 from council.config import get_knowledge_dir
+from council.knowledge.snippets import update_snippet_index
 
 
 # Berkshire Hathaway shareholder letters index
@@ -174,6 +175,7 @@ def save_letter(year: str, content: str) -> Path:
         f.write("---\n\n")
         f.write(content)
 
+    update_snippet_index(filepath)
     return filepath
 
 
@@ -0,0 +1,211 @@
+"""
+Small dependency-graph executor for multi-step background jobs.
+
+Each node is a function that runs once all the nodes it depends on have
+succeeded, and receives their results. Nodes with no path between them run
+concurrently (up to *max_workers* at a time), so independent network and
+LLM calls overlap instead of queueing behind each other.
+
+A failed attempt (an exception, or running past the node's timeout) is
+retried up to ``retries`` times; once a node has failed for good, the nodes
+that depend on it are skipped and everything else carries on. A node can
+also be ordered ``after`` others, which only have to finish, whatever their
+outcome. Python threads
+can't be killed, so a timed-out attempt is abandoned rather than stopped:
+its thread finishes in the background and its result is ignored.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class Node:
+    """One step of a DAG.
+
+    Args:
+        name: Unique node name
+        fn: Called with {dependency name: result} and returns this node's result
+        deps: Names of the nodes that must succeed first
+        after: Names of the nodes that must finish first, successfully or
+            not; their results are not passed in
+        retries: Extra attempts after a failure or timeout
+        timeout: Seconds per attempt (None = no limit)
+        retry_delay: Seconds to wait before retrying
+    """
+
+    name: str
+    fn: Callable[[dict[str, Any]], Any]
+    deps: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    retries: int = 0
+    timeout: float | None = None
+    retry_delay: float = 1.0
+
+
+@dataclass
+class NodeState:
+    """Outcome of a node, updated as the DAG runs."""
+
+    status: str = PENDING
+    attempts: int = 0
+    result: Any = None
+    error: str | None = None
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {"status": self.status, "attempts": self.attempts, "error": self.error, "seconds": round(self.seconds, 2)}
+
+
+@dataclass
+class _Attempt:
+    node: Node
+    future: Future
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def deadline(self) -> float | None:
+        return self.started + self.node.timeout if self.node.timeout is not None else None
+
+
+class DagExecutor:
+    """Run a DAG of nodes concurrently.
+
+    Args:
+        nodes: The nodes; dependencies must name other nodes in the list
+        max_workers: Attempts running at once
+        cancel: Event that stops scheduling; nodes not yet started are
+            marked cancelled and running ones finish
+        on_update: Called with (node name, state) whenever a node changes
+            state (from the thread calling run())
+
+    Raises:
+        ValueError: On unknown dependencies, duplicate names or cycles
+    """
+
+    def __init__(
+        self,
+        nodes: list[Node],
+        max_workers: int = 4,
+        cancel: threading.Event | None = None,
+        on_update: Callable[[str, NodeState], None] | None = None,
+    ):
+        self.nodes = {node.name: node for node in nodes}
+        if len(self.nodes) != len(nodes):
+            raise ValueError("Node names must be unique")
+        for node in nodes:
+            unknown = set(node.deps + node.after) - self.nodes.keys()
+            if unknown:
+                raise ValueError(f"{node.name} depends on unknown nodes: {sorted(unknown)}")
+        self._check_acyclic()
+        self.max_workers = max(1, max_workers)
+        self.cancel = cancel or threading.Event()
+        self.on_update = on_update
+        self.states = {name: NodeState() for name in self.nodes}
+
+    def _check_acyclic(self) -> None:
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through {name}")
+            visiting.add(name)
+            for dep in self.nodes[name].deps + self.nodes[name].after:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.nodes:
+            visit(name)
+
+    def _set(self, name: str, **changes) -> None:
+        state = self.states[name]
+        for key, value in changes.items():
+            setattr(state, key, value)
+        if self.on_update is not None:
+            self.on_update(name, state)
+
+    def _start(self, node: Node) -> _Attempt:
+        future: Future = Future()
+        inputs = {dep: self.states[dep].result for dep in node.deps}
+
+        def target():
+            try:
+                future.set_result(node.fn(inputs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        self._set(node.name, status=RUNNING, attempts=self.states[node.name].attempts + 1)
+        threading.Thread(target=target, name=f"dag-{node.name}", daemon=True).start()
+        return _Attempt(node, future)
+
+    def run(self) -> dict[str, NodeState]:
+        """Run every node; returns the final state of each."""
+        running: dict[Future, _Attempt] = {}
+        retry_at: dict[str, float] = {}
+
+        while True:
+            # Skip nodes whose dependencies failed; start the ready ones
+            for name, node in self.nodes.items():
+                state = self.states[name]
+                if state.status != PENDING:
+                    continue
+                dep_states = [self.states[dep].status for dep in node.deps]
+                after_states = [self.states[dep].status for dep in node.after]
+                if any(s in (FAILED, SKIPPED, CANCELLED) for s in dep_states):
+                    self._set(name, status=SKIPPED)
+                elif self.cancel.is_set():
+                    self._set(name, status=CANCELLED)
+                elif (
+                    all(s == DONE for s in dep_states)
+                    and all(s not in (PENDING, RUNNING) for s in after_states)
+                    and len(running) < self.max_workers
+                    and retry_at.get(name, 0) <= time.monotonic()
+                ):
+                    attempt = self._start(node)
+                    running[attempt.future] = attempt
+
+            if not running and all(s.status != PENDING for s in self.states.values()):
+                return self.states
+
+            # Wait for a result, a timeout or a retry to come due
+            now = time.monotonic()
+            wakeups = [a.deadline for a in running.values() if a.deadline is not None]
+            wakeups += [at for name, at in retry_at.items() if self.states[name].status == PENDING]
+            timeout = max(0.0, min(wakeups) - now) if wakeups else None
+            if running:
+                wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            elif timeout:
+                self.cancel.wait(timeout)
+
+            now = time.monotonic()
+            for future, attempt in list(running.items()):
+                node = attempt.node
+                if future.done():
+                    error = future.exception()
+                    message = None if error is None else f"{type(error).__name__}: {error}"
+                elif attempt.deadline is not None and now >= attempt.deadline:
+                    error, message = TimeoutError(), f"timed out after {node.timeout:g}s"
+                else:
+                    continue
+                del running[future]
+                seconds = self.states[node.name].seconds + now - attempt.started
+                if error is None:
+                    self._set(node.name, status=DONE, result=future.result(), error=None, seconds=seconds)
+                elif self.states[node.name].attempts <= node.retries and not self.cancel.is_set():
+                    retry_at[node.name] = now + node.retry_delay
+                    self._set(node.name, status=PENDING, error=message, seconds=seconds)
+                else:
+                    self._set(node.name, status=FAILED, error=message, seconds=seconds)
@@ -0,0 +1,247 @@
+"""Near-duplicate chunk detection for knowledge ingestion.
+
+Elder corpora repeat themselves: the same Buffett passages across letters,
+one talk uploaded by several YouTube channels, two translations of the same
+Gutenberg text. Each chunk gets a MinHash signature over its word 3-shingles;
+locality-sensitive hashing (banding) finds candidate matches among the
+elder's existing chunks, and a chunk whose estimated Jaccard similarity to an
+existing one reaches the threshold is dropped before embedding.
+
+Signatures persist per elder under ~/.council/knowledge/dedup/{elder_id}/ so
+re-ingestion across runs is deduplicated too, along with the source of each
+signature (so a re-indexed file can drop its old chunks) and per-source counts
+for reporting dedup ratios.
+"""
+
+import json
+import re
+import threading
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from council.config import get_knowledge_dir
+
+NUM_PERM = 64
+BANDS = 8  # 8 bands x 8 rows: candidate threshold ~0.77 Jaccard
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+_rng = np.random.RandomState(1)
+_A = _rng.randint(1, 2**31, size=NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, 2**31, size=NUM_PERM).astype(np.uint64)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text: str) -> set[str]:
+    """Lower-cased word 3-shingles of *text* (words, for very short text)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return set(words)
+    return {
+        " ".join(words[i:i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(text: str) -> np.ndarray:
+    """MinHash signature (NUM_PERM uint32 values) of *text*."""
+    grams = shingles(text)
+    if not grams:
+        return np.full(NUM_PERM, 0xFFFFFFFF, dtype=np.uint32)
+    hashes = np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) for g in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+    permuted = (_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME
+    return (permuted.min(axis=1) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+
+def estimated_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Fraction of matching MinHash slots (estimates Jaccard similarity)."""
+    return float(np.count_nonzero(sig_a == sig_b)) / NUM_PERM
+
+
+def get_dedup_dir(elder_id: str) -> Path:
+    """Directory holding an elder's persisted signature index."""
+    return get_knowledge_dir() / "dedup" / elder_id
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index of one elder's ingested chunks."""
+
+    def __init__(self, elder_id: str, threshold: float = 0.8, root: Path | None = None):
+        self.elder_id = elder_id
+        self.threshold = threshold
+        self.path = root / elder_id if root else get_dedup_dir(elder_id)
+        self._lock = threading.Lock()
+        self._signatures: list[np.ndarray] = []
+        self._owners: list[str | None] = []
+        self._buckets: dict[bytes, list[int]] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+        self._load()
+
+    @property
+    def _signatures_path(self) -> Path:
+        return self.path / "signatures.bin"
+
+    @property
+    def _owners_path(self) -> Path:
+        return self.path / "sources.jsonl"
+
+    @property
+    def _stats_path(self) -> Path:
+        return self.path / "stats.json"
+
+    def _load(self) -> None:
+        if self._signatures_path.exists():
+            raw = self._signatures_path.read_bytes()
+            row_bytes = NUM_PERM * 4
+            usable = len(raw) - len(raw) % row_bytes
+            if usable != len(raw):
+                with open(self._signatures_path, "r+b") as f:
+                    f.truncate(usable)
+            rows = np.frombuffer(raw[:usable], dtype="<u4").reshape(-1, NUM_PERM)
+            owners: list[str | None] = []
+            if self._owners_path.exists():
+                for line in self._owners_path.read_text(encoding="utf-8").splitlines():
+                    try:
+                        owners.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        owners.append(None)
+            # Indexes written before sources were tracked have no owners
+            owners += [None] * (len(rows) - len(owners))
+            for sig, owner in zip(rows, owners):
+                self._insert(sig, owner)
+        if self._stats_path.exists():
+            try:
+                self._stats = json.loads(self._stats_path.read_text())
+            except (OSError, json.JSONDecodeError):
+                self._stats = {}
+
+    def _band_keys(self, sig: np.ndarray) -> list[bytes]:
+        return [
+            bytes([band]) + sig[band * ROWS:(band + 1) * ROWS].tobytes()
+            for band in range(BANDS)
+        ]
+
+    def _insert(self, sig: np.ndarray, owner: str | None = None) -> None:
+        row = len(self._signatures)
+        self._signatures.append(sig)
+        self._owners.append(owner)
+        for key in self._band_keys(sig):
+            self._buckets.setdefault(key, []).append(row)
+
+    def _matches(self, sig: np.ndarray, buckets: dict, signatures: list) -> bool:
+        seen: set[int] = set()
+        for key in self._band_keys(sig):
+            for row in buckets.get(key, ()):
+                if row in seen:
+                    continue
+                seen.add(row)
+                if estimated_jaccard(sig, signatures[row]) >= self.threshold:
+                    return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def check(self, chunks: list[str]) -> tuple[list[bool], list[np.ndarray]]:
+        """Find near-duplicates in *chunks* without modifying the index.
+
+        Returns a keep-mask parallel to *chunks* (False marks a near-duplicate
+        of an indexed chunk or of an earlier chunk in the batch) and the
+        signatures of the kept chunks, to pass to commit() once they are
+        actually stored.
+        """
+        keep: list[bool] = []
+        kept: list[np.ndarray] = []
+        batch_buckets: dict[bytes, list[int]] = {}
+        with self._lock:
+            for chunk in chunks:
+                sig = minhash(chunk)
+                if (self._matches(sig, self._buckets, self._signatures)
+                        or self._matches(sig, batch_buckets, kept)):
+                    keep.append(False)
+                    continue
+                keep.append(True)
+                for key in self._band_keys(sig):
+                    batch_buckets.setdefault(key, []).append(len(kept))
+                kept.append(sig)
+        return keep, kept
+
+    def commit(self, signatures: list[np.ndarray], source: str, total: int) -> None:
+        """Record stored chunks' signatures and the source's dedup counts."""
+        with self._lock:
+            for sig in signatures:
+                self._insert(sig, source)
+            stats = self._stats.setdefault(source, {"chunks": 0, "duplicates": 0})
+            stats["chunks"] += total
+            stats["duplicates"] += total - len(signatures)
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            if signatures:
+                with open(self._signatures_path, "ab") as f:
+                    f.write(np.stack(signatures).astype("<u4").tobytes())
+                with open(self._owners_path, "a", encoding="utf-8") as f:
+                    f.write((json.dumps(source) + "\n") * len(signatures))
+            self._stats_path.write_text(json.dumps(self._stats, indent=2))
+
+    def filter(self, chunks: list[str], source: str = "unknown") -> list[bool]:
+        """check() and immediately commit() the kept chunks."""
+        keep, signatures = self.check(chunks)
+        self.commit(signatures, source, len(chunks))
+        return keep
+
+    def report(self) -> dict[str, dict]:
+        """Per-source chunk counts, duplicates dropped and dedup ratio."""
+        return {
+            source: {
+                **counts,
+                "ratio": round(counts["duplicates"] / counts["chunks"], 3) if counts["chunks"] else 0.0,
+            }
+            for source, counts in sorted(self._stats.items())
+        }
+
+    def remove_source(self, source: str) -> int:
+        """Forget the signatures and statistics recorded for one source.
+
+        Returns the number of signatures removed.
+        """
+        with self._lock:
+            keep = [i for i, owner in enumerate(self._owners) if owner != source]
+            removed = len(self._signatures) - len(keep)
+            if not removed and source not in self._stats:
+                return 0
+
+            signatures = [self._signatures[i] for i in keep]
+            owners = [self._owners[i] for i in keep]
+            self._signatures, self._owners, self._buckets = [], [], {}
+            for sig, owner in zip(signatures, owners):
+                self._insert(sig, owner)
+            self._stats.pop(source, None)
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            sig_bytes = np.stack(signatures).astype("<u4").tobytes() if signatures else b""
+            tmp = self._signatures_path.with_suffix(".tmp")
+            tmp.write_bytes(sig_bytes)
+            tmp.replace(self._signatures_path)
+            tmp = self._owners_path.with_suffix(".tmp")
+            tmp.write_text("".join(json.dumps(o) + "\n" for o in owners), encoding="utf-8")
+            tmp.replace(self._owners_path)
+            self._stats_path.write_text(json.dumps(self._stats, indent=2))
+            return removed
+
+    def clear(self) -> None:
+        """Forget every signature and statistic for this elder."""
+        with self._lock:
+            for path in (self._signatures_path, self._owners_path, self._stats_path):
+                path.unlink(missing_ok=True)
+            self._signatures = []
+            self._owners = []
+            self._buckets = {}
+            self._stats = {}
@@ -11,6 +11,7 @@ A thorough audit that:
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable
 
 from council.config import get_knowledge_dir
 from council.llm import chat
@@ -219,25 +220,98 @@ VERIFICATION_QUOTES = {
 }
 
 
+def _quote_pattern(quote: str) -> re.Pattern:
+    """Approximate match for a quote: its first five words, in order, on one line."""
+    quote_words = quote.lower().split()[:5]
+    return re.compile(r'\b' + r'\b.*\b'.join(re.escape(w) for w in quote_words) + r'\b')
+
+
+class CorpusMatcher:
+    """Finds which quotes and keywords occur in a corpus, one document at a time.
+
+    Documents are fed in turn and dropped, so memory stays at the size of
+    the largest one. A keyword is found once it occurs anywhere in any
+    document; a quote once its _quote_pattern() matches a line.
+
+    Each document is scanned once by a single alternation of every open
+    keyword and quote first word. The alternation sits in a lookahead and
+    is ordered longest first, so at each position it reports the longest
+    term starting there; any shorter term starting at the same position is
+    a substring of it, so overlapping terms are still all found. Only the
+    quotes whose first word turned up get their full pattern checked.
+    Patterns are retired as soon as they're found, and the alternation is
+    rebuilt over what is still missing.
+    """
+
+    def __init__(self, keywords: Iterable[str] = (), quotes: Iterable[str] = ()):
+        self.keywords = list(dict.fromkeys(w.lower() for w in keywords))
+        self.quotes = list(dict.fromkeys(quotes))
+        self._open_keywords = set(self.keywords)
+        # A quote can only match where its first word occurs
+        self._open_quotes = {
+            quote: (quote.lower().split()[0], _quote_pattern(quote))
+            for quote in self.quotes if quote.split()
+        }
+        self._scanner: re.Pattern | None = None
+        self.found_keywords: set[str] = set()
+        self.found_quotes: set[str] = set()
+
+    @property
+    def done(self) -> bool:
+        return not self._open_keywords and not self._open_quotes
+
+    def _terms(self) -> set[str]:
+        return self._open_keywords | {first for first, _ in self._open_quotes.values()}
+
+    def _present(self, text: str) -> set[str]:
+        """Open terms occurring in text, from one pass of the combined pattern."""
+        terms = self._terms()
+        if self._scanner is None:
+            alternation = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+            self._scanner = re.compile(f"(?=({alternation}))")
+        longest = {m.group(1) for m in self._scanner.finditer(text)}
+        return {t for t in terms if any(t in hit for hit in longest)}
+
+    def feed(self, text: str) -> None:
+        """Search one document for everything not found yet."""
+        if self.done:
+            return
+        text = text.lower()
+        present = self._present(text)
+        if not present:
+            return
+        found = self._open_keywords & present
+        self._open_keywords -= found
+        self.found_keywords |= found
+        for quote, (first_word, pattern) in list(self._open_quotes.items()):
+            if first_word in present and pattern.search(text):
+                del self._open_quotes[quote]
+                self.found_quotes.add(quote)
+                found.add(quote)
+        if found:
+            self._scanner = None
+
+    def has_all(self, keywords: Iterable[str]) -> bool:
+        return all(w.lower() in self.found_keywords for w in keywords)
+
+
+def _split_quotes(elder_id: str, matcher: CorpusMatcher) -> tuple[list[str], list[str]]:
+    """(found, missing) expected quotes for an elder, in VERIFICATION_QUOTES order."""
+    found, missing = [], []
+    for quote, _ in VERIFICATION_QUOTES.get(elder_id, []):
+        (found if quote in matcher.found_quotes else missing).append(quote)
+    return found, missing
+
+
 def verify_quotes_in_corpus(elder_id: str, content: str) -> tuple[list[str], list[str]]:
     """Check if known quotes appear in the corpus."""
-    found = []
-    missing = []
-
     if elder_id not in VERIFICATION_QUOTES:
         return [], []
 
-    for quote, _ in VERIFICATION_QUOTES[elder_id]:
-        # Check for approximate match (quotes may vary slightly)
-        quote_words = quote.lower().split()[:5]
-        pattern = r'\b' + r'\b.*\b'.join(re.escape(w) for w in quote_words) + r'\b'
-
-        if re.search(pattern, content.lower()):
-            found.append(quote)
-        else:
-            missing.append(quote)
-
-    return found, missing
+    # Check for approximate match (quotes may vary slightly)
+    matcher = CorpusMatcher(quotes=[quote for quote, _ in VERIFICATION_QUOTES[elder_id]])
+    matcher.feed(content)
+    return _split_quotes(elder_id, matcher)
 
 
 def assess_authenticity(content: str, elder_id: str, source_type: str) -> tuple[int, str, list[str]]:
@@ -301,29 +375,35 @@ def assess_elder_corpus(elder_id: str) -> ElderCorpusAssessment:
             overall_grade="F"
         )
 
-    # Gather all files
+    # Determine what sources we have vs what we're missing
+    canonical = CANONICAL_SOURCES.get(elder_id, {})
+    essential = canonical.get("essential", [])
+    books = canonical.get("books", [])
+    free_available = canonical.get("free_available", [])
+
+    # A source seems present if its first three words all occur in the corpus
+    source_keywords = {source: source.lower().split()[:3] for source in essential}
+
+    # Stream the files once: count words and look for quotes and sources
     all_files = list(knowledge_dir.glob("**/*.txt"))
+    matcher = CorpusMatcher(
+        keywords=[w for words in source_keywords.values() for w in words],
+        quotes=[quote for quote, _ in VERIFICATION_QUOTES.get(elder_id, [])],
+    )
     total_words = 0
-    all_content = ""
     veracity_issues = []
 
     for filepath in all_files:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
-            total_words += len(content.split())
-            all_content += content + "\n"
+        total_words += len(content.split())
+        matcher.feed(content)
 
     # Check for verified quotes
-    found_quotes, missing_quotes = verify_quotes_in_corpus(elder_id, all_content)
+    found_quotes, missing_quotes = _split_quotes(elder_id, matcher)
     if missing_quotes:
         veracity_issues.append(f"Missing expected quotes: {missing_quotes[:2]}")
 
-    # Determine what sources we have vs what we're missing
-    canonical = CANONICAL_SOURCES.get(elder_id, {})
-    essential = canonical.get("essential", [])
-    books = canonical.get("books", [])
-    free_available = canonical.get("free_available", [])
-
     # Estimate completeness based on what we have
     has_youtube = any("youtube" in str(f) for f in all_files)
     has_books = any(f.stem not in ["Key_Wisdom_and_Quotes"] and "youtube" not in str(f) for f in all_files)
@@ -343,14 +423,7 @@ def assess_elder_corpus(elder_id: str) -> ElderCorpusAssessment:
     completeness = min(100, sum(completeness_factors))
 
     # Identify missing sources
-    missing = []
-    for source in essential:
-        source_lower = source.lower()
-        content_lower = all_content.lower()
-        # Check if we seem to have this source
-        key_words = source_lower.split()[:3]
-        if not all(w in content_lower for w in key_words):
-            missing.append(source)
+    missing = [source for source in essential if not matcher.has_all(source_keywords[source])]
 
     # Grade
     if completeness >= 80 and not veracity_issues:
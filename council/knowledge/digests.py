@@ -0,0 +1,173 @@
+"""Precomputed per-elder knowledge digests, one per question category.
+
+Most questions fall into one of the categories in
+council.profile.CATEGORY_KEYWORDS. For each category, a digest holds the
+top-ranked, deduplicated, budgeted context blocks an elder's knowledge base
+returns for that category's keywords. It is built after ingest rather than
+per question, and stored at:
+
+    ~/.council/knowledge/{elder_id}/digests.json
+
+    {
+      "version": 1,
+      "built_at": "2026-01-01T00:00:00Z",
+      "chunks": 1234,
+      "categories": {"career": [[0.9, "text"], ...], ...}
+    }
+
+get_elder_knowledge() serves the digest to the first speaker so that
+retrieval is off the critical path to the first token, while the precise
+semantic query runs in the background for everyone after.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from council.config import get_knowledge_dir
+from council.profile import CATEGORY_KEYWORDS
+
+DIGEST_FILENAME = "digests.json"
+DIGEST_VERSION = 1
+DIGEST_CHARS = 4000  # Matches get_elder_knowledge()'s default budget
+DIGEST_RESULTS = 8
+
+_write_lock = threading.Lock()
+# elder_id -> (digest mtime_ns, categories)
+_cache: dict[str, tuple[int, dict[str, list[tuple[float, str]]]]] = {}
+
+
+def get_digest_path(elder_id: str) -> Path:
+    """Return the digest path for an elder (may not exist yet)."""
+    return get_knowledge_dir() / elder_id / DIGEST_FILENAME
+
+
+def _item_limit(confidence: float, max_chars: int) -> int:
+    """Per-block character limit for a confidence tier."""
+    if confidence < 0.5:
+        return 500
+    if confidence < 0.7:
+        return 1500
+    return max_chars  # No per-item limit for high-confidence
+
+
+def _confidence(metadata: dict, fallback) -> float:
+    confidence = metadata.get("confidence")
+    if isinstance(confidence, (int, float)) and not isinstance(confidence, bool):
+        return float(confidence)
+    return fallback(metadata)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def budget_blocks(parts: list[tuple[float, str]], max_chars: int = DIGEST_CHARS) -> list[tuple[float, str]]:
+    """Order blocks by confidence, drop duplicates and fit them into *max_chars*.
+
+    A block is a duplicate if its text (ignoring case and whitespace) is
+    contained in a block that ranks above it.
+    """
+    kept: list[tuple[float, str]] = []
+    seen: list[str] = []
+    total = 0
+    for confidence, text in sorted(parts, key=lambda p: p[0], reverse=True):
+        if total >= max_chars:
+            break
+        normalized = _normalize(text)
+        if not normalized or any(normalized in other for other in seen):
+            continue
+        text = text[:min(_item_limit(confidence, max_chars), max_chars - total)]
+        kept.append((confidence, text))
+        seen.append(normalized)
+        total += len(text)
+    return kept
+
+
+def build_digest(
+    elder_id: str,
+    store=None,
+    max_chars: int = DIGEST_CHARS,
+    path: Path | None = None,
+) -> int:
+    """(Re)build an elder's digests from their knowledge base.
+
+    Args:
+        elder_id: The elder to build digests for
+        store: KnowledgeStore to query (default: the global store)
+        max_chars: Character budget per category
+        path: Where to write the digest (default: get_digest_path())
+
+    Returns:
+        The number of categories with a non-empty digest
+    """
+    if store is None:
+        from council.knowledge.store import get_knowledge_store
+
+        store = get_knowledge_store()
+
+    from council.knowledge.store import source_confidence
+
+    chunks = store.get_collection(elder_id).count()
+    categories: dict[str, list[tuple[float, str]]] = {}
+    if chunks:
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            results = store.query_tiered(elder_id, " ".join(keywords), n_results=DIGEST_RESULTS)
+            blocks = budget_blocks(
+                [(_confidence(r.get("metadata") or {}, source_confidence), r["content"]) for r in results],
+                max_chars,
+            )
+            if blocks:
+                categories[category] = blocks
+
+    path = path or get_digest_path(elder_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    digest = {
+        "version": DIGEST_VERSION,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "chunks": chunks,
+        "categories": categories,
+    }
+    with _write_lock:
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(digest), encoding="utf-8")
+        tmp_path.replace(path)
+    return len(categories)
+
+
+def remove_digest(elder_id: str, path: Path | None = None) -> None:
+    """Delete an elder's digests (e.g. when their knowledge is cleared)."""
+    with _write_lock:
+        (path or get_digest_path(elder_id)).unlink(missing_ok=True)
+        _cache.pop(elder_id, None)
+
+
+def load_digest(elder_id: str, category: str) -> list[tuple[float, str]] | None:
+    """Return an elder's (confidence, text) blocks for *category*.
+
+    Returns None when there is no digest for the category, so callers can
+    fall back to a live query.
+    """
+    path = get_digest_path(elder_id)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _cache.get(elder_id)
+    if cached is None or cached[0] != mtime_ns:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("version") != DIGEST_VERSION:
+            return None
+        categories = {
+            name: [(float(c), t) for c, t in blocks]
+            for name, blocks in data.get("categories", {}).items()
+        }
+        cached = (mtime_ns, categories)
+        _cache[elder_id] = cached
+
+    return cached[1].get(category)
@@ -0,0 +1,588 @@
+"""Global cross-elder index for picking panelists.
+
+Choosing elders for a question used to cost a full LLM call with
+reasoning before the discussion could start. ElderIndex embeds one
+descriptor per elder instead: name, title, mental models, key works and
+ELDER_EXPERTISE domains. Where the elder has a knowledge base in the same
+embedding space, the descriptor is blended with the centroid of their
+chunk embeddings, so the index reflects what they have actually said. A
+question is then one embedding and a dot product away from a ranked
+shortlist. Maximal Marginal Relevance keeps the panel diverse, and the LLM
+is only consulted to break near-ties at the cut-off.
+
+Descriptor embeddings and centroids are cached at
+``~/.council/knowledge/elder_index.npz``. Entries are re-embedded when an
+elder's descriptor text or the embedding model changes. Centroids are kept
+as a running sum of chunk embeddings that the store updates with the chunks
+it adds or removes; the collection is only scanned when that sum is missing
+or out of step with the chunk count. At startup the
+persisted centroids are used as-is while stale ones are recomputed in the
+background, and the global index picks up elders registered later (custom
+or nominated ones) on its next use.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from council.config import get_knowledge_dir
+
+INDEX_FILENAME = "elder_index.npz"
+CENTROID_WEIGHT = 0.5  # Centroid share of an elder's vector when one exists
+DEFAULT_LAMBDA = 0.7  # MMR relevance/diversity trade-off for panels
+DEFAULT_TIE_MARGIN = 0.02  # Relevance gap below which the cut-off is a tie
+
+TieBreaker = Callable[[str, list[str], int], list[str]]
+
+
+def elder_descriptor(elder) -> str:
+    """Text describing what an elder is an authority on."""
+    from council.smart_refinement import ELDER_EXPERTISE
+
+    parts = [f"{elder.name}, {elder.title}."]
+    if elder.mental_models:
+        parts.append("Mental models: " + ", ".join(elder.mental_models) + ".")
+    if elder.key_works:
+        parts.append("Key works: " + ", ".join(elder.key_works) + ".")
+    expertise = ELDER_EXPERTISE.get(elder.id)
+    if expertise:
+        parts.append("Expertise: " + ", ".join(expertise["domains"]) + ".")
+        parts.append(f"Style: {expertise['style']}.")
+    return " ".join(parts)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+@dataclass
+class ElderSelection:
+    """A ranked panel, how it was chosen and how long it took."""
+
+    elder_ids: list[str]
+    scores: dict[str, float]
+    method: str  # "index" or "index+llm"
+    latency_ms: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "elder_ids": self.elder_ids,
+            "scores": self.scores,
+            "method": self.method,
+            "latency_ms": self.latency_ms,
+        }
+
+
+class ElderIndex:
+    """Descriptor and corpus-centroid embeddings for every elder."""
+
+    def __init__(self, store=None, path: Path | None = None, embedding_function=None):
+        """
+        Args:
+            store: KnowledgeStore used for embeddings and centroids
+                (default: the global store)
+            path: Cache file (default: ~/.council/knowledge/elder_index.npz)
+            embedding_function: Embed with this instead of the store's
+                default; centroids are only used if they share its model
+        """
+        self._store = store
+        self.path = path or get_knowledge_dir() / INDEX_FILENAME
+        self._embedding_function = embedding_function
+        self._lock = threading.RLock()
+        self.elder_ids: list[str] = []
+        self._descriptors: dict[str, np.ndarray] = {}
+        self._hashes: dict[str, str] = {}
+        self._centroids: dict[str, np.ndarray] = {}
+        self._centroid_sums: dict[str, np.ndarray] = {}  # Sum of normalized chunk embeddings
+        self._centroid_counts: dict[str, int] = {}
+        self._unsaved = False
+        self._vectors: np.ndarray | None = None
+
+    @property
+    def store(self):
+        if self._store is None:
+            from council.knowledge.store import get_knowledge_store
+
+            self._store = get_knowledge_store()
+        return self._store
+
+    @property
+    def embedding_function(self):
+        return self._embedding_function or self.store.embedding_function
+
+    @property
+    def model_id(self) -> str:
+        from council.knowledge.embedding_cache import embedding_model_id
+
+        return embedding_model_id(self.embedding_function)
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        vectors = self.store.embed(texts, self.embedding_function)
+        return _normalize(np.asarray(vectors, dtype=np.float32))
+
+    # -- Building -----------------------------------------------------------
+
+    def build(self, elders=None, centroids: bool = True, background: bool = False) -> "ElderIndex":
+        """Load the cache and (re)embed whatever is missing or stale.
+
+        Args:
+            elders: Elders to index (default: every registered elder)
+            centroids: Blend in knowledge-base centroids where available
+            background: Recompute stale centroids in a daemon thread,
+                using the persisted ones until they are done
+
+        Returns:
+            self
+        """
+        if elders is None:
+            from council.elders import ElderRegistry
+
+            elders = ElderRegistry.get_all()
+
+        with self._lock:
+            self._load()
+            descriptors = {e.id: elder_descriptor(e) for e in elders}
+            hashes = {
+                eid: hashlib.sha1(text.encode("utf-8")).hexdigest()
+                for eid, text in descriptors.items()
+            }
+            stale = [eid for eid in descriptors if self._hashes.get(eid) != hashes[eid]]
+            if stale:
+                for eid, vector in zip(stale, self._embed([descriptors[eid] for eid in stale])):
+                    self._descriptors[eid] = vector
+                    self._hashes[eid] = hashes[eid]
+
+            self.elder_ids = list(descriptors)
+            self._rebuild_vectors()
+            self._save()
+
+        if centroids:
+            elder_ids = self._elders_with_knowledge(self.elder_ids)
+            if background:
+                threading.Thread(
+                    target=self.refresh_centroids, args=(elder_ids,),
+                    name="elder-index-centroids", daemon=True,
+                ).start()
+            else:
+                self.refresh_centroids(elder_ids)
+        return self
+
+    def _elders_with_knowledge(self, elder_ids: list[str]) -> list[str]:
+        from council.knowledge.versions import collection_name
+
+        try:
+            names = {c.name for c in self.store.client.list_collections()}
+        except Exception:
+            return []
+        registry = self.store.registry
+        return [
+            eid for eid in elder_ids
+            if collection_name(eid, registry.live(eid)) in names
+        ]
+
+    def _compute_centroid(self, elder_id: str, page: int = 1000) -> tuple[np.ndarray | None, int | None] | None:
+        """An elder's (embedding sum, chunk count), or None if the cached one is current.
+
+        Reads the collection without holding the index lock, so queries
+        keep running while a large corpus is scanned.
+        """
+        from council.knowledge.embedding_cache import embedding_model_id
+
+        store = self.store
+        if embedding_model_id(store.embedding_function_for(elder_id)) != self.model_id:
+            return None, None
+
+        collection = store.get_collection(elder_id)
+        count = collection.count()
+        if count == self._centroid_counts.get(elder_id):
+            return None
+
+        total = None
+        offset = 0
+        while True:
+            batch = collection.get(include=["embeddings"], limit=page, offset=offset)
+            ids = batch.get("ids") or []
+            if not ids:
+                break
+            block = _normalize(np.asarray(batch["embeddings"], dtype=np.float32)).sum(axis=0, dtype=np.float64)
+            total = block if total is None else total + block
+            offset += len(ids)
+
+        return total, count
+
+    def update_centroid(
+        self,
+        elder_id: str,
+        model_id: str,
+        count: int,
+        added=(),
+        removed=(),
+    ) -> None:
+        """Fold chunks just added to or removed from an elder's knowledge into their centroid.
+
+        Called by the store after each write, so the debounced refresh has
+        nothing to scan. If the running sum is missing or out of step with
+        *count*, it is left for refresh_centroids() to recompute.
+
+        Args:
+            elder_id: The elder whose collection changed
+            model_id: Embedding model of that collection
+            count: Chunks in the collection after the change
+            added: Embeddings of the chunks added
+            removed: Embeddings of the chunks removed
+        """
+        if elder_id not in self.elder_ids or model_id != self.model_id:
+            return
+        with self._lock:
+            total = self._centroid_sums.get(elder_id)
+            known = self._centroid_counts.get(elder_id)
+            if known is None and count == len(added) and not len(removed):
+                known = 0  # First chunks of a new knowledge base
+            if known is None or (total is None and known):
+                return
+            for vectors, sign in ((added, 1), (removed, -1)):
+                if len(vectors):
+                    block = _normalize(np.asarray(vectors, dtype=np.float32)).sum(axis=0, dtype=np.float64)
+                    total = block * sign if total is None else total + sign * block
+                    known += sign * len(vectors)
+            if known != count:
+                return
+            self._set_centroid(elder_id, total, count)
+            self._rebuild_vectors()
+            self._unsaved = True
+
+    def _set_centroid(self, elder_id: str, total: np.ndarray | None, count: int | None) -> None:
+        if total is None or not count:
+            self._centroids.pop(elder_id, None)
+            self._centroid_sums.pop(elder_id, None)
+        else:
+            self._centroid_sums[elder_id] = total
+            self._centroids[elder_id] = _normalize(total).astype(np.float32)
+        if count is None:
+            self._centroid_counts.pop(elder_id, None)
+        else:
+            self._centroid_counts[elder_id] = count
+
+    def refresh_centroids(self, elder_ids: list[str]) -> None:
+        """Pick up new or removed knowledge for the given elders."""
+        updates = {}
+        for eid in elder_ids:
+            try:
+                update = self._compute_centroid(eid)
+            except Exception:
+                continue
+            if update is not None:
+                updates[eid] = update
+        if not updates and not self._unsaved:
+            return
+
+        with self._lock:
+            for eid, (total, count) in updates.items():
+                self._set_centroid(eid, total, count)
+            self._rebuild_vectors()
+            self._save()
+
+    def refresh_centroid(self, elder_id: str) -> None:
+        """Pick up new or removed knowledge for one elder."""
+        if elder_id in self.elder_ids:
+            self.refresh_centroids([elder_id])
+
+    def _rebuild_vectors(self) -> None:
+        rows = []
+        for eid in self.elder_ids:
+            vector = self._descriptors[eid]
+            centroid = self._centroids.get(eid)
+            if centroid is not None and centroid.shape == vector.shape:
+                vector = (1.0 - CENTROID_WEIGHT) * vector + CENTROID_WEIGHT * centroid
+            rows.append(vector)
+        self._vectors = _normalize(np.stack(rows)) if rows else None
+
+    # -- Persistence --------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                descriptors = data["descriptors"]
+                centroids = data["centroids"]
+                # Files written before running sums were kept have none;
+                # those centroids are recomputed once the collection changes
+                sums = data["centroid_sums"] if "centroid_sums" in data.files else None
+        except (OSError, KeyError, ValueError):
+            return
+        if meta.get("model") != self.model_id:
+            return  # Different embedding space; start over
+
+        for i, eid in enumerate(meta["elder_ids"]):
+            self._descriptors.setdefault(eid, descriptors[i])
+            self._hashes.setdefault(eid, meta["hashes"][i])
+            count = meta["centroid_counts"][i]
+            if count is not None and eid not in self._centroid_counts:
+                self._centroids[eid] = centroids[i]
+                self._centroid_counts[eid] = count
+                if sums is not None and meta.get("summed", [])[i:i + 1] == [True]:
+                    self._centroid_sums[eid] = sums[i]
+
+    def _save(self) -> None:
+        ids = [eid for eid in self.elder_ids if eid in self._descriptors]
+        if not ids:
+            return
+        descriptors = np.stack([self._descriptors[eid] for eid in ids])
+        centroids = np.zeros_like(descriptors)
+        sums = np.zeros(descriptors.shape, dtype=np.float64)
+        counts = []
+        for i, eid in enumerate(ids):
+            centroid = self._centroids.get(eid)
+            if centroid is not None and centroid.shape == descriptors[i].shape:
+                centroids[i] = centroid
+                if eid in self._centroid_sums:
+                    sums[i] = self._centroid_sums[eid]
+                counts.append(self._centroid_counts.get(eid))
+            else:
+                counts.append(None)
+        meta = {
+            "model": self.model_id,
+            "elder_ids": ids,
+            "hashes": [self._hashes[eid] for eid in ids],
+            "centroid_counts": counts,
+            "summed": [eid in self._centroid_sums for eid in ids],
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f, meta=np.array(json.dumps(meta)), descriptors=descriptors,
+                    centroids=centroids, centroid_sums=sums,
+                )
+            tmp_path.replace(self.path)
+            self._unsaved = False
+        except OSError:
+            pass  # The cache is an optimization
+
+    # -- Querying -----------------------------------------------------------
+
+    def rank(self, question: str, elder_ids: list[str] | None = None) -> list[tuple[str, float]]:
+        """Every (or every given) elder with their relevance, best first."""
+        query = self._embed([question])[0]
+        candidates, vectors = self._candidates(elder_ids)
+        if not candidates:
+            return []
+        relevance = vectors @ query
+        order = np.argsort(-relevance, kind="stable")
+        return [(candidates[i], float(relevance[i])) for i in order]
+
+    def _candidates(self, elder_ids: list[str] | None) -> tuple[list[str], np.ndarray]:
+        with self._lock:
+            if self._vectors is None:
+                return [], np.zeros((0, 0), dtype=np.float32)
+            if elder_ids is None:
+                return list(self.elder_ids), self._vectors
+            wanted = set(elder_ids)
+            rows = [i for i, eid in enumerate(self.elder_ids) if eid in wanted]
+            return [self.elder_ids[i] for i in rows], self._vectors[rows]
+
+    def select(
+        self,
+        question: str,
+        k: int = 3,
+        elder_ids: list[str] | None = None,
+        lambda_mult: float = DEFAULT_LAMBDA,
+        tie_margin: float = DEFAULT_TIE_MARGIN,
+        tie_breaker: TieBreaker | None = None,
+    ) -> ElderSelection:
+        """
+        Pick a relevant, diverse panel of *k* elders.
+
+        Args:
+            question: The user's question
+            k: Panel size
+            elder_ids: Restrict the choice to these elders
+            lambda_mult: MMR trade-off; 1.0 ranks by relevance alone
+            tie_margin: Candidates this close to the last pick's relevance
+                are considered tied with it
+            tie_breaker: Called as ``tie_breaker(question, tied_ids, slots)``
+                to fill the contested slots; without one, MMR order stands
+
+        Returns:
+            The selection with per-elder relevance and latency in ms
+        """
+        from council.knowledge.rerank import mmr
+
+        start = time.perf_counter()
+        query = self._embed([question])[0]
+        embedded = time.perf_counter()
+
+        latency = {"embed": (embedded - start) * 1000}
+        candidates, vectors = self._candidates(elder_ids)
+        if not candidates:
+            latency["total"] = latency["embed"]
+            return ElderSelection([], {}, "index", latency)
+        relevance = vectors @ query
+        picked = [candidates[i] for i in mmr(query, vectors, k, lambda_mult)]
+        scores = {eid: float(relevance[i]) for i, eid in enumerate(candidates)}
+        ranked = time.perf_counter()
+
+        method = "index"
+        latency["rank"] = (ranked - embedded) * 1000
+
+        tied, slots = self._tied_band(picked, scores, tie_margin)
+        if tie_breaker is not None and tied:
+            try:
+                chosen = [eid for eid in tie_breaker(question, tied, slots) if eid in tied]
+            except Exception:
+                chosen = []
+            if chosen:
+                chosen = list(dict.fromkeys(chosen))[:slots]
+                kept = [eid for eid in picked if eid not in tied]
+                fill = [eid for eid in picked if eid in tied and eid not in chosen]
+                picked = (kept + chosen + fill)[:len(picked)]
+                method = "index+llm"
+            latency["tiebreak"] = (time.perf_counter() - ranked) * 1000
+
+        latency["total"] = (time.perf_counter() - start) * 1000
+        return ElderSelection(picked, {eid: scores[eid] for eid in picked}, method, latency)
+
+    @staticmethod
+    def _tied_band(picked: list[str], scores: dict[str, float], margin: float) -> tuple[list[str], int]:
+        """Elders within *margin* of the cut-off, and how many slots they contest."""
+        unpicked = [eid for eid in scores if eid not in picked]
+        if not picked or not unpicked or margin <= 0:
+            return [], 0
+        cut = min(scores[eid] for eid in picked)
+        contenders = [eid for eid in unpicked if scores[eid] >= cut - margin]
+        if not contenders:
+            return [], 0
+        incumbents = [eid for eid in picked if scores[eid] <= cut + margin]
+        contenders.sort(key=scores.get, reverse=True)
+        return incumbents + contenders, len(incumbents)
+
+
+_elder_index: ElderIndex | None = None
+_elder_index_version: int | None = None  # ElderRegistry.version() it was built for
+_elder_index_lock = threading.Lock()
+
+
+def get_elder_index() -> ElderIndex:
+    """Get the global elder index, building it on first use.
+
+    Rebuilt (re-embedding only new or changed descriptors) whenever elders
+    have been registered or removed since it was last built.
+    """
+    global _elder_index, _elder_index_version
+    from council.elders import ElderRegistry
+
+    version = ElderRegistry.version()
+    if _elder_index is None or _elder_index_version != version:
+        with _elder_index_lock:
+            version = ElderRegistry.version()
+            if _elder_index is None or _elder_index_version != version:
+                _elder_index = (_elder_index or ElderIndex()).build(background=True)
+                _elder_index_version = version
+    return _elder_index
+
+
+def loaded_elder_index() -> ElderIndex | None:
+    """The global elder index if it has been built, without building it."""
+    return _elder_index
+
+
+def _parse_elder_ids(text: str, valid_ids: set[str]) -> list[str]:
+    text = re.sub(r"<reasoning>.*?</reasoning>", "", text, flags=re.DOTALL)
+    selected: list[str] = []
+    for line in text.strip().split("\n"):
+        for part in line.split(","):
+            eid = part.strip().strip("-").strip("*").strip().lower()
+            if eid in valid_ids and eid not in selected:
+                selected.append(eid)
+    return selected
+
+
+def _profile_preamble(profile_context: str, category: str) -> str:
+    if not profile_context:
+        return ""
+    return (
+        f"[User context — use as soft guidance, not hard constraint. "
+        f"Consider their engagement history but still prioritize relevance and diversity.]\n"
+        f"{profile_context}\n\n"
+        f"Question category hint: {category}\n\n"
+    )
+
+
+def llm_tie_breaker(
+    question: str,
+    tied_ids: list[str],
+    slots: int,
+    profile_context: str = "",
+    category: str = "",
+) -> list[str]:
+    """Ask the LLM which of the tied elders should take the contested slots.
+
+    Applies the same creative-tension and surprise criteria, and the same
+    adaptive profile context, as llm_select_elders(). Bind the profile with
+    functools.partial to use this as an ElderIndex tie breaker.
+    """
+    from council.elders import ElderRegistry
+    from council.llm import chat
+
+    lines = []
+    for eid in tied_ids:
+        elder = ElderRegistry.get(eid)
+        if elder:
+            lines.append(f"- {eid}: {elder.name} — {elder.title}")
+    prompt = (
+        f"{_profile_preamble(profile_context, category)}"
+        f"Question: \"{question}\"\n\n"
+        f"Candidates:\n" + "\n".join(lines) + "\n\n"
+        f"Pick the {slots} candidate(s) who would add the most to a panel on this question.\n"
+        f"Prefer, in order: applicable expertise; CREATIVE TENSION (someone likely to disagree "
+        f"with the others); SURPRISE (a non-obvious perspective that adds unexpected depth).\n"
+        f"Output ONLY their ids, one per line."
+    )
+    response = "".join(chat([{"role": "user", "content": prompt}], stream=True))
+    return _parse_elder_ids(response, set(tied_ids))[:slots]
+
+
+def llm_select_elders(question: str, max_elders: int, profile_context: str = "", category: str = "") -> list[str]:
+    """Pick elders with a full LLM call (the pre-index selector)."""
+    import random
+
+    from council.elders import ElderRegistry
+    from council.llm import chat
+
+    elders = list(ElderRegistry.get_all())
+    random.shuffle(elders)  # Prevent positional bias
+    elder_descriptions = "\n".join(
+        f"- {e.id}: {e.name} — {e.title} ({e.era})"
+        for e in elders
+    )
+
+    prompt = (
+        f"{_profile_preamble(profile_context, category)}"
+        f"Given this question:\n\"{question}\"\n\n"
+        f"Available elders:\n{elder_descriptions}\n\n"
+        f"Select exactly {max_elders} elders who would create the BEST discussion panel.\n\n"
+        f"Selection criteria (all must be considered):\n"
+        f"1. RELEVANCE: Who has the most applicable expertise for this specific question?\n"
+        f"2. DIVERSITY: Choose elders who will approach the topic from DIFFERENT angles\n"
+        f"3. CREATIVE TENSION: Include at least one elder who would likely DISAGREE with the others\n"
+        f"4. SURPRISE: Include at least one non-obvious pick whose perspective would add unexpected depth\n\n"
+        f"Think step-by-step about why each pick adds value, then output ONLY the elder IDs, one per line.\n"
+        f"Format:\n<reasoning>your brief reasoning here</reasoning>\n"
+        f"elder_id_1\nelder_id_2\n..."
+    )
+
+    response_text = "".join(chat([{"role": "user", "content": prompt}], stream=True))
+    selected = _parse_elder_ids(response_text, {e.id for e in elders})
+    if not selected:
+        # Fallback: pick 3 defaults
+        selected = [e.id for e in elders[:3]]
+    return selected
@@ -0,0 +1,316 @@
+"""Persistent embedding cache for the knowledge store.
+
+Re-ingesting a collection (after clear_elder(), or on a fresh machine) used to
+re-embed every chunk. Embeddings are a pure function of (model, text), so they
+are cached on disk under:
+
+    ~/.council/knowledge/embeddings/{model_slug}/
+        meta.json     model id, dimension, storage dtype
+        vectors.bin   append-only rows, memory-mapped for reads
+        keys.bin      append-only 32-byte sha256 digests, one per row
+
+Rows are stored as float16, or as int8 with a per-vector float32 scale.
+Vectors are always appended before their key, so a key on disk implies its
+row is complete; any torn tail from an interrupted write is trimmed on open.
+
+Several instances (or processes) may share a cache directory: appends and
+trims happen under an exclusive ``flock`` on ``lock``, and each instance
+picks up rows appended by others from the length of keys.bin.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from council.config import get_knowledge_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the in-process lock applies
+    fcntl = None
+
+KEY_SIZE = 32  # sha256 digest
+DTYPES = ("float16", "int8")
+
+
+def text_key(text: str) -> bytes:
+    """Cache key for a chunk of text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def embedding_model_id(embedding_function: Any) -> str:
+    """Best-effort stable identifier for an embedding function's model."""
+    model_id = getattr(embedding_function, "model_id", None)
+    if model_id:
+        return str(model_id)
+
+    name = type(embedding_function).__name__
+    try:
+        name = str(embedding_function.name())
+    except Exception:
+        pass
+
+    try:
+        config = embedding_function.get_config() or {}
+    except Exception:
+        config = {}
+    model_name = config.get("model_name") or config.get("model")
+    return f"{name}:{model_name}" if model_name else name
+
+
+def quantize_int8(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-vector int8 quantization.
+
+    Returns:
+        (int8 values, float32 scales) such that ``values * scales[:, None]``
+        approximates *vectors*.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1) / 127.0 if len(vectors) else np.zeros(0, np.float32)
+    scales[scales == 0] = 1.0
+    quantized = np.clip(np.round(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def dequantize_int8(values: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Inverse of quantize_int8()."""
+    return values.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
+def get_embedding_cache_dir() -> Path:
+    """Root directory for all embedding caches."""
+    return get_knowledge_dir() / "embeddings"
+
+
+class EmbeddingCache:
+    """Append-only, memory-mapped cache of embeddings for one model."""
+
+    def __init__(self, model_id: str, dtype: str = "float16", root: Path | None = None):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+
+        self.model_id = model_id
+        self.dtype = dtype
+        slug = re.sub(r"[^\w.-]", "_", model_id)[:40]
+        digest = hashlib.sha1(f"{model_id}|{dtype}".encode()).hexdigest()[:8]
+        self.path = (root or get_embedding_cache_dir()) / f"{slug}-{digest}"
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dim: int | None = None
+        self._rows: dict[bytes, int] = {}
+        self._count = 0  # rows on disk this instance has read
+        self._mmap: np.ndarray | None = None
+        self._load()
+
+    # -- file layout ---------------------------------------------------------
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.path / "vectors.bin"
+
+    @property
+    def _keys_path(self) -> Path:
+        return self.path / "keys.bin"
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared with other instances and processes."""
+        with open(self.path / "lock", "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _row_bytes(self) -> int:
+        if self.dtype == "float16":
+            return self._dim * 2
+        return self._dim + 4  # int8 values + float32 scale
+
+    def _load(self) -> None:
+        with self._file_lock():
+            self._load_meta()
+            if self._dim is None:
+                return
+
+            keys = self._keys_path.read_bytes() if self._keys_path.exists() else b""
+            vector_bytes = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+            count = min(len(keys) // KEY_SIZE, vector_bytes // self._row_bytes())
+
+            # Trim any torn tail so future appends stay aligned
+            if len(keys) != count * KEY_SIZE:
+                with open(self._keys_path, "r+b") as f:
+                    f.truncate(count * KEY_SIZE)
+            if vector_bytes != count * self._row_bytes():
+                with open(self._vectors_path, "r+b") as f:
+                    f.truncate(count * self._row_bytes())
+
+        self._rows = {keys[i * KEY_SIZE:(i + 1) * KEY_SIZE]: i for i in range(count)}
+        self._count = count
+
+    def _load_meta(self) -> None:
+        if self._dim is None and self._meta_path.exists():
+            self._dim = int(json.loads(self._meta_path.read_text())["dim"])
+
+    def _sync(self) -> None:
+        """Pick up rows appended to the files by other instances."""
+        try:
+            size = self._keys_path.stat().st_size
+        except OSError:
+            return
+        count = self._count
+        if size // KEY_SIZE <= count:
+            return
+        self._load_meta()
+        with open(self._keys_path, "rb") as f:
+            f.seek(count * KEY_SIZE)
+            tail = f.read((size // KEY_SIZE - count) * KEY_SIZE)
+        for i in range(len(tail) // KEY_SIZE):
+            self._rows.setdefault(tail[i * KEY_SIZE:(i + 1) * KEY_SIZE], count + i)
+        self._count = count + len(tail) // KEY_SIZE
+
+    def _init_dim(self, dim: int) -> None:
+        self._dim = dim
+        self._meta_path.write_text(json.dumps({
+            "model_id": self.model_id,
+            "dim": dim,
+            "dtype": self.dtype,
+        }))
+
+    def _view(self) -> np.ndarray:
+        """Memory-mapped view of all rows, remapped when the file has grown."""
+        if self._mmap is None or len(self._mmap) < self._count:
+            self._mmap = np.memmap(
+                self._vectors_path, dtype=np.uint8, mode="r",
+                shape=(self._count, self._row_bytes()),
+            )
+        return self._mmap
+
+    # -- encoding ------------------------------------------------------------
+
+    def _encode(self, vectors: np.ndarray) -> bytes:
+        if self.dtype == "float16":
+            return vectors.astype("<f2").tobytes()
+        quantized, scales = quantize_int8(vectors)
+        rows = np.empty((len(vectors), self._row_bytes()), dtype=np.uint8)
+        rows[:, :4] = scales.astype("<f4", copy=False).view(np.uint8).reshape(-1, 4)
+        rows[:, 4:] = quantized.view(np.uint8)
+        return rows.tobytes()
+
+    def _decode(self, rows: np.ndarray) -> np.ndarray:
+        if self.dtype == "float16":
+            return rows.view("<f2").astype(np.float32)
+        scales = rows[:, :4].copy().view("<f4").reshape(-1)
+        return dequantize_int8(rows[:, 4:].view(np.int8), scales)
+
+    # -- public API ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, texts: Sequence[str]) -> list[list[float] | None]:
+        """Look up cached embeddings; None for texts not in the cache."""
+        keys = [text_key(t) for t in texts]
+        with self._lock:
+            self._sync()
+            positions = [self._rows.get(k) for k in keys]
+            found = [p for p in positions if p is not None]
+            decoded = self._decode(self._view()[found]) if found else None
+
+        results: list[list[float] | None] = []
+        j = 0
+        for pos in positions:
+            if pos is None:
+                results.append(None)
+                self.misses += 1
+            else:
+                results.append(decoded[j].tolist())
+                j += 1
+                self.hits += 1
+        return results
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """Append embeddings for texts not already cached."""
+        if not texts:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        keys = [text_key(t) for t in texts]
+
+        with self._lock, self._file_lock():
+            self._sync()
+            self._load_meta()
+            if self._dim is None:
+                self._init_dim(vectors.shape[1])
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match "
+                    f"cached dimension {self._dim} for {self.model_id}"
+                )
+
+            new_rows = []
+            new_keys = []
+            for key, vector in zip(keys, vectors):
+                if key in self._rows or key in new_keys:
+                    continue
+                new_rows.append(vector)
+                new_keys.append(key)
+            if not new_keys:
+                return
+
+            # _sync() under the file lock made _count the row count on disk;
+            # drop any vectors a crashed writer appended without their keys
+            start = self._count
+            if self._vectors_path.exists() and self._vectors_path.stat().st_size > start * self._row_bytes():
+                with open(self._vectors_path, "r+b") as f:
+                    f.truncate(start * self._row_bytes())
+            with open(self._vectors_path, "ab") as f:
+                f.write(self._encode(np.stack(new_rows)))
+            with open(self._keys_path, "ab") as f:
+                f.write(b"".join(new_keys))
+
+            for i, key in enumerate(new_keys):
+                self._rows[key] = start + i
+            self._count = start + len(new_keys)
+
+    def embed(
+        self,
+        texts: Sequence[str],
+        embed_fn: Callable[[list[str]], Sequence[Sequence[float]]],
+    ) -> list[list[float]]:
+        """Return embeddings for *texts*, calling *embed_fn* only for misses."""
+        cached = self.get_many(texts)
+        missing = [i for i, vec in enumerate(cached) if vec is None]
+        if missing:
+            fresh = embed_fn([texts[i] for i in missing])
+            fresh = [list(map(float, vec)) for vec in fresh]
+            self.put_many([texts[i] for i in missing], fresh)
+            for i, vec in zip(missing, fresh):
+                cached[i] = vec
+        return cached
+
+    def stats(self) -> dict:
+        """Entry count, hit/miss counters and on-disk size."""
+        size = sum(p.stat().st_size for p in self.path.iterdir() if p.is_file())
+        return {
+            "model_id": self.model_id,
+            "dtype": self.dtype,
+            "entries": len(self._rows),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": size,
+        }
@@ -0,0 +1,348 @@
+"""Embedding functions for the knowledge store.
+
+KnowledgeStore embeds with one of three local backends, chosen by the
+``embedding_backend`` config key (see create_embedding_function()):
+
+- ``chroma``: ChromaDB's default ONNX all-MiniLM-L6-v2 (the default)
+- ``ollama``: an Ollama embedding model via the batch ``/api/embed`` endpoint
+- ``sentence-transformers``: a sentence-transformers model on the CPU
+
+All three split input into ``embedding_batch_size`` batches and embed them
+on ``embedding_threads`` threads, and keep throughput counters for
+``/api/knowledge/metrics``.
+
+This module also has an offline, deterministic alternative for tests and
+benchmarks, where downloading and running a model is not wanted.
+"""
+
+import os
+import re
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from council.config import get_config_value
+
+try:
+    from chromadb.api.types import EmbeddingFunction
+except ImportError:  # chromadb is only needed for the chroma store and model
+    class EmbeddingFunction:
+        """Stand-in for ChromaDB's base class when chromadb is not installed."""
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class HashingEmbeddingFunction(EmbeddingFunction):
+    """Feature-hashing bag of unigrams and bigrams.
+
+    Fast, dependency-free (beyond NumPy) and stable across processes, so
+    results are reproducible. It captures lexical overlap only, which is
+    enough to compare chunking and ranking changes against each other.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    @property
+    def model_id(self) -> str:
+        return f"hashing-{self.dim}"
+
+    def __call__(self, input):
+        vectors = np.zeros((len(input), self.dim), dtype=np.float32)
+        for row, text in enumerate(input):
+            tokens = _TOKEN_RE.findall(text.lower())
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                h = zlib.crc32(feature.encode("utf-8"))
+                vectors[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.maximum(norms, 1e-12)
+        return list(vectors)
+
+    @staticmethod
+    def name() -> str:
+        return "council-hashing"
+
+    def get_config(self) -> dict:
+        return {"dim": self.dim}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "HashingEmbeddingFunction":
+        return HashingEmbeddingFunction(dim=config.get("dim", 256))
+
+
+def _default_threads() -> int:
+    threads = int(get_config_value("embedding_threads", 0) or 0)
+    return threads if threads > 0 else os.cpu_count() or 1
+
+
+class BatchedEmbeddingFunction(EmbeddingFunction):
+    """Base class for backends that embed in fixed-size batches on a thread pool.
+
+    Subclasses implement _load() (create the model or client) and
+    _embed_batch(). Batches run concurrently on up to ``threads`` threads
+    unless the backend sets ``parallel_batches = False`` because it already
+    parallelizes inside one batch.
+    """
+
+    parallel_batches = True
+
+    def __init__(self, batch_size: int | None = None, threads: int | None = None):
+        self.batch_size = max(1, int(batch_size or get_config_value("embedding_batch_size", 64)))
+        self.threads = max(1, int(threads or _default_threads()))
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._stats_lock = threading.Lock()
+        self._texts = 0
+        self._batches = 0
+        self._seconds = 0.0
+        self._warm_up_ms: float | None = None
+
+    def _load(self) -> Any:
+        raise NotImplementedError
+
+    def _embed_batch(self, model: Any, texts: list[str]) -> list:
+        raise NotImplementedError
+
+    @property
+    def model(self) -> Any:
+        """The loaded model or client, created on first use."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = self._load()
+        return self._model
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._load_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.threads, thread_name_prefix="embed"
+                    )
+        return self._executor
+
+    def __call__(self, input):
+        texts = list(input)
+        if not texts:
+            return []
+        model = self.model
+        start = time.perf_counter()
+
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        if len(batches) == 1 or self.threads == 1 or not self.parallel_batches:
+            results = [self._embed_batch(model, batch) for batch in batches]
+        else:
+            results = list(self._pool().map(lambda batch: self._embed_batch(model, batch), batches))
+
+        with self._stats_lock:
+            self._texts += len(texts)
+            self._batches += len(batches)
+            self._seconds += time.perf_counter() - start
+        return [np.asarray(vec, dtype=np.float32) for batch in results for vec in batch]
+
+    def warm_up(self) -> float:
+        """Load the model and embed one text so the first real request is fast.
+
+        Returns:
+            Warm-up time in milliseconds
+        """
+        start = time.perf_counter()
+        self._embed_batch(self.model, ["warm up"])
+        self._warm_up_ms = (time.perf_counter() - start) * 1000
+        return self._warm_up_ms
+
+    def stats(self) -> dict:
+        """Throughput counters since the embedding function was created."""
+        with self._stats_lock:
+            texts, batches, seconds = self._texts, self._batches, self._seconds
+        return {
+            "backend": self.name(),
+            "config": self.get_config(),
+            "batch_size": self.batch_size,
+            "threads": self.threads if self.parallel_batches else 1,
+            "texts": texts,
+            "batches": batches,
+            "seconds": round(seconds, 3),
+            "texts_per_second": round(texts / seconds, 1) if seconds else None,
+            "warm_up_ms": round(self._warm_up_ms, 1) if self._warm_up_ms is not None else None,
+        }
+
+
+class ChromaDefaultEmbeddingFunction(BatchedEmbeddingFunction):
+    """ChromaDB's default ONNX all-MiniLM-L6-v2, with one model kept loaded.
+
+    Chroma's DefaultEmbeddingFunction builds a new ONNX session on every
+    call. This keeps one and reuses it across batches and threads. name()
+    and get_config() match Chroma's, so existing collections, embedding
+    caches and snapshots stay valid.
+    """
+
+    def _load(self):
+        from chromadb.utils.embedding_functions.onnx_mini_lm_l6_v2 import ONNXMiniLM_L6_V2
+
+        model = ONNXMiniLM_L6_V2()
+        # Resolve the lazily created session and tokenizer before threads share them
+        model(["warm up"])
+        return model
+
+    def _embed_batch(self, model, texts):
+        return model(texts)
+
+    @staticmethod
+    def name() -> str:
+        return "default"
+
+    def get_config(self) -> dict:
+        return {}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "ChromaDefaultEmbeddingFunction":
+        return ChromaDefaultEmbeddingFunction()
+
+
+class OllamaEmbeddingFunction(BatchedEmbeddingFunction):
+    """An Ollama embedding model, one ``/api/embed`` request per batch.
+
+    Ollama serves concurrent requests (see OLLAMA_NUM_PARALLEL), so several
+    batches are kept in flight at once.
+    """
+
+    def __init__(
+        self,
+        model: str = "nomic-embed-text",
+        host: str | None = None,
+        batch_size: int | None = None,
+        threads: int | None = None,
+    ):
+        super().__init__(batch_size, threads)
+        self.model_name = model
+        self.host = host or get_config_value("ollama_host", "http://localhost:11434")
+
+    def _load(self):
+        try:
+            import ollama
+        except ImportError:
+            raise ImportError(
+                "The ollama package is required for Ollama embeddings. "
+                "Install it with: pip install ollama"
+            )
+        return ollama.Client(host=self.host)
+
+    def _embed_batch(self, client, texts):
+        return client.embed(model=self.model_name, input=texts)["embeddings"]
+
+    @staticmethod
+    def name() -> str:
+        return "council-ollama"
+
+    def get_config(self) -> dict:
+        return {"model": self.model_name}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "OllamaEmbeddingFunction":
+        return OllamaEmbeddingFunction(model=config.get("model", "nomic-embed-text"))
+
+
+class SentenceTransformerEmbeddingFunction(BatchedEmbeddingFunction):
+    """A sentence-transformers model on the CPU.
+
+    Torch already spreads one batch over ``threads`` cores, so batches run
+    one after another instead of on the thread pool.
+    """
+
+    parallel_batches = False
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int | None = None,
+        threads: int | None = None,
+    ):
+        super().__init__(batch_size, threads)
+        self.model_name = model_name
+
+    def _load(self):
+        try:
+            import torch
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers is required for this embedding backend. "
+                "Install it with: pip install 'council-of-elders[embeddings]'"
+            )
+        torch.set_num_threads(self.threads)
+        return SentenceTransformer(self.model_name, device="cpu")
+
+    def _embed_batch(self, model, texts):
+        return model.encode(
+            texts, batch_size=self.batch_size, normalize_embeddings=True, convert_to_numpy=True
+        )
+
+    @staticmethod
+    def name() -> str:
+        return "council-sentence-transformers"
+
+    def get_config(self) -> dict:
+        return {"model_name": self.model_name}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "SentenceTransformerEmbeddingFunction":
+        return SentenceTransformerEmbeddingFunction(config.get("model_name", "all-MiniLM-L6-v2"))
+
+
+# Embedding functions defined here, by name(), for rebuilding from a spec
+EMBEDDING_FUNCTIONS = {
+    HashingEmbeddingFunction.name(): HashingEmbeddingFunction,
+    ChromaDefaultEmbeddingFunction.name(): ChromaDefaultEmbeddingFunction,
+    OllamaEmbeddingFunction.name(): OllamaEmbeddingFunction,
+    SentenceTransformerEmbeddingFunction.name(): SentenceTransformerEmbeddingFunction,
+}
+
+
+def create_embedding_function(backend: str | None = None, model: str | None = None):
+    """Create the embedding function selected in config.
+
+    Args:
+        backend: "chroma", "ollama" or "sentence-transformers"
+            (default: the ``embedding_backend`` config key)
+        model: Model name for the Ollama and sentence-transformers backends
+            (default: the ``embedding_model`` config key, else the backend's default)
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = backend or get_config_value("embedding_backend", "chroma")
+    model = model or get_config_value("embedding_model", "")
+    if backend == "chroma":
+        return ChromaDefaultEmbeddingFunction()
+    if backend == "ollama":
+        return OllamaEmbeddingFunction(model or "nomic-embed-text")
+    if backend == "sentence-transformers":
+        return SentenceTransformerEmbeddingFunction(model or "all-MiniLM-L6-v2")
+    raise ValueError(f"Unknown embedding backend: {backend}")
+
+
+def embedding_function_from_spec(spec: dict):
+    """Rebuild an embedding function from ``{"name": ..., "config": ...}``.
+
+    Looks in EMBEDDING_FUNCTIONS first, then ChromaDB's registry of known
+    embedding functions.
+
+    Raises:
+        ValueError: If no embedding function has that name
+    """
+    name, config = spec["name"], spec.get("config") or {}
+    if name in EMBEDDING_FUNCTIONS:
+        return EMBEDDING_FUNCTIONS[name].build_from_config(config)
+
+    from chromadb.utils.embedding_functions import known_embedding_functions
+
+    if name in known_embedding_functions:
+        return known_embedding_functions[name].build_from_config(config)
+    raise ValueError(f"Unknown embedding function: {name}")
@@ -6,12 +6,23 @@ Runs in a background thread (via TaskManager) to research a person:
 3. ChromaDB indexing (with audit metadata)
 4. Book discovery (with Open Library verification)
 5. Quote verification (fire-and-forget background task)
+
+The steps form a small DAG (see council.knowledge.dag): biography, YouTube
+search and book discovery are independent and run concurrently; videos
+fan out once the search is done; quote verification waits for every other
+step to finish, whether or not it succeeded.
+Each step's outcome is written to the custom elder's JSON as soon as it is
+known, so a slow or failed step doesn't hold back the others.
 """
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 from council.config import get_config_value
 from council.knowledge.biography import get_biography
+from council.knowledge.dag import DONE, FAILED, RUNNING, DagExecutor, Node, NodeState
+from council.knowledge.indexer import mark_indexed
 from council.knowledge.youtube import (
     clean_transcript,
     get_video_info,
@@ -23,6 +34,116 @@ from council.tasks import TaskProgress
 
 logger = logging.getLogger(__name__)
 
+# Share of the progress bar for each step; videos are pro-rated as they finish
+_STEP_WEIGHTS = {"biography": 0.1, "youtube_search": 0.1, "books": 0.15, "videos": 0.55, "quote_verification": 0.1}
+
+_custom_elder_lock = threading.Lock()
+
+
+def _update_custom_elder(elder_id: str, updates: dict) -> None:
+    """Merge *updates* into the custom elder file, if there is one."""
+    try:
+        from council.elders.custom import update_custom_elder
+
+        # update_custom_elder reads, updates and rewrites the whole file
+        with _custom_elder_lock:
+            update_custom_elder(elder_id, updates)
+    except Exception:
+        pass
+
+
+def _process_video(url: str, storage_id: str, substep: dict, writes: list[Future] | None = None) -> bool:
+    """Download, vet, save, audit and index one video; True if it was saved.
+
+    Progress and audit results are recorded on *substep*. The transcript is
+    indexed through the store's write queue; the queued write is appended
+    to *writes*, and a failed write is recorded on *substep* once it lands.
+    """
+    video_info = get_video_info(url)
+    if not video_info:
+        substep["status"] = "skipped: no transcript"
+        return False
+
+    video_info.transcript = clean_transcript(video_info.transcript)
+
+    is_valid, _ = vet_transcript(
+        video_info.transcript, storage_id, video_info.title
+    )
+    if not is_valid:
+        substep["status"] = "skipped: failed vetting"
+        return False
+
+    saved_path = save_transcript(storage_id, video_info)
+
+    # Run rule-based transcript audit (no LLM — already vetted above)
+    audit_passed = True
+    quality_score = 70
+    try:
+        from council.knowledge.audit import audit_transcript
+
+        audit = audit_transcript(saved_path, use_llm=False)
+        audit_passed = audit.passed
+        quality_score = audit.quality_score
+        substep["audit_passed"] = audit_passed
+        substep["quality_score"] = quality_score
+        if not audit_passed:
+            substep["low_quality"] = True
+    except Exception:
+        pass
+
+    substep["status"] = "done"
+    substep["title"] = video_info.title
+
+    def indexed(write: Future) -> None:
+        error = write.exception()
+        if error is None:
+            mark_indexed(saved_path)
+        else:
+            # Left unmarked, so the background indexer retries the file
+            substep["status"] = f"error: indexing failed: {error}"
+
+    # Index in ChromaDB with audit metadata (queued, so this
+    # worker moves on to the next video while the writer embeds)
+    try:
+        from council.knowledge.store import get_knowledge_store
+
+        store = get_knowledge_store()
+        write = store.add_document_async(
+            storage_id,
+            video_info.transcript,
+            metadata={
+                "source": video_info.url,
+                "type": "youtube",
+                "channel": video_info.channel,
+                "title": video_info.title,
+                "duration": str(video_info.duration // 60),
+                "audit_passed": audit_passed,
+                "quality_score": quality_score,
+            },
+        )
+    except Exception as e:
+        substep["status"] = f"error: indexing failed: {e}"
+        return True
+
+    if writes is not None:
+        writes.append(write)
+    write.add_done_callback(indexed)
+    return True
+
+
+def _transcript_audits(substeps: list[dict]) -> list[dict]:
+    """Audit summaries of the saved transcripts, from the video substeps."""
+    return [
+        {
+            "url": s.get("url", ""),
+            "title": s.get("title", ""),
+            "audit_passed": s.get("audit_passed", True),
+            "quality_score": s.get("quality_score", 70),
+        }
+        for s in substeps
+        if s.get("step", "").startswith("video_") and s.get("status") == "done"
+    ]
+
 
 def enrich_elder(
     *,
@@ -39,194 +160,164 @@ def enrich_elder(
     Returns a summary dict of what was accomplished.
     """
     max_videos = get_config_value("enrichment_youtube_max", 5)
+    video_workers = get_config_value("enrichment_video_workers", 3)
+    step_timeout = get_config_value("enrichment_step_timeout", 300)
     result = {
         "biography": None,
         "youtube_transcripts": 0,
         "books_discovered": 0,
     }
+    # Use the canonical elder ID for storage (strip "custom_" prefix if present)
+    storage_id = elder_id.replace("custom_", "").replace("nominated_", "")
 
-    # ---- Step 1: Biography ------------------------------------------------
-    progress.message = f"Fetching biography for {name}..."
-    progress.progress = 0.05
-    progress.substeps = [{"step": "biography", "status": "running"}]
+    lock = threading.Lock()
+    steps: dict[str, dict] = {}
+    video_steps: list[dict] = []
+    progress.message = f"Researching {name}..."
+    progress.progress = 0.0
+    progress.substeps = []
+
+    def add_substep(substep: dict) -> dict:
+        with lock:
+            progress.substeps.append(substep)
+        return substep
+
+    def update_progress() -> None:
+        with lock:
+            total = 0.0
+            for step, weight in _STEP_WEIGHTS.items():
+                if steps.get(step, {}).get("status") not in (None, "pending", "running"):
+                    total += weight
+                elif step == "videos" and video_steps:
+                    finished = sum(1 for s in video_steps if s["status"] not in ("queued", "running"))
+                    total += weight * finished / len(video_steps)
+            progress.progress = min(total, 0.99)
+
+    def enrichment_status(status: str) -> dict:
+        return {
+            "status": status,
+            "youtube_transcripts": result["youtube_transcripts"],
+            "books_discovered": result.get("books_discovered", 0),
+            "transcript_audits": _transcript_audits(progress.substeps),
+        }
 
-    try:
+    # ---- Steps ------------------------------------------------------------
+    def biography(_):
         bio = get_biography(name, expertise)
         result["biography"] = bio
-        progress.substeps[0]["status"] = "done"
-    except Exception as e:
-        progress.substeps[0]["status"] = f"failed: {e}"
-
-    # ---- Step 2: YouTube search + transcripts -----------------------------
-    progress.message = f"Searching YouTube for {name}..."
-    progress.progress = 0.10
-    progress.substeps.append({"step": "youtube_search", "status": "running"})
-
-    queries = [
-        f'"{name}" interview',
-        f'"{name}" {expertise}',
-        f'"{name}" lecture',
-    ]
-    video_urls: list[str] = []
-    for q in queries:
-        found = search_youtube(q, max_results=3)
-        for url in found:
-            if url not in video_urls:
-                video_urls.append(url)
-        if len(video_urls) >= max_videos:
-            break
-
-    video_urls = video_urls[:max_videos]
-    progress.substeps[-1] = {
-        "step": "youtube_search",
-        "status": "done",
-        "found": len(video_urls),
-    }
-
-    # Process each video
-    saved_count = 0
-    # Use the canonical elder ID for storage (strip "custom_" prefix if present)
-    storage_id = elder_id.replace("custom_", "").replace("nominated_", "")
-
-    for i, url in enumerate(video_urls):
-        step_progress = 0.15 + (0.60 * (i / max(len(video_urls), 1)))
-        progress.progress = step_progress
-        progress.message = f"Processing video {i + 1}/{len(video_urls)}..."
-        progress.substeps.append({
-            "step": f"video_{i + 1}",
-            "status": "running",
-            "url": url,
-        })
-
-        try:
-            video_info = get_video_info(url)
-            if not video_info:
-                progress.substeps[-1]["status"] = "skipped: no transcript"
-                continue
-
-            video_info.transcript = clean_transcript(video_info.transcript)
-
-            is_valid, _ = vet_transcript(
-                video_info.transcript, storage_id, video_info.title
-            )
-            if not is_valid:
-                progress.substeps[-1]["status"] = "skipped: failed vetting"
-                continue
-
-            saved_path = save_transcript(storage_id, video_info)
-
-            # Run rule-based transcript audit (no LLM — already vetted above)
-            audit_passed = True
-            quality_score = 70
+        _update_custom_elder(elder_id, {"biography": bio})
+        return bio
+
+    def youtube_search(_):
+        queries = [
+            f'"{name}" interview',
+            f'"{name}" {expertise}',
+            f'"{name}" lecture',
+        ]
+        video_urls: list[str] = []
+        for q in queries:
+            found = search_youtube(q, max_results=3)
+            for url in found:
+                if url not in video_urls:
+                    video_urls.append(url)
+            if len(video_urls) >= max_videos:
+                break
+        video_urls = video_urls[:max_videos]
+        steps["youtube_search"]["found"] = len(video_urls)
+        return video_urls
+
+    def videos(inputs):
+        urls = inputs["youtube_search"]
+        writes: list[Future] = []
+        for i, url in enumerate(urls):
+            video_steps.append(add_substep({"step": f"video_{i + 1}", "status": "queued", "url": url}))
+
+        def run(substep: dict) -> None:
+            if progress.cancelled:
+                substep["status"] = "cancelled"
+                return
+            substep["status"] = "running"
+            progress.message = f"Processing {substep['step'].replace('_', ' ')} of {len(urls)}..."
             try:
-                from council.knowledge.audit import audit_transcript
-
-                audit = audit_transcript(saved_path, use_llm=False)
-                audit_passed = audit.passed
-                quality_score = audit.quality_score
-                progress.substeps[-1]["audit_passed"] = audit_passed
-                progress.substeps[-1]["quality_score"] = quality_score
-                if not audit_passed:
-                    progress.substeps[-1]["low_quality"] = True
-            except Exception:
-                pass
-
-            # Index in ChromaDB with audit metadata
-            try:
-                from council.knowledge.store import get_knowledge_store
-
-                store = get_knowledge_store()
-                store.add_document(
-                    storage_id,
-                    video_info.transcript,
-                    metadata={
-                        "source": video_info.url,
-                        "type": "youtube",
-                        "channel": video_info.channel,
-                        "title": video_info.title,
-                        "duration": str(video_info.duration // 60),
-                        "audit_passed": str(audit_passed),
-                        "quality_score": str(quality_score),
-                    },
-                )
-            except Exception:
-                pass  # ChromaDB optional
-
-            saved_count += 1
-            progress.substeps[-1]["status"] = "done"
-            progress.substeps[-1]["title"] = video_info.title
-
-        except Exception as e:
-            progress.substeps[-1]["status"] = f"error: {e}"
-
-    result["youtube_transcripts"] = saved_count
-
-    # ---- Step 3: Book discovery -------------------------------------------
-    progress.progress = 0.85
-    progress.message = f"Discovering books by and about {name}..."
-    progress.substeps.append({"step": "books", "status": "running"})
-
-    try:
+                if _process_video(substep["url"], storage_id, substep, writes):
+                    with lock:
+                        result["youtube_transcripts"] += 1
+                    _update_custom_elder(elder_id, {"enrichment": enrichment_status("running")})
+            except Exception as e:
+                substep["status"] = f"error: {e}"
+            update_progress()
+
+        with ThreadPoolExecutor(max_workers=max(1, video_workers), thread_name_prefix="enrich-video") as pool:
+            list(pool.map(run, video_steps))
+        # Let the queued writes land, so failures show up before the step ends
+        wait(writes, timeout=step_timeout)
+        return result["youtube_transcripts"]
+
+    def books(_):
         from council.knowledge.books import discover_books
 
-        books = discover_books(name, expertise)
-        result["books_discovered"] = len(books)
-        result["books"] = books
-        progress.substeps[-1] = {
-            "step": "books",
-            "status": "done",
-            "count": len(books),
-        }
-    except Exception as e:
-        progress.substeps[-1] = {"step": "books", "status": f"failed: {e}"}
+        found = discover_books(name, expertise)
+        result["books_discovered"] = len(found)
+        result["books"] = found
+        steps["books"]["count"] = len(found)
+        _update_custom_elder(elder_id, {"books": found})
+        return found
 
-    # ---- Step 4: Quote verification (fire-and-forget) ---------------------
-    try:
+    def quote_verification(_):
         from council.knowledge.verify_quotes import verify_elder_quotes
         from council.tasks import get_task_manager
 
-        tm = get_task_manager()
-        tm.submit(
+        return get_task_manager().submit(
             verify_elder_quotes,
             task_id=f"quotes_{elder_id}",
             elder_id=elder_id,
             elder_name=name,
         )
-        progress.substeps.append({"step": "quote_verification", "status": "submitted"})
-    except Exception as e:
-        logger.debug("Quote verification kick-off failed: %s", e)
+
+    nodes = [
+        Node("biography", biography, retries=1, timeout=step_timeout),
+        Node("youtube_search", youtube_search, retries=1, timeout=step_timeout),
+        Node("books", books, retries=1, timeout=step_timeout),
+        Node("videos", videos, deps=("youtube_search",)),
+        # Mostly reads sources/, so it runs however the other steps went
+        Node("quote_verification", quote_verification, after=("biography", "books", "videos")),
+    ]
+    messages = {
+        "biography": f"Fetching biography for {name}...",
+        "youtube_search": f"Searching YouTube for {name}...",
+        "books": f"Discovering books by and about {name}...",
+    }
+
+    def on_update(step: str, state: NodeState) -> None:
+        if step not in steps:
+            steps[step] = add_substep({"step": step})
+        substep = steps[step]
+        if state.status == RUNNING:
+            substep["status"] = "running"
+            progress.message = messages.get(step, progress.message)
+        elif state.status == DONE:
+            substep["status"] = "submitted" if step == "quote_verification" else "done"
+        elif state.status == FAILED:
+            substep["status"] = f"failed: {state.error}"
+            if step == "quote_verification":
+                logger.debug("Quote verification kick-off failed: %s", state.error)
+        else:
+            substep["status"] = state.status
+        if state.attempts > 1:
+            substep["attempts"] = state.attempts
+        update_progress()
+
+    _update_custom_elder(elder_id, {"enrichment": enrichment_status("running")})
+    DagExecutor(nodes, max_workers=len(nodes), cancel=progress.cancel_event, on_update=on_update).run()
 
     # ---- Done -------------------------------------------------------------
     progress.progress = 1.0
     progress.message = f"Enrichment complete for {name}"
 
-    # Collect transcript audit summaries
-    transcript_audits = [
-        {
-            "url": s.get("url", ""),
-            "title": s.get("title", ""),
-            "audit_passed": s.get("audit_passed", True),
-            "quality_score": s.get("quality_score", 70),
-        }
-        for s in progress.substeps
-        if s.get("step", "").startswith("video_") and s.get("status") == "done"
-    ]
-
-    # Update the custom elder file if it exists
-    try:
-        from council.elders.custom import update_custom_elder
-
-        update_custom_elder(elder_id, {
-            "biography": result.get("biography", {}),
-            "books": result.get("books", []),
-            "enrichment": {
-                "status": "completed",
-                "youtube_transcripts": saved_count,
-                "books_discovered": result.get("books_discovered", 0),
-                "transcript_audits": transcript_audits,
-            },
-        })
-    except Exception:
-        pass
+    _update_custom_elder(elder_id, {
+        "biography": result.get("biography", {}),
+        "books": result.get("books", []),
+        "enrichment": enrichment_status("completed"),
+    })
 
     return result
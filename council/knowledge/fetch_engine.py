@@ -0,0 +1,358 @@
+"""
+Concurrent HTTP fetch engine with a local download cache.
+
+Used by the public-source fetcher to download many texts at once without
+hammering one host or re-downloading what hasn't changed:
+
+- a bounded thread pool, with at most ``per_host`` requests in flight per host
+- keep-alive connections reused across requests to the same host
+- conditional GET (If-None-Match / If-Modified-Since) against the raw
+  responses cached in ``~/.council/knowledge/http_cache/``
+- interrupted downloads resume from the partial file with a Range request,
+  guarded by If-Range so a changed resource is downloaded afresh
+
+Only the standard library is used (http.client), so it works wherever the
+old urllib-based fetcher did.
+"""
+
+import hashlib
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import urljoin, urlsplit
+
+from council.config import get_config_value, get_knowledge_dir
+
+USER_AGENT = "CouncilOfElders/1.0 (Educational Purpose)"
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Errors that mean a reused keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class FetchError(Exception):
+    """A URL could not be downloaded."""
+
+
+def get_http_cache_dir() -> Path:
+    """Directory holding raw downloads and their validators."""
+    return get_knowledge_dir() / "http_cache"
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL.
+
+    status is one of "downloaded", "resumed", "not_modified" (served from
+    the cache after a 304), "stale" (the request failed but a cached copy
+    exists) or "failed".
+    """
+
+    url: str
+    status: str
+    body: bytes | None = None
+    bytes_received: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.body is not None
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return (self.body or b"").decode(encoding, errors="ignore")
+
+
+class DownloadCache:
+    """Raw response bodies keyed by URL, with the validators to revalidate them.
+
+    Each URL has up to three files named after the SHA-1 of the URL:
+    ``.body`` (last complete download), ``.part`` (download in progress) and
+    ``.json`` (ETag / Last-Modified of both).
+    """
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or get_http_cache_dir()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, suffix: str) -> Path:
+        return self.root / f"{hashlib.sha1(url.encode()).hexdigest()}{suffix}"
+
+    def meta(self, url: str) -> dict:
+        try:
+            return json.loads(self._path(url, ".json").read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_meta(self, url: str, meta: dict) -> None:
+        path = self._path(url, ".json")
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"url": url, **meta}, indent=2))
+        tmp.replace(path)
+
+    def body(self, url: str) -> bytes | None:
+        if not self.meta(url).get("body"):
+            return None
+        try:
+            return self._path(url, ".body").read_bytes()
+        except OSError:
+            return None
+
+    def partial_size(self, url: str) -> int:
+        """Bytes already downloaded for an in-progress download (0 if none)."""
+        if not self.meta(url).get("partial"):
+            return 0
+        try:
+            return self._path(url, ".part").stat().st_size
+        except OSError:
+            return 0
+
+    def begin_partial(self, url: str, validators: dict) -> None:
+        """Start a fresh download, remembering its validators for resuming."""
+        self._path(url, ".part").unlink(missing_ok=True)
+        self._save_meta(url, {**self.meta(url), "partial": validators})
+
+    def invalidate(self, url: str) -> None:
+        """Forget the partial download and the body's validators."""
+        self._path(url, ".part").unlink(missing_ok=True)
+        meta = self.meta(url)
+        dropped = [meta.pop(key, None) for key in ("partial", "body")]
+        if any(d is not None for d in dropped):
+            self._save_meta(url, meta)
+
+    def write_partial(self, url: str, response, append: bool) -> int:
+        """Stream *response* into the partial file; returns bytes written."""
+        written = 0
+        with open(self._path(url, ".part"), "ab" if append else "wb") as f:
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+        # read(amt) returns b"" on a dropped connection instead of raising
+        if response.length:
+            raise FetchError(f"Connection closed with {response.length} bytes missing")
+        return written
+
+    def commit(self, url: str) -> bytes:
+        """Promote the finished partial download to the cached body."""
+        meta = self.meta(url)
+        validators = meta.pop("partial", None) or {}
+        self._path(url, ".part").replace(self._path(url, ".body"))
+        self._save_meta(url, {**meta, "body": {**validators, "fetched_at": time.time()}})
+        return self._path(url, ".body").read_bytes()
+
+    def touch(self, url: str) -> None:
+        """Record a successful revalidation."""
+        meta = self.meta(url)
+        if meta.get("body"):
+            meta["body"]["fetched_at"] = time.time()
+            self._save_meta(url, meta)
+
+
+def _validators(response) -> dict:
+    validators = {}
+    if etag := response.getheader("ETag"):
+        validators["etag"] = etag
+    if last_modified := response.getheader("Last-Modified"):
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def _if_range(validators: dict) -> str | None:
+    """If-Range value for resuming; weak ETags are not allowed there."""
+    etag = validators.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return validators.get("last_modified")
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections per host, with a per-host concurrency cap."""
+
+    def __init__(self, per_host: int = 4, timeout: float = 30.0):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = {}
+        self._limits: dict[tuple, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, key: tuple) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._limits:
+                self._limits[key] = threading.BoundedSemaphore(self.per_host)
+            return self._limits[key]
+
+    def _connect(self, key: tuple) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return cls(host, port, timeout=self.timeout)
+
+    def _checkout(self, key: tuple) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _checkin(self, key: tuple, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    @contextmanager
+    def request(self, url: str, headers: dict) -> Iterator[http.client.HTTPResponse]:
+        """GET *url* on a pooled connection and yield the response.
+
+        The connection goes back to the pool only if the caller read the
+        whole body and the server didn't ask to close it.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise FetchError(f"Unsupported URL: {url}")
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        with self._limit(key):
+            conn, reused = self._checkout(key)
+            try:
+                try:
+                    conn.request("GET", path, headers=headers)
+                    response = conn.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    conn.close()
+                    conn = self._connect(key)
+                    conn.request("GET", path, headers=headers)
+                    response = conn.getresponse()
+                yield response
+            except BaseException:
+                conn.close()
+                raise
+            if response.isclosed() and not response.will_close:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class FetchEngine:
+    """Fetch URLs concurrently through a ConnectionPool and a DownloadCache."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_workers: int | None = None,
+        per_host: int | None = None,
+        timeout: float = 30.0,
+    ):
+        self.cache = DownloadCache(cache_dir)
+        self.max_workers = max_workers or get_config_value("fetch_workers", 8)
+        self.pool = ConnectionPool(per_host or get_config_value("fetch_per_host", 4), timeout)
+        self._url_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def fetch(self, url: str) -> FetchResult:
+        """Fetch one URL, revalidating or resuming from the cache when possible.
+
+        Never raises: failures come back as a "failed" result, or as "stale"
+        with the cached body when there is one.
+        """
+        start = time.perf_counter()
+        with self._url_lock(url):
+            try:
+                result = self._fetch(url)
+            except Exception as e:
+                cached = self.cache.body(url)
+                result = FetchResult(url, "stale" if cached is not None else "failed", body=cached, error=str(e))
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _headers(self, url: str) -> dict:
+        headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+        meta = self.cache.meta(url)
+        partial = self.cache.partial_size(url)
+        if partial and _if_range(meta["partial"]):
+            headers["Range"] = f"bytes={partial}-"
+            headers["If-Range"] = _if_range(meta["partial"])
+        elif meta.get("body"):
+            if etag := meta["body"].get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := meta["body"].get("last_modified"):
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _fetch(self, url: str) -> FetchResult:
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            headers = self._headers(url)
+            with self.pool.request(current, headers) as response:
+                status = response.status
+
+                if status in REDIRECT_STATUSES:
+                    response.read()
+                    location = response.getheader("Location")
+                    if not location:
+                        raise FetchError(f"HTTP {status} without Location from {current}")
+                    current = urljoin(current, location)
+                    continue
+
+                if status == 304 and ("If-None-Match" in headers or "If-Modified-Since" in headers):
+                    response.read()
+                    body = self.cache.body(url)
+                    if body is not None:
+                        self.cache.touch(url)
+                        return FetchResult(url, "not_modified", body=body)
+
+                elif status == 206 and "Range" in headers:
+                    offset = int(headers["Range"][len("bytes="):-1])
+                    content_range = response.getheader("Content-Range") or ""
+                    if content_range.startswith(f"bytes {offset}-"):
+                        received = self.cache.write_partial(url, response, append=True)
+                        return FetchResult(url, "resumed", body=self.cache.commit(url), bytes_received=received)
+                    response.read()
+
+                elif status == 200:
+                    self.cache.begin_partial(url, _validators(response))
+                    received = self.cache.write_partial(url, response, append=False)
+                    return FetchResult(url, "downloaded", body=self.cache.commit(url), bytes_received=received)
+
+                else:
+                    response.read()
+                    raise FetchError(f"HTTP {status} from {current}")
+
+            # Unusable 304 or 206: drop what we have and download in full
+            self.cache.invalidate(url)
+        raise FetchError(f"Too many redirects or retries for {url}")
+
+    def fetch_many(self, urls: Iterable[str]) -> Iterator[FetchResult]:
+        """Fetch URLs concurrently, yielding results as downloads finish."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch") as executor:
+            futures = [executor.submit(self.fetch, url) for url in urls]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def close(self) -> None:
+        self.pool.close()
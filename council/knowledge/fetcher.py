@@ -6,10 +6,10 @@ cleans them, and adds them to the elder knowledge bases.
 """
 
 import re
-import urllib.request
 from pathlib import Path
 
 from council.config import get_knowledge_dir
+from council.knowledge.snippets import update_snippet_index
 from council.knowledge.sources import PUBLIC_SOURCES, EMBEDDED_WISDOM
 
 
@@ -53,23 +53,33 @@ def clean_gutenberg_text(text: str) -> str:
     return text
 
 
-def fetch_text(url: str, source_type: str = "gutenberg") -> str | None:
-    """Fetch text from a URL."""
-    try:
-        req = urllib.request.Request(
-            url,
-            headers={'User-Agent': 'CouncilOfElders/1.0 (Educational Purpose)'}
-        )
-        with urllib.request.urlopen(req, timeout=30) as response:
-            text = response.read().decode('utf-8', errors='ignore')
+_fetch_engine = None
 
-        if source_type == "gutenberg":
-            text = clean_gutenberg_text(text)
 
-        return text
-    except Exception as e:
-        print(f"Error fetching {url}: {e}")
+def get_fetch_engine():
+    """Shared FetchEngine (keep-alive connections and the download cache)."""
+    global _fetch_engine
+    if _fetch_engine is None:
+        from council.knowledge.fetch_engine import FetchEngine
+
+        _fetch_engine = FetchEngine()
+    return _fetch_engine
+
+
+def _source_text(result, source_type: str) -> str:
+    text = result.text()
+    if source_type == "gutenberg":
+        text = clean_gutenberg_text(text)
+    return text
+
+
+def fetch_text(url: str, source_type: str = "gutenberg") -> str | None:
+    """Fetch text from a URL (revalidating a cached copy if there is one)."""
+    result = get_fetch_engine().fetch(url)
+    if not result.ok:
+        print(f"Error fetching {url}: {result.error}")
         return None
+    return _source_text(result, source_type)
 
 
 def save_knowledge_file(elder_id: str, title: str, content: str) -> Path:
@@ -80,11 +90,19 @@ def save_knowledge_file(elder_id: str, title: str, content: str) -> Path:
     # Create safe filename
     safe_title = re.sub(r'[^\w\s-]', '', title).strip().replace(' ', '_')
     filepath = knowledge_dir / f"{safe_title}.txt"
+    text = f"# {title}\n\n{content}"
+
+    # Leave unchanged files alone so the indexer doesn't re-ingest them
+    try:
+        if filepath.read_text(encoding='utf-8') == text:
+            return filepath
+    except (OSError, UnicodeDecodeError):
+        pass
 
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(f"# {title}\n\n")
-        f.write(content)
+        f.write(text)
 
+    update_snippet_index(filepath)
     return filepath
 
 
@@ -92,6 +110,11 @@ def fetch_all_public_sources(elder_id: str | None = None, verbose: bool = True)
     """
     Fetch all public domain sources for elders.
 
+    Downloads run concurrently (see council.knowledge.fetch_engine), and
+    each text is cleaned and saved as soon as its download finishes.
+    Unchanged texts are revalidated with a conditional GET rather than
+    downloaded again.
+
     Args:
         elder_id: Specific elder to fetch for, or None for all
         verbose: Print progress
@@ -105,29 +128,42 @@ def fetch_all_public_sources(elder_id: str | None = None, verbose: bool = True)
     if elder_id:
         sources_to_fetch = {elder_id: PUBLIC_SOURCES.get(elder_id, [])}
 
+    # url -> [(elder_id, position, source)], so shared texts download once
+    wanted: dict[str, list[tuple[str, int, dict]]] = {}
     for eid, sources in sources_to_fetch.items():
         results[eid] = []
 
-        for source in sources:
+        for position, source in enumerate(sources):
             if source["type"] == "berkshire_index":
                 # Skip index pages - these need special handling
                 if verbose:
                     print(f"  [skip] {source['title']} - requires manual download")
                 continue
+            wanted.setdefault(source["url"], []).append((eid, position, source))
 
-            if verbose:
-                print(f"  Fetching: {source['title']}...")
+    if verbose and wanted:
+        print(f"  Fetching {len(wanted)} texts...")
 
-            content = fetch_text(source["url"], source["type"])
-            if content:
-                filepath = save_knowledge_file(eid, source["title"], content)
-                results[eid].append(filepath)
-                if verbose:
-                    print(f"    ✓ Saved to {filepath}")
-            else:
+    saved: dict[str, list[tuple[int, Path]]] = {eid: [] for eid in results}
+    for result in get_fetch_engine().fetch_many(wanted):
+        for eid, position, source in wanted[result.url]:
+            if not result.ok:
                 if verbose:
-                    print(f"    ✗ Failed to fetch")
+                    print(f"    ✗ Failed to fetch {source['title']}: {result.error}")
+                continue
+
+            content = _source_text(result, source["type"])
+            if not content:
+                continue
+            filepath = save_knowledge_file(eid, source["title"], content)
+            saved[eid].append((position, filepath))
+            if verbose:
+                note = {"not_modified": " (unchanged)", "stale": " (cached copy, fetch failed)",
+                        "resumed": " (resumed)"}.get(result.status, "")
+                print(f"    ✓ {source['title']} saved to {filepath}{note}")
 
+    for eid, files in saved.items():
+        results[eid] = [path for _, path in sorted(files)]
     return results
 
 
@@ -0,0 +1,344 @@
+"""Background auto-indexing of knowledge files.
+
+Files dropped into ``~/.council/knowledge/{elder}/`` (for example under
+``sources/``), or written by savers such as save_transcript() and
+save_knowledge_file(), are not searchable until something calls
+add_document(). KnowledgeIndexer polls the knowledge directory, waits until a
+new or changed .txt file has been quiet for ``debounce`` seconds, then
+submits one batch to the TaskManager. Progress is published under the fixed
+task id ``knowledge-indexer`` (``/api/tasks/knowledge-indexer``).
+
+What has been indexed is tracked by (mtime, size) in
+``~/.council/knowledge/index_state.json``. Pipelines that index a file
+themselves, with richer metadata, call mark_indexed() so the watcher leaves
+it alone. Near-duplicate suppression covers files already indexed under
+another source name.
+
+Installs that predate the watcher have no state file. On its first pass,
+seed_state() records the files of every elder whose collection already holds
+chunks as indexed, so they are not re-added with bare metadata.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from council.config import get_knowledge_dir
+from council.knowledge.snippets import remove_from_snippet_index, update_snippet_index
+
+TASK_ID = "knowledge-indexer"
+STATE_FILENAME = "index_state.json"
+
+# Top-level directories under the knowledge dir that are not elders
+RESERVED_DIRS = {"chromadb", "quantized", "embeddings", "dedup", "http_cache"}
+
+# Seconds before a file that failed for a reason other than its content is retried
+RETRY_DELAY = 600
+
+_state_lock = threading.Lock()
+
+
+def get_index_state_path() -> Path:
+    """Path of the auto-indexer's record of indexed files."""
+    return get_knowledge_dir() / STATE_FILENAME
+
+
+def _load_state() -> dict[str, dict]:
+    try:
+        return json.loads(get_index_state_path().read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(state: dict[str, dict]) -> None:
+    path = get_index_state_path()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=1, sort_keys=True))
+    tmp.replace(path)
+
+
+def _file_key(filepath: Path) -> str | None:
+    """Knowledge-dir-relative key for an elder's file, or None if outside it."""
+    try:
+        rel = filepath.resolve().relative_to(get_knowledge_dir().resolve())
+    except ValueError:
+        return None
+    if len(rel.parts) < 2 or rel.parts[0] in RESERVED_DIRS:
+        return None
+    return rel.as_posix()
+
+
+def scan_knowledge_files() -> dict[str, tuple[int, int]]:
+    """Map every elder .txt file to its (mtime_ns, size)."""
+    root = get_knowledge_dir()
+    files: dict[str, tuple[int, int]] = {}
+    for elder_dir in root.iterdir():
+        if not elder_dir.is_dir() or elder_dir.name in RESERVED_DIRS or elder_dir.name.startswith("."):
+            continue
+        for path in elder_dir.rglob("*.txt"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files[path.relative_to(root).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def mark_indexed(filepath: str | Path) -> None:
+    """Record *filepath* as indexed in its current state.
+
+    Call right after saving a file that the caller indexes itself.
+    """
+    filepath = Path(filepath)
+    key = _file_key(filepath)
+    if key is None:
+        return
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return
+    with _state_lock:
+        state = _load_state()
+        state[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "chunks": None}
+        _save_state(state)
+
+
+def seed_state(store=None) -> int:
+    """Create the state file on first run from what is already ingested.
+
+    Files of elders whose collection already has chunks were ingested by
+    their own pipelines, so they are recorded as indexed in their current
+    state. Elders with an empty collection are left for the watcher.
+
+    Returns:
+        Number of files seeded (0 if the state file already existed)
+    """
+    if get_index_state_path().exists():
+        return 0
+    if store is None:
+        from council.knowledge.store import get_knowledge_store
+
+        store = get_knowledge_store()
+
+    files = scan_knowledge_files()
+    ingested = {
+        elder_id for elder_id in {Path(key).parts[0] for key in files}
+        if store.get_collection(elder_id).count() > 0
+    }
+    with _state_lock:
+        if get_index_state_path().exists():
+            return 0
+        state = {
+            key: {"mtime_ns": mtime_ns, "size": size, "chunks": None}
+            for key, (mtime_ns, size) in files.items()
+            if Path(key).parts[0] in ingested
+        }
+        _save_state(state)
+    return len(state)
+
+
+def pending_changes(debounce: float = 0.0, now: float | None = None) -> tuple[list[str], list[str]]:
+    """Find files to (re)index and indexed files that have disappeared.
+
+    Files modified less than *debounce* seconds ago are left for a later pass,
+    so a file that is still being written is indexed once, when it settles.
+
+    Returns:
+        (changed keys, removed keys), both sorted
+    """
+    now = time.time() if now is None else now
+    files = scan_knowledge_files()
+    with _state_lock:
+        state = _load_state()
+
+    changed = [
+        key for key, (mtime_ns, size) in files.items()
+        if (key not in state
+            or (state[key]["mtime_ns"], state[key]["size"]) != (mtime_ns, size)
+            or state[key].get("retry_at", now + 1) <= now)
+        and now - mtime_ns / 1e9 >= debounce
+    ]
+    removed = [key for key in state if key not in files]
+    return sorted(changed), sorted(removed)
+
+
+def _file_metadata(path: Path, key: str) -> dict:
+    parts = Path(key).parts
+    if "youtube" in parts:
+        source_type = "youtube"
+    elif "sources" in parts:
+        source_type = "source_material"
+    else:
+        source_type = "document"
+    return {"source": str(path), "filename": path.name, "title": path.stem, "type": source_type}
+
+
+def index_changes(
+    progress=None,
+    changed: list[str] | None = None,
+    removed: list[str] | None = None,
+    store=None,
+) -> dict:
+    """Index changed files and drop removed ones.
+
+    A changed file's previous chunks are removed before it is re-added, so
+    edits replace content instead of accumulating.
+
+    Args:
+        progress: Optional TaskProgress to report into
+        changed: Knowledge-dir-relative keys of files to (re)index
+        removed: Keys of indexed files that no longer exist
+        store: KnowledgeStore to use (default: the global store)
+
+    Returns:
+        Counts of files indexed, removed and failed, and chunks added
+    """
+    if store is None:
+        from council.knowledge.store import get_knowledge_store
+
+        store = get_knowledge_store()
+
+    changed = changed or []
+    removed = removed or []
+    root = get_knowledge_dir()
+    summary = {"indexed": 0, "removed": 0, "failed": 0, "chunks": 0}
+    total = max(len(changed) + len(removed), 1)
+
+    with _state_lock:
+        indexed = set(_load_state())
+
+    def record(key: str, entry: dict | None) -> None:
+        # Merge into the latest state so concurrent mark_indexed() calls
+        # survive, and save per file so a failure never loses earlier work
+        with _state_lock:
+            state = _load_state()
+            if entry is None:
+                state.pop(key, None)
+            else:
+                state[key] = entry
+            _save_state(state)
+
+    for i, key in enumerate(changed):
+        if progress is not None:
+            progress.message = f"Indexing {key} ({i + 1}/{len(changed)})"
+            progress.progress = i / total
+        path = root / key
+        elder_id = Path(key).parts[0]
+        substep = {"step": "index", "file": key, "status": "running"}
+        if progress is not None:
+            progress.substeps.append(substep)
+        try:
+            stat = path.stat()
+        except OSError as e:
+            substep["status"] = f"error: {e}"
+            summary["failed"] += 1
+            continue
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "chunks": 0}
+        try:
+            text = path.read_text(encoding="utf-8")
+            if key in indexed:
+                store.remove_source(elder_id, str(path))
+            chunks = store.add_document(elder_id, text, _file_metadata(path, key)) if text.strip() else 0
+        except (OSError, UnicodeDecodeError) as e:
+            # Remember the failure so the file is retried only once it changes
+            record(key, {**entry, "error": str(e)})
+            substep["status"] = f"error: {e}"
+            summary["failed"] += 1
+            continue
+        except Exception as e:
+            # Not the file's fault (e.g. embedding backend down): retry later
+            record(key, {**entry, "error": str(e), "retry_at": time.time() + RETRY_DELAY})
+            substep["status"] = f"error: {e}"
+            summary["failed"] += 1
+            continue
+
+        record(key, {**entry, "chunks": chunks})
+        indexed.add(key)
+        update_snippet_index(path)
+        substep.update(status="done", chunks=chunks)
+        summary["indexed"] += 1
+        summary["chunks"] += chunks
+
+    for key in removed:
+        try:
+            store.remove_source(Path(key).parts[0], str(root / key))
+        except Exception:
+            summary["failed"] += 1
+            continue
+        remove_from_snippet_index(root / key)
+        record(key, None)
+        summary["removed"] += 1
+
+    if progress is not None:
+        progress.message = (
+            f"Indexed {summary['indexed']} file(s), {summary['chunks']} chunk(s); "
+            f"removed {summary['removed']}"
+        )
+    return summary
+
+
+class KnowledgeIndexer:
+    """Polls the knowledge directory and hands debounced changes to TaskManager.
+
+    Polling only stats files, so it is cheap; the indexing itself runs as a
+    TaskManager task, one batch at a time.
+    """
+
+    def __init__(self, interval: float = 10.0, debounce: float = 30.0, task_manager=None, store=None):
+        self.interval = interval
+        self.debounce = debounce
+        self._task_manager = task_manager
+        self._store = store
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def task_manager(self):
+        if self._task_manager is None:
+            from council.tasks import get_task_manager
+
+            self._task_manager = get_task_manager()
+        return self._task_manager
+
+    def _busy(self) -> bool:
+        from council.tasks import TaskStatus
+
+        current = self.task_manager.get_status(TASK_ID)
+        return current is not None and current.status in (TaskStatus.PENDING, TaskStatus.RUNNING)
+
+    def poll(self) -> bool:
+        """Submit an indexing batch if there is settled work.
+
+        Returns True if a batch was submitted.
+        """
+        if self._busy():
+            return False
+        seed_state(self._store)
+        changed, removed = pending_changes(self.debounce)
+        if not changed and not removed:
+            return False
+        self.task_manager.submit(
+            index_changes, task_id=TASK_ID, changed=changed, removed=removed, store=self._store
+        )
+        return True
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="knowledge-indexer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                pass  # Keep watching; the next pass retries
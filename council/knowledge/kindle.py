@@ -3,15 +3,40 @@ Kindle Book Ingestion Pipeline
 
 Processes ePub files extracted from Kindle books via Calibre + DeDRM plugin.
 Maps books to elders and ingests them into the knowledge base.
+
+Books are read as a stream of sections (ePub chapters, PDF pages) that are
+chunked and stored as they come, so a whole book is never held as one
+string. When importing a directory, the HTML parsing runs in a process pool
+(``--workers`` / ``kindle_workers``) and each book is stored as soon as its
+extraction finishes.
 """
 
+import functools
+import itertools
+import os
 import re
 import sys
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from council.config import get_config_value
 from council.knowledge.store import get_knowledge_store
 
+BOOK_SUFFIXES = (".epub", ".txt", ".text", ".pdf")
+
+# Sections are joined into batches of at least this many characters before
+# chunking, so short title pages don't become chunks of their own
+INGEST_BATCH_CHARS = 20_000
+
+# Books extracted ahead of the one being stored, beyond one per worker.
+# Storing (embedding) is slower than extracting, so without a bound the
+# extracted books of a large import pile up in memory
+EXTRACT_AHEAD = 2
+
 
 # Book-to-Elder mapping based on ASIN and title keywords
 BOOK_ELDER_MAP = {
@@ -142,21 +167,131 @@ TITLE_PATTERNS = {
     r"dao\s*de\s*jing": ("laotzu", "Tao Te Ching"),
 }
 
+# Characters of opening text checked against TITLE_PATTERNS
+HEADER_CHARS = 1000
 
-def extract_epub_text(epub_path: Path) -> str:
+
+_PATTERN_TOKEN_RE = re.compile(r"\([^()]*\)\?|\\s[*?]|\.[*?]?|[a-z0-9 ]\??")
+
+
+def _required_literal(pattern: str) -> str:
+    """Longest plain text that every match of *pattern* contains.
+
+    Only understands the simple patterns used in TITLE_PATTERNS (letters,
+    optional letters and groups, ``\\s*`` and ``.*``); any other pattern
+    gets "", so it is always searched.
     """
-    Extract text content from an ePub file.
+    tokens = _PATTERN_TOKEN_RE.findall(pattern)
+    if "".join(tokens) != pattern:
+        return ""
+    runs = "".join(t if len(t) == 1 and t != "." else "\0" for t in tokens).split("\0")
+    return max(runs, key=len)
+
+
+# (required literal, compiled pattern, (elder_id, title)) in TITLE_PATTERNS order
+_TITLE_MATCHERS = [
+    (_required_literal(pattern), re.compile(pattern, re.IGNORECASE), entry)
+    for pattern, entry in TITLE_PATTERNS.items()
+]
+
+
+def match_title(text: str) -> tuple[str, str] | None:
+    """
+    Find the first TITLE_PATTERNS entry whose pattern occurs in *text*.
+
+    A pattern's regex only runs if the text contains its required literal,
+    which a plain substring test rules out for nearly every pattern.
 
     Args:
-        epub_path: Path to the ePub file
+        text: Filename, title or opening text of a book
 
     Returns:
-        Extracted text content
+        (elder_id, book_title) or None
     """
+    lowered = text.lower()
+    for literal, regex, entry in _TITLE_MATCHERS:
+        if literal in lowered and regex.search(lowered):
+            return entry
+    return None
+
+
+def _title_key(title: str) -> str:
+    """Normalised title for exact lookups: no subtitle, article or punctuation."""
+    title = title.split(":")[0].lower()
+    title = re.sub(r"[^a-z0-9]+", " ", title.replace("'", "")).strip()
+    return re.sub(r"^(the|a|an) ", "", title)
+
+
+# Known titles by normalised title, for ePub metadata lookups
+_TITLE_INDEX = {
+    _title_key(title): (elder_id, title)
+    for elder_id, title in [*TITLE_PATTERNS.values(), *BOOK_ELDER_MAP.values()]
+}
+
+_ASIN_RE = re.compile(r"\bB0[0-9A-Z]{8}\b")
+
+_OPF_NAMESPACES = {
+    "container": "urn:oasis:names:tc:opendocument:xmlns:container",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _html_parser() -> str:
+    """HTML parser to use: lxml (C, several times faster) if installed."""
+    try:
+        import lxml.html  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+def _chapter_text(content: bytes, parser: str) -> str:
+    """Visible text of an ePub document, one line per text node."""
+    if parser == "lxml":
+        # lxml directly: building a BeautifulSoup tree costs more than the parse
+        import lxml.html
+        from lxml.etree import ParserError
+
+        try:
+            root = lxml.html.document_fromstring(content)
+        except ParserError:  # empty document
+            return ""
+        for tag in root.xpath('//script|//style|//nav'):
+            tag.drop_tree()
+        text = '\n'.join(root.itertext())
+    else:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(content, parser)
+
+        # Remove scripts and styles
+        for tag in soup(['script', 'style', 'nav']):
+            tag.decompose()
+
+        text = soup.get_text(separator='\n')
+
+    # Clean up whitespace
+    lines = [line.strip() for line in text.split('\n')]
+    return '\n'.join(line for line in lines if line)
+
+
+def iter_epub_chapters(epub_path: Path) -> Iterator[str]:
+    """
+    Yield the text of each chapter (document item) of an ePub file.
+
+    Args:
+        epub_path: Path to the ePub file
+
+    Yields:
+        Non-empty chapter texts, in the order of the file's items
+    """
+    parser = _html_parser()
     try:
         import ebooklib
         from ebooklib import epub
-        from bs4 import BeautifulSoup
+        if parser != "lxml":
+            import bs4  # noqa: F401
     except ImportError:
         raise ImportError(
             "ebooklib and beautifulsoup4 are required for ePub processing. "
@@ -165,26 +300,24 @@ def extract_epub_text(epub_path: Path) -> str:
 
     book = epub.read_epub(str(epub_path))
 
-    text_parts = []
-
     for item in book.get_items():
         if item.get_type() == ebooklib.ITEM_DOCUMENT:
-            soup = BeautifulSoup(item.get_content(), 'html.parser')
-
-            # Remove scripts and styles
-            for tag in soup(['script', 'style', 'nav']):
-                tag.decompose()
+            text = _chapter_text(item.get_content(), parser)
+            if text.strip():
+                yield text
 
-            text = soup.get_text(separator='\n')
 
-            # Clean up whitespace
-            lines = [line.strip() for line in text.split('\n')]
-            text = '\n'.join(line for line in lines if line)
+def extract_epub_text(epub_path: Path) -> str:
+    """
+    Extract text content from an ePub file.
 
-            if text.strip():
-                text_parts.append(text)
+    Args:
+        epub_path: Path to the ePub file
 
-    return '\n\n'.join(text_parts)
+    Returns:
+        Extracted text content
+    """
+    return '\n\n'.join(iter_epub_chapters(epub_path))
 
 
 def extract_text_file(txt_path: Path) -> str:
@@ -192,30 +325,142 @@ def extract_text_file(txt_path: Path) -> str:
     return txt_path.read_text(encoding='utf-8', errors='replace')
 
 
-def identify_book(file_path: Path, content: str = "") -> tuple[str, str] | None:
+def iter_book_sections(file_path: Path) -> Iterator[str]:
+    """
+    Stream a book's text in sections: chapters of an ePub, pages of a PDF,
+    or the whole of a text file.
+
+    Args:
+        file_path: Path to the ePub, PDF or TXT file
+
+    Returns:
+        Iterator over the sections' text
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    if suffix == '.epub':
+        return iter_epub_chapters(file_path)
+    if suffix == '.pdf':
+        from council.knowledge.source_material import iter_pdf_pages
+        return iter_pdf_pages(file_path)
+    if suffix in ['.txt', '.text']:
+        return iter([extract_text_file(file_path)])
+    raise ValueError(f"Unsupported format: {suffix}")
+
+
+def extract_book(file_path: Path) -> list[str]:
+    """Extract every section of a book (runs in the extraction process pool)."""
+    return list(iter_book_sections(file_path))
+
+
+def _batch_sections(sections: Iterable[str], min_chars: int = INGEST_BATCH_CHARS) -> Iterator[str]:
+    """Join consecutive sections until each batch has at least *min_chars*."""
+    batch, size = [], 0
+    for section in sections:
+        batch.append(section)
+        size += len(section)
+        if size >= min_chars:
+            yield '\n\n'.join(batch)
+            batch, size = [], 0
+    if batch:
+        yield '\n\n'.join(batch)
+
+
+@dataclass
+class BookMetadata:
+    """Title, authors and identifiers from an ePub's OPF package file."""
+    title: str = ""
+    authors: list[str] = field(default_factory=list)
+    identifiers: list[str] = field(default_factory=list)
+
+    @property
+    def asins(self) -> list[str]:
+        return [asin for identifier in self.identifiers for asin in _ASIN_RE.findall(identifier.upper())]
+
+
+def read_epub_metadata(epub_path: Path) -> BookMetadata:
+    """
+    Read an ePub's metadata without parsing its content.
+
+    Only the container file and the OPF package file are read from the zip.
+
+    Args:
+        epub_path: Path to the ePub file
+
+    Returns:
+        The metadata; empty if the file has none or isn't a valid ePub
+    """
+    try:
+        with zipfile.ZipFile(epub_path) as archive:
+            container = ET.fromstring(archive.read("META-INF/container.xml"))
+            rootfile = container.find(".//container:rootfile", _OPF_NAMESPACES)
+            opf_path = rootfile.get("full-path") if rootfile is not None else None
+            if not opf_path:
+                return BookMetadata()
+            opf = ET.fromstring(archive.read(opf_path))
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError):
+        return BookMetadata()
+
+    def texts(tag: str) -> list[str]:
+        elements = opf.iterfind(f".//dc:{tag}", _OPF_NAMESPACES)
+        return [el.text.strip() for el in elements if el.text and el.text.strip()]
+
+    titles = texts("title")
+    return BookMetadata(
+        title=titles[0] if titles else "",
+        authors=texts("creator"),
+        identifiers=texts("identifier"),
+    )
+
+
+def identify_book(
+    file_path: Path,
+    content: str = "",
+    metadata: Optional[BookMetadata] = None,
+) -> tuple[str, str] | None:
     """
-    Identify which elder a book belongs to based on filename or content.
+    Identify which elder a book belongs to based on filename, metadata or content.
+
+    Checked in order: the filename against TITLE_PATTERNS, the ePub's
+    title (exact match, then patterns on title and authors) and ASIN, and
+    finally the opening text.
 
     Args:
         file_path: Path to the book file
         content: Optional content to help identify
+        metadata: ePub metadata; read from the file when omitted
 
     Returns:
         (elder_id, book_title) or None if not identified
     """
-    filename = file_path.stem.lower()
+    file_path = Path(file_path)
 
     # Check filename against title patterns
-    for pattern, (elder_id, title) in TITLE_PATTERNS.items():
-        if re.search(pattern, filename, re.IGNORECASE):
-            return (elder_id, title)
-
-    # Check content header (first 1000 chars) against patterns
+    identified = match_title(file_path.stem)
+    if identified:
+        return identified
+
+    # Check the ePub's own title, authors and ASIN
+    if metadata is None and file_path.suffix.lower() == '.epub':
+        metadata = read_epub_metadata(file_path)
+    if metadata is not None:
+        if metadata.title:
+            identified = (
+                _TITLE_INDEX.get(_title_key(metadata.title))
+                or match_title(" ".join([metadata.title, *metadata.authors]))
+            )
+            if identified:
+                return identified
+        for asin in metadata.asins:
+            if asin in BOOK_ELDER_MAP:
+                return BOOK_ELDER_MAP[asin]
+
+    # Check content header against patterns
     if content:
-        header = content[:1000].lower()
-        for pattern, (elder_id, title) in TITLE_PATTERNS.items():
-            if re.search(pattern, header, re.IGNORECASE):
-                return (elder_id, title)
+        return match_title(content[:HEADER_CHARS])
 
     return None
 
@@ -225,36 +470,48 @@ def ingest_book(
     elder_id: Optional[str] = None,
     book_title: Optional[str] = None,
     dry_run: bool = False,
+    sections: Optional[Iterable[str]] = None,
 ) -> dict:
     """
     Ingest a single book into the knowledge base.
 
+    The text is chunked and stored a batch of sections at a time, as it is
+    extracted.
+
     Args:
-        file_path: Path to the ePub or TXT file
+        file_path: Path to the ePub, PDF or TXT file
         elder_id: Override elder assignment
         book_title: Override book title
         dry_run: If True, don't actually ingest, just report
+        sections: Already extracted sections (see extract_book); read from
+            the file if omitted
 
     Returns:
         Dict with ingestion results
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        return {"success": False, "error": f"File not found: {file_path}"}
-
-    # Extract content
-    suffix = file_path.suffix.lower()
-    if suffix == '.epub':
-        content = extract_epub_text(file_path)
-    elif suffix in ['.txt', '.text']:
-        content = extract_text_file(file_path)
-    else:
-        return {"success": False, "error": f"Unsupported format: {suffix}"}
+    if sections is None:
+        if not file_path.exists():
+            return {"success": False, "error": f"File not found: {file_path}"}
+        try:
+            sections = iter_book_sections(file_path)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+    sections = iter(sections)
 
     # Identify the book if not specified
+    head = []
     if not elder_id or not book_title:
-        identified = identify_book(file_path, content)
+        book_info = read_epub_metadata(file_path) if file_path.suffix.lower() == '.epub' else BookMetadata()
+        identified = identify_book(file_path, metadata=book_info)
+        if not identified:
+            # Read just enough to identify the book from its opening text
+            for section in sections:
+                head.append(section)
+                if sum(len(s) for s in head) >= HEADER_CHARS:
+                    break
+            identified = identify_book(file_path, '\n\n'.join(head), metadata=book_info)
         if identified:
             elder_id = elder_id or identified[0]
             book_title = book_title or identified[1]
@@ -265,7 +522,22 @@ def ingest_book(
                 "filename": file_path.name,
             }
 
-    word_count = len(content.split())
+    store = None if dry_run else get_knowledge_store()
+
+    metadata = {
+        "source": f"kindle:{book_title}",
+        "title": book_title,
+        "type": "book",
+        "format": "kindle",
+    }
+
+    word_count = chunks_added = 0
+    batches = _batch_sections(itertools.chain(head, sections), INGEST_BATCH_CHARS)
+    for part, batch in enumerate(batches):
+        word_count += len(batch.split())
+        if store is not None:
+            # Each batch numbers its chunks from 0; the part keeps them apart
+            chunks_added += store.add_document(elder_id, batch, {**metadata, "part": part})
 
     result = {
         "success": True,
@@ -282,17 +554,6 @@ def ingest_book(
         print(f"  Words: {word_count:,}")
         return result
 
-    # Ingest into knowledge store
-    store = get_knowledge_store()
-
-    metadata = {
-        "source": f"kindle:{book_title}",
-        "title": book_title,
-        "type": "book",
-        "format": "kindle",
-    }
-
-    chunks_added = store.add_document(elder_id, content, metadata)
     result["chunks_added"] = chunks_added
 
     print(f"✓ Ingested: {book_title}")
@@ -303,19 +564,34 @@ def ingest_book(
     return result
 
 
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Extraction processes to use (0 or None in config = one per CPU core)."""
+    if workers is None:
+        workers = get_config_value("kindle_workers", 0)
+    return workers if workers and workers > 0 else (os.cpu_count() or 1)
+
+
 def ingest_directory(
     directory: Path,
     dry_run: bool = False,
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """
-    Ingest all ePub/TXT files from a directory.
+    Ingest all ePub/PDF/TXT files from a directory.
+
+    Books are extracted in a pool of *workers* processes and stored (in
+    this process) as each extraction finishes; at most *workers* +
+    EXTRACT_AHEAD books are extracted but not yet stored. With one worker,
+    each book is streamed from the file straight into the store.
 
     Args:
         directory: Directory containing book files
         dry_run: If True, don't actually ingest
+        workers: Extraction processes (default: kindle_workers config,
+            0 = one per CPU core)
 
     Returns:
-        List of ingestion results
+        List of ingestion results, in filename order
     """
     directory = Path(directory)
 
@@ -324,20 +600,53 @@ def ingest_directory(
         return []
 
     # Find all book files
-    book_files = list(directory.glob("*.epub")) + list(directory.glob("*.txt"))
+    book_files = sorted(
+        path for path in directory.iterdir()
+        if path.is_file() and path.suffix.lower() in BOOK_SUFFIXES
+    )
 
     if not book_files:
-        print(f"No ePub or TXT files found in {directory}")
+        print(f"No ePub, PDF or TXT files found in {directory}")
         return []
 
+    workers = min(_resolve_workers(workers), len(book_files))
     print(f"Found {len(book_files)} book file(s)")
     print("-" * 50)
 
-    results = []
-    for book_file in sorted(book_files):
-        result = ingest_book(book_file, dry_run=dry_run)
-        results.append(result)
-        print()
+    def failure(book_file: Path, error: Exception) -> dict:
+        return {"success": False, "error": f"{type(error).__name__}: {error}", "filename": book_file.name}
+
+    by_file = {}
+    if workers <= 1:
+        for book_file in book_files:
+            try:
+                by_file[book_file] = ingest_book(book_file, dry_run=dry_run)
+            except Exception as e:
+                by_file[book_file] = failure(book_file, e)
+            print()
+    else:
+        queued = iter(book_files)
+        futures = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+
+            def submit_next() -> None:
+                book_file = next(queued, None)
+                if book_file is not None:
+                    futures[pool.submit(extract_book, book_file)] = book_file
+
+            for _ in range(workers + EXTRACT_AHEAD):
+                submit_next()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    book_file = futures.pop(future)
+                    submit_next()
+                    try:
+                        by_file[book_file] = ingest_book(book_file, dry_run=dry_run, sections=future.result())
+                    except Exception as e:
+                        by_file[book_file] = failure(book_file, e)
+                    print()
+    results = [by_file[book_file] for book_file in book_files]
 
     # Summary
     successful = [r for r in results if r.get("success")]
@@ -371,7 +680,7 @@ def main():
         "path",
         type=Path,
         nargs='?',
-        help="Path to ePub/TXT file or directory containing books"
+        help="Path to ePub/PDF/TXT file or directory containing books"
     )
 
     parser.add_argument(
@@ -392,6 +701,13 @@ def main():
         help="Show what would be ingested without actually ingesting"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes extracting books when importing a directory (0 = one per CPU core)"
+    )
+
     parser.add_argument(
         "--list-mappings",
         action="store_true",
@@ -424,7 +740,7 @@ def main():
     path = args.path
 
     if path.is_dir():
-        ingest_directory(path, dry_run=args.dry_run)
+        ingest_directory(path, dry_run=args.dry_run, workers=args.workers)
     elif path.is_file():
         ingest_book(path, elder_id=args.elder, book_title=args.title, dry_run=args.dry_run)
     else:
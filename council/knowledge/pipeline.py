@@ -0,0 +1,202 @@
+"""
+Staged worker pipeline for knowledge ingestion.
+
+Each stage has its own bounded pool of worker threads and reads from a
+bounded queue filled by the stage before it, so a slow stage (an LLM call)
+doesn't hold up a fast one (a subprocess download) beyond the queue size.
+Total time is then close to that of the slowest stage rather than the sum
+of all stages.
+
+A stage function returns the item to hand to the next stage, or None to
+drop it (for example a transcript that failed vetting). Exceptions are
+counted against the stage and drop the item; they never stop the pipeline,
+and neither do exceptions raised by the on_update/on_drop callbacks.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One step of a pipeline, run by *workers* threads."""
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class StageStats:
+    """Counters for one stage, updated as items pass through it."""
+
+    name: str
+    workers: int
+    started: int = 0
+    passed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    skipped: int = 0  # Discarded unprocessed after cancellation
+    busy_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def active(self) -> int:
+        return self.started - self.passed - self.dropped - self.failed
+
+    def to_dict(self) -> dict:
+        return {
+            "step": self.name,
+            "workers": self.workers,
+            "active": self.active,
+            "passed": self.passed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "busy_seconds": round(self.busy_seconds, 2),
+        }
+
+
+class StagedPipeline:
+    """Run items through stages concurrently, with queues between them.
+
+    Args:
+        stages: Stages in order; the last stage's return values are the results
+        queue_size: Capacity of each inter-stage queue (default: twice the
+            consuming stage's workers)
+        cancel: Event that stops the pipeline; queued items are discarded
+            and in-flight ones finish their current stage
+        on_update: Called with the pipeline after every item leaves a stage
+            (from worker threads; keep it cheap)
+        on_drop: Called with (stage name, item, error or None) when a stage
+            drops an item
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        queue_size: int | None = None,
+        cancel: threading.Event | None = None,
+        on_update: Callable[["StagedPipeline"], None] | None = None,
+        on_drop: Callable[[str, Any, Exception | None], None] | None = None,
+    ):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.cancel = cancel or threading.Event()
+        self.on_update = on_update
+        self.on_drop = on_drop
+        self.stats = [StageStats(s.name, max(1, s.workers)) for s in stages]
+        self.total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> int:
+        """Items that left the pipeline: completed, dropped, failed or skipped."""
+        last = self.stats[-1]
+        return last.passed + sum(s.dropped + s.failed + s.skipped for s in self.stats)
+
+    @property
+    def skipped(self) -> int:
+        """Items discarded unprocessed after cancellation."""
+        return sum(s.skipped for s in self.stats)
+
+    def progress(self) -> float:
+        """Share of items processed; skipped items don't count as progress."""
+        return (self.finished - self.skipped) / self.total if self.total else 1.0
+
+    def run(self, items: Iterable[Any]) -> list[Any]:
+        """Process *items*; returns the last stage's results, in completion order."""
+        items = list(items)
+        self.total = len(items)
+        queues = [
+            queue.Queue(maxsize=self.queue_size or 2 * stats.workers) for stats in self.stats
+        ]
+        results: list[Any] = []
+        remaining = [stats.workers for stats in self.stats]
+
+        def feed():
+            for fed, item in enumerate(items):
+                if self.cancel.is_set():
+                    with self._lock:
+                        self.stats[0].skipped += len(items) - fed
+                    break
+                queues[0].put(item)
+            for _ in range(self.stats[0].workers):
+                queues[0].put(_DONE)
+
+        def notify(callback, *args):
+            try:
+                callback(*args)
+            except Exception:
+                pass  # A broken callback must not strand the stages downstream
+
+        def work(index: int):
+            stage, stats = self.stages[index], self.stats[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            try:
+                while True:
+                    item = inbox.get()
+                    if item is _DONE:
+                        break
+                    if self.cancel.is_set():
+                        with self._lock:
+                            stats.skipped += 1
+                        continue
+                    with self._lock:
+                        stats.started += 1
+                    start = time.perf_counter()
+                    error = None
+                    try:
+                        output = stage.fn(item)
+                    except Exception as e:
+                        output, error = None, e
+                    with self._lock:
+                        stats.busy_seconds += time.perf_counter() - start
+                        if error is not None:
+                            stats.failed += 1
+                            stats.errors.append(f"{type(error).__name__}: {error}")
+                        elif output is None:
+                            stats.dropped += 1
+                        else:
+                            stats.passed += 1
+                            if outbox is None:
+                                results.append(output)
+                    if output is None and self.on_drop is not None:
+                        notify(self.on_drop, stage.name, item, error)
+                    if output is not None and outbox is not None:
+                        outbox.put(output)
+                    if self.on_update is not None:
+                        notify(self.on_update, self)
+            finally:
+                # The last worker of a stage tells the next stage it's done
+                with self._lock:
+                    remaining[index] -= 1
+                    last = remaining[index] == 0
+                if last and outbox is not None:
+                    for _ in range(self.stats[index + 1].workers):
+                        outbox.put(_DONE)
+
+        threads = [threading.Thread(target=feed, name="pipeline-feed", daemon=True)]
+        for index, stats in enumerate(self.stats):
+            threads += [
+                threading.Thread(target=work, args=(index,), name=f"pipeline-{stats.name}-{n}", daemon=True)
+                for n in range(stats.workers)
+            ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def snapshot(self) -> list[dict]:
+        """Per-stage counters, in the shape of TaskProgress.substeps."""
+        with self._lock:
+            return [stats.to_dict() for stats in self.stats]
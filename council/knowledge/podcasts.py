@@ -9,6 +9,7 @@ import re
 from pathlib import Path
 
 from council.config import get_knowledge_dir
+from council.knowledge.snippets import update_snippet_index
 from council.knowledge.youtube import get_video_info, save_transcript, vet_transcript, VideoInfo
 
 
@@ -161,6 +162,8 @@ def fetch_podcast_episode(
         f.write(f"\n---\n\n")
         f.write(video_info.transcript)
 
+    update_snippet_index(filepath)
+
     if verbose:
         print(f"      ✓ Saved")
 
@@ -0,0 +1,485 @@
+"""Quantized, memory-mapped storage backend for the knowledge store.
+
+ChromaDB keeps float32 vectors plus an HNSW graph in memory for every loaded
+collection, which adds up to gigabytes across all elders. With
+``knowledge_backend: quantized`` the store uses this backend instead:
+
+    ~/.council/knowledge/quantized/{collection}/
+        meta.json       dimension, dtype, collection metadata
+        records.sqlite  ids, documents and JSON metadata (row number = vector row)
+        vectors.bin     int8 rows with a float32 scale, or float16 rows
+        norms.bin       float32 squared norm of each quantized row
+        full.bin        float32 rows, read only for re-scoring
+
+A query scans the memory-mapped quantized rows for approximate squared-L2
+distances, then re-scores the best ``RESCORE_FACTOR * n_results`` candidates
+exactly against their float32 rows. Only the pages touched are resident, so
+process memory stays at roughly the quantized matrix size or less.
+
+QuantizedClient and QuantizedCollection implement the subset of ChromaDB's
+client/collection API that KnowledgeStore and snapshots use, so the rest of
+the code does not care which backend is active.
+"""
+
+import json
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from council.knowledge.embedding_cache import dequantize_int8, quantize_int8
+
+DTYPES = ("int8", "float16")
+RESCORE_FACTOR = 4
+SCAN_BLOCK = 65536
+MAX_BATCH_SIZE = 5000
+
+_OPERATORS = {"$eq": "=", "$ne": "!=", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def where_to_sql(where: dict) -> tuple[str, list]:
+    """Translate a ChromaDB-style ``where`` filter into SQL over JSON metadata."""
+    clauses = []
+    params: list = []
+    for key, condition in where.items():
+        if key in ("$and", "$or"):
+            parts = [where_to_sql(sub) for sub in condition]
+            joiner = " AND " if key == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            for _, sub_params in parts:
+                params.extend(sub_params)
+            continue
+
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        for op, value in condition.items():
+            field = "json_extract(metadata, ?)"
+            params.append(f'$."{key}"')
+            if op in _OPERATORS:
+                clauses.append(f"{field} {_OPERATORS[op]} ?")
+                params.append(value)
+            elif op in ("$in", "$nin"):
+                placeholders = ", ".join("?" for _ in value) or "NULL"
+                negate = "NOT " if op == "$nin" else ""
+                clauses.append(f"{field} {negate}IN ({placeholders})")
+                params.extend(value)
+            else:
+                raise ValueError(f"Unsupported where operator: {op}")
+    return " AND ".join(clauses) or "1", params
+
+
+class QuantizedCollection:
+    """One elder's vectors, documents and metadata."""
+
+    def __init__(self, path: Path, name: str, dtype: str = "int8",
+                 metadata: dict | None = None, embedding_function=None):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported quantized dtype: {dtype}")
+
+        self.path = path
+        self.name = name
+        self.embedding_function = embedding_function
+        self._lock = threading.RLock()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        meta_path = self.path / "meta.json"
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+        else:
+            meta = {"dim": None, "dtype": dtype, "metadata": metadata or {}}
+        self._meta = meta
+        self.dtype = meta["dtype"]
+        self._save_meta()
+
+        self._db = sqlite3.connect(str(self.path / "records.sqlite"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "row INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, document TEXT, metadata TEXT)"
+        )
+        self._db.commit()
+        self._maps: dict[str, np.ndarray] = {}
+        self._repair()
+
+    # -- file layout ---------------------------------------------------------
+
+    @property
+    def metadata(self) -> dict:
+        return self._meta["metadata"]
+
+    @property
+    def _dim(self) -> int | None:
+        return self._meta["dim"]
+
+    def _save_meta(self) -> None:
+        tmp = self.path / "meta.json.tmp"
+        tmp.write_text(json.dumps(self._meta))
+        tmp.replace(self.path / "meta.json")
+
+    def _row_bytes(self, kind: str) -> int:
+        if kind == "vectors":
+            return self._dim + 4 if self.dtype == "int8" else self._dim * 2
+        return self._dim * 4 if kind == "full" else 4
+
+    def _rows(self) -> int:
+        """Number of vector rows on disk, including rows of deleted records."""
+        return self._db.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM records").fetchone()[0]
+
+    def _live(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def _repair(self) -> None:
+        """Trim vector rows written by an add whose records never committed."""
+        if self._dim is None:
+            return
+        count = self._rows()
+        for kind in ("vectors", "norms", "full"):
+            path = self.path / f"{kind}.bin"
+            expected = count * self._row_bytes(kind)
+            if path.exists() and path.stat().st_size > expected:
+                with open(path, "r+b") as f:
+                    f.truncate(expected)
+
+    def _map(self, kind: str, rows: int) -> np.ndarray:
+        """Memory-mapped (rows, row_bytes) view, remapped when the file has grown."""
+        current = self._maps.get(kind)
+        if current is None or len(current) < rows:
+            current = np.memmap(
+                self.path / f"{kind}.bin", dtype=np.uint8, mode="r",
+                shape=(rows, self._row_bytes(kind)),
+            )
+            self._maps[kind] = current
+        return current[:rows]
+
+    # -- encoding ------------------------------------------------------------
+
+    def _encode(self, vectors: np.ndarray) -> tuple[bytes, np.ndarray]:
+        """Quantized row bytes and the squared norms of the decoded rows."""
+        if self.dtype == "float16":
+            half = vectors.astype("<f2")
+            decoded = half.astype(np.float32)
+            raw = half.tobytes()
+        else:
+            values, scales = quantize_int8(vectors)
+            decoded = dequantize_int8(values, scales)
+            rows = np.empty((len(vectors), self._dim + 4), dtype=np.uint8)
+            rows[:, :4] = scales.astype("<f4").view(np.uint8).reshape(-1, 4)
+            rows[:, 4:] = values.view(np.uint8)
+            raw = rows.tobytes()
+        return raw, np.einsum("ij,ij->i", decoded, decoded).astype("<f4")
+
+    def _approx_scores(self, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Dot products between *query* and quantized *rows*."""
+        if self.dtype == "float16":
+            return rows.view("<f2").astype(np.float32) @ query
+        scales = rows[:, :4].copy().view("<f4").reshape(-1)
+        return (rows[:, 4:].view(np.int8).astype(np.float32) @ query) * scales
+
+    def _write_rows(self, positions: list[int], vectors: np.ndarray) -> None:
+        """Write vectors at row *positions*; rows past the end are appended."""
+        raw, norms = self._encode(vectors)
+        payloads = {
+            "vectors": raw,
+            "norms": norms.tobytes(),
+            "full": vectors.astype("<f4").tobytes(),
+        }
+        for kind, payload in payloads.items():
+            size = self._row_bytes(kind)
+            path = self.path / f"{kind}.bin"
+            with open(path, "r+b" if path.exists() else "wb") as f:
+                if positions == list(range(positions[0], positions[0] + len(positions))):
+                    f.seek(positions[0] * size)
+                    f.write(payload)
+                    continue
+                for i, position in enumerate(positions):
+                    f.seek(position * size)
+                    f.write(payload[i * size:(i + 1) * size])
+        self._maps.clear()
+
+    # -- ChromaDB-compatible API ---------------------------------------------
+
+    def count(self) -> int:
+        with self._lock:
+            return self._live()
+
+    def modify(self, name: str | None = None, metadata: dict | None = None) -> None:
+        with self._lock:
+            if metadata is not None:
+                self._meta["metadata"] = dict(metadata)
+                self._save_meta()
+
+    def _embeddings_for(self, documents, embeddings) -> np.ndarray:
+        if embeddings is None:
+            if self.embedding_function is None:
+                raise ValueError("No embeddings given and no embedding function set")
+            embeddings = self.embedding_function(list(documents))
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def upsert(self, ids: Sequence[str], documents: Sequence[str] | None = None,
+               metadatas: Sequence[dict] | None = None, embeddings=None) -> None:
+        if not ids:
+            return
+        vectors = self._embeddings_for(documents, embeddings)
+        with self._lock:
+            if self._dim is None:
+                self._meta["dim"] = int(vectors.shape[1])
+                self._save_meta()
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match "
+                    f"collection dimension {self._dim}"
+                )
+
+            existing = self._row_numbers(ids)
+            next_row = self._rows()
+            positions = []
+            for chunk_id in ids:
+                if chunk_id not in existing:
+                    existing[chunk_id] = next_row
+                    next_row += 1
+                positions.append(existing[chunk_id])
+
+            # Vectors first: a crash before the commit leaves trailing rows
+            # that _repair() trims, never records without vectors.
+            self._write_rows(positions, vectors)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO records (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        position,
+                        chunk_id,
+                        documents[i] if documents is not None else None,
+                        json.dumps(metadatas[i] if metadatas is not None else {}),
+                    )
+                    for i, (chunk_id, position) in enumerate(zip(ids, positions))
+                ],
+            )
+            self._db.commit()
+
+    def add(self, ids: Sequence[str], documents: Sequence[str] | None = None,
+            metadatas: Sequence[dict] | None = None, embeddings=None) -> None:
+        with self._lock:
+            clashes = self._row_numbers(ids)
+            if clashes:
+                raise ValueError(f"IDs already exist: {sorted(clashes)[:5]}")
+            self.upsert(ids, documents, metadatas, embeddings)
+
+    def update(self, ids: Sequence[str], documents: Sequence[str] | None = None,
+               metadatas: Sequence[dict] | None = None, embeddings=None) -> None:
+        with self._lock:
+            rows = self._row_numbers(ids)
+            for i, chunk_id in enumerate(ids):
+                if chunk_id not in rows:
+                    continue
+                if documents is not None:
+                    self._db.execute("UPDATE records SET document = ? WHERE id = ?",
+                                     (documents[i], chunk_id))
+                if metadatas is not None:
+                    self._db.execute("UPDATE records SET metadata = ? WHERE id = ?",
+                                     (json.dumps(metadatas[i]), chunk_id))
+            self._db.commit()
+            if embeddings is not None:
+                present = [i for i, chunk_id in enumerate(ids) if chunk_id in rows]
+                vectors = np.asarray(embeddings, dtype=np.float32)[present]
+                self._write_rows([rows[ids[i]] for i in present], vectors)
+
+    def delete(self, ids: Sequence[str] | None = None, where: dict | None = None) -> None:
+        """Delete records; their vector rows stay on disk but are never returned."""
+        with self._lock:
+            if ids is not None:
+                ids = list(ids)
+                for start in range(0, len(ids), 900):
+                    batch = ids[start:start + 900]
+                    self._db.execute(
+                        f"DELETE FROM records WHERE id IN ({', '.join('?' for _ in batch)})", batch
+                    )
+            if where:
+                where_sql, params = where_to_sql(where)
+                self._db.execute(f"DELETE FROM records WHERE {where_sql}", params)
+            self._db.commit()
+
+    def _row_numbers(self, ids: Sequence[str]) -> dict[str, int]:
+        found: dict[str, int] = {}
+        ids = list(ids)
+        for start in range(0, len(ids), 900):
+            batch = ids[start:start + 900]
+            placeholders = ", ".join("?" for _ in batch)
+            for chunk_id, row in self._db.execute(
+                f"SELECT id, row FROM records WHERE id IN ({placeholders})", batch
+            ):
+                found[chunk_id] = row
+        return found
+
+    def _fetch(self, rows: Sequence[int]) -> dict[int, tuple[str, str, dict]]:
+        fetched = {}
+        rows = [int(r) for r in rows]
+        for start in range(0, len(rows), 900):
+            batch = rows[start:start + 900]
+            placeholders = ", ".join("?" for _ in batch)
+            for row, chunk_id, document, metadata in self._db.execute(
+                f"SELECT row, id, document, metadata FROM records WHERE row IN ({placeholders})",
+                batch,
+            ):
+                fetched[row] = (chunk_id, document, json.loads(metadata or "{}"))
+        return fetched
+
+    def _full(self, rows: Sequence[int]) -> np.ndarray:
+        total = self._rows()
+        return self._map("full", total)[np.asarray(rows, dtype=np.int64)].view("<f4").astype(np.float32)
+
+    def get(self, ids: Sequence[str] | None = None, where: dict | None = None,
+            limit: int | None = None, offset: int | None = None,
+            include: Sequence[str] = ("documents", "metadatas")) -> dict[str, Any]:
+        with self._lock:
+            where_sql, params = where_to_sql(where) if where else ("1", [])
+            select = "SELECT row, id, document, metadata FROM records WHERE "
+            if ids is None:
+                records = self._db.execute(select + where_sql + " ORDER BY row", params).fetchall()
+            else:
+                ids = list(ids)
+                records = []
+                for start in range(0, len(ids), 900):
+                    batch = ids[start:start + 900]
+                    placeholders = ", ".join("?" for _ in batch)
+                    records.extend(self._db.execute(
+                        select + f"id IN ({placeholders}) AND {where_sql}", batch + params
+                    ))
+                records.sort()
+            start = offset or 0
+            records = records[start:start + limit] if limit is not None else records[start:]
+
+            result: dict[str, Any] = {"ids": [r[1] for r in records]}
+            if "documents" in include:
+                result["documents"] = [r[2] for r in records]
+            if "metadatas" in include:
+                result["metadatas"] = [json.loads(r[3] or "{}") for r in records]
+            if "embeddings" in include:
+                result["embeddings"] = (
+                    self._full([r[0] for r in records]) if records
+                    else np.zeros((0, self._dim or 0), dtype=np.float32)
+                )
+            return result
+
+    def query(self, query_texts: Sequence[str] | None = None, query_embeddings=None,
+              n_results: int = 10, where: dict | None = None,
+              include: Sequence[str] = ("documents", "metadatas", "distances")) -> dict[str, Any]:
+        if query_embeddings is None:
+            query_embeddings = self.embedding_function(list(query_texts))
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+
+        result: dict[str, list] = {key: [] for key in ("ids", *include)}
+        with self._lock:
+            total = self._rows()
+            allowed = None
+            if where or self._live() < total:
+                # A filter, or holes left by deletes: scan only live matching rows
+                where_sql, params = where_to_sql(where) if where else ("1", [])
+                allowed = np.fromiter(
+                    (r for (r,) in self._db.execute(
+                        f"SELECT row FROM records WHERE {where_sql} ORDER BY row", params
+                    )),
+                    dtype=np.int64,
+                )
+
+            for query in queries:
+                rows = self._search(query, n_results, total, allowed)
+                distances = self._exact_distances(query, rows)
+                order = np.argsort(distances, kind="stable")[:n_results]
+                rows, distances = rows[order], distances[order]
+
+                fetched = self._fetch(rows)
+                result["ids"].append([fetched[r][0] for r in rows])
+                if "documents" in include:
+                    result["documents"].append([fetched[r][1] for r in rows])
+                if "metadatas" in include:
+                    result["metadatas"].append([fetched[r][2] for r in rows])
+                if "distances" in include:
+                    result["distances"].append([float(d) for d in distances])
+                if "embeddings" in include:
+                    result["embeddings"].append(self._full(rows) if len(rows) else [])
+        return result
+
+    def _search(self, query: np.ndarray, n_results: int, total: int,
+                allowed: np.ndarray | None) -> np.ndarray:
+        """Candidate rows by approximate distance over the quantized vectors."""
+        if total == 0 or self._dim is None:
+            return np.zeros(0, dtype=np.int64)
+        vectors = self._map("vectors", total)
+        norms = self._map("norms", total).view("<f4").reshape(-1)
+        keep = max(n_results * RESCORE_FACTOR, 1)
+
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_dist = np.zeros(0, dtype=np.float32)
+        candidates = allowed if allowed is not None else None
+        span = len(candidates) if candidates is not None else total
+
+        for start in range(0, span, SCAN_BLOCK):
+            if candidates is not None:
+                rows = candidates[start:start + SCAN_BLOCK]
+            else:
+                rows = np.arange(start, min(start + SCAN_BLOCK, total), dtype=np.int64)
+            block = vectors[rows] if candidates is not None else vectors[start:start + len(rows)]
+            # Squared L2 without the constant |q|^2 term
+            dist = norms[rows] - 2.0 * self._approx_scores(np.asarray(block), query)
+
+            best_rows = np.concatenate([best_rows, rows])
+            best_dist = np.concatenate([best_dist, dist.astype(np.float32)])
+            if len(best_rows) > keep:
+                top = np.argpartition(best_dist, keep - 1)[:keep]
+                best_rows, best_dist = best_rows[top], best_dist[top]
+        return best_rows
+
+    def _exact_distances(self, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        if not len(rows):
+            return np.zeros(0, dtype=np.float32)
+        diff = self._full(rows) - query
+        return np.einsum("ij,ij->i", diff, diff)
+
+    def close(self) -> None:
+        with self._lock:
+            self._maps.clear()
+            self._db.close()
+
+
+class QuantizedClient:
+    """Stand-in for ``chromadb.PersistentClient`` backed by QuantizedCollection."""
+
+    def __init__(self, path: str | Path, dtype: str = "int8"):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported quantized dtype: {dtype}")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dtype = dtype
+        self._collections: dict[str, QuantizedCollection] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create_collection(self, name: str, metadata: dict | None = None,
+                                 embedding_function=None) -> QuantizedCollection:
+        with self._lock:
+            if name not in self._collections:
+                self._collections[name] = QuantizedCollection(
+                    self.path / name, name, dtype=self.dtype,
+                    metadata=metadata, embedding_function=embedding_function,
+                )
+            collection = self._collections[name]
+            if embedding_function is not None:
+                collection.embedding_function = embedding_function
+            return collection
+
+    def delete_collection(self, name: str) -> None:
+        with self._lock:
+            collection = self._collections.pop(name, None)
+            if collection is not None:
+                collection.close()
+            if not (self.path / name).exists():
+                raise ValueError(f"Collection {name} does not exist")
+            shutil.rmtree(self.path / name)
+
+    def list_collections(self) -> list[QuantizedCollection]:
+        names = sorted(p.name for p in self.path.iterdir() if (p / "meta.json").exists())
+        return [self.get_or_create_collection(name) for name in names]
+
+    def get_max_batch_size(self) -> int:
+        return MAX_BATCH_SIZE
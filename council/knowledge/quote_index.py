@@ -0,0 +1,166 @@
+"""
+Local fuzzy quote index over an elder's knowledge files.
+
+Quote verification used to ask the LLM about every extracted quote. Many
+of them can be settled by looking at the texts we already have: a quote
+that appears (near) verbatim in the elder's own books or letters is
+confirmed, and one that isn't even in the material it was extracted from
+was misquoted by the extractor.
+
+Texts are normalised to lowercase word tokens (punctuation and apostrophes
+dropped, so "Don't" and "dont" agree) and every run of SHINGLE_SIZE tokens
+is indexed. A quote's shingles vote for where it starts in each document;
+the best-voted spots are then scored by token edit distance, so a few
+changed, missing or extra words still give a high similarity.
+"""
+
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SHINGLE_SIZE = 3
+# Shingles more common than this (e.g. "one of the") carry no signal
+MAX_POSTINGS = 2000
+# Candidate alignments scored per document
+MAX_CANDIDATES = 3
+
+_WORD_RE = re.compile(r"\w+")
+_APOSTROPHES_RE = re.compile(r"['’‘`]")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens, with apostrophes removed inside words."""
+    return _WORD_RE.findall(_APOSTROPHES_RE.sub("", text.lower()))
+
+
+def _fuzzy_distance(needle: list[str], haystack: list[str]) -> tuple[int, int, int]:
+    """Token edit distance of *needle* to its best-matching span of *haystack*.
+
+    Returns:
+        (distance, start, end) of the span
+    """
+    # Semi-global alignment: the span may start and end anywhere
+    previous = [0] * (len(haystack) + 1)
+    starts = list(range(len(haystack) + 1))
+    for i, token in enumerate(needle, 1):
+        current = [i] + [0] * len(haystack)
+        current_starts = [0] + [0] * len(haystack)
+        for j, other in enumerate(haystack, 1):
+            options = (
+                (previous[j - 1] + (token != other), starts[j - 1]),  # match / substitute
+                (previous[j] + 1, starts[j]),  # word missing from the text
+                (current[j - 1] + 1, current_starts[j - 1]),  # extra word in the text
+            )
+            current[j], current_starts[j] = min(options)
+        previous, starts = current, current_starts
+    end = min(range(len(haystack) + 1), key=lambda j: (previous[j], -j))
+    return previous[end], starts[end], end
+
+
+@dataclass
+class QuoteMatch:
+    """Where a quote was found and how closely it matched (1.0 = verbatim)."""
+    path: Path
+    similarity: float
+    excerpt: str
+
+
+class QuoteIndex:
+    """Word-shingle index of documents for fuzzy quote lookup."""
+
+    def __init__(self, shingle_size: int = SHINGLE_SIZE):
+        self.shingle_size = shingle_size
+        self.paths: list[Path] = []
+        self.tokens: list[list[str]] = []
+        self.postings: dict[tuple[str, ...], list[tuple[int, int]]] = defaultdict(list)
+
+    @classmethod
+    def build(
+        cls,
+        root: Path,
+        quotes: Iterable[str] | None = None,
+        paths: Iterable[Path] | None = None,
+    ) -> "QuoteIndex":
+        """Index every .txt file under *root*, or just the given *paths*.
+
+        With *quotes*, only files sharing at least one shingle with one of
+        them are kept, so the index holds the few candidate documents
+        instead of the whole corpus.
+        """
+        index = cls()
+        wanted = None
+        if quotes is not None:
+            wanted = {shingle for quote in quotes for shingle in index._shingles(tokenize(quote))}
+        for path in sorted(root.glob("**/*.txt")) if paths is None else paths:
+            try:
+                tokens = tokenize(path.read_text(encoding="utf-8", errors="replace"))
+            except OSError:
+                continue
+            if wanted is not None and wanted.isdisjoint(index._shingles(tokens)):
+                continue
+            index.add_tokens(path, tokens)
+        return index
+
+    def _shingles(self, tokens: list[str]) -> Iterator[tuple[str, ...]]:
+        size = self.shingle_size
+        return (tuple(tokens[pos:pos + size]) for pos in range(len(tokens) - size + 1))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def add(self, path: Path, text: str) -> None:
+        self.add_tokens(path, tokenize(text))
+
+    def add_tokens(self, path: Path, tokens: list[str]) -> None:
+        doc = len(self.paths)
+        self.paths.append(path)
+        self.tokens.append(tokens)
+        for pos, shingle in enumerate(self._shingles(tokens)):
+            self.postings[shingle].append((doc, pos))
+
+    def find(self, quote: str) -> list[QuoteMatch]:
+        """Best match of *quote* in each document that shares a shingle with it.
+
+        Returns:
+            Matches sorted by descending similarity; empty if the quote is
+            shorter than a shingle or shares nothing with the index
+        """
+        needle = tokenize(quote)
+        size = self.shingle_size
+        if len(needle) < size:
+            return []
+
+        # Each shared shingle votes for where the quote would start
+        votes: Counter[tuple[int, int]] = Counter()
+        for offset in range(len(needle) - size + 1):
+            postings = self.postings.get(tuple(needle[offset:offset + size]), ())
+            if len(postings) > MAX_POSTINGS:
+                continue
+            for doc, pos in postings:
+                votes[(doc, pos - offset)] += 1
+
+        by_doc: dict[int, list[int]] = defaultdict(list)
+        for (doc, start), _ in votes.most_common():
+            if len(by_doc[doc]) < MAX_CANDIDATES:
+                by_doc[doc].append(start)
+
+        matches = []
+        slack = max(2, len(needle) // 4)
+        for doc, starts in by_doc.items():
+            tokens = self.tokens[doc]
+            best = None
+            for start in starts:
+                lo, hi = max(0, start - slack), min(len(tokens), start + len(needle) + slack)
+                distance, span_start, span_end = _fuzzy_distance(needle, tokens[lo:hi])
+                if best is None or distance < best[0]:
+                    best = (distance, lo + span_start, lo + span_end)
+            distance, span_start, span_end = best
+            matches.append(QuoteMatch(
+                path=self.paths[doc],
+                similarity=max(0.0, 1 - distance / len(needle)),
+                excerpt=" ".join(tokens[span_start:span_end]),
+            ))
+        matches.sort(key=lambda m: -m.similarity)
+        return matches
@@ -0,0 +1,148 @@
+"""Diversity re-ranking of retrieved knowledge chunks.
+
+Nearest-neighbour retrieval tends to return clusters of near-identical text:
+chunks overlap by ~200 chars, so neighbouring chunks of the same passage all
+score well and fill the context budget with repetition. Retrieval therefore
+over-fetches candidates, re-ranks them with Maximal Marginal Relevance (MMR),
+and stitches overlapping adjacent chunks of the same source back together.
+"""
+
+import numpy as np
+
+
+def mmr(
+    query_embedding,
+    embeddings,
+    k: int,
+    lambda_mult: float = 0.5,
+) -> list[int]:
+    """Select *k* candidate indices by Maximal Marginal Relevance.
+
+    Each step picks the candidate maximising
+    ``lambda_mult * sim(query, d) - (1 - lambda_mult) * max sim(d, selected)``
+    using cosine similarity. ``lambda_mult=1`` is plain relevance order.
+
+    Returns indices into *embeddings* in selection order.
+    """
+    docs = np.asarray(embeddings, dtype=np.float32)
+    if docs.ndim != 2 or len(docs) == 0 or k <= 0:
+        return []
+
+    query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+    docs = docs / np.maximum(np.linalg.norm(docs, axis=1, keepdims=True), 1e-12)
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+    relevance = docs @ query
+    similarity = docs @ docs.T
+
+    first = int(np.argmax(relevance))
+    selected = [first]
+    max_similarity = similarity[first].copy()
+    available = np.ones(len(docs), dtype=bool)
+    available[first] = False
+
+    while len(selected) < min(k, len(docs)):
+        scores = lambda_mult * relevance - (1.0 - lambda_mult) * max_similarity
+        scores[~available] = -np.inf
+        chosen = int(np.argmax(scores))
+        selected.append(chosen)
+        available[chosen] = False
+        np.maximum(max_similarity, similarity[chosen], out=max_similarity)
+
+    return selected
+
+
+def join_overlapping(
+    first: str,
+    second: str,
+    min_overlap: int = 20,
+    max_overlap: int = 400,
+    overlap: int = 200,
+) -> str:
+    """Join two consecutive chunks, dropping the text they share.
+
+    The shared text is normally an exact prefix of *second*. If it is not
+    (the chunker strips whitespace at chunk edges), the end of *first* is
+    looked for within *second*'s first *overlap* chars; failing that, the
+    configured *overlap* is trimmed from *second* at a word boundary.
+    Chunks too short to have overlapped are joined with a newline.
+    """
+    longest = min(len(first), len(second), max_overlap)
+    for size in range(longest, min_overlap - 1, -1):
+        if first.endswith(second[:size]):
+            return first + second[size:]
+
+    anchor = first[-min_overlap:]
+    if len(anchor) == min_overlap:
+        found = second.find(anchor, 0, overlap + min_overlap)
+        if found != -1:
+            return first + second[found + min_overlap:]
+
+    if len(second) <= overlap:
+        return first + "\n" + second
+    cut = second.find(" ", overlap)
+    return first + "\n" + (second[cut + 1:] if cut != -1 else second[overlap:]).lstrip()
+
+
+def merge_adjacent(results: list[dict], overlap: int = 200) -> list[dict]:
+    """Merge results that are consecutive chunks of the same source.
+
+    Results keep their rank order; a chunk adjacent to an earlier-ranked one
+    (same ``source`` and ``part`` metadata, ``chunk_index`` one apart) is
+    folded into it. A chunk that bridges two runs joins them into the higher-ranked one.
+    *overlap* is the chunk overlap the store was ingested with.
+    """
+    merged: list[dict | None] = []
+    # ((source, part), chunk_index) -> position in merged, for both ends of each run
+    ends: dict[tuple[str, int], int] = {}
+    # position in merged -> (first chunk_index, last chunk_index)
+    spans: dict[int, tuple[int, int]] = {}
+
+    def join(first: str, second: str) -> str:
+        return join_overlapping(first, second, overlap=overlap)
+
+    for result in results:
+        metadata = result.get("metadata") or {}
+        source = metadata.get("source")
+        index = metadata.get("chunk_index")
+        if source is None or not isinstance(index, int):
+            merged.append(result)
+            continue
+        # Chunk indices restart in each separately stored part of a source
+        source = (source, metadata.get("part"))
+
+        before = ends.get((source, index - 1))
+        after = ends.get((source, index + 1))
+        if before is not None and spans.get(before, (None, None))[1] != index - 1:
+            before = None
+        if after is not None and spans.get(after, (None, None))[0] != index + 1:
+            after = None
+
+        if before is not None and after is not None:
+            keep, drop = min(before, after), max(before, after)
+            content = join(join(merged[before]["content"], result["content"]), merged[after]["content"])
+            merged[keep]["content"] = content
+            spans[keep] = (spans[before][0], spans[after][1])
+            ends[(source, spans[keep][0])] = ends[(source, spans[keep][1])] = keep
+            ends[(source, index)] = keep
+            merged[drop] = None
+            del spans[drop]
+        elif before is not None:
+            target = merged[before]
+            target["content"] = join(target["content"], result["content"])
+            start, _ = spans[before]
+            spans[before] = (start, index)
+            ends[(source, index)] = before
+        elif after is not None:
+            target = merged[after]
+            target["content"] = join(result["content"], target["content"])
+            _, end = spans[after]
+            spans[after] = (index, end)
+            ends[(source, index)] = after
+        else:
+            position = len(merged)
+            merged.append(dict(result))
+            spans[position] = (index, index)
+            ends[(source, index)] = position
+
+    return [result for result in merged if result is not None]
@@ -0,0 +1,249 @@
+"""Portable snapshots of elder knowledge bases.
+
+Copying ``~/.council/knowledge/chromadb`` between machines drags along
+SQLite, HNSW segments and WAL files. A snapshot is one compressed zip per
+elder holding just what is needed to rebuild the collection:
+
+    manifest.json       format version, elder, counts, embedding model, dtype
+    ids.json            chunk ids
+    metadatas.json      chunk metadata
+    texts.bin           UTF-8 chunk texts, concatenated
+    text_offsets.npy    uint64 byte offsets into texts.bin (count + 1)
+    embeddings.npy      int8 or float16 matrix, one row per chunk
+    scales.npy          float32 per-row scales (int8 only)
+
+Import upserts the stored vectors directly, so nothing is re-embedded.
+"""
+
+import io
+import json
+import time
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from council.config import get_config_value
+from council.knowledge.embedding_cache import (
+    dequantize_int8,
+    embedding_model_id,
+    quantize_int8,
+)
+
+SNAPSHOT_FORMAT = "council-knowledge-snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot.zip"
+DTYPES = ("int8", "float16", "float32")
+
+
+class SnapshotError(Exception):
+    """A snapshot could not be read or does not fit this store."""
+
+
+def _write_array(zf: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    zf.writestr(name, buffer.getvalue())
+
+
+def _read_array(zf: zipfile.ZipFile, name: str) -> np.ndarray:
+    return np.load(io.BytesIO(zf.read(name)), allow_pickle=False)
+
+
+def _page_size(store) -> int:
+    try:
+        return int(store.client.get_max_batch_size())
+    except Exception:
+        return 5000
+
+
+def export_elder(store, elder_id: str, output_dir: str | Path, dtype: str = "int8") -> Path:
+    """
+    Write a snapshot of one elder's collection.
+
+    Args:
+        store: The KnowledgeStore to read from
+        elder_id: The elder to export
+        output_dir: Directory for the snapshot file
+        dtype: Embedding storage type ("int8", "float16" or "float32")
+
+    Returns:
+        Path to the written snapshot
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported snapshot dtype: {dtype}")
+
+    collection = store.get_collection(elder_id)
+    ids: list[str] = []
+    metadatas: list[dict] = []
+    texts: list[str] = []
+    vectors: list[np.ndarray] = []
+
+    page = _page_size(store)
+    offset = 0
+    while True:
+        batch = collection.get(
+            include=["documents", "metadatas", "embeddings"],
+            limit=page,
+            offset=offset,
+        )
+        batch_ids = batch.get("ids") or []
+        if not batch_ids:
+            break
+        ids.extend(batch_ids)
+        metadatas.extend(m or {} for m in batch["metadatas"])
+        texts.extend(d or "" for d in batch["documents"])
+        vectors.append(np.asarray(batch["embeddings"], dtype=np.float32))
+        offset += len(batch_ids)
+
+    matrix = np.concatenate(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+    encoded = [t.encode("utf-8") for t in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(b) for b in encoded], dtype=np.uint64)
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "elder_id": elder_id,
+        "count": len(ids),
+        "dim": int(matrix.shape[1]) if matrix.ndim == 2 else 0,
+        "dtype": dtype,
+        "embedding_model": embedding_model_id(store.embedding_function_for(elder_id)),
+        "collection_metadata": dict(collection.metadata or {}),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{elder_id}{SNAPSHOT_SUFFIX}"
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        zf.writestr("ids.json", json.dumps(ids))
+        zf.writestr("metadatas.json", json.dumps(metadatas))
+        zf.writestr("texts.bin", b"".join(encoded))
+        _write_array(zf, "text_offsets.npy", offsets)
+        if dtype == "int8":
+            values, scales = quantize_int8(matrix)
+            _write_array(zf, "embeddings.npy", values)
+            _write_array(zf, "scales.npy", scales)
+        else:
+            _write_array(zf, "embeddings.npy", matrix.astype(dtype))
+
+    tmp_path.replace(path)
+    return path
+
+
+def read_manifest(path: str | Path) -> dict:
+    """Read and validate a snapshot's manifest."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+    except (OSError, KeyError, zipfile.BadZipFile, json.JSONDecodeError) as e:
+        raise SnapshotError(f"Not a knowledge snapshot: {path} ({e})")
+
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise SnapshotError(f"Not a knowledge snapshot: {path}")
+    if manifest.get("version", 0) > SNAPSHOT_VERSION:
+        raise SnapshotError(
+            f"Snapshot version {manifest['version']} is newer than supported "
+            f"({SNAPSHOT_VERSION}); upgrade council to import it"
+        )
+    return manifest
+
+
+def import_snapshot(
+    store,
+    path: str | Path,
+    elder_id: str | None = None,
+    replace: bool = False,
+    force: bool = False,
+    digest_now: bool = False,
+) -> dict[str, Any]:
+    """
+    Load a snapshot into the store without re-embedding.
+
+    Chunks are upserted by id, so importing the same snapshot twice is a no-op.
+
+    Args:
+        store: The KnowledgeStore to load into
+        path: Snapshot file
+        elder_id: Import under a different elder id (default: the manifest's)
+        replace: Clear the elder's existing knowledge first
+        force: Import even if the snapshot was made with a different embedding model
+        digest_now: Build the elder's digests before returning instead of
+            once writes go quiet (for short-lived processes like the CLI)
+
+    Returns:
+        The manifest, with "imported" set to the number of new chunks
+    """
+    manifest = read_manifest(path)
+    elder_id = elder_id or manifest["elder_id"]
+
+    model = embedding_model_id(store.embedding_function_for(elder_id))
+    if manifest.get("embedding_model") != model and not force:
+        raise SnapshotError(
+            f"Snapshot embeddings come from '{manifest.get('embedding_model')}' "
+            f"but this store uses '{model}'; queries would not match"
+        )
+
+    with zipfile.ZipFile(path) as zf:
+        ids = json.loads(zf.read("ids.json"))
+        metadatas = json.loads(zf.read("metadatas.json"))
+        blob = zf.read("texts.bin")
+        offsets = _read_array(zf, "text_offsets.npy")
+        values = _read_array(zf, "embeddings.npy")
+        if manifest["dtype"] == "int8":
+            embeddings = dequantize_int8(values, _read_array(zf, "scales.npy"))
+        else:
+            embeddings = values.astype(np.float32)
+
+    if not (len(ids) == len(metadatas) == len(offsets) - 1 == len(embeddings)):
+        raise SnapshotError(f"Snapshot arrays have inconsistent lengths: {path}")
+
+    texts = [
+        blob[int(offsets[i]):int(offsets[i + 1])].decode("utf-8")
+        for i in range(len(ids))
+    ]
+
+    with store.write_lock:
+        if store.registry.building(elder_id) is not None:
+            raise SnapshotError(f"{elder_id} is being re-embedded; import once it finishes")
+        if replace:
+            store.clear_elder(elder_id)
+        collection = store.get_collection(elder_id)
+
+        existing = set(collection.get(ids=ids, include=[]).get("ids") or []) if ids else set()
+
+        page = _page_size(store)
+        for start in range(0, len(ids), page):
+            end = start + page
+            collection.upsert(
+                ids=ids[start:end],
+                documents=texts[start:end],
+                metadatas=metadatas[start:end],
+                embeddings=embeddings[start:end],
+            )
+
+        # Let future ingestion recognise the imported chunks as duplicates
+        dedup = store.get_dedup_index(elder_id)
+        if dedup is not None:
+            from council.knowledge.dedup import minhash
+
+            by_source: dict[str, list[np.ndarray]] = {}
+            for chunk_id, text, metadata in zip(ids, texts, metadatas):
+                if chunk_id not in existing:
+                    source = str(metadata.get("source", "unknown"))
+                    by_source.setdefault(source, []).append(minhash(text))
+            for source, signatures in by_source.items():
+                dedup.commit(signatures, source, len(signatures))
+
+    if not digest_now:
+        store.schedule_digest(elder_id)
+    elif get_config_value("knowledge_digests_enabled", True):
+        store.build_digest(elder_id)
+
+    return {**manifest, "elder_id": elder_id, "imported": len(set(ids) - existing)}
@@ -0,0 +1,293 @@
+"""Precomputed per-elder snippet index for the knowledge fallback.
+
+When semantic search returns nothing, get_elder_knowledge() falls back to the
+raw knowledge files. Instead of globbing and reading whole files (some are
+full books) on every call, the opening snippet of each file is captured once
+at save time into a compact index at:
+
+    ~/.council/knowledge/{elder_id}/snippets.idx
+
+Layout: an 8-byte magic, a 4-byte little-endian manifest length, a JSON
+manifest, then the UTF-8 snippet bytes back to back. Each manifest entry
+records the file's relative path, size, mtime, confidence tier, and the byte
+offset/length of its snippet in the data section. Readers memory-map the
+index and slice out only the snippets they need.
+
+Readers also stat the elder's .txt files (without reading them) and refresh
+the entries of files that were added, changed or deleted behind the index's
+back, e.g. dropped into ``sources/`` by hand, so the index always reflects
+the disk. Files that can't be read are indexed without a snippet, so they
+don't look new on every call.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+
+from council.config import get_knowledge_dir
+
+SNIPPET_CHARS = 2000
+INDEX_FILENAME = "snippets.idx"
+
+_MAGIC = b"CSNIPv1\n"
+_HEADER = struct.Struct("<I")
+
+_write_lock = threading.Lock()
+# elder_id -> (index mtime_ns, {path: (mtime_ns, size)}, [(confidence, snippet), ...])
+_cache: dict[str, tuple[int, dict, list[tuple[float, str]]]] = {}
+
+
+def get_snippet_index_path(elder_id: str) -> Path:
+    """Return the snippet index path for an elder (may not exist yet)."""
+    return get_knowledge_dir() / elder_id / INDEX_FILENAME
+
+
+def source_confidence(rel_parts: tuple[str, ...]) -> float:
+    """Heuristic confidence for a knowledge file from its directory."""
+    if "sources" in rel_parts:
+        return 0.5  # Unvetted user uploads
+    if "youtube" in rel_parts:
+        return 0.7  # Default YouTube
+    return 0.7  # Other knowledge files
+
+
+def _make_entry(elder_dir: Path, filepath: Path) -> tuple[dict, bytes] | None:
+    """Read the opening snippet of *filepath* (never the whole file).
+
+    A file that exists but can't be read as UTF-8 gets an ``unreadable``
+    entry with no snippet, so it isn't retried until it changes.
+    """
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+    try:
+        with open(filepath, encoding="utf-8") as f:
+            snippet = f.read(SNIPPET_CHARS)
+    except (OSError, UnicodeDecodeError):
+        snippet = None
+
+    rel = filepath.relative_to(elder_dir)
+    entry = {
+        "path": rel.as_posix(),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "confidence": source_confidence(rel.parts),
+    }
+    if snippet is None:
+        entry["unreadable"] = True
+        return entry, b""
+    return entry, snippet.encode("utf-8")
+
+
+def _scan_files(elder_dir: Path) -> dict[str, tuple[int, int]]:
+    """Map each of an elder's .txt files to its (mtime_ns, size)."""
+    files = {}
+    for filepath in elder_dir.glob("**/*.txt"):
+        try:
+            stat = filepath.stat()
+        except OSError:
+            continue
+        files[filepath.relative_to(elder_dir).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def _signature(entries: list[tuple[dict, bytes]]) -> dict[str, tuple[int, int]]:
+    return {entry["path"]: (entry["mtime_ns"], entry["size"]) for entry, _ in entries}
+
+
+def _read_index(index_path: Path) -> list[tuple[dict, bytes]]:
+    """Read every entry and its snippet bytes from an index file."""
+    try:
+        with open(index_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            manifest, data_start = _parse_header(mm)
+            return [
+                (entry, mm[data_start + entry["offset"]:data_start + entry["offset"] + entry["length"]])
+                for entry in manifest
+            ]
+    except (OSError, ValueError):
+        return []
+
+
+def _parse_header(mm: mmap.mmap) -> tuple[list[dict], int]:
+    if mm[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("Not a snippet index")
+    pos = len(_MAGIC)
+    (manifest_len,) = _HEADER.unpack_from(mm, pos)
+    pos += _HEADER.size
+    manifest = json.loads(mm[pos:pos + manifest_len].decode("utf-8"))
+    return manifest, pos + manifest_len
+
+
+def _write_index(index_path: Path, entries: list[tuple[dict, bytes]]) -> None:
+    """Atomically write *entries* (sorted like the old glob fallback)."""
+    entries = sorted(entries, key=lambda e: Path(e[0]["path"]).parts)
+
+    manifest = []
+    offset = 0
+    for entry, data in entries:
+        manifest.append({**entry, "offset": offset, "length": len(data)})
+        offset += len(data)
+
+    manifest_bytes = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+    tmp_path = index_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER.pack(len(manifest_bytes)))
+        f.write(manifest_bytes)
+        for _, data in entries:
+            f.write(data)
+    os.replace(tmp_path, index_path)
+
+
+def build_snippet_index(elder_id: str) -> int:
+    """(Re)build an elder's snippet index from their knowledge files.
+
+    Returns the number of files indexed.
+    """
+    elder_dir = get_knowledge_dir() / elder_id
+    if not elder_dir.exists():
+        return 0
+
+    entries = []
+    for filepath in elder_dir.glob("**/*.txt"):
+        made = _make_entry(elder_dir, filepath)
+        if made:
+            entries.append(made)
+
+    with _write_lock:
+        _write_index(elder_dir / INDEX_FILENAME, entries)
+    return len(entries)
+
+
+def update_snippet_index(filepath: str | Path) -> bool:
+    """Add or refresh a single knowledge file in its elder's snippet index.
+
+    Called by the knowledge savers right after they write a file. The elder
+    is derived from the file's location under the knowledge directory.
+
+    Returns True if the index was updated.
+    """
+    filepath = Path(filepath)
+    try:
+        rel = filepath.resolve().relative_to(get_knowledge_dir().resolve())
+    except ValueError:
+        return False
+    if len(rel.parts) < 2 or filepath.suffix != ".txt":
+        return False
+
+    elder_dir = get_knowledge_dir() / rel.parts[0]
+    made = _make_entry(elder_dir, elder_dir.joinpath(*rel.parts[1:]))
+    if made is None:
+        return False
+
+    index_path = elder_dir / INDEX_FILENAME
+    with _write_lock:
+        if index_path.exists():
+            entries = [e for e in _read_index(index_path) if e[0]["path"] != made[0]["path"]]
+        else:
+            # First file for this elder (or a pre-index install): capture everything
+            entries = [
+                e for e in (_make_entry(elder_dir, p) for p in elder_dir.glob("**/*.txt"))
+                if e and e[0]["path"] != made[0]["path"]
+            ]
+        entries.append(made)
+        try:
+            _write_index(index_path, entries)
+        except OSError:
+            return False
+    return True
+
+
+def remove_from_snippet_index(filepath: str | Path) -> bool:
+    """Drop a deleted knowledge file from its elder's snippet index.
+
+    Returns True if the index had an entry for the file.
+    """
+    filepath = Path(filepath)
+    try:
+        rel = filepath.resolve().relative_to(get_knowledge_dir().resolve())
+    except ValueError:
+        return False
+    if len(rel.parts) < 2:
+        return False
+
+    index_path = get_knowledge_dir() / rel.parts[0] / INDEX_FILENAME
+    path = Path(*rel.parts[1:]).as_posix()
+    with _write_lock:
+        entries = _read_index(index_path)
+        kept = [e for e in entries if e[0]["path"] != path]
+        if len(kept) == len(entries):
+            return False
+        try:
+            _write_index(index_path, kept)
+        except OSError:
+            return False
+    return True
+
+
+def _refresh_index(elder_dir: Path, files: dict[str, tuple[int, int]]) -> None:
+    """Bring the index in line with *files*, re-reading only what changed."""
+    index_path = elder_dir / INDEX_FILENAME
+    with _write_lock:
+        old = {entry["path"]: (entry, data) for entry, data in _read_index(index_path)}
+        entries = []
+        for path, (mtime_ns, size) in files.items():
+            kept = old.get(path)
+            if kept is not None and (kept[0]["mtime_ns"], kept[0]["size"]) == (mtime_ns, size):
+                entries.append((
+                    {k: v for k, v in kept[0].items() if k not in ("offset", "length")},
+                    kept[1],
+                ))
+                continue
+            made = _make_entry(elder_dir, elder_dir / path)
+            if made:
+                entries.append(made)
+        try:
+            _write_index(index_path, entries)
+        except OSError:
+            pass
+
+
+def load_snippets(elder_id: str, limit: int = 5) -> list[tuple[float, str]]:
+    """Return up to *limit* (confidence, snippet) pairs for an elder.
+
+    Snippets come from the compact index. The elder's files are only
+    stat'ed: if any were added, changed or deleted since the index was
+    written (or there is no index yet), their entries are refreshed first.
+    """
+    elder_dir = get_knowledge_dir() / elder_id
+    if not elder_dir.is_dir():
+        return []
+    files = _scan_files(elder_dir)
+    if not files:
+        return []
+
+    index_path = elder_dir / INDEX_FILENAME
+    cached = _cache.get(elder_id)
+    try:
+        mtime_ns = index_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if cached is not None and cached[0] == mtime_ns and cached[1] == files:
+        return cached[2][:limit]
+
+    entries = _read_index(index_path) if mtime_ns is not None else []
+    if mtime_ns is None or _signature(entries) != files:
+        _refresh_index(elder_dir, files)
+        entries = _read_index(index_path)
+        try:
+            mtime_ns = index_path.stat().st_mtime_ns
+        except OSError:
+            return []
+
+    snippets = [
+        (entry["confidence"], data.decode("utf-8", errors="replace"))
+        for entry, data in entries
+        if not entry.get("unreadable")
+    ]
+    _cache[elder_id] = (mtime_ns, _signature(entries), snippets)
+    return snippets[:limit]
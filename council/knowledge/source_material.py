@@ -3,7 +3,8 @@
 Saves raw files to ~/.council/knowledge/{elder_id}/sources/,
 indexes text into ChromaDB (if available), and updates elder metadata.
 Falls back gracefully: even without ChromaDB, raw .txt files in the
-sources directory are picked up by get_elder_knowledge()'s glob fallback.
+sources directory are recorded in the elder's snippet index, which
+get_elder_knowledge() uses as its fallback.
 """
 
 import json
@@ -11,8 +12,11 @@ import logging
 import re
 import time
 from pathlib import Path
+from typing import Iterator
 
 from council.config import get_knowledge_dir
+from council.knowledge.indexer import mark_indexed
+from council.knowledge.snippets import update_snippet_index
 from council.llm import chat
 
 logger = logging.getLogger(__name__)
@@ -73,6 +77,24 @@ def get_sources_dir(elder_id: str) -> Path:
     return sources_dir
 
 
+def iter_pdf_pages(file_path: Path) -> Iterator[str]:
+    """Yield the text of each page of a PDF, one page in memory at a time."""
+    try:
+        import fitz  # pymupdf
+    except ImportError:
+        raise ImportError(
+            "PDF support requires pymupdf. "
+            "Install it with: pip install 'council-of-elders[pdf]'"
+        )
+
+    doc = fitz.open(str(file_path))
+    try:
+        for page in doc:
+            yield page.get_text()
+    finally:
+        doc.close()
+
+
 def extract_file_text(file_path: Path) -> str:
     """Extract plain text from a .txt, .md, or .pdf file."""
     suffix = file_path.suffix.lower()
@@ -81,18 +103,7 @@ def extract_file_text(file_path: Path) -> str:
         return file_path.read_text(encoding="utf-8", errors="replace")
 
     if suffix == ".pdf":
-        try:
-            import fitz  # pymupdf
-
-            doc = fitz.open(str(file_path))
-            pages = [page.get_text() for page in doc]
-            doc.close()
-            return "\n\n".join(pages)
-        except ImportError:
-            raise ImportError(
-                "PDF support requires pymupdf. "
-                "Install it with: pip install 'council-of-elders[pdf]'"
-            )
+        return "\n\n".join(iter_pdf_pages(file_path))
 
     raise ValueError(f"Unsupported file type: {suffix}")
 
@@ -148,6 +159,8 @@ def ingest_source_material(
         filename = f"pasted_{int(time.time())}.txt"
         filepath = sources_dir / filename
         filepath.write_text(source_text, encoding="utf-8")
+        update_snippet_index(filepath)
+        mark_indexed(filepath)  # indexed below, with vetting metadata
 
         vetting = vet_source_material(elder_id, source_text, filename)
         entry = {
@@ -169,6 +182,8 @@ def ingest_source_material(
         safe_name = Path(filename).name
         filepath = sources_dir / safe_name
         filepath.write_bytes(file_bytes)
+        update_snippet_index(filepath)
+        mark_indexed(filepath)  # indexed below, with vetting metadata
 
         try:
             text = extract_file_text(filepath)
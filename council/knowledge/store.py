@@ -1,10 +1,120 @@
 """Knowledge store using ChromaDB for RAG."""
 
 import hashlib
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from council.config import get_knowledge_dir
+from council.config import get_config_value, get_knowledge_dir
+
+# Bump when normalize_metadata() changes; older collections are migrated
+METADATA_SCHEMA = 2
+
+# Confidence floors for tiered retrieval, highest first
+CONFIDENCE_TIERS = (0.7, 0.5, 0.0)
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("true", "1")
+
+
+def source_confidence(metadata: dict) -> float:
+    """Derive a confidence weight (0.0-1.0) from chunk metadata."""
+    source_type = metadata.get("type", "")
+    vetting_confidence = metadata.get("vetting_confidence")
+    audit_passed = metadata.get("audit_passed")
+
+    # User-uploaded source material
+    if vetting_confidence is not None:
+        try:
+            conf = int(vetting_confidence)
+        except (ValueError, TypeError):
+            conf = 50
+        if conf >= 70:
+            return 0.9  # Verified user source
+        return 0.5  # Unvetted / low-confidence
+
+    if source_type == "source_material":
+        return 0.5  # Unvetted upload
+
+    # YouTube transcripts
+    if source_type == "youtube":
+        if audit_passed is not None:
+            if _as_bool(audit_passed):
+                return 0.8  # Audit passed
+            return 0.3  # Audit failed
+        return 0.7  # Default YouTube (no audit data)
+
+    # Default for other types (e.g. Kindle books, letters)
+    return 0.7
+
+
+def normalize_metadata(metadata: dict) -> dict:
+    """Store audit/vetting metadata as typed, filterable fields.
+
+    Adds a numeric ``confidence`` and a ``source_type`` to every chunk and
+    coerces ``audit_passed`` to bool and scores to int, so retrieval can
+    filter with ``where`` clauses instead of post-processing results.
+    """
+    normalized = dict(metadata)
+    if "audit_passed" in normalized:
+        normalized["audit_passed"] = _as_bool(normalized["audit_passed"])
+    for key in ("vetting_confidence", "quality_score"):
+        if key in normalized:
+            try:
+                normalized[key] = int(normalized[key])
+            except (ValueError, TypeError):
+                del normalized[key]
+
+    if "type" in normalized:
+        normalized["source_type"] = str(normalized["type"])
+    elif "vetting_confidence" in normalized:
+        normalized["source_type"] = "source_material"
+    else:
+        normalized["source_type"] = "document"
+
+    normalized["confidence"] = source_confidence(normalized)
+    return normalized
+
+
+class TimedLock:
+    """Lock that records how long callers waited to acquire it."""
+
+    def __init__(self, reentrant: bool = False):
+        self._lock = threading.RLock() if reentrant else threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.acquisitions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def __enter__(self):
+        start = time.perf_counter()
+        self._lock.acquire()
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self.acquisitions += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+                "mean_wait_ms": round(self.total_wait * 1000 / self.acquisitions, 3)
+                if self.acquisitions else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
 
 
 class KnowledgeStore:
@@ -13,42 +123,280 @@ class KnowledgeStore:
 
     This allows adding custom documents (books, speeches, letters) for each elder
     to enhance their responses with specific knowledge.
+
+    Chunk embeddings are computed by the store (not inside ``collection.add``)
+    so they can be served from the persistent embedding cache when the same
+    text is ingested again.
+
+    The store is shared by Flask request threads and background tasks:
+
+    - lazy resources (client, embedding function, cache) are created once
+      under an init lock; call initialize() to do it up front
+    - collection handles are created under a lock, then cached per thread so
+      the read path takes no lock at all
+    - writes are serialized by a write lock (dedup check + add + commit must
+      not interleave); background ingestion can go through the write queue
+      via add_document_async() instead of holding a worker thread
+
+    lock_stats() reports how long callers waited on each lock.
+
+    Elder collections are versioned (see council.knowledge.versions):
+    reembed_elder() builds a new version with another embedding function
+    while queries keep using the live one, then swaps it in atomically.
+
+    Writes schedule a debounced rebuild of the elder's per-category
+    knowledge digests (see council.knowledge.digests) and of their corpus
+    centroid in the elder index (see council.knowledge.elder_index).
     """
 
-    def __init__(self):
+    def __init__(self, embedding_function=None, embedding_cache=None):
         self._client = None
         self._collections: dict[str, Any] = {}
+        self._generations: dict[str, int] = {}
+        self._local = threading.local()
+        self._embedding_function = embedding_function
+        self._embedding_cache = embedding_cache
+        self._dedup_indexes: dict[str, Any] = {}
+        self._registry = None
+        self._version_functions: dict[str, Any] = {}
+        self._digest_timers: dict[str, threading.Timer] = {}
+        self._digest_lock = threading.Lock()
+
+        self._init_lock = TimedLock(reentrant=True)
+        self._collections_lock = TimedLock()
+        self._write_lock = TimedLock(reentrant=True)
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+
+    def initialize(self) -> "KnowledgeStore":
+        """Create the client and warm up the embedding function now rather than on first use."""
+        self.client
+        warm_up = getattr(self.embedding_function, "warm_up", None)
+        if warm_up is not None:
+            try:
+                warm_up()
+            except Exception:
+                pass  # Surfaces again, with context, on the first real embed
+        return self
 
     @property
     def client(self):
-        """Lazy-load ChromaDB client."""
+        """Lazy-load ChromaDB client (or the quantized backend, if configured)."""
         if self._client is None:
-            try:
-                import chromadb
-                from chromadb.config import Settings
+            with self._init_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
 
-                persist_dir = get_knowledge_dir() / "chromadb"
-                persist_dir.mkdir(parents=True, exist_ok=True)
+    def _create_client(self):
+        if get_config_value("knowledge_backend", "chroma") == "quantized":
+            from council.knowledge.quantized import QuantizedClient
 
-                self._client = chromadb.PersistentClient(
-                    path=str(persist_dir),
-                    settings=Settings(anonymized_telemetry=False),
-                )
-            except ImportError:
-                raise ImportError(
-                    "ChromaDB is required for knowledge storage. "
-                    "Install it with: pip install chromadb"
+            return QuantizedClient(
+                get_knowledge_dir() / "quantized",
+                dtype=get_config_value("quantized_dtype", "int8"),
+            )
+        try:
+            import chromadb
+            from chromadb.config import Settings
+
+            persist_dir = get_knowledge_dir() / "chromadb"
+            persist_dir.mkdir(parents=True, exist_ok=True)
+
+            return chromadb.PersistentClient(
+                path=str(persist_dir),
+                settings=Settings(anonymized_telemetry=False),
+            )
+        except ImportError:
+            raise ImportError(
+                "ChromaDB is required for knowledge storage. "
+                "Install it with: pip install chromadb"
+            )
+
+    @property
+    def embedding_function(self):
+        """Lazy-load the embedding function (the configured embedding backend)."""
+        if self._embedding_function is None:
+            with self._init_lock:
+                if self._embedding_function is None:
+                    from council.knowledge.embeddings import create_embedding_function
+
+                    self._embedding_function = create_embedding_function()
+        return self._embedding_function
+
+    def embedding_stats(self) -> dict | None:
+        """Throughput of the store's embedding function, if it keeps counters."""
+        stats = getattr(self._embedding_function, "stats", None)
+        return stats() if stats is not None else None
+
+    @property
+    def embedding_cache(self):
+        """Lazy-load the on-disk embedding cache, or None if disabled."""
+        if self._embedding_cache is None:
+            with self._init_lock:
+                if self._embedding_cache is None:
+                    self._embedding_cache = self._create_embedding_cache()
+        return self._embedding_cache if self._embedding_cache is not False else None
+
+    @property
+    def registry(self):
+        """Lazy-load the collection version registry."""
+        if self._registry is None:
+            with self._init_lock:
+                if self._registry is None:
+                    from council.knowledge.versions import REGISTRY_FILENAME, CollectionRegistry
+
+                    self._registry = CollectionRegistry(get_knowledge_dir() / REGISTRY_FILENAME)
+        return self._registry
+
+    def embedding_function_for(self, elder_id: str, version: int | None = None):
+        """Embedding function of an elder's live (or given) collection version."""
+        if version is None:
+            version = self.registry.live(elder_id)
+        spec = self.registry.spec(elder_id, version)
+        if spec is None:
+            return self.embedding_function
+
+        from council.knowledge.versions import embedding_spec
+
+        if spec == embedding_spec(self.embedding_function):
+            return self.embedding_function
+
+        key = json.dumps(spec, sort_keys=True)
+        if key not in self._version_functions:
+            with self._init_lock:
+                if key not in self._version_functions:
+                    from council.knowledge.embeddings import embedding_function_from_spec
+
+                    self._version_functions[key] = embedding_function_from_spec(spec)
+        return self._version_functions[key]
+
+    def _create_embedding_cache(self):
+        if not get_config_value("embedding_cache_enabled", True):
+            return False
+        from council.knowledge.embedding_cache import EmbeddingCache, embedding_model_id
+
+        return EmbeddingCache(
+            embedding_model_id(self.embedding_function),
+            dtype=get_config_value("embedding_cache_dtype", "float16"),
+        )
+
+    def embed(self, texts: list[str], embedding_function=None) -> list[list[float]]:
+        """Embed texts, reusing cached embeddings where available.
+
+        The cache only holds the store's default model; other embedding
+        functions (for a versioned collection) are called directly.
+        """
+        if not texts:
+            return []
+        if embedding_function is not None and embedding_function is not self.embedding_function:
+            return [list(map(float, vec)) for vec in embedding_function(texts)]
+        cache = self.embedding_cache
+        if cache is not None:
+            return cache.embed(texts, self.embedding_function)
+        return [list(map(float, vec)) for vec in self.embedding_function(texts)]
+
+    def get_dedup_index(self, elder_id: str):
+        """Get the near-duplicate index for an elder, or None if disabled."""
+        if not get_config_value("dedup_enabled", True):
+            return None
+        with self._collections_lock:
+            if elder_id not in self._dedup_indexes:
+                from council.knowledge.dedup import NearDuplicateIndex
+
+                self._dedup_indexes[elder_id] = NearDuplicateIndex(
+                    elder_id, threshold=get_config_value("dedup_threshold", 0.8)
                 )
-        return self._client
+            return self._dedup_indexes[elder_id]
+
+    def dedup_report(self, elder_id: str) -> dict[str, dict]:
+        """Per-source dedup ratios for an elder's ingested documents."""
+        index = self.get_dedup_index(elder_id)
+        return index.report() if index is not None else {}
 
     def get_collection(self, elder_id: str):
         """Get or create a collection for an elder."""
-        if elder_id not in self._collections:
-            self._collections[elder_id] = self.client.get_or_create_collection(
-                name=f"elder_{elder_id}",
-                metadata={"description": f"Knowledge base for {elder_id}"},
+        handles = getattr(self._local, "collections", None)
+        if handles is None:
+            handles = self._local.collections = {}
+
+        # Another process may have swapped in a new version since
+        live = self.registry.live(elder_id)
+        cached = handles.get(elder_id)
+        if cached is not None and cached[:2] == (self._generations.get(elder_id, 0), live):
+            return cached[2]
+
+        with self._collections_lock:
+            opened = self._collections.get(elder_id)
+            if opened is None or opened[0] != live:
+                if opened is not None:
+                    self._invalidate(elder_id)
+                opened = self._collections[elder_id] = (live, self._open_version(elder_id, live))
+            collection = opened[1]
+            generation = self._generations.get(elder_id, 0)
+
+        handles[elder_id] = (generation, live, collection)
+        return collection
+
+    def _open_version(self, elder_id: str, version: int):
+        """Get or create the collection for one version of an elder's knowledge."""
+        from council.knowledge.versions import collection_name, embedding_spec
+
+        name = collection_name(elder_id, version)
+        if self.registry.spec(elder_id, version) is None:
+            # Pin the version to the model that embeds it, so changing
+            # embedding_backend later doesn't mix vector spaces
+            spec = self._existing_spec(name) or embedding_spec(self.embedding_function)
+            if spec is not None:
+                self.registry.record(elder_id, version, spec)
+
+        collection = self.client.get_or_create_collection(
+            name=name,
+            metadata={"description": f"Knowledge base for {elder_id}"},
+            embedding_function=self.embedding_function_for(elder_id, version),
+        )
+        if (collection.metadata or {}).get("metadata_schema") != METADATA_SCHEMA:
+            self._migrate_metadata(collection)
+        return collection
+
+    def _existing_spec(self, name: str) -> dict | None:
+        """Embedding spec of an existing collection that the registry doesn't know yet.
+
+        Uses the embedding function Chroma persisted with the collection.
+        Collections without one predate configurable backends, so they were
+        embedded by Chroma's default. None if the collection doesn't exist.
+        """
+        from council.knowledge.versions import LEGACY_SPEC
+
+        for collection in self.client.list_collections():
+            if collection.name == name:
+                persisted = (getattr(collection, "configuration_json", None) or {}).get("embedding_function") or {}
+                if persisted.get("type") == "known" and persisted.get("name"):
+                    return {"name": persisted["name"], "config": persisted.get("config") or {}}
+                return LEGACY_SPEC
+        return None
+
+    def _invalidate(self, elder_id: str) -> None:
+        """Drop cached handles for an elder in every thread (caller holds the lock)."""
+        self._collections.pop(elder_id, None)
+        self._generations[elder_id] = self._generations.get(elder_id, 0) + 1
+
+    def _migrate_metadata(self, collection, batch_size: int = 1000) -> None:
+        """Normalize metadata of chunks ingested before typed fields existed."""
+        existing = collection.get(include=["metadatas"])
+        ids = existing.get("ids") or []
+        metadatas = existing.get("metadatas") or []
+        for start in range(0, len(ids), batch_size):
+            collection.update(
+                ids=ids[start:start + batch_size],
+                metadatas=[
+                    normalize_metadata(m or {}) for m in metadatas[start:start + batch_size]
+                ],
             )
-        return self._collections[elder_id]
+        collection.modify(metadata={
+            **(collection.metadata or {}),
+            "metadata_schema": METADATA_SCHEMA,
+        })
 
     def add_document(
         self,
@@ -61,6 +409,9 @@ class KnowledgeStore:
         """
         Add a document to an elder's knowledge base.
 
+        Chunks that are near-duplicates of text the elder already has (or of
+        earlier chunks in this document) are skipped.
+
         Args:
             elder_id: The elder this document is for
             content: The document text
@@ -71,10 +422,120 @@ class KnowledgeStore:
         Returns:
             Number of chunks added
         """
+        chunks = self._chunk_text(content, chunk_size, chunk_overlap)
+        prepared = self._prepare_embeddings(elder_id, chunks)
+        with self._write_lock:
+            return self._add_document(elder_id, chunks, metadata, prepared)
+
+    def _prepare_embeddings(self, elder_id: str, chunks: list[str]) -> tuple[Any, dict]:
+        """Embed the chunks that will probably be kept, without holding the write lock.
+
+        Embedding is the slow part of ingestion, so doing it before taking
+        the lock lets concurrent ingests embed in parallel. The dedup check
+        is repeated under the lock; its result decides what is stored.
+
+        Returns:
+            The embedding function used and a {chunk: embedding} map
+        """
+        dedup = self.get_dedup_index(elder_id)
+        keep = dedup.check(chunks)[0] if dedup is not None else [True] * len(chunks)
+        documents = list(dict.fromkeys(c for c, k in zip(chunks, keep) if k))
+        embedding_function = self.embedding_function_for(elder_id)
+        return embedding_function, dict(zip(documents, self.embed(documents, embedding_function)))
+
+    def _embed_documents(
+        self, documents: list[str], embedding_function, prepared: tuple[Any, dict] | None = None
+    ) -> list[list[float]]:
+        """Embeddings for *documents*, reusing prepared ones made with the same function."""
+        vectors = dict(prepared[1]) if prepared and prepared[0] is embedding_function else {}
+        missing = [doc for doc in dict.fromkeys(documents) if doc not in vectors]
+        if missing:
+            vectors.update(zip(missing, self.embed(missing, embedding_function)))
+        return [vectors[doc] for doc in documents]
+
+    def add_document_async(
+        self,
+        elder_id: str,
+        content: str,
+        metadata: dict | None = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+    ) -> Future:
+        """
+        Queue a document for the background writer.
+
+        Returns:
+            Future resolving to the number of chunks added
+        """
+        return self.submit_write(
+            self.add_document, elder_id, content, metadata, chunk_size, chunk_overlap
+        )
+
+    def submit_write(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Run a write operation on the store's single writer thread."""
+        future: Future = Future()
+        self._ensure_writer()
+        self._write_queue.put((future, fn, args, kwargs))
+        return future
+
+    def flush(self) -> None:
+        """Block until every queued write has been applied."""
+        if self._writer is not None:
+            self._write_queue.join()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None:
+            with self._init_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._writer_loop, name="knowledge-writer", daemon=True
+                    )
+                    self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            future, fn, args, kwargs = self._write_queue.get()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except Exception as exc:
+                        future.set_exception(exc)
+            finally:
+                self._write_queue.task_done()
+
+    @property
+    def write_lock(self) -> TimedLock:
+        """Lock held while mutating collections; hold it for multi-step writes."""
+        return self._write_lock
+
+    def lock_stats(self) -> dict:
+        """Lock wait metrics and write queue depth."""
+        return {
+            "init": self._init_lock.stats(),
+            "collections": self._collections_lock.stats(),
+            "write": self._write_lock.stats(),
+            "write_queue_depth": self._write_queue.qsize(),
+        }
+
+    def _add_document(
+        self,
+        elder_id: str,
+        chunks: list[str],
+        metadata: dict | None,
+        prepared: tuple[Any, dict] | None = None,
+    ) -> int:
         collection = self.get_collection(elder_id)
 
-        # Simple chunking
-        chunks = self._chunk_text(content, chunk_size, chunk_overlap)
+        dedup = self.get_dedup_index(elder_id)
+        if dedup is not None and len(dedup) and not collection.count():
+            # The signatures describe chunks this collection doesn't hold (it
+            # was lost, rebuilt, or belongs to another knowledge_backend)
+            dedup.clear()
+        if dedup is not None:
+            keep, signatures = dedup.check(chunks)
+        else:
+            keep, signatures = [True] * len(chunks), []
 
         # Generate IDs based on content hash
         ids = []
@@ -82,17 +543,45 @@ class KnowledgeStore:
         metadatas = []
 
         for i, chunk in enumerate(chunks):
+            if not keep[i]:
+                continue
             chunk_hash = hashlib.md5(chunk.encode()).hexdigest()[:12]
             chunk_id = f"{elder_id}_{chunk_hash}_{i}"
             ids.append(chunk_id)
             documents.append(chunk)
-            chunk_metadata = metadata.copy() if metadata else {}
+            chunk_metadata = normalize_metadata(metadata or {})
             chunk_metadata["chunk_index"] = i
             metadatas.append(chunk_metadata)
 
-        collection.add(ids=ids, documents=documents, metadatas=metadatas)
+        if documents:
+            embedding_function = self.embedding_function_for(elder_id)
+            embeddings = self._embed_documents(documents, embedding_function, prepared)
+            collection.add(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=embeddings,
+            )
+            self._update_centroid(elder_id, collection, embedding_function, added=embeddings)
+
+            # Keep an in-progress re-embed in step with new writes
+            building = self.registry.building(elder_id)
+            if building is not None:
+                self._open_version(elder_id, building).upsert(
+                    ids=ids,
+                    documents=documents,
+                    metadatas=metadatas,
+                    embeddings=self.embed(documents, self.embedding_function_for(elder_id, building)),
+                )
+
+        # Only remember signatures once the chunks are actually stored
+        if dedup is not None:
+            source = (metadata or {}).get("source", "unknown")
+            dedup.commit(signatures, str(source), len(chunks))
 
-        return len(chunks)
+        if documents:
+            self.schedule_digest(elder_id)
+        return len(documents)
 
     def add_file(
         self,
@@ -128,6 +617,7 @@ class KnowledgeStore:
         elder_id: str,
         query: str,
         n_results: int = 5,
+        where: dict | None = None,
     ) -> list[dict]:
         """
         Query an elder's knowledge base.
@@ -136,13 +626,14 @@ class KnowledgeStore:
             elder_id: The elder to query
             query: The search query
             n_results: Number of results to return
+            where: Optional metadata filter, e.g. ``{"confidence": {"$gte": 0.7}}``
 
         Returns:
             List of matching documents with metadata
         """
         collection = self.get_collection(elder_id)
 
-        results = collection.query(query_texts=[query], n_results=n_results)
+        results = collection.query(query_texts=[query], n_results=n_results, where=where)
 
         # Format results
         formatted = []
@@ -156,6 +647,124 @@ class KnowledgeStore:
 
         return formatted
 
+    def query_diverse(
+        self,
+        elder_id: str,
+        query: str,
+        n_results: int = 8,
+        fetch_k: int = 30,
+        lambda_mult: float = 0.5,
+        where: dict | None = None,
+        query_embeddings: list | None = None,
+    ) -> list[dict]:
+        """
+        Query an elder's knowledge base for relevant *and* varied results.
+
+        Over-fetches *fetch_k* nearest chunks, re-ranks them with Maximal
+        Marginal Relevance, keeps the top *n_results* and merges overlapping
+        adjacent chunks of the same source into single results.
+
+        Args:
+            elder_id: The elder to query
+            query: The search query
+            n_results: Number of results to keep after re-ranking
+            fetch_k: Number of nearest candidates to re-rank
+            lambda_mult: Relevance/diversity trade-off (1.0 = relevance only)
+            where: Optional metadata filter applied inside the vector query
+            query_embeddings: The query already embedded for this elder's
+                collection (a one-item list), to skip embedding it again
+
+        Returns:
+            List of matching documents with metadata, best first
+        """
+        from council.knowledge.rerank import merge_adjacent, mmr
+
+        collection = self.get_collection(elder_id)
+        if query_embeddings is None:
+            query_embeddings = self.embedding_function_for(elder_id)([query])
+        query_embedding = query_embeddings[0]
+
+        results = collection.query(
+            query_embeddings=[query_embedding],
+            n_results=max(fetch_k, n_results),
+            where=where,
+            include=["documents", "metadatas", "distances", "embeddings"],
+        )
+        if not results["documents"] or not results["documents"][0]:
+            return []
+
+        documents = results["documents"][0]
+        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(documents)
+        distances = results["distances"][0] if results["distances"] else [None] * len(documents)
+
+        order = mmr(query_embedding, results["embeddings"][0], n_results, lambda_mult)
+        ranked = [
+            {
+                "content": documents[i],
+                "metadata": metadatas[i] or {},
+                "distance": distances[i],
+            }
+            for i in order
+        ]
+        return merge_adjacent(ranked)
+
+    def query_tiered(
+        self,
+        elder_id: str,
+        query: str,
+        n_results: int = 8,
+        min_confidence: float = 0.0,
+        fetch_k: int = 30,
+        lambda_mult: float = 0.5,
+    ) -> list[dict]:
+        """
+        Query by confidence tier, highest first.
+
+        Each tier in CONFIDENCE_TIERS is a ``where`` filter on the chunk's
+        ``confidence`` field, so lower-confidence chunks never take retrieval
+        slots from better ones: a lower tier is only queried for the slots
+        the tiers above it could not fill.
+
+        Args:
+            elder_id: The elder to query
+            query: The search query
+            n_results: Total number of results wanted
+            min_confidence: Never return chunks below this confidence
+            fetch_k: Candidates re-ranked per tier (see query_diverse)
+            lambda_mult: Relevance/diversity trade-off (see query_diverse)
+
+        Returns:
+            List of matching documents with metadata, best tier first
+        """
+        results: list[dict] = []
+        ceiling = None
+        query_embeddings = None
+        for floor in CONFIDENCE_TIERS:
+            needed = n_results - len(results)
+            if needed <= 0:
+                break
+            floor = max(floor, min_confidence)
+            if ceiling is not None and floor >= ceiling:
+                break
+
+            where: dict = {"confidence": {"$gte": floor}}
+            if ceiling is not None:
+                where = {"$and": [where, {"confidence": {"$lt": ceiling}}]}
+
+            # Embed once for all tiers
+            if query_embeddings is None:
+                query_embeddings = self.embedding_function_for(elder_id)([query])
+            results.extend(self.query_diverse(
+                elder_id, query,
+                n_results=needed,
+                fetch_k=max(fetch_k, needed),
+                lambda_mult=lambda_mult,
+                where=where,
+                query_embeddings=query_embeddings,
+            ))
+            ceiling = floor
+        return results
+
     def get_context(self, elder_id: str, query: str, max_tokens: int = 2000) -> str:
         """
         Get relevant context for a query to include in the prompt.
@@ -208,14 +817,240 @@ class KnowledgeStore:
 
         return list(sources.values())
 
+    def remove_source(self, elder_id: str, source: str) -> None:
+        """Delete every chunk ingested from *source* for an elder."""
+        with self._write_lock:
+            collection = self.get_collection(elder_id)
+            removed = None
+            if self._centroid_index() is not None:
+                removed = collection.get(where={"source": source}, include=["embeddings"]).get("embeddings")
+            collection.delete(where={"source": source})
+            if removed is not None:
+                self._update_centroid(elder_id, collection, self.embedding_function_for(elder_id), removed=removed)
+            building = self.registry.building(elder_id)
+            if building is not None:
+                self._open_version(elder_id, building).delete(where={"source": source})
+            dedup = self.get_dedup_index(elder_id)
+            if dedup is not None:
+                dedup.remove_source(source)
+        self.schedule_digest(elder_id)
+
     def clear_elder(self, elder_id: str) -> None:
         """Clear all knowledge for an elder."""
+        from council.knowledge.versions import collection_name
+
+        with self._write_lock:
+            with self._collections_lock:
+                for version in self.registry.reset(elder_id):
+                    try:
+                        self.client.delete_collection(collection_name(elder_id, version))
+                    except Exception:
+                        pass  # Collection might not exist
+                self._invalidate(elder_id)
+
+            dedup = self.get_dedup_index(elder_id)
+            if dedup is not None:
+                dedup.clear()
+
+        from council.knowledge.digests import DIGEST_FILENAME, remove_digest
+
+        with self._digest_lock:
+            timer = self._digest_timers.pop(elder_id, None)
+        if timer is not None:
+            timer.cancel()
+        remove_digest(elder_id, get_knowledge_dir() / elder_id / DIGEST_FILENAME)
+
+    def _centroid_index(self):
+        """The loaded global elder index, if it tracks this store's centroids."""
+        from council.knowledge.elder_index import loaded_elder_index
+
+        index = loaded_elder_index()
+        return index if index is not None and index.store is self else None
+
+    def _update_centroid(self, elder_id: str, collection, embedding_function, added=(), removed=()) -> None:
+        """Fold a write's chunk embeddings into the elder index's running centroid."""
+        index = self._centroid_index()
+        if index is None or (not len(added) and not len(removed)):
+            return
+        from council.knowledge.embedding_cache import embedding_model_id
+
+        try:
+            index.update_centroid(
+                elder_id, embedding_model_id(embedding_function), collection.count(), added, removed
+            )
+        except Exception:
+            pass  # The debounced refresh rescans the collection instead
+
+    def schedule_digest(self, elder_id: str, delay: float | None = None) -> None:
+        """Rebuild an elder's knowledge digests once writes go quiet.
+
+        Each call restarts the countdown, so a bulk ingest triggers a single
+        rebuild *delay* seconds after its last chunk lands.
+        """
+        if not get_config_value("knowledge_digests_enabled", True):
+            return
+        if delay is None:
+            delay = get_config_value("knowledge_digest_delay", 30)
+
+        with self._digest_lock:
+            timer = self._digest_timers.pop(elder_id, None)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(delay, self._refresh_derived, args=(elder_id,))
+            timer.daemon = True
+            self._digest_timers[elder_id] = timer
+            timer.start()
+
+    def _refresh_derived(self, elder_id: str) -> None:
+        """Rebuild what is precomputed from an elder's knowledge after writes."""
+        with self._digest_lock:
+            if self._digest_timers.get(elder_id) is threading.current_thread():
+                del self._digest_timers[elder_id]
+        self.build_digest(elder_id)
+
+        index = self._centroid_index()
+        if index is not None:
+            index.refresh_centroid(elder_id)
+
+    def build_digest(self, elder_id: str) -> int:
+        """Rebuild an elder's per-category knowledge digests now.
+
+        Returns:
+            Number of categories with a digest (0 if the build failed)
+        """
+        from council.knowledge.digests import DIGEST_FILENAME, build_digest
+
         try:
-            self.client.delete_collection(f"elder_{elder_id}")
-            if elder_id in self._collections:
-                del self._collections[elder_id]
+            return build_digest(
+                elder_id, store=self, path=get_knowledge_dir() / elder_id / DIGEST_FILENAME
+            )
         except Exception:
-            pass  # Collection might not exist
+            return 0  # The next write schedules another attempt
+
+    def reembed_elder(
+        self,
+        elder_id: str,
+        embedding_function,
+        progress=None,
+        batch_size: int = 256,
+        pause: float = 0.05,
+        grace: float = 60.0,
+    ) -> dict:
+        """
+        Rebuild an elder's knowledge with another embedding function.
+
+        Builds the next collection version alongside the live one. Queries
+        keep hitting the live version throughout, and add_document() writes
+        to both while the build runs. When every chunk is copied, the
+        registry swaps the new version in atomically. The old version is
+        garbage-collected after *grace* seconds, so queries already running
+        against it can finish.
+
+        Args:
+            elder_id: The elder to re-embed
+            embedding_function: The new embedding function
+            progress: Optional TaskProgress to report into
+            batch_size: Chunks embedded per batch
+            pause: Seconds to sleep between batches, so the rebuild runs at
+                low priority next to interactive queries
+            grace: Seconds before the replaced version is deleted
+
+        Returns:
+            The old and new version numbers and the number of chunks copied
+        """
+        from council.knowledge.versions import embedding_spec
+
+        spec = embedding_spec(embedding_function)
+        version = self.registry.begin(elder_id, spec)
+        if spec is not None:
+            self._version_functions[json.dumps(spec, sort_keys=True)] = embedding_function
+
+        try:
+            live = self.get_collection(elder_id)
+            target = self._open_version(elder_id, version)
+            total = live.count()
+            copied = 0
+            while True:
+                batch = live.get(include=["documents", "metadatas"], limit=batch_size, offset=copied)
+                ids = batch.get("ids") or []
+                if not ids:
+                    break
+                target.upsert(
+                    ids=ids,
+                    documents=batch["documents"],
+                    metadatas=batch["metadatas"],
+                    embeddings=self.embed(batch["documents"], embedding_function),
+                )
+                copied += len(ids)
+                if progress is not None:
+                    progress.progress = copied / max(total, 1)
+                    progress.message = f"Re-embedded {copied}/{total} chunks"
+                time.sleep(pause)
+
+            with self._write_lock:
+                # remove_source() during the copy shifts the offsets above,
+                # so settle any difference by id before going live
+                copied = self._reconcile_version(live, target, embedding_function, batch_size)
+                with self._collections_lock:
+                    old = self.registry.swap(elder_id)
+                    self._invalidate(elder_id)
+        except Exception:
+            self.registry.abort(elder_id)
+            self.gc_versions(elder_id)
+            raise
+
+        if grace > 0:
+            timer = threading.Timer(grace, self.gc_versions, args=(elder_id, grace))
+            timer.daemon = True
+            timer.start()
+        else:
+            self.gc_versions(elder_id)
+
+        if progress is not None:
+            progress.message = f"Version {version} live ({copied} chunks)"
+        return {"elder_id": elder_id, "old_version": old, "version": version, "chunks": copied}
+
+    def _reconcile_version(self, live, target, embedding_function, batch_size: int) -> int:
+        """Make *target* hold exactly *live*'s chunk ids; returns its count."""
+        live_ids = set(live.get(include=[])["ids"])
+        target_ids = set(target.get(include=[])["ids"])
+
+        stale = sorted(target_ids - live_ids)
+        if stale:
+            target.delete(ids=stale)
+        missing = sorted(live_ids - target_ids)
+        for start in range(0, len(missing), batch_size):
+            batch = live.get(ids=missing[start:start + batch_size], include=["documents", "metadatas"])
+            target.upsert(
+                ids=batch["ids"],
+                documents=batch["documents"],
+                metadatas=batch["metadatas"],
+                embeddings=self.embed(batch["documents"], embedding_function),
+            )
+        return len(live_ids)
+
+    def reembed_elder_async(self, elder_id: str, embedding_function, **kwargs) -> str:
+        """Run reembed_elder() through the TaskManager; returns the task id."""
+        from council.tasks import get_task_manager
+
+        def _task(progress):
+            return self.reembed_elder(elder_id, embedding_function, progress=progress, **kwargs)
+
+        return get_task_manager().submit(_task, task_id=f"reembed-{elder_id}")
+
+    def gc_versions(self, elder_id: str, grace: float = 0.0) -> list[int]:
+        """Delete retired collection versions older than *grace* seconds."""
+        from council.knowledge.versions import collection_name
+
+        versions = self.registry.collectable(elder_id, grace)
+        for version in versions:
+            try:
+                self.client.delete_collection(collection_name(elder_id, version))
+            except Exception:
+                pass  # Already gone
+        if versions:
+            self.registry.forget(elder_id, versions)
+        return versions
 
     def _chunk_text(
         self, text: str, chunk_size: int, chunk_overlap: int
@@ -249,11 +1084,14 @@ class KnowledgeStore:
 
 # Global instance
 _knowledge_store: KnowledgeStore | None = None
+_knowledge_store_lock = threading.Lock()
 
 
 def get_knowledge_store() -> KnowledgeStore:
     """Get the global knowledge store instance."""
     global _knowledge_store
     if _knowledge_store is None:
-        _knowledge_store = KnowledgeStore()
+        with _knowledge_store_lock:
+            if _knowledge_store is None:
+                _knowledge_store = KnowledgeStore()
     return _knowledge_store
@@ -5,6 +5,10 @@ Three-stage pipeline:
 2. attribution_agent — Round 1: identifies likely original source for each quote
 3. skeptic_agent — Round 2: challenges attributions, returns verdict
 
+Between stages 1 and 2, quotes are looked up in a local fuzzy index of the
+elder's knowledge files (settle_quotes_locally). Only the ones that can't
+be settled there go to the two agents.
+
 Entry point: verify_elder_quotes() (designed for TaskManager.submit()).
 """
 
@@ -14,6 +18,7 @@ import re
 from pathlib import Path
 
 from council.config import get_knowledge_dir
+from council.knowledge.quote_index import QuoteIndex
 from council.llm import chat
 from council.tasks import TaskProgress
 
@@ -178,6 +183,88 @@ def skeptic_agent(attributed_quotes: list[dict], elder_name: str) -> list[dict]:
         return attributed_quotes
 
 
+# Similarity (1.0 = verbatim) needed to confirm a quote from a primary
+# source, and below which a quote is not in the source material at all
+CONFIRM_SIMILARITY = 0.85
+REJECT_SIMILARITY = 0.5
+
+# Elder subdirectories holding what others said about the elder; they can
+# never confirm a quote
+SECONDARY_DIRS = {"youtube"}
+
+
+def is_primary_source(path: Path, root: Path) -> bool:
+    """Whether *path* is the elder's own text (books, letters, Key_Wisdom files)."""
+    try:
+        parts = path.relative_to(root).parts
+    except ValueError:
+        return False
+    return not (len(parts) > 1 and parts[0] in SECONDARY_DIRS)
+
+
+def settle_quotes_locally(
+    quotes: list[dict],
+    index: QuoteIndex,
+    extracted_from: set[Path],
+    root: Path,
+) -> list[dict]:
+    """Confirm or reject quotes against the elder's own files, without the LLM.
+
+    A quote is confirmed if it closely matches a primary source other than
+    the files it was extracted from (the elder's books in ``sources/``,
+    letters or Key_Wisdom files; never third-party ``youtube/``
+    transcripts), and disputed if it doesn't even match the material it was
+    extracted from.
+    Settled quotes get the fields the agents would have added, plus
+    "settled_locally"; the rest are left for the agents.
+
+    Args:
+        quotes: Extracted quotes, updated in place
+        index: Index of the elder's knowledge directory
+        extracted_from: Files the quotes were extracted from
+        root: Knowledge directory, for reporting source paths
+
+    Returns:
+        The quotes that still need the agents
+    """
+    ambiguous = []
+    for q in quotes:
+        matches = index.find(q["quote"])
+        primary = next(
+            (
+                m for m in matches
+                if m.path not in extracted_from
+                and m.similarity >= CONFIRM_SIMILARITY
+                and is_primary_source(m.path, root)
+            ),
+            None,
+        )
+        best = max((m.similarity for m in matches if m.path in extracted_from), default=0.0)
+
+        if primary is not None:
+            source = primary.path.relative_to(root).as_posix()
+            q.update({
+                "source": source,
+                "attribution": "confirmed",
+                "attribution_notes": f"Found in {source} (similarity {primary.similarity:.2f})",
+                "verdict": "confirmed",
+                "skeptic_notes": f"Matches the primary source text: \"{primary.excerpt[:200]}\"",
+                "settled_locally": True,
+            })
+        elif best < REJECT_SIMILARITY:
+            q.update({
+                "source": "unknown",
+                "attribution": "misattributed",
+                "attribution_notes": "Not found in the source material",
+                "verdict": "disputed",
+                "skeptic_notes": f"Not in the material it was extracted from (best similarity {best:.2f})",
+                "settled_locally": True,
+            })
+        else:
+            ambiguous.append(q)
+    return ambiguous
+
+
 def verify_elder_quotes(
     *,
     elder_id: str,
@@ -195,6 +282,7 @@ def verify_elder_quotes(
     # Gather source text
     knowledge_dir = get_knowledge_dir() / elder_id.replace("custom_", "").replace("nominated_", "")
     all_text = []
+    extracted_from = set()
 
     for subdir in ("sources", "youtube"):
         target = knowledge_dir / subdir
@@ -202,6 +290,7 @@ def verify_elder_quotes(
             for txt_file in sorted(target.glob("*.txt"))[:10]:
                 try:
                     all_text.append(txt_file.read_text(encoding="utf-8", errors="replace"))
+                    extracted_from.add(txt_file)
                 except Exception:
                     pass
 
@@ -215,20 +304,35 @@ def verify_elder_quotes(
     progress.message = "Extracting quotes..."
     progress.progress = 0.3
     quotes = extract_quotes(combined_text, elder_name)
+    llm_calls = 1
 
     if not quotes:
         progress.message = "No direct quotes found to verify"
         return {"quotes_checked": 0, "status": "no_quotes"}
 
-    # Stage 2: Attribution
-    progress.message = f"Checking attribution for {len(quotes)} quotes..."
-    progress.progress = 0.5
-    quotes = attribution_agent(quotes, elder_name)
-
-    # Stage 3: Skeptic review
-    progress.message = "Running skeptic review..."
-    progress.progress = 0.7
-    quotes = skeptic_agent(quotes, elder_name)
+    # Settle what we can against the local corpus
+    progress.message = f"Looking up {len(quotes)} quotes in the knowledge base..."
+    progress.progress = 0.4
+    # Only primary sources can confirm and only the extracted-from files can
+    # reject, and only files sharing words with a quote can match at all
+    candidates = [
+        path for path in sorted(knowledge_dir.glob("**/*.txt"))
+        if path in extracted_from or is_primary_source(path, knowledge_dir)
+    ]
+    index = QuoteIndex.build(knowledge_dir, quotes=[q["quote"] for q in quotes], paths=candidates)
+    ambiguous = settle_quotes_locally(quotes, index, extracted_from, knowledge_dir)
+
+    if ambiguous:
+        # Stage 2: Attribution
+        progress.message = f"Checking attribution for {len(ambiguous)} quotes..."
+        progress.progress = 0.5
+        attribution_agent(ambiguous, elder_name)
+
+        # Stage 3: Skeptic review
+        progress.message = "Running skeptic review..."
+        progress.progress = 0.7
+        skeptic_agent(ambiguous, elder_name)
+        llm_calls += 2
 
     # Save results
     progress.message = "Saving verification results..."
@@ -244,6 +348,8 @@ def verify_elder_quotes(
             "disputed": sum(1 for q in quotes if q.get("verdict") == "disputed"),
             "uncertain": sum(1 for q in quotes if q.get("verdict") == "uncertain"),
         },
+        "settled_locally": len(quotes) - len(ambiguous),
+        "llm_calls": {"made": llm_calls, "saved": 3 - llm_calls},
     }
 
     # Save to file
@@ -264,7 +370,8 @@ def verify_elder_quotes(
     progress.message = (
         f"Quote verification complete: {results['summary']['confirmed']} confirmed, "
         f"{results['summary']['disputed']} disputed, "
-        f"{results['summary']['uncertain']} uncertain"
+        f"{results['summary']['uncertain']} uncertain "
+        f"({results['settled_locally']} settled locally, {results['llm_calls']['saved']} LLM calls saved)"
     )
 
     return results
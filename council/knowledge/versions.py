@@ -0,0 +1,204 @@
+"""Versioned elder collections.
+
+Each elder's knowledge lives in a versioned collection, ``elder_{id}__v{n}``.
+A small registry at ``~/.council/knowledge/collections.json`` is the alias
+that says which version is live, which (if any) is being built, and which
+retired versions are waiting to be garbage-collected:
+
+    {
+      "seneca": {
+        "live": 2,
+        "building": null,
+        "versions": {"2": {"embedding": {"name": ..., "config": {...}}}},
+        "retired": {"1": 1760000000.0}
+      }
+    }
+
+Version 0 is the unversioned ``elder_{id}`` collection that existed before
+versioning, so existing installs need no migration. Re-embedding builds
+version n+1 next to the live one, and swap() makes it live by rewriting the
+registry with an atomic rename. Every registry re-reads the file when it
+has been replaced, so a swap made by another process is seen on the next call.
+"""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from council.config import get_knowledge_dir
+
+REGISTRY_FILENAME = "collections.json"
+
+# Embedding of collections created before specs were recorded (Chroma's default)
+LEGACY_SPEC = {"name": "default", "config": {}}
+
+_VERSION_RE = re.compile(r"^elder_(?P<elder>.+?)(?:__v(?P<version>\d+))?$")
+
+
+def collection_name(elder_id: str, version: int) -> str:
+    """Collection name for an elder's knowledge at *version*."""
+    return f"elder_{elder_id}" if version == 0 else f"elder_{elder_id}__v{version}"
+
+
+def parse_collection_name(name: str) -> tuple[str, int] | None:
+    """Inverse of collection_name(); None for collections that are not elders'."""
+    match = _VERSION_RE.match(name)
+    if not match:
+        return None
+    return match["elder"], int(match["version"] or 0)
+
+
+def embedding_spec(embedding_function: Any) -> dict | None:
+    """Serializable description of an embedding function, if it has one."""
+    try:
+        return {"name": str(embedding_function.name()), "config": embedding_function.get_config() or {}}
+    except Exception:
+        return None
+
+
+class CollectionRegistry:
+    """Persistent alias table from elder id to live collection version."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_knowledge_dir() / REGISTRY_FILENAME
+        self._lock = threading.Lock()
+        self._stamp: tuple[int, int] | None = None
+        self._data: dict[str, dict] = {}
+        self._refresh()
+
+    def _stat(self) -> tuple[int, int] | None:
+        # Saves replace the file, so the inode changes even within one mtime tick
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _refresh(self) -> None:
+        """Re-read the file if another registry replaced it (caller holds the lock)."""
+        stamp = self._stat()
+        if stamp != self._stamp:
+            self._data = self._load()
+            self._stamp = stamp
+
+    def _save(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._data, indent=2, sort_keys=True))
+        tmp.replace(self.path)
+        self._stamp = self._stat()
+
+    def _entry(self, elder_id: str) -> dict:
+        return self._data.setdefault(
+            elder_id, {"live": 0, "building": None, "versions": {}, "retired": {}}
+        )
+
+    def live(self, elder_id: str) -> int:
+        with self._lock:
+            self._refresh()
+            return self._data.get(elder_id, {}).get("live", 0)
+
+    def building(self, elder_id: str) -> int | None:
+        with self._lock:
+            self._refresh()
+            return self._data.get(elder_id, {}).get("building")
+
+    def spec(self, elder_id: str, version: int) -> dict | None:
+        """Embedding spec recorded for a version (None if unknown)."""
+        with self._lock:
+            self._refresh()
+            info = self._data.get(elder_id, {}).get("versions", {}).get(str(version))
+            return info.get("embedding") if info else None
+
+    def record(self, elder_id: str, version: int, spec: dict) -> None:
+        """Record the embedding spec of a version that was not created by begin()."""
+        with self._lock:
+            self._refresh()
+            versions = self._entry(elder_id)["versions"]
+            if versions.get(str(version), {}).get("embedding") is None:
+                versions[str(version)] = {"embedding": spec, "created_at": time.time()}
+                self._save()
+
+    def begin(self, elder_id: str, spec: dict | None) -> int:
+        """Reserve the next version number for a build.
+
+        Raises:
+            RuntimeError: If a build is already in progress for the elder
+        """
+        with self._lock:
+            self._refresh()
+            entry = self._entry(elder_id)
+            if entry["building"] is not None:
+                raise RuntimeError(f"Version {entry['building']} of {elder_id} is already building")
+            used = [entry["live"], *map(int, entry["versions"]), *map(int, entry["retired"])]
+            version = max(used) + 1
+            entry["building"] = version
+            entry["versions"][str(version)] = {"embedding": spec, "created_at": time.time()}
+            self._save()
+            return version
+
+    def abort(self, elder_id: str) -> int | None:
+        """Drop the in-progress build; returns its version for cleanup."""
+        with self._lock:
+            self._refresh()
+            entry = self._entry(elder_id)
+            version = entry["building"]
+            if version is not None:
+                entry["building"] = None
+                entry["versions"].pop(str(version), None)
+                entry["retired"][str(version)] = time.time()
+                self._save()
+            return version
+
+    def swap(self, elder_id: str) -> int:
+        """Make the building version live; returns the version it replaced."""
+        with self._lock:
+            self._refresh()
+            entry = self._entry(elder_id)
+            if entry["building"] is None:
+                raise RuntimeError(f"No version of {elder_id} is building")
+            old = entry["live"]
+            entry["live"] = entry["building"]
+            entry["building"] = None
+            entry["versions"].pop(str(old), None)
+            entry["retired"][str(old)] = time.time()
+            self._save()
+            return old
+
+    def collectable(self, elder_id: str, grace: float = 0.0) -> list[int]:
+        """Retired versions whose grace period has passed."""
+        now = time.time()
+        with self._lock:
+            self._refresh()
+            retired = self._data.get(elder_id, {}).get("retired", {})
+            return sorted(int(v) for v, at in retired.items() if now - at >= grace)
+
+    def forget(self, elder_id: str, versions: list[int]) -> None:
+        """Remove retired versions from the registry once their collections are gone."""
+        with self._lock:
+            self._refresh()
+            retired = self._entry(elder_id)["retired"]
+            for version in versions:
+                retired.pop(str(version), None)
+            self._save()
+
+    def reset(self, elder_id: str) -> list[int]:
+        """Forget an elder entirely; returns every version it referenced."""
+        with self._lock:
+            self._refresh()
+            entry = self._data.pop(elder_id, None)
+            self._save()
+        if not entry:
+            return [0]
+        versions = {entry["live"], *map(int, entry["versions"]), *map(int, entry["retired"])}
+        if entry["building"] is not None:
+            versions.add(entry["building"])
+        return sorted(versions)
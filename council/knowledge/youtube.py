@@ -2,16 +2,24 @@
 Automated YouTube transcript pipeline.
 
 Finds, downloads, vets, cleans, and adds YouTube transcripts to elder knowledge bases.
+
+Videos flow through a staged pipeline (see council.knowledge.pipeline):
+download (yt-dlp) -> clean -> vet (LLM) -> save, each stage with its own
+worker pool, so a run takes about as long as its slowest stage.
 """
 
 import json
 import re
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-from council.config import get_knowledge_dir
+from council.config import get_config_value, get_knowledge_dir
+from council.knowledge.snippets import update_snippet_index
+from council.knowledge.youtube_cache import get_youtube_cache, video_id
 from council.llm import chat
 
 # Known high-quality video sources for each elder
@@ -344,12 +352,42 @@ class VideoInfo:
     language: str
 
 
-def get_video_info(url: str) -> VideoInfo | None:
+# Fields of yt-dlp's --dump-json output worth caching (the rest is format lists)
+METADATA_FIELDS = (
+    "id", "title", "channel", "uploader", "duration", "thumbnail", "webpage_url",
+    "view_count", "like_count", "upload_date", "description",
+)
+
+DAY = 24 * 60 * 60
+
+
+def get_video_metadata(
+    url: str,
+    timeout: int = 60,
+    max_age: float | None = None,
+    quiet: bool = False,
+) -> dict | None:
     """
-    Get video information and transcript using yt-dlp.
+    Video metadata from ``yt-dlp --dump-json``, or None on failure.
+
+    Served from the YouTube cache when it holds a fresh enough copy.
+
+    Args:
+        url: Video URL
+        timeout: yt-dlp timeout in seconds
+        max_age: Re-fetch cached metadata older than this (default:
+            the youtube_metadata_ttl config key)
+        quiet: Don't print errors
     """
+    cache, vid = get_youtube_cache(), video_id(url)
+    if cache is not None and vid:
+        if max_age is None:
+            max_age = get_config_value("youtube_metadata_ttl", 7 * DAY)
+        entry = cache.get("metadata", vid, max_age=max_age)
+        if entry is not None:
+            return entry.value
+
     try:
-        # Get video metadata
         result = subprocess.run(
             [
                 "yt-dlp",
@@ -359,46 +397,85 @@ def get_video_info(url: str) -> VideoInfo | None:
             ],
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=timeout,
         )
 
         if result.returncode != 0:
-            print(f"Error getting video info: {result.stderr}")
+            if not quiet:
+                print(f"Error getting video info: {result.stderr}")
             return None
 
         info = json.loads(result.stdout)
+        metadata = {key: info[key] for key in METADATA_FIELDS if key in info}
 
-        title = info.get("title", "Unknown")
-        channel = info.get("channel", info.get("uploader", "Unknown"))
-        duration = info.get("duration", 0)
+    except subprocess.TimeoutExpired:
+        if not quiet:
+            print(f"Timeout getting video info for {url}")
+        return None
+    except Exception as e:
+        if not quiet:
+            print(f"Error: {e}")
+        return None
 
-        # Get transcript
-        transcript = get_transcript(url)
+    if cache is not None:
+        cache.put("metadata", metadata.get("id") or vid or url, metadata)
+    return metadata
 
-        if not transcript:
-            return None
 
-        return VideoInfo(
-            url=url,
-            title=title,
-            channel=channel,
-            duration=duration,
-            transcript=transcript,
-            language="en",
-        )
+def _video_info(url: str, metadata: dict, transcript: str) -> VideoInfo:
+    return VideoInfo(
+        url=url,
+        title=metadata.get("title", "Unknown"),
+        channel=metadata.get("channel", metadata.get("uploader", "Unknown")),
+        duration=metadata.get("duration", 0),
+        transcript=transcript,
+        language="en",
+    )
 
-    except subprocess.TimeoutExpired:
-        print(f"Timeout getting video info for {url}")
+
+def get_video_info(url: str) -> VideoInfo | None:
+    """
+    Get video information and transcript using yt-dlp.
+    """
+    metadata = get_video_metadata(url)
+    if metadata is None:
         return None
-    except Exception as e:
-        print(f"Error: {e}")
+
+    transcript = get_transcript(url)
+    if not transcript:
         return None
 
+    return _video_info(url, metadata, transcript)
+
 
 def get_transcript(url: str) -> str | None:
     """
     Download transcript/subtitles for a video.
     """
+    raw_transcript = download_subtitles(url)
+    return clean_transcript(raw_transcript) if raw_transcript else None
+
+
+def download_subtitles(url: str) -> str | None:
+    """
+    Download a video's raw VTT (or SRT) subtitles, without cleaning them.
+
+    Subtitles don't change, so once downloaded they are served from the
+    YouTube cache.
+    """
+    cache, vid = get_youtube_cache(), video_id(url)
+    if cache is not None and vid:
+        entry = cache.get("subtitles", vid)
+        if entry is not None:
+            return entry.value
+
+    raw = _download_subtitles(url)
+    if raw and cache is not None and vid:
+        cache.put("subtitles", vid, raw)
+    return raw
+
+
+def _download_subtitles(url: str) -> str | None:
     with tempfile.TemporaryDirectory() as tmpdir:
         try:
             # Try to get auto-generated or manual subtitles
@@ -444,11 +521,8 @@ def get_transcript(url: str) -> str | None:
                 print(f"No subtitles found for {url}")
                 return None
 
-            # Read and clean the transcript
             with open(vtt_files[0], 'r', encoding='utf-8') as f:
-                raw_transcript = f.read()
-
-            return clean_transcript(raw_transcript)
+                return f.read()
 
         except subprocess.TimeoutExpired:
             print(f"Timeout downloading transcript for {url}")
@@ -577,13 +651,29 @@ def save_transcript(elder_id: str, video_info: VideoInfo) -> Path:
         f.write(f"\n---\n\n")
         f.write(video_info.transcript)
 
+    update_snippet_index(filepath)
     return filepath
 
 
+def _search_key(query: str, max_results: int) -> str:
+    return f"{max_results}:{query}"
+
+
 def search_youtube(query: str, max_results: int = 5) -> list[str]:
     """
     Search YouTube and return video URLs.
+
+    Results are cached for youtube_search_ttl seconds.
     """
+    cache = get_youtube_cache()
+    if cache is not None:
+        entry = cache.get(
+            "search", _search_key(query, max_results),
+            max_age=get_config_value("youtube_search_ttl", DAY),
+        )
+        if entry is not None:
+            return [f"https://www.youtube.com/watch?v={vid}" for vid in entry.value]
+
     try:
         result = subprocess.run(
             [
@@ -600,23 +690,108 @@ def search_youtube(query: str, max_results: int = 5) -> list[str]:
         if result.returncode != 0:
             return []
 
-        video_ids = result.stdout.strip().split('\n')
-        return [f"https://www.youtube.com/watch?v={vid}" for vid in video_ids if vid]
+        video_ids = [vid for vid in result.stdout.strip().split('\n') if vid]
 
     except Exception as e:
         print(f"Search error: {e}")
         return []
 
+    if cache is not None:
+        cache.put("search", _search_key(query, max_results), video_ids)
+    return [f"https://www.youtube.com/watch?v={vid}" for vid in video_ids]
+
+
+def _video_link(url: str, info: dict) -> dict:
+    vid = info.get("id", "")
+    return {
+        "title": info.get("title", "Unknown"),
+        "url": url,
+        "channel": info.get("channel", info.get("uploader", "Unknown")),
+        "duration": info.get("duration", 0),
+        "thumbnail": info.get("thumbnail", f"https://img.youtube.com/vi/{vid}/mqdefault.jpg"),
+    }
+
+
+def _cached_video_links(elder_id: str, max_results: int) -> tuple[list[dict], bool]:
+    """Video links from the cache alone; also says whether anything was missing or stale."""
+    cache = get_youtube_cache()
+    sources = YOUTUBE_SOURCES[elder_id]
+    stale = False
+
+    video_urls = list(sources.get("known_videos", []))
+    if len(video_urls) < max_results:
+        for query in sources.get("search_queries", [])[:2]:
+            entry = cache.get("search", _search_key(query, 3))
+            if entry is None or entry.age > get_config_value("youtube_search_ttl", DAY):
+                stale = True
+            for vid in entry.value if entry else []:
+                url = f"https://www.youtube.com/watch?v={vid}"
+                if url not in video_urls:
+                    video_urls.append(url)
+            if len(video_urls) >= max_results:
+                break
+
+    results = []
+    metadata_ttl = get_config_value("youtube_metadata_ttl", 7 * DAY)
+    for url in video_urls[:max_results]:
+        entry = cache.get("metadata", video_id(url) or url)
+        if entry is None or entry.age > metadata_ttl:
+            stale = True
+        if entry is not None:
+            results.append(_video_link(url, entry.value))
+    return results, stale
+
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refreshing: set[str] = set()
+_refresh_lock = threading.Lock()
 
-def get_video_links(elder_id: str, max_results: int = 8) -> list[dict]:
+
+def refresh_video_links_async(elder_id: str, max_results: int = 8) -> bool:
+    """Re-fetch an elder's video links into the cache in the background.
+
+    Returns False if a refresh for the elder is already running.
+    """
+    global _refresh_executor
+    with _refresh_lock:
+        if elder_id in _refreshing:
+            return False
+        _refreshing.add(elder_id)
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="youtube-refresh")
+
+    def _refresh():
+        try:
+            get_video_links(elder_id, max_results)
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(elder_id)
+
+    _refresh_executor.submit(_refresh)
+    return True
+
+
+def get_video_links(elder_id: str, max_results: int = 8, cached_only: bool = False) -> list[dict]:
     """Get watchable YouTube video links with metadata (no transcript download).
 
     Returns a list of dicts with title, url, channel, duration, and thumbnail.
     Uses known videos from YOUTUBE_SOURCES and optionally searches for more.
+
+    Args:
+        elder_id: The elder whose videos to list
+        max_results: Maximum number of links
+        cached_only: Answer from the YouTube cache without running yt-dlp,
+            and refresh missing or stale entries in the background
     """
     if elder_id not in YOUTUBE_SOURCES:
         return []
 
+    if cached_only and get_youtube_cache() is not None:
+        links, stale = _cached_video_links(elder_id, max_results)
+        if stale:
+            refresh_video_links_async(elder_id, max_results)
+        return links
+
     sources = YOUTUBE_SOURCES[elder_id]
     video_urls = list(sources.get("known_videos", []))
 
@@ -634,28 +809,8 @@ def get_video_links(elder_id: str, max_results: int = 8) -> list[dict]:
 
     def _fetch_metadata(url):
         """Fetch metadata for a single video URL."""
-        try:
-            result = subprocess.run(
-                ["yt-dlp", "--dump-json", "--no-download", url],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                return None
-            info = json.loads(result.stdout)
-            video_id = info.get("id", "")
-            return {
-                "title": info.get("title", "Unknown"),
-                "url": url,
-                "channel": info.get("channel", info.get("uploader", "Unknown")),
-                "duration": info.get("duration", 0),
-                "thumbnail": info.get("thumbnail", f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"),
-            }
-        except (subprocess.TimeoutExpired, Exception):
-            return None
-
-    from concurrent.futures import ThreadPoolExecutor
+        info = get_video_metadata(url, timeout=10, quiet=True)
+        return _video_link(url, info) if info is not None else None
 
     results = []
     with ThreadPoolExecutor(max_workers=4) as executor:
@@ -666,108 +821,192 @@ def get_video_links(elder_id: str, max_results: int = 8) -> list[dict]:
     return results
 
 
-def process_elder_youtube(
+def find_video_urls(
     elder_id: str,
     max_videos: int = 10,
     use_known_only: bool = False,
     verbose: bool = True
-) -> list[Path]:
-    """
-    Process YouTube videos for an elder.
-
-    Args:
-        elder_id: The elder to process
-        max_videos: Maximum videos to process
-        use_known_only: Only use known video URLs, don't search
-        verbose: Print progress
-
-    Returns:
-        List of saved transcript paths
-    """
+) -> list[str]:
+    """Known videos for an elder, topped up by YouTube searches unless *use_known_only*."""
     if elder_id not in YOUTUBE_SOURCES:
         if verbose:
             print(f"No YouTube sources configured for {elder_id}")
         return []
 
     sources = YOUTUBE_SOURCES[elder_id]
-    video_urls = set()
-
-    # Add known videos
-    video_urls.update(sources.get("known_videos", []))
+    video_urls = dict.fromkeys(sources.get("known_videos", []))
 
     # Search for more if not using known only
     if not use_known_only:
         for query in sources.get("search_queries", [])[:3]:  # Limit queries
+            if len(video_urls) >= max_videos:
+                break
             if verbose:
                 print(f"  Searching: {query}")
-            found = search_youtube(query, max_results=3)
-            video_urls.update(found)
+            video_urls.update(dict.fromkeys(search_youtube(query, max_results=3)))
 
-            if len(video_urls) >= max_videos:
-                break
+    return list(video_urls)[:max_videos]
 
-    video_urls = list(video_urls)[:max_videos]
 
-    if verbose:
-        print(f"  Found {len(video_urls)} videos to process")
+@dataclass
+class VideoJob:
+    """A video on its way through the transcript pipeline."""
+    elder_id: str
+    url: str
+    position: int
+    metadata: dict | None = None
+    raw_transcript: str | None = None
+    info: VideoInfo | None = None
+    rejection: str | None = None
+    path: Path | None = None
+
+
+def _download_stage(job: VideoJob) -> VideoJob | None:
+    job.metadata = get_video_metadata(job.url)
+    if job.metadata is None:
+        job.rejection = "could not get video info"
+        return None
+    job.raw_transcript = download_subtitles(job.url)
+    if not job.raw_transcript:
+        job.rejection = "could not get transcript"
+        return None
+    return job
 
-    saved_paths = []
 
-    for i, url in enumerate(video_urls):
-        if verbose:
-            print(f"\n  [{i+1}/{len(video_urls)}] Processing: {url}")
+def _clean_stage(job: VideoJob) -> VideoJob | None:
+    transcript = clean_transcript(job.raw_transcript)
+    job.raw_transcript = None
+    if not transcript:
+        job.rejection = "empty transcript"
+        return None
+    job.info = _video_info(job.url, job.metadata, transcript)
+    return job
 
-        # Get video info and transcript
-        video_info = get_video_info(url)
 
-        if not video_info:
-            if verbose:
-                print(f"    ✗ Could not get transcript")
-            continue
+def _vet_stage(job: VideoJob) -> VideoJob | None:
+    is_valid, result = vet_transcript(job.info.transcript, job.elder_id, job.info.title)
+    if not is_valid:
+        job.rejection = f"rejected: {result.strip()}"
+        return None
+    return job
+
+
+def _save_stage(job: VideoJob) -> VideoJob:
+    job.path = save_transcript(job.elder_id, job.info)
+    return job
+
+
+def run_youtube_pipeline(
+    urls_by_elder: dict[str, list[str]],
+    progress=None,
+    cancel: threading.Event | None = None,
+    verbose: bool = True,
+) -> dict[str, list[Path]]:
+    """
+    Download, clean, vet and save transcripts for many videos concurrently.
 
+    Worker counts per stage come from the youtube_*_workers config keys.
+
+    Args:
+        urls_by_elder: Video URLs to process for each elder
+        progress: Optional TaskProgress, updated with per-stage counters in
+            ``substeps``; its cancellation stops the pipeline
+        cancel: Event that stops the pipeline (default: the progress's)
+        verbose: Print progress
+
+    Returns:
+        Dict mapping elder_id to saved transcript paths, in URL order
+    """
+    from council.knowledge.pipeline import Stage, StagedPipeline
+
+    if cancel is None and progress is not None:
+        cancel = progress.cancel_event
+
+    jobs = [
+        VideoJob(elder_id, url, position)
+        for elder_id, urls in urls_by_elder.items()
+        for position, url in enumerate(urls)
+    ]
+    stages = [
+        Stage("download", _download_stage, get_config_value("youtube_download_workers", 4)),
+        Stage("clean", _clean_stage, get_config_value("youtube_clean_workers", 2)),
+        Stage("vet", _vet_stage, get_config_value("youtube_vet_workers", 2)),
+        Stage("save", _save_stage, get_config_value("youtube_save_workers", 1)),
+    ]
+
+    def on_update(pipeline):
+        if progress is not None:
+            progress.progress = pipeline.progress()
+            progress.substeps = pipeline.snapshot()
+            progress.message = f"Processed {pipeline.finished}/{pipeline.total} videos"
+
+    def on_drop(stage, job, error):
         if verbose:
-            print(f"    Title: {video_info.title}")
-            print(f"    Duration: {video_info.duration // 60} min")
+            reason = f"{stage} failed: {error}" if error is not None else job.rejection
+            print(f"    ✗ [{job.elder_id}] {job.url}: {reason}")
+
+    if verbose:
+        print(f"  Processing {len(jobs)} videos...")
 
-        # Vet the transcript
+    done = StagedPipeline(stages, cancel=cancel, on_update=on_update, on_drop=on_drop).run(jobs)
+
+    results: dict[str, list[Path]] = {elder_id: [] for elder_id in urls_by_elder}
+    for job in sorted(done, key=lambda j: j.position):
+        results[job.elder_id].append(job.path)
         if verbose:
-            print(f"    Vetting transcript...")
+            print(f"    ✓ [{job.elder_id}] {job.info.title} saved to {job.path}")
+    return results
 
-        is_valid, result = vet_transcript(
-            video_info.transcript,
-            elder_id,
-            video_info.title
-        )
 
-        if not is_valid:
-            if verbose:
-                print(f"    ✗ Rejected: {result}")
-            continue
+def process_elder_youtube(
+    elder_id: str,
+    max_videos: int = 10,
+    use_known_only: bool = False,
+    verbose: bool = True,
+    progress=None,
+) -> list[Path]:
+    """
+    Process YouTube videos for an elder.
 
-        # Save
-        filepath = save_transcript(elder_id, video_info)
-        saved_paths.append(filepath)
+    Args:
+        elder_id: The elder to process
+        max_videos: Maximum videos to process
+        use_known_only: Only use known video URLs, don't search
+        verbose: Print progress
+        progress: Optional TaskProgress for stage counters and cancellation
 
-        if verbose:
-            print(f"    ✓ Saved to {filepath}")
+    Returns:
+        List of saved transcript paths
+    """
+    video_urls = find_video_urls(elder_id, max_videos, use_known_only, verbose)
+    if not video_urls:
+        return []
+
+    if verbose:
+        print(f"  Found {len(video_urls)} videos to process")
 
-    return saved_paths
+    return run_youtube_pipeline({elder_id: video_urls}, progress=progress, verbose=verbose)[elder_id]
 
 
 def setup_youtube_knowledge(
     elder_ids: list[str] | None = None,
     max_videos_per_elder: int = 5,
     use_known_only: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    progress=None,
 ) -> dict[str, list[Path]]:
     """
     Run complete YouTube knowledge setup.
 
+    Every elder's videos go through one shared pipeline, so downloads for
+    one elder overlap with vetting for another.
+
     Args:
         elder_ids: List of elders to process, or None for all configured
         max_videos_per_elder: Max videos per elder
         use_known_only: Only use known video URLs
         verbose: Print progress
+        progress: Optional TaskProgress for stage counters and cancellation
 
     Returns:
         Dict mapping elder_id to list of saved paths
@@ -780,21 +1019,13 @@ def setup_youtube_knowledge(
         print("YOUTUBE TRANSCRIPT PIPELINE")
         print("=" * 60 + "\n")
 
-    results = {}
+    def _find(elder_id):
+        return find_video_urls(elder_id, max_videos_per_elder, use_known_only, verbose)
 
-    for elder_id in elder_ids:
-        if verbose:
-            print(f"\nProcessing {elder_id}...")
-            print("-" * 40)
-
-        paths = process_elder_youtube(
-            elder_id,
-            max_videos=max_videos_per_elder,
-            use_known_only=use_known_only,
-            verbose=verbose
-        )
+    with ThreadPoolExecutor(max_workers=get_config_value("youtube_download_workers", 4)) as executor:
+        urls_by_elder = dict(zip(elder_ids, executor.map(_find, elder_ids)))
 
-        results[elder_id] = paths
+    results = run_youtube_pipeline(urls_by_elder, progress=progress, verbose=verbose)
 
     # Summary
     if verbose:
@@ -13,16 +13,15 @@ Usage:
     python -m council.knowledge.youtube_agents --all --dry-run
 """
 
-import json
 import re
-import subprocess
-import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Generator
 
 from council.config import get_knowledge_dir
+from council.knowledge.snippets import update_snippet_index
+from council.knowledge.youtube import download_subtitles, get_video_metadata, search_youtube
 from council.llm import chat
 
 
@@ -161,74 +160,35 @@ class AgentWorkflow:
     def _search_youtube(self, query: str, max_results: int = 5) -> list[VideoCandidate]:
         """Search YouTube and return video candidates with metadata."""
         try:
-            # Use yt-dlp to search and get video info
-            result = subprocess.run(
-                [
-                    "yt-dlp",
-                    f"ytsearch{max_results}:{query}",
-                    "--dump-json",
-                    "--no-download",
-                    "--flat-playlist",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode != 0:
-                return []
-
             videos = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                try:
-                    info = json.loads(line)
-                    # Get full video info for detailed metadata
-                    full_info = self._get_video_details(info.get('url', f"https://www.youtube.com/watch?v={info.get('id', '')}"))
-                    if full_info:
-                        videos.append(full_info)
-                except json.JSONDecodeError:
-                    continue
-
+            for url in search_youtube(query, max_results=max_results):
+                # Get full video info for detailed metadata
+                full_info = self._get_video_details(url)
+                if full_info:
+                    videos.append(full_info)
             return videos
 
-        except subprocess.TimeoutExpired:
-            self.log(f"Search timeout for: {query}", "warn")
-            return []
         except Exception as e:
             self.log(f"Search error: {e}", "error")
             return []
 
     def _get_video_details(self, url: str) -> VideoCandidate | None:
-        """Get detailed information about a single video."""
-        try:
-            result = subprocess.run(
-                ["yt-dlp", "--dump-json", "--no-download", url],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if result.returncode != 0:
-                return None
-
-            info = json.loads(result.stdout)
-
-            return VideoCandidate(
-                url=info.get('webpage_url', url),
-                title=info.get('title', 'Unknown'),
-                channel=info.get('channel', info.get('uploader', 'Unknown')),
-                view_count=info.get('view_count', 0) or 0,
-                like_count=info.get('like_count', 0) or 0,
-                duration=info.get('duration', 0) or 0,
-                upload_date=info.get('upload_date', ''),
-                description=info.get('description', '')[:500],
-            )
-
-        except Exception:
+        """Get detailed information about a single video (cached by video id)."""
+        info = get_video_metadata(url, timeout=30, quiet=True)
+        if info is None:
             return None
 
+        return VideoCandidate(
+            url=info.get('webpage_url', url),
+            title=info.get('title', 'Unknown'),
+            channel=info.get('channel', info.get('uploader', 'Unknown')),
+            view_count=info.get('view_count', 0) or 0,
+            like_count=info.get('like_count', 0) or 0,
+            duration=info.get('duration', 0) or 0,
+            upload_date=info.get('upload_date', ''),
+            description=(info.get('description') or '')[:500],
+        )
+
     # =========================================================================
     # AGENT 2: VERIFICATION AGENT
     # =========================================================================
@@ -357,62 +317,17 @@ NOTES: [Brief explanation of your assessment]
         """Download and clean transcript for a video."""
         self.log(f"Extracting transcript: {video.title[:50]}...")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            try:
-                # Download subtitles
-                result = subprocess.run(
-                    [
-                        "yt-dlp",
-                        "--write-auto-sub",
-                        "--write-sub",
-                        "--sub-lang", "en",
-                        "--sub-format", "vtt",
-                        "--skip-download",
-                        "-o", f"{tmpdir}/%(id)s.%(ext)s",
-                        video.url,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                )
-
-                # Find subtitle file
-                vtt_files = list(Path(tmpdir).glob("*.vtt"))
-                if not vtt_files:
-                    # Try SRT
-                    subprocess.run(
-                        [
-                            "yt-dlp",
-                            "--write-auto-sub",
-                            "--write-sub",
-                            "--sub-lang", "en",
-                            "--sub-format", "srt",
-                            "--skip-download",
-                            "-o", f"{tmpdir}/%(id)s.%(ext)s",
-                            video.url,
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=120,
-                    )
-                    vtt_files = list(Path(tmpdir).glob("*.srt"))
-
-                if not vtt_files:
-                    self.log("  No subtitles found", "warn")
-                    return None
-
-                # Read and clean
-                with open(vtt_files[0], 'r', encoding='utf-8') as f:
-                    raw = f.read()
-
-                return self._clean_transcript(raw)
-
-            except subprocess.TimeoutExpired:
-                self.log("  Transcript download timeout", "warn")
-                return None
-            except Exception as e:
-                self.log(f"  Transcript error: {e}", "error")
-                return None
+        try:
+            raw = download_subtitles(video.url)
+        except Exception as e:
+            self.log(f"  Transcript error: {e}", "error")
+            return None
+
+        if not raw:
+            self.log("  No subtitles found", "warn")
+            return None
+
+        return self._clean_transcript(raw)
 
     def _clean_transcript(self, raw: str) -> str:
         """Clean VTT/SRT transcript to plain text."""
@@ -610,6 +525,7 @@ NOTES: [Brief explanation of your assessment]
             f.write(f"\n---\n\n")
             f.write(result.transcript)
 
+        update_snippet_index(filepath)
         self.log(f"Saved: {filepath}")
         return filepath
 
@@ -0,0 +1,122 @@
+"""
+On-disk cache of yt-dlp results.
+
+Every yt-dlp call spawns a process and makes a network round trip, and
+the same videos come up again and again across setup runs, enrichment
+and the elder video links page. This SQLite cache at
+``~/.council/knowledge/youtube_cache.sqlite`` keeps:
+
+- ``metadata``: ``yt-dlp --dump-json`` output, keyed by video id
+- ``subtitles``: raw subtitle files, keyed by video id
+- ``search``: video ids returned by a ``ytsearch`` query
+
+Entries carry the time they were fetched. Callers choose how old is too
+old: search results expire after ``youtube_search_ttl``, metadata is
+refreshed after ``youtube_metadata_ttl``, and subtitles never change.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from council.config import get_config_value, get_knowledge_dir
+
+CACHE_FILENAME = "youtube_cache.sqlite"
+
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|/shorts/|/embed/)([\w-]{11})")
+
+
+def video_id(url: str) -> str | None:
+    """The 11-character id in a YouTube URL, or None if there isn't one."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+@dataclass
+class CacheEntry:
+    """A cached value and when it was fetched."""
+    value: Any
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class YouTubeCache:
+    """Thread-safe SQLite store of JSON values by (kind, key)."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_knowledge_dir() / CACHE_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (kind, key))"
+        )
+        self._db.commit()
+
+    def get(self, kind: str, key: str, max_age: float | None = None) -> CacheEntry | None:
+        """Cached entry, or None if missing or older than *max_age* seconds."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, fetched_at FROM entries WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(json.loads(row[0]), row[1])
+        if max_age is not None and entry.age > max_age:
+            return None
+        return entry
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (kind, key, value, fetched_at) VALUES (?, ?, ?, ?)",
+                (kind, key, json.dumps(value), time.time()),
+            )
+            self._db.commit()
+
+    def clear(self, kind: str | None = None) -> int:
+        """Delete all entries (of one kind); returns how many were removed."""
+        with self._lock:
+            if kind is None:
+                cursor = self._db.execute("DELETE FROM entries")
+            else:
+                cursor = self._db.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+            self._db.commit()
+            return cursor.rowcount
+
+    def stats(self) -> dict[str, int]:
+        """Number of entries per kind."""
+        with self._lock:
+            rows = self._db.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind").fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_cache: YouTubeCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_youtube_cache() -> YouTubeCache | None:
+    """The shared cache, or None if youtube_cache_enabled is off."""
+    global _cache
+    if not get_config_value("youtube_cache_enabled", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = YouTubeCache()
+    return _cache
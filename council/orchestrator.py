@@ -1,12 +1,16 @@
 """Orchestrator for managing conversations with elders."""
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Generator
 
 from council.elders import Elder, ElderRegistry
 from council.llm import chat
-from council.config import get_knowledge_dir, get_config_value
+from council.config import get_config_value
 from council.knowledge.sources import EMBEDDED_WISDOM
 from council.nomination import (
     NOMINATION_INSTRUCTION,
@@ -64,47 +68,115 @@ class Conversation:
 def _get_source_confidence(metadata: dict) -> float:
     """Derive a confidence weight from ChromaDB result metadata.
 
+    Chunks carry a normalized numeric ``confidence`` field (see
+    ``council.knowledge.store.normalize_metadata``); it is derived from the
+    raw audit/vetting fields for anything that lacks it.
+
     Returns a float between 0.0 and 1.0.
     """
-    source_type = metadata.get("type", "")
-    vetting_confidence = metadata.get("vetting_confidence")
-    audit_passed = metadata.get("audit_passed")
-    quality_score = metadata.get("quality_score")
+    confidence = metadata.get("confidence")
+    if isinstance(confidence, (int, float)) and not isinstance(confidence, bool):
+        return float(confidence)
 
-    # User-uploaded source material
-    if vetting_confidence is not None:
-        try:
-            conf = int(vetting_confidence)
-        except (ValueError, TypeError):
-            conf = 50
-        if conf >= 70:
-            return 0.9  # Verified user source
-        return 0.5  # Unvetted / low-confidence
-
-    # YouTube transcripts
-    if source_type == "youtube":
-        if audit_passed is not None:
-            passed = str(audit_passed).lower() in ("true", "1")
-            if passed:
-                return 0.8  # Audit passed
-            return 0.3  # Audit failed
-        return 0.7  # Default YouTube (no audit data)
-
-    # Default for other types (e.g. Kindle books, letters)
-    return 0.7
-
-
-def get_elder_knowledge(elder_id: str, query: str = "", max_chars: int = 4000) -> str:
+    from council.knowledge.store import source_confidence
+
+    return source_confidence(metadata)
+
+
+# Semantic knowledge queries run on a small pool so they can start before a
+# speaker needs them; results are shared by later calls with the same query.
+PREFETCH_TTL = 300  # seconds a prefetched result is reused
+MAX_PREFETCHED = 64
+
+_prefetch_executor: ThreadPoolExecutor | None = None
+_prefetch_lock = threading.Lock()
+# (elder_id, query) -> (submitted at, future of [(confidence, text), ...])
+_prefetched: "OrderedDict[tuple[str, str], tuple[float, Future]]" = OrderedDict()
+
+
+def _query_knowledge(elder_id: str, query: str) -> list[tuple[float, str]]:
+    """Run the confidence-tiered semantic query for an elder."""
+    from council.knowledge.store import get_knowledge_store
+
+    store = get_knowledge_store()
+    results = store.query_tiered(elder_id, query, n_results=8, fetch_k=30)
+    return [
+        (_get_source_confidence(result.get("metadata", {})), result["content"])
+        for result in results
+    ]
+
+
+def _knowledge_future(elder_id: str, query: str) -> Future:
+    """Return the (possibly already running) semantic query for an elder."""
+    global _prefetch_executor
+
+    key = (elder_id, query)
+    now = time.monotonic()
+    with _prefetch_lock:
+        entry = _prefetched.get(key)
+        fresh = entry is not None and now - entry[0] < PREFETCH_TTL
+        if fresh and not (entry[1].done() and entry[1].exception() is not None):
+            _prefetched.move_to_end(key)
+            return entry[1]
+
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="knowledge-prefetch")
+        future = _prefetch_executor.submit(_query_knowledge, elder_id, query)
+        _prefetched[key] = (now, future)
+        _prefetched.move_to_end(key)
+        while len(_prefetched) > MAX_PREFETCHED:
+            _prefetched.popitem(last=False)
+        return future
+
+
+def prefetch_elder_knowledge(elder_ids: list[str], query: str) -> None:
+    """Start the semantic knowledge queries for *elder_ids* in the background.
+
+    A later get_elder_knowledge() call for the same elder and query picks up
+    the result instead of querying again.
+    """
+    if not query:
+        return
+    for elder_id in elder_ids:
+        _knowledge_future(elder_id, query)
+
+
+def _digest_parts(elder_id: str, query: str) -> list[tuple[float, str]] | None:
+    """The precomputed knowledge digest for the query's category, if any."""
+    if not get_config_value("knowledge_digests_enabled", True):
+        return None
+    try:
+        from council.knowledge.digests import load_digest
+        from council.profile import classify_question
+
+        return load_digest(elder_id, classify_question(query))
+    except Exception:
+        return None
+
+
+def get_elder_knowledge(
+    elder_id: str,
+    query: str = "",
+    max_chars: int = 4000,
+    first_turn: bool = False,
+) -> str:
     """
     Get QUERY-RELEVANT knowledge for an elder using confidence-weighted retrieval.
 
-    Higher-confidence sources are prioritized. Low-confidence material is
-    truncated to prevent unreliable content from dominating the context.
+    Higher-confidence sources are prioritized: retrieval fills slots tier by
+    tier inside the vector query, and low-confidence material is truncated to
+    prevent unreliable content from dominating the context.
+
+    For the first speaker, the elder's precomputed digest for the question's
+    category (see council.knowledge.digests) is served without waiting on
+    retrieval; the precise query starts in the background and is used by
+    later turns.
 
     Args:
         elder_id: The elder ID
         query: The user's query (for semantic search)
         max_chars: Maximum characters to include
+        first_turn: Prefer the precomputed digest over waiting for retrieval
 
     Returns:
         Knowledge context string
@@ -118,40 +190,26 @@ def get_elder_knowledge(elder_id: str, query: str = "", max_chars: int = 4000) -
 
     # 2. Use ChromaDB for semantic search with confidence metadata
     if query:
+        digest = _digest_parts(elder_id, query) if first_turn else None
+        if digest:
+            knowledge_parts.extend(digest)
+            prefetch_elder_knowledge([elder_id], query)
+        else:
+            try:
+                knowledge_parts.extend(_knowledge_future(elder_id, query).result())
+            except Exception:
+                pass  # No vector store (e.g. chromadb not installed)
+
+    # 3. Fallback: If no semantic results, use the precomputed snippet index
+    #    of downloaded knowledge files (never reads the files themselves)
+    if len(knowledge_parts) <= 1:  # Only embedded wisdom so far
         try:
-            from council.knowledge.store import get_knowledge_store
-
-            store = get_knowledge_store()
-            results = store.query(elder_id, query, n_results=8)
-            for result in results:
-                content = result["content"]
-                metadata = result.get("metadata", {})
-                confidence = _get_source_confidence(metadata)
-                knowledge_parts.append((confidence, content))
-        except ImportError:
-            pass
+            from council.knowledge.snippets import load_snippets
+
+            knowledge_parts.extend(load_snippets(elder_id, limit=5))
         except Exception:
             pass
 
-    # 3. Fallback: If no semantic results, check downloaded knowledge files
-    if len(knowledge_parts) <= 1:  # Only embedded wisdom so far
-        knowledge_dir = get_knowledge_dir() / elder_id
-        if knowledge_dir.exists():
-            for filepath in sorted(knowledge_dir.glob("**/*.txt"))[:5]:
-                try:
-                    content = filepath.read_text(encoding="utf-8")
-                    # Heuristic confidence from directory name
-                    parts = filepath.parts
-                    if "sources" in parts:
-                        confidence = 0.5  # Unvetted user uploads
-                    elif "youtube" in parts:
-                        confidence = 0.7  # Default YouTube
-                    else:
-                        confidence = 0.7  # Other knowledge files
-                    knowledge_parts.append((confidence, content[:2000]))
-                except Exception:
-                    pass
-
     if not knowledge_parts:
         return ""
 
@@ -404,6 +462,8 @@ class Orchestrator:
             elders.append(elder)
 
         self.conversation.add_user_message(question)
+        if self.use_knowledge:
+            prefetch_elder_knowledge(elder_ids, question)
 
         nomination_count = 0
         guest_queue: list[Elder] = []  # guests to speak at end of current round
@@ -436,7 +496,9 @@ class Orchestrator:
 
                 system_prompt = elder.system_prompt + context_note + nomination_suffix
                 if self.use_knowledge:
-                    knowledge_context = get_elder_knowledge(elder.id, query=question)
+                    knowledge_context = get_elder_knowledge(
+                        elder.id, query=question, first_turn=(turn == 0 and elder == elders[0])
+                    )
                     if knowledge_context:
                         system_prompt += knowledge_context
 
@@ -721,6 +783,10 @@ Be direct and clear. These questions will be shown to the user.
             "- Be professional and speak naturally, as yourself, not as a narrator.\n"
         )
 
+        # Retrieval runs while the moderator speaks
+        if self.use_knowledge:
+            prefetch_elder_knowledge(elder_ids, question)
+
         if continuation:
             # Resuming after user clarification
             speakers_so_far = set(continuation.get('speakers_so_far', []))
@@ -1115,6 +1181,10 @@ Be direct and clear. These questions will be shown to the user.
             "- The moderator may cut you off if you exceed your budget.\n"
         )
 
+        # Retrieval runs while the moderator speaks
+        if self.use_knowledge:
+            prefetch_elder_knowledge(elder_ids, question)
+
         if continuation:
             speakers_so_far = set(continuation.get('speakers_so_far', []))
             turns_used = continuation.get('turns_used', 0)
@@ -13,6 +13,7 @@ This replaces the brute-force approach where every elder asks questions.
 from dataclasses import dataclass, field
 from typing import Generator, Callable
 
+from council.config import get_config_value
 from council.elders import Elder, ElderRegistry
 from council.llm import chat
 
@@ -226,9 +227,56 @@ class SmartRefinementEngine:
 
     def select_elders(self) -> Generator[str, None, list[str]]:
         """
-        Use LLM to select the most relevant elders for this topic.
+        Select the most relevant elders for this topic.
+
+        Uses the global elder index when enabled (see
+        council.knowledge.elder_index), and the LLM selector otherwise or if
+        the index is unavailable.
         Yields progress, returns list of elder IDs.
         """
+        if get_config_value("elder_selection", "index") == "index":
+            try:
+                selected = yield from self._select_elders_from_index()
+                if selected:
+                    return selected
+            except Exception:
+                # Fall back to the LLM selector
+                self.selected_elder_ids, self.selected_elders = [], []
+                self.selection_rationale = {}
+
+        return (yield from self._select_elders_with_llm())
+
+    def _select_elders_from_index(self) -> Generator[str, None, list[str]]:
+        """Pick 3 elders from the embedding index, asking the LLM only to break ties."""
+        from council.knowledge.elder_index import get_elder_index, llm_tie_breaker
+
+        tie_breaker = llm_tie_breaker if get_config_value("elder_selection_llm_tiebreak", True) else None
+        selection = get_elder_index().select(
+            self.initial_topic,
+            k=3,
+            elder_ids=[e.id for e in self.available_elders],
+            tie_margin=get_config_value("elder_selection_tie_margin", 0.02),
+            tie_breaker=tie_breaker,
+        )
+        if not selection.elder_ids:
+            return []
+
+        yield f"SELECTED: {', '.join(selection.elder_ids)}\nRATIONALE:\n"
+        for eid in selection.elder_ids:
+            elder = ElderRegistry.get(eid)
+            if not elder:
+                continue
+            domains = ELDER_EXPERTISE.get(eid, {}).get("domains") or elder.mental_models[:3]
+            rationale = f"closest match on {', '.join(domains[:3])}" if domains else "closest match"
+            self.selected_elders.append(elder)
+            self.selection_rationale[eid] = rationale
+            self.selected_elder_ids.append(eid)
+            yield f"- {eid}: {rationale}\n"
+
+        return self.selected_elder_ids
+
+    def _select_elders_with_llm(self) -> Generator[str, None, list[str]]:
+        """Use LLM to select the most relevant elders for this topic."""
         prompt = SELECTOR_PROMPT.format(
             topic=self.initial_topic,
             elder_summaries=self._build_elder_summaries()
@@ -18,6 +18,7 @@ class TaskStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 @dataclass
@@ -30,6 +31,12 @@ class TaskProgress:
     substeps: list[dict] = field(default_factory=list)
     result: Any = None
     error: str | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancellation was requested; long tasks should check it."""
+        return self.cancel_event.is_set()
 
     def to_dict(self) -> dict:
         return {
@@ -89,6 +96,10 @@ class TaskManager:
             try:
                 result = task_fn(progress=progress, **kwargs)
                 progress.result = result
+                if progress.cancelled:
+                    progress.status = TaskStatus.CANCELLED
+                    progress.message = "Cancelled"
+                    return
                 progress.status = TaskStatus.COMPLETED
                 progress.progress = 1.0
                 if not progress.message or progress.message == "Starting...":
@@ -104,6 +115,18 @@ class TaskManager:
     def get_status(self, task_id: str) -> TaskProgress | None:
         return self._tasks.get(task_id)
 
+    def cancel(self, task_id: str) -> bool:
+        """Ask a running task to stop; returns False if there is no such task.
+
+        Cancellation is cooperative: the task sees ``progress.cancelled``
+        and stops at its next check.
+        """
+        progress = self._tasks.get(task_id)
+        if progress is None:
+            return False
+        progress.cancel_event.set()
+        return True
+
     def list_tasks(self) -> dict[str, dict]:
         return {tid: tp.to_dict() for tid, tp in self._tasks.items()}
 
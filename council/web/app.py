@@ -101,6 +101,83 @@ def api_ask():
     return Response(generate(), mimetype='text/event-stream')
 
 
+# Longest the end of a discussion stream waits for outstanding biographies
+_NOMINATION_BIO_WAIT = 15
+
+
+class _NominationBios:
+    """Biographies of nominated guests, looked up without blocking a stream.
+
+    The lookup starts as soon as an elder's streamed text contains a
+    complete [NOMINATE: ...] tag. The nomination event carries the
+    biography if it is already known (cached); otherwise it is marked
+    ``biography_pending`` and a ``nomination_bio`` event follows once the
+    lookup finishes.
+    """
+
+    def __init__(self):
+        self._waiting = []  # (future, nomination payload)
+        # (name, expertise) -> lookup future; LLM-written biographies are not
+        # cached, so the nomination must reuse the prefetched lookup
+        self._prefetched = {}
+
+    def prefetch(self, text):
+        """Start the lookup for a nomination tag in *text*, if there is one."""
+        from council.nomination import parse_nomination
+
+        nomination = parse_nomination(text)
+        if nomination and nomination not in self._prefetched:
+            from council.knowledge.biography import get_biography_async
+            self._prefetched[nomination] = get_biography_async(*nomination)
+
+    def nomination_event(self, guest):
+        from council.knowledge.biography import get_biography_async
+
+        future = self._prefetched.get((guest.name, guest._expertise))
+        if future is None:
+            future = get_biography_async(guest.name, guest._expertise)
+        # Check if the nominated person is already a registered elder
+        is_existing = ElderRegistry.get(guest.id) is not None
+        if not is_existing:
+            from council.nomination import find_existing_elder
+            is_existing = find_existing_elder(guest.name) is not None
+        payload = {'nomination': True, 'guest_id': guest.id, 'guest_name': guest.name, 'expertise': guest._expertise, 'nominated_by': guest._nominated_by, 'biography': {}, 'is_existing_elder': is_existing}
+        if future.done():
+            payload['biography'] = self._result(future)
+        else:
+            payload['biography_pending'] = True
+            self._waiting.append((future, payload))
+        return f"data: {json.dumps(payload)}\n\n"
+
+    def ready_events(self):
+        """``nomination_bio`` events for the lookups that have finished."""
+        done = [(f, p) for f, p in self._waiting if f.done()]
+        if done:
+            self._waiting = [(f, p) for f, p in self._waiting if not f.done()]
+        return [self._bio_event(f, p) for f, p in done]
+
+    def remaining_events(self, timeout=_NOMINATION_BIO_WAIT):
+        """Wait (up to *timeout* seconds in all) for the outstanding lookups."""
+        from concurrent.futures import wait
+
+        waiting, self._waiting = self._waiting, []
+        if waiting:
+            wait([f for f, _ in waiting], timeout=timeout)
+        return [self._bio_event(f, p) for f, p in waiting]
+
+    @staticmethod
+    def _result(future):
+        if not future.done() or future.exception() is not None:
+            return {}
+        return future.result()
+
+    def _bio_event(self, future, payload):
+        event = {key: value for key, value in payload.items() if key not in ('nomination', 'biography_pending')}
+        event['nomination_bio'] = True
+        event['biography'] = self._result(future)
+        return f"data: {json.dumps(event)}\n\n"
+
+
 @app.route('/api/roundtable', methods=['POST'])
 def api_roundtable():
     """Convene a roundtable discussion."""
@@ -128,23 +205,16 @@ def api_roundtable():
         current_response = []
         nominated_elders = {}  # id -> NominatedElder
 
+        bios = _NominationBios()
+
         for elder_id, chunk in orchestrator.roundtable(elder_ids, question, turns=turns):
-            # Handle nomination events
+            yield from bios.ready_events()
+
+            # Handle nomination events; the biography follows when ready
             if elder_id == "__nomination__":
                 guest = chunk
                 nominated_elders[guest.id] = guest
-                # Fetch biography for the nominated person
-                nom_bio = {}
-                try:
-                    from council.knowledge.biography import get_biography
-                    nom_bio = get_biography(guest.name, guest._expertise)
-                except Exception:
-                    pass
-                is_existing = ElderRegistry.get(guest.id) is not None
-                if not is_existing:
-                    from council.nomination import find_existing_elder
-                    is_existing = find_existing_elder(guest.name) is not None
-                yield f"data: {json.dumps({'nomination': True, 'guest_id': guest.id, 'guest_name': guest.name, 'expertise': guest._expertise, 'nominated_by': guest._nominated_by, 'biography': nom_bio, 'is_existing_elder': is_existing})}\n\n"
+                yield bios.nomination_event(guest)
                 continue
 
             if chunk is None:
@@ -163,8 +233,11 @@ def api_roundtable():
                     elder = ElderRegistry.get(elder_id) or nominated_elders.get(elder_id)
                     yield f"data: {json.dumps({'elder_start': True, 'elder_id': elder_id, 'name': elder.name, 'title': elder.title, 'era': elder.era})}\n\n"
                 current_response.append(chunk)
+                if ']' in chunk and '[NOMINATE:' in ''.join(current_response):
+                    bios.prefetch(''.join(current_response))
                 yield f"data: {json.dumps({'chunk': chunk, 'elder_id': elder_id})}\n\n"
 
+        yield from bios.remaining_events()
         yield f"data: {json.dumps({'roundtable_done': True})}\n\n"
 
     return Response(generate(), mimetype='text/event-stream')
@@ -265,22 +338,16 @@ def api_roundtable_with_context():
         current_response = []
         nominated_elders = {}  # id -> NominatedElder
 
+        bios = _NominationBios()
+
         for elder_id, chunk in orchestrator.roundtable(elder_ids, enriched_question, turns=turns):
-            # Handle nomination events
+            yield from bios.ready_events()
+
+            # Handle nomination events; the biography follows when ready
             if elder_id == "__nomination__":
                 guest = chunk
                 nominated_elders[guest.id] = guest
-                nom_bio = {}
-                try:
-                    from council.knowledge.biography import get_biography
-                    nom_bio = get_biography(guest.name, guest._expertise)
-                except Exception:
-                    pass
-                is_existing = ElderRegistry.get(guest.id) is not None
-                if not is_existing:
-                    from council.nomination import find_existing_elder
-                    is_existing = find_existing_elder(guest.name) is not None
-                yield f"data: {json.dumps({'nomination': True, 'guest_id': guest.id, 'guest_name': guest.name, 'expertise': guest._expertise, 'nominated_by': guest._nominated_by, 'biography': nom_bio, 'is_existing_elder': is_existing})}\n\n"
+                yield bios.nomination_event(guest)
                 continue
 
             if chunk is None:
@@ -297,8 +364,11 @@ def api_roundtable_with_context():
                     elder = ElderRegistry.get(elder_id) or nominated_elders.get(elder_id)
                     yield f"data: {json.dumps({'elder_start': True, 'elder_id': elder_id, 'name': elder.name, 'title': elder.title, 'era': elder.era})}\n\n"
                 current_response.append(chunk)
+                if ']' in chunk and '[NOMINATE:' in ''.join(current_response):
+                    bios.prefetch(''.join(current_response))
                 yield f"data: {json.dumps({'chunk': chunk, 'elder_id': elder_id})}\n\n"
 
+        yield from bios.remaining_events()
         yield f"data: {json.dumps({'roundtable_done': True})}\n\n"
 
     return Response(generate(), mimetype='text/event-stream')
@@ -443,8 +513,11 @@ def _stream_moderated(generator, done_key='panel_done'):
     current_elder_id = None
     current_response = []
     nominated_elders = {}
+    bios = _NominationBios()
 
     for elder_id, chunk in generator:
+        yield from bios.ready_events()
+
         # Moderator start
         if elder_id == "__moderator_start__":
             yield f"data: {json.dumps({'moderator_start': True, 'phase': chunk.get('phase', '')})}\n\n"
@@ -464,6 +537,7 @@ def _stream_moderated(generator, done_key='panel_done'):
 
         # Ask user for clarification
         if elder_id == "__ask_user__":
+            yield from bios.remaining_events()
             yield f"data: {json.dumps({'ask_user': True, 'state': chunk})}\n\n"
             return
 
@@ -472,22 +546,11 @@ def _stream_moderated(generator, done_key='panel_done'):
             yield f"data: {json.dumps({'elder_interrupted': True, 'elder_id': chunk['elder_id'], 'name': chunk['name']})}\n\n"
             continue
 
-        # Nomination
+        # Nomination; the biography follows when ready
         if elder_id == "__nomination__":
             guest = chunk
             nominated_elders[guest.id] = guest
-            nom_bio = {}
-            try:
-                from council.knowledge.biography import get_biography
-                nom_bio = get_biography(guest.name, guest._expertise)
-            except Exception:
-                pass
-            # Check if the nominated person is already a registered elder
-            is_existing = ElderRegistry.get(guest.id) is not None
-            if not is_existing:
-                from council.nomination import find_existing_elder
-                is_existing = find_existing_elder(guest.name) is not None
-            yield f"data: {json.dumps({'nomination': True, 'guest_id': guest.id, 'guest_name': guest.name, 'expertise': guest._expertise, 'nominated_by': guest._nominated_by, 'biography': nom_bio, 'is_existing_elder': is_existing})}\n\n"
+            yield bios.nomination_event(guest)
             continue
 
         # Elder turn end
@@ -505,8 +568,11 @@ def _stream_moderated(generator, done_key='panel_done'):
                 elder = ElderRegistry.get(elder_id) or nominated_elders.get(elder_id)
                 yield f"data: {json.dumps({'elder_start': True, 'elder_id': elder_id, 'name': elder.name, 'title': elder.title, 'era': elder.era})}\n\n"
             current_response.append(chunk)
+            if ']' in chunk and '[NOMINATE:' in ''.join(current_response):
+                bios.prefetch(''.join(current_response))
             yield f"data: {json.dumps({'chunk': chunk, 'elder_id': elder_id})}\n\n"
 
+    yield from bios.remaining_events()
     yield f"data: {json.dumps({done_key: True})}\n\n"
 
 
@@ -787,7 +853,13 @@ def api_tts_preview():
 
 @app.route('/api/select-elders', methods=['POST'])
 def api_select_elders():
-    """Use LLM to pick the best elders for a given question."""
+    """Pick the best elders for a given question.
+
+    Uses the global elder index (milliseconds, LLM only for near-ties) unless
+    ``elder_selection`` is set to "llm" or the index is unavailable.
+    """
+    import time
+
     data = request.json
     question = data.get('question', '')
     max_elders = data.get('max_elders', 5)
@@ -797,64 +869,38 @@ def api_select_elders():
     # Clamp max_elders to reasonable range
     max_elders = max(2, min(10, int(max_elders)))
 
-    from council.llm import chat as llm_chat
-    import random
-
-    elders = list(ElderRegistry.get_all())
-    random.shuffle(elders)  # Prevent positional bias
-    elder_descriptions = "\n".join(
-        f"- {e.id}: {e.name} — {e.title} ({e.era})"
-        for e in elders
-    )
-
     # Inject adaptive profile context
     from council.profile import classify_question, get_profile_context
-    category = classify_question(question)
-    profile_context = get_profile_context()
-
-    profile_preamble = ""
-    if profile_context:
-        profile_preamble = (
-            f"[User context — use as soft guidance, not hard constraint. "
-            f"Consider their engagement history but still prioritize relevance and diversity.]\n"
-            f"{profile_context}\n\n"
-            f"Question category hint: {category}\n\n"
-        )
-
-    prompt = (
-        f"{profile_preamble}"
-        f"Given this question:\n\"{question}\"\n\n"
-        f"Available elders:\n{elder_descriptions}\n\n"
-        f"Select exactly {max_elders} elders who would create the BEST discussion panel.\n\n"
-        f"Selection criteria (all must be considered):\n"
-        f"1. RELEVANCE: Who has the most applicable expertise for this specific question?\n"
-        f"2. DIVERSITY: Choose elders who will approach the topic from DIFFERENT angles\n"
-        f"3. CREATIVE TENSION: Include at least one elder who would likely DISAGREE with the others\n"
-        f"4. SURPRISE: Include at least one non-obvious pick whose perspective would add unexpected depth\n\n"
-        f"Think step-by-step about why each pick adds value, then output ONLY the elder IDs, one per line.\n"
-        f"Format:\n<reasoning>your brief reasoning here</reasoning>\n"
-        f"elder_id_1\nelder_id_2\n..."
-    )
 
-    messages = [{"role": "user", "content": prompt}]
-    response_text = "".join(llm_chat(messages, stream=True))
-
-    # Strip reasoning tags if present
-    import re
-    response_text = re.sub(r'<reasoning>.*?</reasoning>', '', response_text, flags=re.DOTALL)
+    profile_context = get_profile_context()
+    category = classify_question(question)
 
-    valid_ids = {e.id for e in elders}
-    selected = []
-    for line in response_text.strip().split('\n'):
-        eid = line.strip().strip('-').strip('*').strip().lower()
-        if eid in valid_ids and eid not in selected:
-            selected.append(eid)
+    if get_config_value('elder_selection', 'index') == 'index':
+        try:
+            from functools import partial
+
+            from council.knowledge.elder_index import get_elder_index, llm_tie_breaker
+
+            tie_breaker = None
+            if get_config_value('elder_selection_llm_tiebreak', True):
+                tie_breaker = partial(llm_tie_breaker, profile_context=profile_context, category=category)
+            selection = get_elder_index().select(
+                question,
+                k=max_elders,
+                tie_margin=get_config_value('elder_selection_tie_margin', 0.02),
+                tie_breaker=tie_breaker,
+            )
+            if selection.elder_ids:
+                return jsonify(selection.to_dict())
+        except Exception:
+            pass  # Fall back to the LLM selector
 
-    if not selected:
-        # Fallback: pick 3 defaults
-        selected = [e.id for e in elders[:3]]
+    from council.knowledge.elder_index import llm_select_elders
 
-    return jsonify({'elder_ids': selected})
+    start = time.perf_counter()
+    selected = llm_select_elders(question, max_elders, profile_context=profile_context, category=category)
+    elapsed = (time.perf_counter() - start) * 1000
+    return jsonify({'elder_ids': selected, 'method': 'llm', 'latency_ms': {'llm': elapsed, 'total': elapsed}})
 
 
 # ---------------------------------------------------------------------------
@@ -1045,6 +1091,47 @@ def api_task_status(task_id):
     return jsonify(progress.to_dict())
 
 
+@app.route('/api/tasks/<task_id>/cancel', methods=['POST'])
+def api_task_cancel(task_id):
+    """Ask a background task to stop at its next cancellation check."""
+    if not get_task_manager().cancel(task_id):
+        return jsonify({'error': 'Task not found'}), 404
+    return jsonify({'cancelled': True})
+
+
+@app.route('/api/knowledge/metrics')
+def api_knowledge_metrics():
+    """Knowledge store lock contention, write queue depth and embedding throughput."""
+    from council.knowledge.store import get_knowledge_store
+
+    store = get_knowledge_store()
+    return jsonify({**store.lock_stats(), "embedding": store.embedding_stats()})
+
+
+@app.route('/api/knowledge/reembed', methods=['POST'])
+def api_knowledge_reembed():
+    """Re-embed an elder's knowledge into a new collection version in the background.
+
+    Body: {"elder_id": "...", "embedding": {"name": "...", "config": {...}}}
+    """
+    data = request.get_json() or {}
+    elder_id = data.get('elder_id')
+    spec = data.get('embedding')
+    if not elder_id or not isinstance(spec, dict) or 'name' not in spec:
+        return jsonify({'error': 'elder_id and embedding {name, config} are required'}), 400
+
+    from council.knowledge.embeddings import embedding_function_from_spec
+    from council.knowledge.store import get_knowledge_store
+
+    try:
+        embedding_function = embedding_function_from_spec(spec)
+    except Exception as e:
+        return jsonify({'error': f'Invalid embedding: {e}'}), 400
+
+    task_id = get_knowledge_store().reembed_elder_async(elder_id, embedding_function)
+    return jsonify({'task_id': task_id})
+
+
 # ---------------------------------------------------------------------------
 # Custom Elders API
 # ---------------------------------------------------------------------------
@@ -1304,7 +1391,7 @@ def api_elder_videos(elder_id):
     if not name:
         return jsonify({'error': 'Elder not found and no name provided'}), 404
 
-    youtube = get_video_links(elder_id)
+    youtube = get_video_links(elder_id, cached_only=True)
 
     try:
         documentaries = discover_documentaries(name, expertise)
@@ -1436,6 +1523,30 @@ def api_profile():
 def run_server(host='127.0.0.1', port=5000, debug=False):
     """Run the Flask development server."""
     port = int(os.environ.get('FLASK_PORT', port))
+
+    # Open the knowledge store once, up front, instead of racing on first use
+    def _init_knowledge(progress):
+        from council.knowledge.store import get_knowledge_store
+
+        progress.message = "Opening knowledge store and warming up embeddings..."
+        get_knowledge_store().initialize()
+        if get_config_value('elder_selection', 'index') == 'index':
+            from council.knowledge.elder_index import get_elder_index
+
+            progress.message = "Building elder index..."
+            get_elder_index()
+        progress.message = "Knowledge store ready"
+
+    get_task_manager().submit(_init_knowledge, task_id="knowledge-init")
+
+    # Index knowledge files that were added or changed outside a pipeline
+    if get_config_value('auto_index_enabled', True):
+        from council.knowledge.indexer import KnowledgeIndexer
+
+        KnowledgeIndexer(
+            interval=get_config_value('auto_index_interval', 10),
+            debounce=get_config_value('auto_index_debounce', 30),
+        ).start()
     app.run(host=host, port=port, debug=debug)
 
 
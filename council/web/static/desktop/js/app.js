@@ -334,6 +334,11 @@ window.App = (() => {
                     handleNominationEvent(data);
                 }
 
+                // Biography of a nominated guest, looked up in the background
+                if (data.nomination_bio) {
+                    showNominationBiography(data);
+                }
+
                 // Moderator asks user for clarification
                 if (data.ask_user) {
                     sessionFollowUpCount++;
@@ -486,6 +491,11 @@ window.App = (() => {
                     handleNominationEvent(data);
                 }
 
+                // Biography of a nominated guest, looked up in the background
+                if (data.nomination_bio) {
+                    showNominationBiography(data);
+                }
+
                 if (data.ask_user) {
                     sessionFollowUpCount++;
                     AppState.set('isStreaming', false);
@@ -803,6 +813,9 @@ window.App = (() => {
                 };
                 handleNominationEvent(data);
             }
+            if (data.nomination_bio) {
+                showNominationBiography(data);
+            }
 
             if (data.elder_start) {
                 const elderData = findElder(data.elder_id) || nominatedElders[data.elder_id] || {
@@ -949,7 +962,25 @@ window.App = (() => {
             text: `${data.nominated_by} nominates ${data.guest_name}, an expert in ${data.expertise}.`,
         });
 
-        // Show biography card if we have biography data
+        // Show biography card if we have biography data; otherwise it
+        // arrives later in a nomination_bio event
+        showNominationBiography(data);
+
+        // Auto-trigger enrichment if enabled
+        if (AppState.get('enrichmentEnabled') !== false &&
+            typeof EnrichmentComponent !== 'undefined') {
+            EnrichmentComponent.startEnrichment(
+                data.guest_id,
+                data.guest_name,
+                data.expertise
+            );
+        }
+    }
+
+    /**
+     * Show the biography card for a nominated guest (nomination or nomination_bio event).
+     */
+    function showNominationBiography(data) {
         if (data.biography && data.biography.summary) {
             ChatComponent.showBiographyCard(
                 {
@@ -966,16 +997,6 @@ window.App = (() => {
                 { showSaveButton: !data.is_existing_elder, showBooksButton: true }
             );
         }
-
-        // Auto-trigger enrichment if enabled
-        if (AppState.get('enrichmentEnabled') !== false &&
-            typeof EnrichmentComponent !== 'undefined') {
-            EnrichmentComponent.startEnrichment(
-                data.guest_id,
-                data.guest_name,
-                data.expertise
-            );
-        }
     }
 
     /**
@@ -0,0 +1,194 @@
+"""Tests for the biography cache and the non-blocking nomination biographies."""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import council.knowledge.biography as biography
+from council.knowledge.biography import BiographyCache
+
+WIKI = {"summary": "Seneca was a Stoic philosopher.", "url": "https://w/Seneca", "source": "wikipedia"}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = BiographyCache(tmp_path / "biographies.json")
+    monkeypatch.setattr(biography, "_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Fake Wikipedia: records each lookup; knows only Seneca."""
+    calls = []
+
+    def fetch(name):
+        calls.append(name)
+        return dict(WIKI) if "seneca" in name.lower() else None
+
+    monkeypatch.setattr(biography, "fetch_wikipedia_summary", fetch)
+    monkeypatch.setattr(biography, "generate_llm_biography", lambda name, expertise: f"{name} knows {expertise}.")
+    return calls
+
+
+def sse(events):
+    return [json.loads(event[len("data: "):]) for event in events]
+
+
+class TestBiographyCache:
+    def test_put_get_and_max_age(self, cache):
+        cache.put("Seneca", WIKI)
+
+        assert cache.get("  seneca ") == WIKI
+        assert cache.get("Seneca", max_age=3600) == WIKI
+        assert cache.get("Seneca", max_age=-1) is None
+        assert cache.get("Cato") is None
+
+    def test_persists_and_clears(self, cache):
+        cache.put("Seneca", WIKI)
+        assert BiographyCache(cache.path).get("Seneca") == WIKI
+        assert cache.clear() == 1
+        assert BiographyCache(cache.path).get("Seneca") is None
+
+    def test_instances_keep_each_others_entries(self, cache):
+        other = BiographyCache(cache.path)
+        cache.put("Seneca", WIKI)
+        other.put("Cato", dict(WIKI, summary="Cato was a senator."))
+
+        assert BiographyCache(cache.path).get("Seneca") == WIKI
+        assert other.get("Seneca") == WIKI
+        assert other.clear() == 2
+        assert BiographyCache(cache.path).get("Cato") is None
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "biographies.json"
+        path.write_text("{not json")
+        assert BiographyCache(path).get("Seneca") is None
+
+
+class TestGetBiography:
+    def test_only_wikipedia_results_are_cached(self, cache, lookups):
+        assert biography.get_biography("Seneca") == WIKI
+        assert biography.get_biography("seneca") == WIKI
+        assert biography.get_biography("Ada Palmer", "history") == {"summary": "Ada Palmer knows history.", "source": "llm"}
+        assert biography.get_biography("Ada Palmer", "science") == {"summary": "Ada Palmer knows science.", "source": "llm"}
+        assert lookups == ["Seneca", "Ada Palmer", "Ada Palmer"]
+        assert cache.get("Ada Palmer") is None
+
+    def test_llm_entries_from_older_caches_are_ignored(self, cache, lookups):
+        cache.put("Ada Palmer", {"summary": "Ada Palmer knows history.", "source": "llm"})
+        assert biography.get_biography("Ada Palmer", "science")["summary"] == "Ada Palmer knows science."
+        assert biography.get_biography_async("Ada Palmer", "art").result(5)["summary"] == "Ada Palmer knows art."
+
+    def test_ttl_and_disabled_cache(self, cache, lookups, monkeypatch):
+        biography.get_biography("Seneca")
+        biography.get_biography("Seneca", max_age=-1)
+        assert len(lookups) == 2
+
+        monkeypatch.setattr(biography, "get_config_value", lambda key, default=None: False if key == "biography_cache_enabled" else default)
+        biography.get_biography("Seneca")
+        assert len(lookups) == 3
+
+    def test_async_shares_one_lookup(self, cache, lookups, monkeypatch):
+        gate = threading.Event()
+        fetch = biography.fetch_wikipedia_summary
+        monkeypatch.setattr(biography, "fetch_wikipedia_summary", lambda name: gate.wait(5) and fetch(name))
+
+        first = biography.get_biography_async("Seneca")
+        second = biography.get_biography_async("SENECA")
+        assert first is second and not first.done()
+        gate.set()
+        assert first.result(5) == WIKI
+
+        cached = biography.get_biography_async("Seneca")
+        assert cached is not first and cached.done() and cached.result() == WIKI
+        assert lookups == ["Seneca"]
+
+
+class TestNominationStream:
+    @pytest.fixture
+    def app(self, cache, lookups, monkeypatch):
+        pytest.importorskip("flask")
+        import council.web.app as app
+
+        monkeypatch.setattr(app, "markdown_to_html", lambda text: text)
+        cato = SimpleNamespace(name="Cato", title="Senator", era="")
+        monkeypatch.setattr(app.ElderRegistry, "get", classmethod(lambda cls, elder_id: cato if elder_id == "cato" else None))
+        monkeypatch.setattr("council.nomination.find_existing_elder", lambda name: None)
+        return app
+
+    @staticmethod
+    def guest(name):
+        return SimpleNamespace(id=name.lower().replace(" ", "_"), name=name, title="Guest", era="",
+                               _expertise="stoicism", _nominated_by="Marcus Aurelius")
+
+    def test_cached_biography_is_sent_with_the_nomination(self, app, cache):
+        cache.put("Seneca", WIKI)
+        bios = app._NominationBios()
+
+        [event] = sse([bios.nomination_event(self.guest("Seneca"))])
+
+        assert event["biography"] == WIKI and "biography_pending" not in event
+        assert bios.remaining_events() == []
+
+    def test_slow_biography_follows_the_nomination(self, app, monkeypatch):
+        gate = threading.Event()
+        fetch = biography.fetch_wikipedia_summary
+        monkeypatch.setattr(biography, "fetch_wikipedia_summary", lambda name: gate.wait(5) and fetch(name))
+        guest = self.guest("Seneca")
+
+        def discussion():
+            yield ("__nomination__", guest)
+            yield ("seneca", "Greetings.")
+            gate.set()
+            yield ("seneca", None)
+
+        events = sse(app._stream_moderated(discussion()))
+
+        kinds = [next(k for k in ("nomination_bio", "nomination", "elder_start", "chunk", "elder_done", "panel_done") if k in e) for e in events]
+        assert kinds.index("nomination") < kinds.index("chunk") < kinds.index("nomination_bio") < kinds.index("panel_done")
+        nomination = events[kinds.index("nomination")]
+        assert nomination["biography_pending"] and nomination["biography"] == {}
+        bio = events[kinds.index("nomination_bio")]
+        assert bio["biography"] == WIKI and bio["guest_id"] == "seneca" and bio["nominated_by"] == "Marcus Aurelius"
+
+    def test_tag_in_stream_starts_lookup_early(self, app, lookups):
+        def discussion():
+            yield ("cato", "We should hear from ")
+            yield ("cato", "[NOMINATE: Seneca | stoicism]")
+            yield ("cato", " and [DIRECT: x]")
+            yield ("cato", None)
+
+        list(app._stream_moderated(discussion()))
+
+        # The lookup started from the tag is still running or already cached
+        assert biography.get_biography_async("Seneca").result(5) == WIKI
+        assert lookups == ["Seneca"]
+
+    def test_nomination_reuses_the_prefetched_llm_lookup(self, app, lookups):
+        bios = app._NominationBios()
+        bios.prefetch("Let us hear from [NOMINATE: Ada Palmer | stoicism]")
+        bios._prefetched[("Ada Palmer", "stoicism")].result(5)  # finished before the nomination
+
+        [event] = sse([bios.nomination_event(self.guest("Ada Palmer"))])
+
+        assert event["biography"] == {"summary": "Ada Palmer knows stoicism.", "source": "llm"}
+        assert lookups == ["Ada Palmer"]
+
+    def test_failed_lookup_still_resolves(self, app, monkeypatch):
+        gate = threading.Event()
+
+        def broken(name, expertise):
+            gate.wait(5)
+            raise RuntimeError("LLM down")
+
+        monkeypatch.setattr(biography, "generate_llm_biography", broken)
+        bios = app._NominationBios()
+        [nomination] = sse([bios.nomination_event(self.guest("Ada Palmer"))])
+        gate.set()
+
+        assert nomination["biography_pending"]
+        [event] = sse(bios.remaining_events(timeout=5))
+        assert event["nomination_bio"] and event["biography"] == {}
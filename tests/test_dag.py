@@ -0,0 +1,251 @@
+"""Tests for the DAG executor and the enrichment steps built on it."""
+
+import threading
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from council.knowledge.dag import DagExecutor, Node
+from council.tasks import TaskProgress
+
+
+def _sleep_then(value, seconds=0.1):
+    def fn(inputs):
+        time.sleep(seconds)
+        return value
+    return fn
+
+
+class TestDagExecutor:
+    def test_independent_nodes_run_concurrently(self):
+        nodes = [
+            Node("a", _sleep_then(1)),
+            Node("b", _sleep_then(2)),
+            Node("c", _sleep_then(3)),
+            Node("sum", lambda inputs: sum(inputs.values()), deps=("a", "b", "c")),
+        ]
+        start = time.perf_counter()
+        states = DagExecutor(nodes).run()
+
+        assert time.perf_counter() - start < 0.25
+        assert states["sum"].result == 6
+
+    def test_retries_then_succeeds(self):
+        attempts = []
+
+        def flaky(inputs):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("try again")
+            return "ok"
+
+        states = DagExecutor([Node("flaky", flaky, retries=2, retry_delay=0.01)]).run()
+        assert (states["flaky"].status, states["flaky"].attempts, states["flaky"].result) == ("done", 3, "ok")
+
+    def test_failure_skips_dependents_only(self):
+        updates = []
+        nodes = [
+            Node("bad", lambda inputs: 1 / 0),
+            Node("after_bad", lambda inputs: "never", deps=("bad",)),
+            Node("good", lambda inputs: "fine"),
+        ]
+        states = DagExecutor(nodes, on_update=lambda name, state: updates.append((name, state.status))).run()
+
+        assert states["bad"].status == "failed"
+        assert states["bad"].error == "ZeroDivisionError: division by zero"
+        assert states["after_bad"].status == "skipped"
+        assert states["good"].status == "done"
+        assert ("after_bad", "running") not in updates
+
+    def test_after_waits_for_any_outcome(self):
+        order = []
+        nodes = [
+            Node("bad", lambda inputs: 1 / 0),
+            Node("skipped", lambda inputs: "never", deps=("bad",)),
+            Node("slow", lambda inputs: time.sleep(0.05) or order.append("slow")),
+            Node("last", lambda inputs: order.append("last") or inputs, after=("skipped", "slow")),
+        ]
+        states = DagExecutor(nodes).run()
+
+        assert states["last"].status == "done" and states["last"].result == {}
+        assert order == ["slow", "last"]
+
+    def test_timeout_abandons_attempt(self):
+        release = threading.Event()
+        states = DagExecutor([Node("slow", lambda inputs: release.wait(5), timeout=0.05, retries=1, retry_delay=0)]).run()
+        release.set()
+
+        assert states["slow"].status == "failed"
+        assert states["slow"].attempts == 2
+        assert states["slow"].error == "timed out after 0.05s"
+
+    def test_max_workers_bounds_concurrency(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def tracked(inputs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        DagExecutor([Node(str(i), tracked) for i in range(6)], max_workers=2).run()
+        assert peak[0] == 2
+
+    def test_cancel_stops_scheduling(self):
+        cancel = threading.Event()
+        nodes = [
+            Node("first", lambda inputs: cancel.set()),
+            Node("second", lambda inputs: "never", deps=("first",)),
+        ]
+        states = DagExecutor(nodes, cancel=cancel).run()
+        assert states["second"].status == "cancelled"
+
+    @pytest.mark.parametrize("nodes", [
+        [Node("a", print, deps=("missing",))],
+        [Node("a", print), Node("a", print)],
+        [Node("a", print, deps=("b",)), Node("b", print, deps=("a",))],
+        [Node("a", print, after=("b",)), Node("b", print, deps=("a",))],
+    ])
+    def test_invalid_graphs(self, nodes):
+        with pytest.raises(ValueError):
+            DagExecutor(nodes)
+
+
+class TestEnrichment:
+    @pytest.fixture
+    def enrichment(self, monkeypatch, tmp_path):
+        import council.knowledge.books as books
+        import council.knowledge.enrichment as enrichment
+        from council.knowledge.youtube import VideoInfo
+
+        monkeypatch.setattr(enrichment, "get_biography", _sleep_then_args({"summary": "Stoic emperor"}))
+        monkeypatch.setattr(enrichment, "search_youtube", lambda query, max_results=3: [f"https://y/{query[-3:]}{i}" for i in range(2)])
+        monkeypatch.setattr(books, "discover_books", _sleep_then_args([{"title": "Meditations"}]))
+
+        def video_info(url):
+            time.sleep(0.1)
+            if url.endswith("0"):
+                return None
+            return VideoInfo(url=url, title=f"Talk {url[-4:]}", channel="c", duration=600, transcript="words " * 200, language="en")
+
+        saved = tmp_path / "talk.txt"
+        saved.write_text("# Talk\n\nSource: test\n\n" + "virtue is enough " * 40)
+        monkeypatch.setattr(enrichment, "get_video_info", video_info)
+        monkeypatch.setattr(enrichment, "clean_transcript", lambda text: text)
+        monkeypatch.setattr(enrichment, "vet_transcript", lambda text, elder_id, title: (True, text))
+        monkeypatch.setattr(enrichment, "save_transcript", lambda elder_id, info: saved)
+        monkeypatch.setattr(enrichment, "mark_indexed", lambda path: marked.append(path))
+
+        updates, marked = [], []
+        monkeypatch.setattr(enrichment, "_update_custom_elder", lambda elder_id, data: updates.append(dict(data)))
+        monkeypatch.setattr(enrichment, "marked", marked, raising=False)
+        return enrichment, updates
+
+    @staticmethod
+    def _tasks(monkeypatch):
+        import council.tasks as tasks
+
+        submitted = []
+        monkeypatch.setattr(tasks, "get_task_manager", lambda: SimpleNamespace(
+            submit=lambda fn, task_id, **kwargs: submitted.append(task_id) or task_id,
+        ))
+        return submitted
+
+    def test_steps_overlap_and_stream_results(self, enrichment, monkeypatch):
+        enrichment, updates = enrichment
+        import council.knowledge.store as store
+
+        indexed = []
+        monkeypatch.setattr(store, "get_knowledge_store", lambda: SimpleNamespace(
+            add_document_async=lambda elder_id, text, metadata: indexed.append(metadata["title"]) or _finished(1),
+        ))
+        submitted = self._tasks(monkeypatch)
+
+        progress = TaskProgress()
+        start = time.perf_counter()
+        result = enrichment.enrich_elder(elder_id="custom_aurelius", name="Marcus", expertise="stoicism", progress=progress)
+        elapsed = time.perf_counter() - start
+
+        # Serially: bio 0.1 + books 0.1 + 5 videos x 0.1
+        assert elapsed < 0.5
+        assert result["biography"] == {"summary": "Stoic emperor"}
+        assert result["youtube_transcripts"] == 2 and result["books_discovered"] == 1
+        assert submitted == ["quotes_custom_aurelius"]
+        assert len(indexed) == 2
+
+        by_step = {s["step"]: s for s in progress.substeps}
+        assert by_step["youtube_search"] == {"step": "youtube_search", "status": "done", "found": 5}
+        assert by_step["books"]["count"] == 1
+        assert by_step["quote_verification"]["status"] == "submitted"
+        assert sorted(s["status"] for k, s in by_step.items() if k.startswith("video_")) == ["done"] * 2 + ["skipped: no transcript"] * 3
+        assert progress.progress == 1.0
+
+        # Biography and books are saved as soon as they arrive, not only at the end
+        assert {"biography": {"summary": "Stoic emperor"}} in updates
+        assert {"books": [{"title": "Meditations"}]} in updates
+        assert updates[-1]["enrichment"]["status"] == "completed"
+        assert len(updates[-1]["enrichment"]["transcript_audits"]) == 2
+        assert len(enrichment.marked) == 2
+
+    @pytest.mark.parametrize("broken", ["write", "store"])
+    def test_failed_index_is_reported_and_left_for_the_indexer(self, enrichment, monkeypatch, broken):
+        enrichment, _ = enrichment
+        import council.knowledge.store as store
+
+        def get_store():
+            if broken == "store":
+                raise ImportError("no chromadb")
+            return SimpleNamespace(add_document_async=lambda elder_id, text, metadata: _finished(error=OSError("disk full")))
+
+        monkeypatch.setattr(store, "get_knowledge_store", get_store)
+        self._tasks(monkeypatch)
+        progress = TaskProgress()
+
+        result = enrichment.enrich_elder(elder_id="aurelius", name="Marcus", expertise="stoicism", progress=progress)
+
+        statuses = [s["status"] for s in progress.substeps if s["step"].startswith("video_")]
+        assert sorted(statuses)[:2] == ["error: indexing failed: " + ("no chromadb" if broken == "store" else "disk full")] * 2
+        assert result["youtube_transcripts"] == 2
+        assert enrichment.marked == []
+
+    def test_quote_verification_runs_when_search_fails(self, enrichment, monkeypatch):
+        enrichment, _ = enrichment
+        from functools import partial
+
+        def search(query, max_results=3):
+            raise ConnectionError("offline")
+
+        monkeypatch.setattr(enrichment, "search_youtube", search)
+        monkeypatch.setattr(enrichment, "Node", partial(Node, retry_delay=0))
+        submitted = self._tasks(monkeypatch)
+        progress = TaskProgress()
+
+        enrichment.enrich_elder(elder_id="aurelius", name="Marcus", expertise="stoicism", progress=progress)
+
+        by_step = {s["step"]: s for s in progress.substeps}
+        assert by_step["youtube_search"]["status"].startswith("failed")
+        assert by_step["videos"]["status"] == "skipped"
+        assert by_step["quote_verification"]["status"] == "submitted"
+        assert submitted == ["quotes_aurelius"]
+
+
+def _finished(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def _sleep_then_args(value, seconds=0.1):
+    def fn(*args, **kwargs):
+        time.sleep(seconds)
+        return value
+    return fn
+
@@ -0,0 +1,80 @@
+"""Tests for near-duplicate chunk suppression at ingest."""
+
+from council.knowledge.dedup import NearDuplicateIndex, estimated_jaccard, minhash
+
+PASSAGE = (
+    "Rule number one is never lose money. Rule number two is never forget rule "
+    "number one. Price is what you pay and value is what you get, and it is far "
+    "better to buy a wonderful company at a fair price than a fair company at a "
+    "wonderful price. Our favorite holding period is forever."
+)
+VARIANT = PASSAGE.replace("Our favorite holding period is forever.", "Our favourite holding period is forever!")
+UNRELATED = (
+    "The happiness of your life depends upon the quality of your thoughts, "
+    "therefore guard accordingly and take care that you entertain no notions "
+    "unsuitable to virtue and reasonable nature."
+)
+
+
+class TestMinHash:
+    def test_identical_text_has_identical_signature(self):
+        assert estimated_jaccard(minhash(PASSAGE), minhash(PASSAGE)) == 1.0
+
+    def test_case_and_punctuation_insensitive(self):
+        assert estimated_jaccard(minhash(PASSAGE), minhash(PASSAGE.upper().replace(",", ""))) == 1.0
+
+    def test_near_duplicate_scores_high_and_unrelated_low(self):
+        assert estimated_jaccard(minhash(PASSAGE), minhash(VARIANT)) >= 0.8
+        assert estimated_jaccard(minhash(PASSAGE), minhash(UNRELATED)) < 0.2
+
+
+class TestNearDuplicateIndex:
+    def test_drops_duplicates_within_and_across_batches(self, tmp_path):
+        index = NearDuplicateIndex("buffett", root=tmp_path)
+        assert index.filter([PASSAGE, VARIANT, UNRELATED], source="letter_1990") == [True, False, True]
+        assert index.filter([PASSAGE], source="youtube") == [False]
+
+    def test_check_does_not_modify_until_commit(self, tmp_path):
+        index = NearDuplicateIndex("buffett", root=tmp_path)
+        keep, signatures = index.check([PASSAGE])
+        assert keep == [True] and len(index) == 0
+
+        index.commit(signatures, "letter", total=1)
+        assert index.check([PASSAGE])[0] == [False]
+
+    def test_persists_signatures_and_report(self, tmp_path):
+        NearDuplicateIndex("buffett", root=tmp_path).filter([PASSAGE, VARIANT], source="a")
+
+        reopened = NearDuplicateIndex("buffett", root=tmp_path)
+        assert reopened.filter([VARIANT, UNRELATED], source="b") == [False, True]
+        assert reopened.report() == {
+            "a": {"chunks": 2, "duplicates": 1, "ratio": 0.5},
+            "b": {"chunks": 2, "duplicates": 1, "ratio": 0.5},
+        }
+
+    def test_elders_are_independent(self, tmp_path):
+        NearDuplicateIndex("buffett", root=tmp_path).filter([PASSAGE])
+        assert NearDuplicateIndex("munger", root=tmp_path).filter([PASSAGE]) == [True]
+
+    def test_clear_forgets_everything(self, tmp_path):
+        index = NearDuplicateIndex("buffett", root=tmp_path)
+        index.filter([PASSAGE], source="a")
+        index.clear()
+
+        assert index.report() == {}
+        assert NearDuplicateIndex("buffett", root=tmp_path).filter([PASSAGE]) == [True]
+
+    def test_remove_source_forgets_only_that_source(self, tmp_path):
+        index = NearDuplicateIndex("buffett", root=tmp_path)
+        index.filter([PASSAGE], source="a")
+        index.filter([UNRELATED], source="b")
+
+        assert index.remove_source("a") == 1
+        assert set(index.report()) == {"b"}
+
+        reloaded = NearDuplicateIndex("buffett", root=tmp_path)
+        assert reloaded.filter([PASSAGE, UNRELATED], source="c") == [True, False]
+
+    def test_threshold_is_configurable(self, tmp_path):
+        strict = NearDuplicateIndex("buffett", threshold=1.01, root=tmp_path)
+        assert strict.filter([PASSAGE, PASSAGE]) == [True, True]
@@ -0,0 +1,92 @@
+"""Tests for the streaming corpus assessment in deep_audit."""
+
+import pytest
+
+import council.knowledge.deep_audit as deep_audit
+from council.knowledge.deep_audit import CorpusMatcher, assess_elder_corpus, verify_quotes_in_corpus
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    monkeypatch.setattr(deep_audit, "get_knowledge_dir", lambda: tmp_path)
+    elder = tmp_path / "munger"
+    (elder / "youtube").mkdir(parents=True)
+    return elder
+
+
+class TestCorpusMatcher:
+    def test_keywords_can_be_found_in_different_documents(self):
+        matcher = CorpusMatcher(keywords=["Psychology", "human", "misjudgment"])
+        matcher.feed("The PSYCHOLOGY of it")
+        matcher.feed("all too human misjudgments")
+
+        assert matcher.done
+        assert matcher.has_all(["psychology", "Human", "misjudgment"])
+
+    def test_overlapping_keywords_are_all_found_in_one_document(self):
+        matcher = CorpusMatcher(keywords=["man", "human", "many", "any", "an"])
+        matcher.feed("so many humans")
+        assert matcher.done
+
+    def test_each_document_is_scanned_once(self, monkeypatch):
+        matcher = CorpusMatcher(keywords=["alpha", "beta", "gamma"], quotes=["beta test run"])
+        scans = []
+        present = matcher._present
+        monkeypatch.setattr(matcher, "_present", lambda text: scans.append(text) or present(text))
+        matcher.feed("alpha and gamma")
+        matcher.feed("a beta test run")
+
+        assert scans == ["alpha and gamma", "a beta test run"]
+        assert matcher.done
+
+    def test_quote_words_must_be_in_order_on_one_line(self):
+        quote = "Show me the incentive and I will show you the outcome"
+        matcher = CorpusMatcher(quotes=[quote])
+        matcher.feed("show me the\nincentive and")
+        matcher.feed("incentive and show me the")
+        assert matcher.found_quotes == set()
+
+        matcher.feed("He said: show me THE real incentive, and")
+        assert matcher.found_quotes == {quote}
+
+    @pytest.mark.parametrize("documents", [
+        ["be fearful when", "others are greedy"],
+        ["be fearful when others are greedy", "price is what you pay. value is what you get"],
+        ["rule no. 1: never lose money.", "", "BE FEARFUL WHEN OTHERS ARE"],
+    ])
+    def test_matches_whole_text_search(self, documents):
+        # Splitting the corpus into documents must not change the outcome
+        quotes = [quote for quote, _ in deep_audit.VERIFICATION_QUOTES["buffett"]]
+        streamed = CorpusMatcher(quotes=quotes)
+        for document in documents:
+            streamed.feed(document)
+
+        found, missing = verify_quotes_in_corpus("buffett", "\n".join(documents) + "\n")
+        assert set(found) == streamed.found_quotes
+        assert set(missing) == set(quotes) - streamed.found_quotes
+
+
+class TestAssessElderCorpus:
+    def test_streams_files_and_reports_missing_sources(self, corpus):
+        (corpus / "Key_Wisdom_and_Quotes.txt").write_text(
+            "Show me the incentive and I will show you the outcome.\n" * 3
+        )
+        (corpus / "youtube" / "talk.txt").write_text("The psychology of human misjudgment, a lecture.\nUSC law")
+        (corpus / "speeches.txt").write_text("school commencement address")
+
+        assessment = assess_elder_corpus("munger")
+
+        assert assessment.total_files == 3
+        assert assessment.total_words == 33 + 9 + 3
+        assert assessment.missing_sources == [
+            "Daily Journal Annual Meeting transcripts",
+            "Berkshire Annual Meeting Q&A (with Buffett)",
+        ]
+        assert assessment.veracity_issues == [
+            "Missing expected quotes: ['Invert, always invert', "
+            "\"I never allow myself to have an opinion on anything that I don't know the other side's argument better than they do\"]"
+        ]
+
+    def test_missing_corpus(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(deep_audit, "get_knowledge_dir", lambda: tmp_path)
+        assert assess_elder_corpus("aurelius").overall_grade == "F"
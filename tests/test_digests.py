@@ -0,0 +1,134 @@
+"""Tests for precomputed per-category knowledge digests."""
+
+import threading
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+import council.knowledge.digests as digests_mod
+from council.knowledge.digests import budget_blocks, build_digest, load_digest
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path, monkeypatch):
+    """Redirect digest storage to a temp directory."""
+    monkeypatch.setattr(digests_mod, "get_knowledge_dir", lambda: tmp_path)
+    monkeypatch.setattr(digests_mod, "_cache", {})
+    return tmp_path
+
+
+class TestBudgetBlocks:
+    def test_orders_by_confidence_and_drops_contained_text(self):
+        blocks = budget_blocks([
+            (0.5, "Compound interest"),
+            (0.9, "On   compound INTEREST and patience."),
+            (0.8, "Stay in your circle of competence."),
+        ])
+        assert blocks == [
+            (0.9, "On   compound INTEREST and patience."),
+            (0.8, "Stay in your circle of competence."),
+        ]
+
+    def test_tier_limits_and_total_budget(self):
+        blocks = budget_blocks([(0.3, "a" * 800), (0.6, "b" * 2000), (0.9, "c" * 2000)], max_chars=3000)
+        assert [(c, len(t)) for c, t in blocks] == [(0.9, 2000), (0.6, 1000)]
+
+
+class TestBuildAndLoad:
+    @pytest.fixture
+    def store(self, knowledge_dir, monkeypatch):
+        pytest.importorskip("chromadb")
+        import council.knowledge.store as store_mod
+        from council.knowledge.embeddings import HashingEmbeddingFunction
+
+        settings = {"embedding_cache_enabled": False, "dedup_enabled": False, "knowledge_digests_enabled": False}
+        monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: knowledge_dir)
+        monkeypatch.setattr(store_mod, "get_config_value", lambda key, default=None: settings.get(key, default))
+        return store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction())
+
+    def test_digest_per_category(self, store, knowledge_dir):
+        store.add_document("munger", "Invest in a stock the way you would buy a whole business.", {"source": "a"})
+        store.add_document("munger", "Your career compounds when you work with people you admire.", {"source": "b"})
+
+        assert store.build_digest("munger") == len(digests_mod.CATEGORY_KEYWORDS)
+        assert (knowledge_dir / "munger" / "digests.json").exists()
+
+        investing = load_digest("munger", "investing")
+        assert investing[0] == (0.7, "Invest in a stock the way you would buy a whole business.")
+        assert load_digest("munger", "general") is None
+
+    def test_empty_knowledge_base_writes_empty_digest(self, store):
+        assert build_digest("nobody", store=store) == 0
+        assert load_digest("nobody", "career") is None
+
+    def test_clear_elder_removes_digest(self, store, knowledge_dir):
+        store.add_document("munger", "Invert, always invert.", {"source": "a"})
+        store.build_digest("munger")
+        store.clear_elder("munger")
+
+        assert not (knowledge_dir / "munger" / "digests.json").exists()
+        assert load_digest("munger", "strategy") is None
+
+    def test_writes_schedule_one_debounced_rebuild(self, store, monkeypatch):
+        built = []
+        done = threading.Event()
+
+        def fake_build(elder_id):
+            built.append(elder_id)
+            done.set()
+
+        monkeypatch.setattr(store, "build_digest", fake_build)
+        import council.knowledge.store as store_mod
+
+        monkeypatch.setattr(store_mod, "get_config_value", lambda key, default=None: {
+            "embedding_cache_enabled": False, "dedup_enabled": False, "knowledge_digest_delay": 0.2,
+        }.get(key, default))
+
+        store.add_document("munger", "First.", {"source": "a"})
+        store.add_document("munger", "Second.", {"source": "b"})
+        assert done.wait(5)
+        assert built == ["munger"]
+
+
+class TestFirstTurn:
+    @pytest.fixture
+    def knowledge(self, knowledge_dir, monkeypatch):
+        import council.orchestrator as orch
+
+        calls = []
+        release = threading.Event()
+
+        def fake_query(elder_id, query):
+            calls.append((elder_id, query))
+            release.wait(5)
+            return [(0.9, "precise result")]
+
+        monkeypatch.setattr(orch, "_query_knowledge", fake_query)
+        monkeypatch.setattr(orch, "_prefetched", OrderedDict())
+        yield SimpleNamespace(get=orch.get_elder_knowledge, calls=calls, release=release)
+        release.set()
+
+    def _write_digest(self, knowledge_dir):
+        (knowledge_dir / "nobody").mkdir()
+        (knowledge_dir / "nobody" / "digests.json").write_text(
+            '{"version": 1, "categories": {"career": [[0.8, "career digest"]]}}'
+        )
+
+    def test_first_turn_serves_digest_and_prefetches(self, knowledge, knowledge_dir):
+        self._write_digest(knowledge_dir)
+        question = "Should I quit my job?"
+
+        first = knowledge.get("nobody", question, first_turn=True)
+        assert "career digest" in first
+        assert "precise result" not in first
+
+        knowledge.release.set()
+        later = knowledge.get("nobody", question)
+        assert "precise result" in later
+        assert knowledge.calls == [("nobody", question)]
+
+    def test_first_turn_without_digest_waits_for_query(self, knowledge):
+        knowledge.release.set()
+        context = knowledge.get("nobody", "What is virtue?", first_turn=True)
+        assert "precise result" in context
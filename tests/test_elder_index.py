@@ -0,0 +1,223 @@
+"""Tests for the global elder index used to pick panelists."""
+
+from dataclasses import dataclass, field
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+from council.knowledge.elder_index import ElderIndex, elder_descriptor
+from council.knowledge.embeddings import HashingEmbeddingFunction
+
+
+@dataclass
+class FakeElder:
+    id: str
+    name: str
+    title: str
+    mental_models: list[str] = field(default_factory=list)
+    key_works: list[str] = field(default_factory=list)
+
+
+ELDERS = [
+    FakeElder("stoic", "Stoic", "Philosopher", ["virtue", "death", "duty", "acceptance"]),
+    FakeElder("investor", "Investor", "Value Investor", ["stocks", "compounding", "margin of safety"]),
+    FakeElder("general", "General", "Strategist", ["war", "tactics", "terrain", "deception"]),
+]
+
+
+class CountingEmbedder(HashingEmbeddingFunction):
+    def __init__(self, dim=256):
+        super().__init__(dim)
+        self.texts = []
+
+    def __call__(self, input):
+        self.texts.extend(input)
+        return super().__call__(input)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    import council.knowledge.store as store_mod
+
+    settings = {"embedding_cache_enabled": False, "dedup_enabled": False, "knowledge_digests_enabled": False}
+    monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: tmp_path)
+    monkeypatch.setattr(store_mod, "get_config_value", lambda key, default=None: settings.get(key, default))
+    return store_mod.KnowledgeStore(embedding_function=CountingEmbedder())
+
+
+@pytest.fixture
+def index(store, tmp_path):
+    return ElderIndex(store=store, path=tmp_path / "elder_index.npz").build(ELDERS)
+
+
+class TestDescriptor:
+    def test_includes_models_and_works(self):
+        elder = FakeElder("x", "X", "Thinker", ["first principles"], ["The Book"])
+        assert elder_descriptor(elder) == "X, Thinker. Mental models: first principles. Key works: The Book."
+
+
+class TestSelect:
+    def test_most_relevant_elder_first(self, index):
+        selection = index.select("stocks compounding", k=2, tie_margin=0)
+
+        assert selection.elder_ids[0] == "investor"
+        assert selection.method == "index"
+        assert set(selection.latency_ms) == {"embed", "rank", "total"}
+        assert selection.scores["investor"] > max(
+            s for eid, s in selection.scores.items() if eid != "investor"
+        )
+
+    def test_rank_and_restriction(self, index):
+        ranked = index.rank("war tactics and deception", elder_ids=["general", "stoic"])
+        assert [eid for eid, _ in ranked] == ["general", "stoic"]
+
+    def test_diversity_skips_near_duplicate(self, store, tmp_path):
+        clone = FakeElder("investor2", "Investor", "Value Investor", ["stocks", "compounding", "margin of safety"])
+        index = ElderIndex(store=store, path=tmp_path / "idx.npz").build([*ELDERS, clone])
+
+        relevant_only = index.select("stocks compounding", k=2, lambda_mult=1.0, tie_margin=0)
+        assert set(relevant_only.elder_ids) == {"investor", "investor2"}
+
+        diverse = index.select("stocks compounding", k=2, lambda_mult=0.5, tie_margin=0)
+        assert diverse.elder_ids[0] in {"investor", "investor2"}
+        assert not {"investor", "investor2"} <= set(diverse.elder_ids)
+
+    def test_tie_breaker_only_sees_tied_band(self, index):
+        calls = []
+
+        def tie_breaker(question, tied, slots):
+            calls.append((tied, slots))
+            return [tied[-1]]
+
+        selection = index.select("stocks", k=1, tie_margin=10.0, tie_breaker=tie_breaker)
+
+        [(tied, slots)] = calls
+        assert slots == 1 and tied[0] == "investor" and len(tied) == 3
+        assert selection.elder_ids == [tied[-1]]
+        assert selection.method == "index+llm"
+        assert "tiebreak" in selection.latency_ms
+
+    def test_clear_winner_skips_tie_breaker(self, index):
+        def tie_breaker(question, tied, slots):
+            raise AssertionError("LLM consulted without a tie")
+
+        assert index.select("stocks compounding", k=1, tie_margin=0.0001, tie_breaker=tie_breaker).elder_ids == ["investor"]
+
+
+class TestCache:
+    def test_descriptors_embedded_once(self, store, tmp_path, index):
+        embedder = store.embedding_function
+        embedder.texts.clear()
+
+        ElderIndex(store=store, path=tmp_path / "elder_index.npz").build(ELDERS)
+        assert embedder.texts == []
+
+        changed = [*ELDERS[:2], FakeElder("general", "General", "Strategist", ["logistics"])]
+        ElderIndex(store=store, path=tmp_path / "elder_index.npz").build(changed)
+        assert embedder.texts == [elder_descriptor(changed[2])]
+
+    def test_other_model_invalidates_cache(self, store, tmp_path, index):
+        other = ElderIndex(store=store, path=tmp_path / "elder_index.npz", embedding_function=HashingEmbeddingFunction(dim=64))
+        other.build(ELDERS)
+        assert other.rank("stocks")[0][0] == "investor"
+
+
+class TestCentroids:
+    def test_knowledge_moves_elder_towards_their_corpus(self, store, index):
+        question = "tending tomatoes in the vegetable garden"
+        before = dict(index.rank(question))
+
+        store.add_document("stoic", "Tend your tomatoes; the vegetable garden rewards patience.", {"source": "letters"})
+        index.refresh_centroid("stoic")
+
+        after = dict(index.rank(question))
+        assert after["stoic"] > before["stoic"]
+        assert after["investor"] == pytest.approx(before["investor"])
+
+    def test_build_does_not_create_empty_collections(self, store, index):
+        assert store.client.list_collections() == []
+
+    def test_persisted_centroids_refresh_in_background(self, store, tmp_path, index, monkeypatch):
+        import threading
+
+        store.add_document("stoic", "Tend your tomatoes; the vegetable garden rewards patience.", {"source": "letters"})
+        index.refresh_centroid("stoic")
+        store.add_document("stoic", "Prune the vines before the frost.", {"source": "letters2"})
+
+        gate = threading.Event()
+        compute = ElderIndex._compute_centroid
+        monkeypatch.setattr(ElderIndex, "_compute_centroid", lambda self, eid: gate.wait(5) and compute(self, eid))
+        fresh = ElderIndex(store=store, path=tmp_path / "elder_index.npz").build(ELDERS, background=True)
+
+        # The persisted centroid serves queries until the refresh lands
+        assert fresh._centroid_counts["stoic"] == 1
+        assert dict(fresh.rank("tomatoes"))["stoic"] == pytest.approx(dict(index.rank("tomatoes"))["stoic"])
+        gate.set()
+        next(t for t in threading.enumerate() if t.name == "elder-index-centroids").join(5)
+        assert fresh._centroid_counts["stoic"] == 2
+
+    def test_writes_update_the_running_centroid(self, store, tmp_path, index, monkeypatch):
+        import council.knowledge.elder_index as elder_index_mod
+
+        monkeypatch.setattr(elder_index_mod, "_elder_index", index)
+        store.add_document("stoic", "Tend your tomatoes; the vegetable garden rewards patience.", {"source": "letters"})
+        store.add_document("stoic", "Prune the vines before the frost.", {"source": "letters2"})
+        store.add_document("stoic", "Virtue is the only good.", {"source": "letters3"})
+        store.remove_source("stoic", "letters2")
+
+        # The debounced refresh finds the centroid current, with nothing to scan
+        assert index._centroid_counts["stoic"] == 2
+        assert index._compute_centroid("stoic") is None
+        scanned = ElderIndex(store=store, path=tmp_path / "scanned.npz").build(ELDERS)
+        assert index._centroids["stoic"] == pytest.approx(scanned._centroids["stoic"], abs=1e-6)
+
+        # The running sum is persisted, so it keeps being updated after a restart
+        index.refresh_centroid("stoic")
+        reloaded = ElderIndex(store=store, path=tmp_path / "elder_index.npz").build(ELDERS, centroids=False)
+        reloaded.update_centroid("stoic", reloaded.model_id, 3, added=store.embed(["Fortune favours the bold."]))
+        assert reloaded._centroid_counts["stoic"] == 3
+
+
+class TestGlobalIndex:
+    def test_picks_up_elders_registered_later(self, store, tmp_path, monkeypatch):
+        from functools import partial
+
+        import council.knowledge.elder_index as elder_index_mod
+        from council.elders import ElderRegistry
+
+        monkeypatch.setattr(elder_index_mod, "_elder_index", None)
+        monkeypatch.setattr(elder_index_mod, "ElderIndex", partial(ElderIndex, store=store, path=tmp_path / "global.npz"))
+        first = elder_index_mod.get_elder_index()
+        assert "gardener" not in first.elder_ids
+
+        ElderRegistry.register(FakeElder("gardener", "Gardener", "Horticulturist", ["tomatoes", "pruning"]))
+        try:
+            index = elder_index_mod.get_elder_index()
+            assert index is first and "gardener" in index.elder_ids
+            assert index.rank("pruning tomatoes")[0][0] == "gardener"
+        finally:
+            ElderRegistry.unregister("gardener")
+        assert "gardener" not in elder_index_mod.get_elder_index().elder_ids
+
+
+class TestLLMTieBreaker:
+    def test_prompt_carries_profile_and_criteria(self, monkeypatch):
+        from council.knowledge.elder_index import llm_tie_breaker
+
+        prompts = []
+
+        def chat(messages, stream=True):
+            prompts.append(messages[0]["content"])
+            return iter(["seneca\n"])
+
+        monkeypatch.setattr("council.llm.chat", chat)
+        chosen = llm_tie_breaker(
+            "How do I grieve?", ["aurelius", "seneca"], 1,
+            profile_context="User profile (6 sessions):", category="emotional",
+        )
+
+        assert chosen == ["seneca"]
+        assert "User profile (6 sessions):" in prompts[0]
+        assert "Question category hint: emotional" in prompts[0]
+        assert "CREATIVE TENSION" in prompts[0] and "SURPRISE" in prompts[0]
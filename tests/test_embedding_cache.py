@@ -0,0 +1,107 @@
+"""Tests for the persistent embedding cache."""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from council.knowledge.embedding_cache import EmbeddingCache, embedding_model_id
+
+
+class CountingEmbedder:
+    """Deterministic bag-of-words embedder that counts texts embedded."""
+
+    model_id = "counting-test"
+
+    def __init__(self, dim: int = 16):
+        self.dim = dim
+        self.calls = 0
+
+    def __call__(self, input):
+        self.calls += len(input)
+        vectors = []
+        for text in input:
+            vec = np.zeros(self.dim, dtype=np.float32)
+            for word in text.lower().split():
+                vec[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1.0
+            norm = np.linalg.norm(vec)
+            vectors.append((vec / norm if norm else vec).tolist())
+        return vectors
+
+
+TEXTS = ["the obstacle is the way", "know thyself", "waste no more time arguing"]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+class TestEmbeddingCache:
+    @pytest.mark.parametrize("dtype,tol", [("float16", 1e-3), ("int8", 1e-2)])
+    def test_round_trip(self, tmp_path, embedder, dtype, tol):
+        cache = EmbeddingCache("m", dtype=dtype, root=tmp_path)
+        expected = embedder(TEXTS)
+        cache.put_many(TEXTS, expected)
+
+        got = cache.get_many(TEXTS)
+        assert np.allclose(got, expected, atol=tol)
+
+    def test_embed_only_calls_model_for_misses(self, tmp_path, embedder):
+        cache = EmbeddingCache("m", root=tmp_path)
+        cache.embed(TEXTS[:2], embedder)
+        assert embedder.calls == 2
+
+        cache.embed(TEXTS, embedder)
+        assert embedder.calls == 3
+        assert cache.hits == 2
+
+    def test_persists_across_instances(self, tmp_path, embedder):
+        EmbeddingCache("m", root=tmp_path).embed(TEXTS, embedder)
+
+        reopened = EmbeddingCache("m", root=tmp_path)
+        assert len(reopened) == 3
+        reopened.embed(TEXTS, embedder)
+        assert embedder.calls == 3
+
+    def test_instances_share_a_directory(self, tmp_path, embedder):
+        a = EmbeddingCache("m", root=tmp_path)
+        b = EmbeddingCache("m", root=tmp_path)
+        a.put_many(["x"], embedder(["x"]))
+        b.put_many(["y"], embedder(["y"]))
+        a.put_many(["z"], embedder(["z"]))
+
+        for cache in (a, b, EmbeddingCache("m", root=tmp_path)):
+            assert np.allclose(cache.get_many(["x", "y", "z"]), embedder(["x", "y", "z"]), atol=1e-3)
+
+    def test_models_do_not_share_entries(self, tmp_path, embedder):
+        EmbeddingCache("model-a", root=tmp_path).embed(TEXTS, embedder)
+        assert len(EmbeddingCache("model-b", root=tmp_path)) == 0
+
+    def test_torn_tail_is_trimmed(self, tmp_path, embedder):
+        cache = EmbeddingCache("m", root=tmp_path)
+        cache.embed(TEXTS, embedder)
+        with open(cache.path / "vectors.bin", "ab") as f:
+            f.write(b"\x00" * 7)  # interrupted append with no key
+
+        reopened = EmbeddingCache("m", root=tmp_path)
+        reopened.embed(["a brand new chunk"], embedder)
+        assert np.allclose(
+            EmbeddingCache("m", root=tmp_path).get_many(TEXTS + ["a brand new chunk"]),
+            embedder(TEXTS + ["a brand new chunk"]),
+            atol=1e-3,
+        )
+
+    def test_dimension_mismatch_raises(self, tmp_path, embedder):
+        cache = EmbeddingCache("m", root=tmp_path)
+        cache.embed(TEXTS, embedder)
+        with pytest.raises(ValueError):
+            cache.put_many(["other"], [[0.1, 0.2]])
+
+    def test_rejects_unknown_dtype(self, tmp_path):
+        with pytest.raises(ValueError):
+            EmbeddingCache("m", dtype="float64", root=tmp_path)
+
+
+def test_model_id_prefers_explicit_attribute(embedder):
+    assert embedding_model_id(embedder) == "counting-test"
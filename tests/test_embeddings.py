@@ -0,0 +1,172 @@
+"""Tests for the batched embedding backends."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import council.knowledge.embeddings as emb_mod
+from council.knowledge.embedding_cache import embedding_model_id
+from council.knowledge.embeddings import (
+    BatchedEmbeddingFunction,
+    ChromaDefaultEmbeddingFunction,
+    HashingEmbeddingFunction,
+    OllamaEmbeddingFunction,
+    create_embedding_function,
+    embedding_function_from_spec,
+)
+from council.knowledge.versions import embedding_spec
+
+
+class FakeBackend(BatchedEmbeddingFunction):
+    """Embeds with hashing and records each batch and the thread that ran it."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.thread_names = set()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        return HashingEmbeddingFunction(dim=32)
+
+    def _embed_batch(self, model, texts):
+        with self._lock:
+            self.batches.append(list(texts))
+            self.thread_names.add(threading.current_thread().name)
+        return model(texts)
+
+    @staticmethod
+    def name():
+        return "fake"
+
+    def get_config(self):
+        return {}
+
+
+class FakeOllamaClient:
+    def __init__(self, host):
+        self.host = host
+        self.calls = []
+
+    def embed(self, model, input):
+        self.calls.append((model, list(input)))
+        return {"embeddings": [[float(len(text)), 1.0] for text in input]}
+
+
+class TestBatching:
+    def test_splits_into_batches_and_keeps_order(self):
+        backend = FakeBackend(batch_size=3, threads=4)
+        texts = [f"text number {i}" for i in range(10)]
+
+        vectors = backend(texts)
+
+        assert sorted(len(b) for b in backend.batches) == [1, 3, 3, 3]
+        expected = HashingEmbeddingFunction(dim=32)(texts)
+        assert all(np.allclose(a, b) for a, b in zip(vectors, expected))
+        assert len(vectors) == 10
+
+    def test_batches_run_on_thread_pool(self):
+        backend = FakeBackend(batch_size=1, threads=4)
+        backend([f"t{i}" for i in range(8)])
+        assert all(name.startswith("embed") for name in backend.thread_names)
+
+    def test_single_batch_runs_inline(self):
+        backend = FakeBackend(batch_size=8, threads=4)
+        backend(["a", "b"])
+        assert backend.thread_names == {threading.current_thread().name}
+
+    def test_stats_count_texts_and_batches(self):
+        backend = FakeBackend(batch_size=2, threads=2)
+        backend(["a", "b", "c"])
+
+        stats = backend.stats()
+        assert stats["texts"] == 3 and stats["batches"] == 2
+        assert stats["backend"] == "fake" and stats["batch_size"] == 2
+        assert stats["texts_per_second"] > 0
+
+    def test_warm_up_loads_model(self):
+        backend = FakeBackend()
+        assert backend._model is None
+        assert backend.warm_up() >= 0
+        assert backend._model is not None
+        assert backend.stats()["warm_up_ms"] is not None
+
+    def test_threads_default_from_config(self, monkeypatch):
+        settings = {"embedding_threads": 0, "embedding_batch_size": 16}
+        monkeypatch.setattr(emb_mod, "get_config_value", lambda key, default=None: settings.get(key, default))
+        monkeypatch.setattr(emb_mod.os, "cpu_count", lambda: 6)
+
+        backend = FakeBackend()
+        assert (backend.batch_size, backend.threads) == (16, 6)
+
+
+class TestOllama:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        ollama = pytest.importorskip("ollama")
+        clients = []
+
+        def make_client(host):
+            clients.append(FakeOllamaClient(host))
+            return clients[-1]
+
+        monkeypatch.setattr(ollama, "Client", make_client)
+        return clients
+
+    def test_one_request_per_batch(self, client):
+        backend = OllamaEmbeddingFunction("nomic-embed-text", host="http://ollama:11434", batch_size=2, threads=2)
+
+        vectors = backend(["a", "bb", "ccc"])
+
+        [fake] = client
+        assert fake.host == "http://ollama:11434"
+        assert sorted(len(texts) for _, texts in fake.calls) == [1, 2]
+        assert {model for model, _ in fake.calls} == {"nomic-embed-text"}
+        assert [float(v[0]) for v in vectors] == [1.0, 2.0, 3.0]
+
+    def test_spec_round_trip(self, client):
+        backend = OllamaEmbeddingFunction("mxbai-embed-large")
+        rebuilt = embedding_function_from_spec(embedding_spec(backend))
+
+        assert isinstance(rebuilt, OllamaEmbeddingFunction)
+        assert rebuilt.model_name == "mxbai-embed-large"
+        assert embedding_model_id(backend) == "council-ollama:mxbai-embed-large"
+
+
+class TestWithoutChromaDB:
+    def test_backends_import_without_chromadb(self):
+        code = (
+            "import sys; sys.modules['chromadb'] = None\n"
+            "from council.knowledge.embeddings import HashingEmbeddingFunction, create_embedding_function\n"
+            "assert len(HashingEmbeddingFunction(dim=8)(['a b'])[0]) == 8\n"
+            "create_embedding_function('ollama')\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
+
+
+class TestFactory:
+    def test_chroma_backend_keeps_chroma_identity(self):
+        backend = create_embedding_function("chroma")
+
+        assert isinstance(backend, ChromaDefaultEmbeddingFunction)
+        # Same name and config as Chroma's DefaultEmbeddingFunction, so
+        # existing collections and embedding caches stay valid
+        assert embedding_spec(backend) == {"name": "default", "config": {}}
+        assert embedding_model_id(backend) == "default"
+        assert isinstance(embedding_function_from_spec({"name": "default"}), ChromaDefaultEmbeddingFunction)
+
+    def test_model_from_config(self, monkeypatch):
+        settings = {"embedding_backend": "ollama", "embedding_model": "all-minilm"}
+        monkeypatch.setattr(emb_mod, "get_config_value", lambda key, default=None: settings.get(key, default))
+
+        backend = create_embedding_function()
+        assert isinstance(backend, OllamaEmbeddingFunction)
+        assert backend.model_name == "all-minilm"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_embedding_function("word2vec")
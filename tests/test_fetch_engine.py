@@ -0,0 +1,211 @@
+"""Tests for the concurrent fetch engine, against a local HTTP server."""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from council.knowledge.fetch_engine import FetchEngine
+
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, dict(self.headers)))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            self._respond()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self):
+        server = self.server
+        kind, _, name = self.path.strip("/").partition("/")
+        if kind == "redirect":
+            self.send_response(302)
+            self.send_header("Location", f"/text/{name}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if kind == "slow":
+            time.sleep(0.05)
+        body = server.files.get(name)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = f'"{hashlib.sha1(body).hexdigest()[:12]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == etag:
+            start = int(range_header[len("bytes="):-1])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        cut = server.truncate.pop(name, None)
+        if cut is not None:
+            # Drop the connection half-way through the body
+            self.wfile.write(body[start:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.files = {}
+    httpd.truncate = {}
+    httpd.requests = []
+    httpd.connections = 0
+    httpd.active = 0
+    httpd.max_active = 0
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = FetchEngine(cache_dir=tmp_path / "http_cache", max_workers=4, per_host=2, timeout=5)
+    yield engine
+    engine.close()
+
+
+class TestFetch:
+    def test_download_then_not_modified(self, server, engine):
+        server.files["meditations"] = b"Waste no more time arguing what a good man should be." * 100
+
+        first = engine.fetch(f"{server.url}/text/meditations")
+        second = engine.fetch(f"{server.url}/text/meditations")
+
+        assert first.status == "downloaded" and first.body == server.files["meditations"]
+        assert second.status == "not_modified" and second.body == first.body
+        assert second.bytes_received == 0
+        assert "If-None-Match" in server.requests[-1][1]
+
+    def test_changed_resource_is_downloaded_again(self, server, engine):
+        server.files["letters"] = b"old text"
+        engine.fetch(f"{server.url}/text/letters")
+
+        server.files["letters"] = b"new text"
+        result = engine.fetch(f"{server.url}/text/letters")
+        assert (result.status, result.body) == ("downloaded", b"new text")
+
+    def test_interrupted_download_resumes(self, server, engine):
+        body = bytes(range(256)) * 400
+        server.files["republic"] = body
+        server.truncate["republic"] = 30000
+
+        failed = engine.fetch(f"{server.url}/text/republic")
+        assert failed.status == "failed"
+
+        resumed = engine.fetch(f"{server.url}/text/republic")
+        assert resumed.status == "resumed"
+        assert resumed.body == body
+        assert resumed.bytes_received == len(body) - 30000
+        assert server.requests[-1][1]["Range"] == "bytes=30000-"
+
+    def test_follows_redirects_and_caches_under_original_url(self, server, engine):
+        server.files["art_of_war"] = b"All warfare is based on deception."
+
+        assert engine.fetch(f"{server.url}/redirect/art_of_war").status == "downloaded"
+        assert engine.fetch(f"{server.url}/redirect/art_of_war").status == "not_modified"
+
+    def test_http_error_falls_back_to_cached_copy(self, server, engine):
+        server.files["gone"] = b"still here"
+        engine.fetch(f"{server.url}/text/gone")
+
+        del server.files["gone"]
+        result = engine.fetch(f"{server.url}/text/gone")
+        assert (result.status, result.body) == ("stale", b"still here")
+        assert "404" in result.error
+
+        assert engine.fetch(f"{server.url}/text/never").status == "failed"
+
+
+class TestConcurrency:
+    def test_keep_alive_reuses_connections(self, server, engine):
+        for i in range(5):
+            server.files[f"t{i}"] = b"x" * 1000
+        for i in range(5):
+            assert engine.fetch(f"{server.url}/text/t{i}").ok
+
+        assert server.connections == 1
+        assert engine.pool.connections_opened == 1
+
+    def test_fetch_many_respects_per_host_limit(self, server, engine):
+        for i in range(8):
+            server.files[f"s{i}"] = f"text {i}".encode()
+
+        results = list(engine.fetch_many(f"{server.url}/slow/s{i}" for i in range(8)))
+
+        assert sorted(r.body for r in results) == sorted(server.files.values())
+        assert 1 < server.max_active <= 2
+
+
+class TestPublicSources:
+    def test_fetch_all_public_sources_saves_cleaned_texts(self, server, tmp_path, monkeypatch):
+        import council.knowledge.fetcher as fetcher
+        import council.knowledge.snippets as snippets
+
+        server.files["a"] = b"header\n*** START OF THE PROJECT GUTENBERG EBOOK A ***\nBody A\n*** END OF THE PROJECT GUTENBERG EBOOK A ***"
+        server.files["b"] = b"Body B"
+        sources = {
+            "seneca": [
+                {"title": "Letters", "url": f"{server.url}/text/a", "type": "gutenberg"},
+                {"title": "Index", "url": f"{server.url}/index", "type": "berkshire_index"},
+                {"title": "Essays", "url": f"{server.url}/text/b", "type": "text"},
+            ],
+        }
+        monkeypatch.setattr(fetcher, "PUBLIC_SOURCES", sources)
+        monkeypatch.setattr(fetcher, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(snippets, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(fetcher, "_fetch_engine", FetchEngine(cache_dir=tmp_path / "http_cache", per_host=2))
+
+        results = fetcher.fetch_all_public_sources(verbose=False)
+
+        assert [p.name for p in results["seneca"]] == ["Letters.txt", "Essays.txt"]
+        assert results["seneca"][0].read_text() == "# Letters\n\nBody A"
+
+        mtime = results["seneca"][0].stat().st_mtime_ns
+        fetcher.fetch_all_public_sources(verbose=False)
+        assert results["seneca"][0].stat().st_mtime_ns == mtime
+        assert not any(path == "/index" for path, _ in server.requests)
@@ -0,0 +1,189 @@
+"""Tests for the background knowledge auto-indexer."""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+import council.knowledge.indexer as indexer
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path, monkeypatch):
+    import council.knowledge.dedup as dedup_mod
+    import council.knowledge.snippets as snippets_mod
+    import council.knowledge.store as store_mod
+
+    for module in (indexer, store_mod, dedup_mod, snippets_mod):
+        monkeypatch.setattr(module, "get_knowledge_dir", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def store(knowledge_dir, monkeypatch):
+    import council.knowledge.store as store_mod
+    from council.knowledge.embeddings import HashingEmbeddingFunction
+
+    monkeypatch.setattr(
+        store_mod, "get_config_value",
+        lambda key, default=None: False if key == "embedding_cache_enabled" else default,
+    )
+    return store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction())
+
+
+def _write(path, text, age=120):
+    """Write *text* and backdate the mtime so it is past any debounce."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    past = time.time() - age
+    os.utime(path, (past, past))
+    return path
+
+
+class TestPendingChanges:
+    def test_new_files_and_debounce(self, knowledge_dir):
+        _write(knowledge_dir / "seneca" / "sources" / "old.txt", "settled")
+        _write(knowledge_dir / "seneca" / "fresh.txt", "still writing", age=0)
+
+        changed, removed = indexer.pending_changes(debounce=30)
+        assert changed == ["seneca/sources/old.txt"]
+        assert removed == []
+        assert indexer.pending_changes(debounce=0)[0] == ["seneca/fresh.txt", "seneca/sources/old.txt"]
+
+    def test_reserved_dirs_and_other_files_ignored(self, knowledge_dir):
+        _write(knowledge_dir / "dedup" / "seneca" / "notes.txt", "x")
+        _write(knowledge_dir / "seneca" / "snippets.idx", "x")
+        assert indexer.pending_changes() == ([], [])
+
+    def test_mark_indexed_skips_file(self, knowledge_dir):
+        path = _write(knowledge_dir / "seneca" / "sources" / "pasted.txt", "vetted text")
+        indexer.mark_indexed(path)
+        assert indexer.pending_changes() == ([], [])
+
+    def test_first_run_seeds_already_ingested_elders(self, knowledge_dir, store):
+        store.add_document("seneca", "Anger is a brief madness.", {"source": "https://youtu.be/x", "type": "youtube"})
+        _write(knowledge_dir / "seneca" / "youtube" / "talk.txt", "Anger is a brief madness.")
+        _write(knowledge_dir / "aurelius" / "sources" / "new.txt", "never ingested")
+
+        assert indexer.seed_state(store) == 1
+        assert indexer.pending_changes() == (["aurelius/sources/new.txt"], [])
+
+        # Only the first run seeds
+        _write(knowledge_dir / "seneca" / "sources" / "later.txt", "added after the upgrade")
+        assert indexer.seed_state(store) == 0
+        assert indexer.pending_changes()[0] == ["aurelius/sources/new.txt", "seneca/sources/later.txt"]
+
+
+class TestIndexChanges:
+    def test_indexes_then_settles(self, knowledge_dir, store):
+        _write(knowledge_dir / "seneca" / "letters.txt", "We suffer more often in imagination than in reality.")
+
+        summary = indexer.index_changes(changed=indexer.pending_changes()[0], store=store)
+        assert summary == {"indexed": 1, "removed": 0, "failed": 0, "chunks": 1}
+        assert indexer.pending_changes() == ([], [])
+
+        [result] = store.query("seneca", "imagination", n_results=5)
+        assert result["metadata"]["filename"] == "letters.txt"
+        assert result["metadata"]["source_type"] == "document"
+        assert (knowledge_dir / "seneca" / "snippets.idx").exists()
+
+    def test_edit_replaces_previous_chunks(self, knowledge_dir, store):
+        path = _write(knowledge_dir / "seneca" / "letters.txt", "Luck is what happens when preparation meets opportunity.")
+        indexer.index_changes(changed=indexer.pending_changes()[0], store=store)
+
+        _write(path, "Luck is what happens when preparation meets opportunity. Begin at once to live.", age=60)
+        changed, _ = indexer.pending_changes()
+        assert changed == ["seneca/letters.txt"]
+        indexer.index_changes(changed=changed, store=store)
+
+        results = store.query("seneca", "luck", n_results=5)
+        assert [r["content"] for r in results] == [
+            "Luck is what happens when preparation meets opportunity. Begin at once to live."
+        ]
+
+    def test_deleted_file_is_removed(self, knowledge_dir, store):
+        path = _write(knowledge_dir / "seneca" / "youtube" / "talk.txt", "Anger is a brief madness.")
+        indexer.index_changes(changed=indexer.pending_changes()[0], store=store)
+        assert store.query("seneca", "anger")[0]["metadata"]["source_type"] == "youtube"
+
+        path.unlink()
+        changed, removed = indexer.pending_changes()
+        assert removed == ["seneca/youtube/talk.txt"]
+        indexer.index_changes(changed=changed, removed=removed, store=store)
+        assert store.query("seneca", "anger") == []
+
+    def test_unreadable_file_is_not_retried_until_changed(self, knowledge_dir, store):
+        path = knowledge_dir / "seneca" / "binary.txt"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"\xff\xfe\x00bad")
+
+        summary = indexer.index_changes(changed=indexer.pending_changes()[0], store=store)
+        assert summary["failed"] == 1
+        assert indexer.pending_changes() == ([], [])
+
+    def test_failure_keeps_progress_and_is_retried_later(self, knowledge_dir, store, monkeypatch):
+        _write(knowledge_dir / "seneca" / "a.txt", "first letter on anger")
+        _write(knowledge_dir / "seneca" / "b.txt", "second letter on grief")
+        _write(knowledge_dir / "seneca" / "c.txt", "third letter on time")
+        add_document = store.add_document
+
+        def flaky(elder_id, text, metadata=None):
+            if "grief" in text:
+                raise ValueError("ID clash")
+            return add_document(elder_id, text, metadata)
+
+        monkeypatch.setattr(store, "add_document", flaky)
+        summary = indexer.index_changes(changed=indexer.pending_changes()[0], store=store)
+
+        assert (summary["indexed"], summary["failed"]) == (2, 1)
+        assert indexer.pending_changes() == ([], [])
+        later = time.time() + indexer.RETRY_DELAY + 1
+        assert indexer.pending_changes(now=later) == (["seneca/b.txt"], [])
+
+    def test_reports_progress(self, knowledge_dir, store):
+        from council.tasks import TaskProgress
+
+        _write(knowledge_dir / "seneca" / "a.txt", "first letter on anger")
+        _write(knowledge_dir / "aurelius" / "b.txt", "meditations on the self")
+        progress = TaskProgress()
+        indexer.index_changes(progress=progress, changed=indexer.pending_changes()[0], store=store)
+
+        assert [s["file"] for s in progress.substeps] == ["aurelius/b.txt", "seneca/a.txt"]
+        assert all(s["status"] == "done" for s in progress.substeps)
+        assert progress.message.startswith("Indexed 2 file(s)")
+
+
+class FakeTaskManager:
+    def __init__(self):
+        self.submitted = []
+        self.status = None
+
+    def submit(self, fn, task_id=None, **kwargs):
+        self.submitted.append((task_id, kwargs))
+        return task_id
+
+    def get_status(self, task_id):
+        return self.status
+
+
+class TestKnowledgeIndexer:
+    def test_poll_submits_settled_changes_once_idle(self, knowledge_dir, store):
+        from council.tasks import TaskProgress, TaskStatus
+
+        _write(knowledge_dir / "seneca" / "a.txt", "text")
+        tm = FakeTaskManager()
+        watcher = indexer.KnowledgeIndexer(debounce=30, task_manager=tm, store=store)
+
+        assert watcher.poll() is True
+        assert tm.submitted[0][0] == indexer.TASK_ID
+        assert tm.submitted[0][1]["changed"] == ["seneca/a.txt"]
+
+        tm.status = TaskProgress(status=TaskStatus.RUNNING)
+        assert watcher.poll() is False
+
+    def test_poll_is_quiet_without_changes(self, knowledge_dir, store):
+        tm = FakeTaskManager()
+        assert indexer.KnowledgeIndexer(task_manager=tm, store=store).poll() is False
+        assert tm.submitted == []
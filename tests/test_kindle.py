@@ -0,0 +1,257 @@
+"""Tests for Kindle book extraction and ingestion."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ebooklib")
+pytest.importorskip("bs4")
+
+import council.knowledge.kindle as kindle
+from council.knowledge.kindle import BookMetadata, identify_book, match_title
+
+CHAPTER = "<p>Chapter {n} of the book.</p><p>Virtue is the only good, said the stoic {n}.</p>"
+
+
+def make_epub(path, title, chapters, author=None, asin=None):
+    from ebooklib import epub
+
+    book = epub.EpubBook()
+    book.set_identifier(asin or path.stem)
+    book.set_title(title)
+    book.set_language("en")
+    if author:
+        book.add_author(author)
+    items = []
+    for n, body in enumerate(chapters, 1):
+        item = epub.EpubHtml(title=f"Chapter {n}", file_name=f"chap_{n}.xhtml", lang="en")
+        item.content = f"<html><head><style>p {{}}</style></head><body>{body}<script>x()</script></body></html>"
+        book.add_item(item)
+        items.append(item)
+    book.toc = items
+    book.spine = ["nav", *items]
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(str(path), book)
+    return path
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Fake knowledge store recording each add_document call."""
+    calls = []
+
+    def add_document(elder_id, content, metadata=None):
+        calls.append((elder_id, content, metadata))
+        return 1
+
+    monkeypatch.setattr(kindle, "get_knowledge_store", lambda: SimpleNamespace(add_document=add_document))
+    return calls
+
+
+class TestExtraction:
+    def test_chapters_are_cleaned_and_streamed(self, tmp_path):
+        path = make_epub(tmp_path / "book.epub", "Meditations", [CHAPTER.format(n=n) for n in (1, 2)])
+
+        chapters = list(kindle.iter_epub_chapters(path))
+
+        assert chapters[-2:] == [
+            "Chapter 1 of the book.\nVirtue is the only good, said the stoic 1.",
+            "Chapter 2 of the book.\nVirtue is the only good, said the stoic 2.",
+        ]
+        assert all("x()" not in c and "p {}" not in c for c in chapters)
+        assert kindle.extract_epub_text(path) == "\n\n".join(chapters)
+
+    def test_parsers_agree(self, tmp_path, monkeypatch):
+        pytest.importorskip("lxml")
+        path = make_epub(tmp_path / "book.epub", "Meditations", [
+            CHAPTER.format(n=1),
+            "<h1>Title &amp; more</h1><!-- note --><div>  nested <em>emphasis</em>\n text </div><br/>tail",
+            "<nav><p>Contents</p></nav>after&#160;nav",
+        ])
+        assert kindle._html_parser() == "lxml"
+
+        fast = kindle.extract_epub_text(path)
+        monkeypatch.setattr(kindle, "_html_parser", lambda: "html.parser")
+        assert kindle.extract_epub_text(path) == fast
+
+    def test_book_sections_by_format(self, tmp_path):
+        text = tmp_path / "notes.txt"
+        text.write_text("plain text")
+
+        assert list(kindle.iter_book_sections(text)) == ["plain text"]
+        with pytest.raises(ValueError):
+            kindle.iter_book_sections(tmp_path / "book.mobi")
+
+    def test_batches_reach_minimum_size(self):
+        batches = list(kindle._batch_sections(["a" * 4, "b" * 4, "c" * 9, "d"], min_chars=8))
+        assert batches == ["aaaa\n\nbbbb", "c" * 9, "d"]
+
+
+def reference_match(text):
+    """identify_book's original per-pattern loop."""
+    import re
+
+    for pattern, entry in kindle.TITLE_PATTERNS.items():
+        if re.search(pattern, text.lower(), re.IGNORECASE):
+            return entry
+    return None
+
+
+class TestIdentify:
+    @pytest.mark.parametrize("pattern,literal", [
+        (r"48 laws?\s*(of)?\s*power", "48 law"),
+        (r"noise.*kahneman", "kahneman"),
+        (r"six\s*pillars?\s*(of)?\s*self.?esteem", "pillar"),
+        (r"tao|dao", ""),
+        (r"[0-9]+ rules", ""),
+    ])
+    def test_required_literal(self, pattern, literal):
+        assert kindle._required_literal(pattern) == literal
+
+    def test_matches_the_pattern_loop(self):
+        import random
+
+        rng = random.Random(7)
+        words = (
+            "the of 48 50th 12 laws law power art seduction human nature rules life red book black "
+            "swan noise kahneman tao te ching mastery Thinking FAST and slow stoic letters"
+        ).split()
+        texts = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 60))) for _ in range(500)]
+        assert [match_title(t) for t in texts] == [reference_match(t) for t in texts]
+
+    def test_first_pattern_wins(self):
+        assert match_title("Mastery - The 48 Laws of Power") == ("greene", "The 48 Laws of Power")
+        assert match_title("Noise, by Daniel Kahneman") == ("kahneman", "Noise")
+        assert match_title("cookbook") is None
+
+    def test_reads_opf_metadata(self, tmp_path):
+        path = make_epub(tmp_path / "b.epub", "Antifragile: Things That Gain", [CHAPTER.format(n=1)],
+                         author="Nassim Nicholas Taleb", asin="B0083DJWGO")
+
+        assert kindle.read_epub_metadata(path) == BookMetadata(
+            title="Antifragile: Things That Gain",
+            authors=["Nassim Nicholas Taleb"],
+            identifiers=["B0083DJWGO"],
+        )
+        (tmp_path / "junk.epub").write_bytes(b"junk")
+        assert kindle.read_epub_metadata(tmp_path / "junk.epub") == BookMetadata()
+
+    def test_identifies_from_metadata(self, tmp_path):
+        path = make_epub(tmp_path / "1234.epub", "The Creative Act: A Way of Being", [CHAPTER.format(n=1)])
+        assert identify_book(path) == ("rubin", "The Creative Act")
+
+        by_author = BookMetadata(title="Noise", authors=["Daniel Kahneman"])
+        assert identify_book(tmp_path / "x.epub", metadata=by_author) == ("kahneman", "Noise")
+
+        by_asin = BookMetadata(title="Untitled", identifiers=["urn:asin:b005vsrfea"])
+        assert identify_book(tmp_path / "x.epub", metadata=by_asin) == ("meadows", "Thinking in Systems")
+
+    def test_filename_before_metadata_before_content(self, tmp_path):
+        info = BookMetadata(title="Meditations")
+        assert identify_book(tmp_path / "black swan.epub", "Tao Te Ching", info) == ("taleb", "The Black Swan")
+        assert identify_book(tmp_path / "x.epub", "Tao Te Ching", info) == ("aurelius", "Meditations")
+        assert identify_book(tmp_path / "x.epub", "Tao Te Ching", BookMetadata()) == ("laotzu", "Tao Te Ching")
+        assert identify_book(tmp_path / "x.epub", "x" * 1000 + "Tao Te Ching", BookMetadata()) is None
+
+
+class TestIngest:
+    def test_book_is_stored_in_batches(self, tmp_path, store, monkeypatch):
+        monkeypatch.setattr(kindle, "INGEST_BATCH_CHARS", 50)
+        path = make_epub(tmp_path / "letters.epub", "Letters", [CHAPTER.format(n=n) for n in range(1, 5)])
+
+        result = kindle.ingest_book(path, elder_id="seneca", book_title="Letters from a Stoic")
+
+        assert result["success"] and result["chunks_added"] == len(store) > 1
+        assert result["word_count"] == len(kindle.extract_epub_text(path).split())
+        assert {meta["source"] for _, _, meta in store} == {"kindle:Letters from a Stoic"}
+        assert "\n\n".join(content for _, content, _ in store) == kindle.extract_epub_text(path)
+
+    def test_batches_get_distinct_adjacency_keys(self, tmp_path, store, monkeypatch):
+        from council.knowledge.rerank import merge_adjacent
+        from council.knowledge.store import KnowledgeStore
+
+        monkeypatch.setattr(kindle, "INGEST_BATCH_CHARS", 50)
+        path = make_epub(tmp_path / "letters.epub", "Letters", [CHAPTER.format(n=n) for n in range(1, 5)])
+
+        kindle.ingest_book(path, elder_id="seneca", book_title="Letters from a Stoic")
+
+        # Chunk each batch as the store would; chunk_index restarts per batch
+        results = [
+            {"content": chunk, "metadata": {**meta, "chunk_index": i}}
+            for _, content, meta in store
+            for i, chunk in enumerate(KnowledgeStore._chunk_text(None, content, 40, 0))
+        ]
+        keys = [(r["metadata"]["source"], r["metadata"]["part"], r["metadata"]["chunk_index"]) for r in results]
+        assert len(store) > 1 and len(set(keys)) == len(keys)
+        # Only chunks of the same batch are merged
+        assert len(merge_adjacent(results, overlap=0)) == len(store)
+
+    def test_identifies_from_opening_text(self, tmp_path, store):
+        path = make_epub(tmp_path / "unknown.epub", "x", ["<h1>The Black Swan</h1>" + CHAPTER.format(n=1)])
+
+        result = kindle.ingest_book(path, dry_run=True)
+
+        assert (result["elder_id"], result["book_title"]) == ("taleb", "The Black Swan")
+        assert store == []
+
+    def test_metadata_identification_needs_no_content(self, tmp_path, store, monkeypatch):
+        path = make_epub(tmp_path / "1234.epub", "Superforecasting", [CHAPTER.format(n=1)])
+        contents = []
+        monkeypatch.setattr(kindle, "identify_book", lambda path, content="", metadata=None: (
+            contents.append(content) or identify_book(path, content, metadata)
+        ))
+
+        result = kindle.ingest_book(path, dry_run=True)
+
+        assert result["book_title"] == "Superforecasting"
+        assert contents == [""]
+
+    def test_unsupported_and_missing_files(self, tmp_path, store):
+        mobi = tmp_path / "book.mobi"
+        mobi.write_bytes(b"")
+
+        assert kindle.ingest_book(mobi)["error"] == "Unsupported format: .mobi"
+        assert not kindle.ingest_book(tmp_path / "missing.epub")["success"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_directory_import(self, tmp_path, store, workers):
+        make_epub(tmp_path / "meditations.epub", "Meditations", [CHAPTER.format(n=1)])
+        make_epub(tmp_path / "black swan.epub", "The Black Swan", [CHAPTER.format(n=2)])
+        (tmp_path / "mystery.txt").write_text("No clue what this is.")
+        (tmp_path / "broken.epub").write_bytes(b"not a zip file")
+
+        results = kindle.ingest_directory(tmp_path, workers=workers)
+
+        assert [r.get("book_title") for r in results] == ["The Black Swan", None, "Meditations", None]
+        assert "could not identify" in results[3]["error"].lower()
+        assert results[1]["filename"] == "broken.epub" and not results[1]["success"]
+        assert sorted(elder for elder, _, _ in store) == ["aurelius", "taleb"]
+
+    def test_pool_extracts_a_bounded_number_of_books_ahead(self, tmp_path, monkeypatch):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        for n in range(12):
+            (tmp_path / f"book{n:02d}.txt").write_text(f"book {n}")
+        held, peak, lock = [0], [0], threading.Lock()
+
+        def extract(path):
+            with lock:
+                held[0] += 1
+                peak[0] = max(peak[0], held[0])
+            return [path.read_text()]
+
+        def ingest(path, dry_run=False, sections=None):
+            with lock:
+                held[0] -= 1
+            return {"success": True, "file": str(path)}
+
+        monkeypatch.setattr(kindle, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(kindle, "extract_book", extract)
+        monkeypatch.setattr(kindle, "ingest_book", ingest)
+
+        results = kindle.ingest_directory(tmp_path, workers=2)
+
+        assert [r["file"] for r in results] == [str(p) for p in sorted(tmp_path.glob("*.txt"))]
+        assert peak[0] <= 2 + kindle.EXTRACT_AHEAD + 1
@@ -0,0 +1,221 @@
+"""Tests for KnowledgeStore metadata normalization and filtered retrieval."""
+
+import pytest
+
+from council.knowledge.store import normalize_metadata, source_confidence
+
+
+class TestNormalizeMetadata:
+    def test_youtube_audit_fields_are_typed(self):
+        meta = normalize_metadata({"type": "youtube", "audit_passed": "False", "quality_score": "40"})
+        assert meta["audit_passed"] is False
+        assert meta["quality_score"] == 40
+        assert meta["source_type"] == "youtube"
+        assert meta["confidence"] == 0.3
+
+    def test_vetted_source_material(self):
+        meta = normalize_metadata({"source": "pasted.txt", "vetting_confidence": "85"})
+        assert meta["vetting_confidence"] == 85
+        assert meta["source_type"] == "source_material"
+        assert meta["confidence"] == 0.9
+
+    def test_unparseable_score_is_dropped(self):
+        meta = normalize_metadata({"type": "youtube", "quality_score": "n/a"})
+        assert "quality_score" not in meta
+        assert meta["confidence"] == 0.7
+
+    def test_defaults_and_input_not_mutated(self):
+        original = {"source": "kindle:Meditations"}
+        meta = normalize_metadata(original)
+        assert meta["source_type"] == "document"
+        assert meta["confidence"] == 0.7
+        assert original == {"source": "kindle:Meditations"}
+
+    @pytest.mark.parametrize("metadata,expected", [
+        ({"vetting_confidence": 70}, 0.9),
+        ({"vetting_confidence": 69}, 0.5),
+        ({"vetting_confidence": "garbage"}, 0.5),
+        ({"type": "youtube", "audit_passed": True}, 0.8),
+        ({"type": "youtube", "audit_passed": "true"}, 0.8),
+        ({"type": "youtube"}, 0.7),
+        ({"type": "book"}, 0.7),
+        ({"type": "source_material"}, 0.5),
+        ({"type": "source_material", "vetting_confidence": 80}, 0.9),
+    ])
+    def test_source_confidence(self, metadata, expected):
+        assert source_confidence(metadata) == expected
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """KnowledgeStore backed by a temp ChromaDB and an offline embedder."""
+    pytest.importorskip("chromadb")
+    import council.knowledge.store as store_mod
+    from council.knowledge.embeddings import HashingEmbeddingFunction
+
+    disabled = ("embedding_cache_enabled", "dedup_enabled")
+    monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: tmp_path)
+    monkeypatch.setattr(
+        store_mod, "get_config_value",
+        lambda key, default=None: False if key in disabled else default,
+    )
+    return store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction())
+
+
+class TestTieredRetrieval:
+    def test_low_confidence_only_fills_remaining_slots(self, store):
+        store.add_document("seneca", "time is the only thing we own", {"source": "letters", "type": "book"})
+        store.add_document("seneca", "time flies when we waste it", {"source": "clip", "type": "youtube", "audit_passed": "False"})
+
+        one = store.query_tiered("seneca", "time", n_results=1)
+        assert [r["metadata"]["source"] for r in one] == ["letters"]
+
+        both = store.query_tiered("seneca", "time", n_results=5)
+        assert [r["metadata"]["source"] for r in both] == ["letters", "clip"]
+
+    def test_query_is_embedded_once_for_all_tiers(self, store, monkeypatch):
+        store.add_document("seneca", "time is the only thing we own", {"source": "letters", "type": "book"})
+        store.add_document("seneca", "time flies when we waste it", {"source": "clip", "type": "youtube", "audit_passed": False})
+        embedded = []
+        embed = store.embedding_function_for("seneca")
+        monkeypatch.setattr(store, "embedding_function_for", lambda elder_id: lambda texts: embedded.extend(texts) or embed(texts))
+
+        assert len(store.query_tiered("seneca", "time", n_results=5)) == 2
+        assert embedded == ["time"]
+
+    def test_min_confidence_excludes_lower_tiers(self, store):
+        store.add_document("seneca", "time flies when we waste it", {"source": "clip", "type": "youtube", "audit_passed": False})
+        assert store.query_tiered("seneca", "time", n_results=5, min_confidence=0.5) == []
+
+    def test_where_filter_on_typed_fields(self, store):
+        store.add_document("seneca", "anger is brief madness", {"source": "a", "type": "youtube", "audit_passed": True})
+        store.add_document("seneca", "anger is a short madness", {"source": "b", "type": "youtube", "audit_passed": False})
+
+        results = store.query("seneca", "anger", n_results=5, where={"audit_passed": True})
+        assert [r["metadata"]["source"] for r in results] == ["a"]
+
+    def test_legacy_collection_is_migrated(self, store):
+        legacy = store.client.get_or_create_collection("elder_legacy", embedding_function=store.embedding_function)
+        legacy.add(
+            ids=["old"],
+            documents=["fortune favors the bold"],
+            metadatas=[{"type": "youtube", "audit_passed": "True", "source": "v"}],
+            embeddings=store.embedding_function(["fortune favors the bold"]),
+        )
+
+        [result] = store.query_tiered("legacy", "fortune", n_results=3)
+        assert result["metadata"]["confidence"] == 0.8
+        assert result["metadata"]["audit_passed"] is True
+
+
+class TestConcurrency:
+    @pytest.fixture
+    def dedup_store(self, tmp_path, monkeypatch):
+        """Store with near-duplicate suppression on, to expose racing writers."""
+        pytest.importorskip("chromadb")
+        import council.knowledge.dedup as dedup_mod
+        import council.knowledge.store as store_mod
+        from council.knowledge.embeddings import HashingEmbeddingFunction
+
+        monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(dedup_mod, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(
+            store_mod, "get_config_value",
+            lambda key, default=None: False if key == "embedding_cache_enabled" else default,
+        )
+        return store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction())
+
+    def _run_threads(self, target, count=8):
+        import threading
+
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def worker(i):
+            barrier.wait()
+            results[i] = target(i)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_concurrent_first_use_shares_one_client_and_collection(self, store):
+        clients = self._run_threads(lambda i: store.client)
+        assert all(c is clients[0] for c in clients)
+
+        collections = self._run_threads(lambda i: store.get_collection("seneca"))
+        assert len({id(c) for c in collections}) == 1
+
+    def test_concurrent_writers_do_not_race_dedup(self, dedup_store):
+        text = "We suffer more often in imagination than in reality. " * 4
+        added = self._run_threads(
+            lambda i: dedup_store.add_document("seneca", text, {"source": f"copy{i}"})
+        )
+        assert sum(added) == 1
+        assert dedup_store.get_collection("seneca").count() == 1
+        assert dedup_store.lock_stats()["write"]["acquisitions"] == 8
+
+    def test_add_document_async(self, store):
+        futures = [
+            store.add_document_async("seneca", f"letter number {i} on the shortness of life", {"source": f"l{i}"})
+            for i in range(5)
+        ]
+        store.flush()
+        assert [f.result(timeout=5) for f in futures] == [1] * 5
+        assert store.lock_stats()["write_queue_depth"] == 0
+        assert len(store.query("seneca", "shortness of life", n_results=10)) == 5
+
+    def test_chunks_are_embedded_outside_the_write_lock(self, tmp_path, monkeypatch):
+        import threading
+
+        import council.knowledge.store as store_mod
+        from council.knowledge.embeddings import HashingEmbeddingFunction
+
+        class LockProbe(HashingEmbeddingFunction):
+            def __call__(self, input):
+                # Another thread can only take the write lock if no writer holds it
+                def try_lock():
+                    with store.write_lock:
+                        free.append(True)
+
+                t = threading.Thread(target=try_lock)
+                t.start()
+                t.join(timeout=0.5)
+                free.append(not t.is_alive())
+                return super().__call__(input)
+
+        free = []
+        # The quantized backend, so this runs without chromadb too
+        settings = {"knowledge_backend": "quantized", "embedding_cache_enabled": False, "dedup_enabled": False}
+        monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(store_mod, "get_config_value", lambda key, default=None: settings.get(key, default))
+        store = store_mod.KnowledgeStore(embedding_function=LockProbe())
+
+        assert store.add_document("seneca", "anger is brief madness", {"source": "a"}) == 1
+        assert free == [True, True]
+
+    def test_async_write_errors_surface_on_future(self, store):
+        future = store.submit_write(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=5)
+
+    def test_clear_elder_invalidates_other_threads_handles(self, store):
+        import threading
+
+        store.add_document("seneca", "anger is brief madness", {"source": "a"})
+        assert store.get_collection("seneca").count() == 1  # cached for this thread
+
+        clearer = threading.Thread(target=store.clear_elder, args=("seneca",))
+        clearer.start()
+        clearer.join()
+        assert store.get_collection("seneca").count() == 0
+
+    def test_get_knowledge_store_is_a_singleton_across_threads(self, monkeypatch):
+        import council.knowledge.store as store_mod
+
+        monkeypatch.setattr(store_mod, "_knowledge_store", None)
+        stores = self._run_threads(lambda i: store_mod.get_knowledge_store())
+        assert all(s is stores[0] for s in stores)
@@ -0,0 +1,177 @@
+"""Tests for the staged ingestion pipeline and the YouTube transcript pipeline."""
+
+import threading
+import time
+
+import pytest
+
+from council.knowledge.pipeline import Stage, StagedPipeline
+from council.tasks import TaskProgress
+
+
+def _sleep_then(fn, seconds=0.05):
+    def stage(item):
+        time.sleep(seconds)
+        return fn(item)
+    return stage
+
+
+class TestStagedPipeline:
+    def test_results_and_counters(self):
+        dropped = []
+        pipeline = StagedPipeline(
+            [
+                Stage("double", lambda x: x * 2, workers=2),
+                Stage("odd_only", lambda x: x if x % 4 else None, workers=2),
+                Stage("fail_on_6", lambda x: 1 / 0 if x == 6 else x + 1),
+            ],
+            on_drop=lambda stage, item, error: dropped.append((stage, item, type(error).__name__)),
+        )
+
+        results = pipeline.run(range(5))
+
+        assert sorted(results) == [3]
+        assert sorted(dropped) == [
+            ("fail_on_6", 6, "ZeroDivisionError"),
+            ("odd_only", 0, "NoneType"),
+            ("odd_only", 4, "NoneType"),
+            ("odd_only", 8, "NoneType"),
+        ]
+        [double, odd, last] = pipeline.snapshot()
+        assert (double["passed"], odd["dropped"], last["failed"], last["passed"]) == (5, 3, 1, 1)
+        assert pipeline.finished == pipeline.total == 5
+        assert pipeline.progress() == 1.0
+        assert pipeline.stats[2].errors == ["ZeroDivisionError: division by zero"]
+
+    def test_runtime_bounded_by_slowest_stage(self):
+        stages = [
+            Stage("download", _sleep_then(lambda x: x), workers=4),
+            Stage("clean", _sleep_then(lambda x: x), workers=4),
+            Stage("vet", _sleep_then(lambda x: x), workers=4),
+        ]
+        start = time.perf_counter()
+        results = StagedPipeline(stages).run(range(8))
+        elapsed = time.perf_counter() - start
+
+        assert sorted(results) == list(range(8))
+        # Serially this is 8 items x 3 stages x 50 ms = 1.2 s
+        assert elapsed < 0.6
+
+    def test_stage_concurrency_is_bounded(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def tracked(item):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return item
+
+        StagedPipeline([Stage("vet", tracked, workers=2)]).run(range(10))
+        assert peak[0] == 2
+
+    def test_cancel_discards_queued_items(self):
+        cancel = threading.Event()
+
+        def first(item):
+            if item == 2:
+                cancel.set()
+            return item
+
+        pipeline = StagedPipeline([Stage("first", first), Stage("second", lambda x: x)], cancel=cancel)
+        results = pipeline.run(range(100))
+
+        assert len(results) < 100
+        assert pipeline.progress() < 1.0
+        assert pipeline.skipped > 0
+        assert pipeline.finished == pipeline.total == 100
+
+    @pytest.mark.parametrize("callback", ["on_drop", "on_update"])
+    def test_raising_callback_does_not_hang(self, callback):
+        def broken(*args):
+            raise RuntimeError("UI went away")
+
+        pipeline = StagedPipeline(
+            [Stage("drop_odd", lambda x: None if x % 2 else x, workers=2), Stage("keep", lambda x: x)],
+            **{callback: broken},
+        )
+        runner = threading.Thread(target=lambda: pipeline.run(range(10)), daemon=True)
+        runner.start()
+        runner.join(5)
+
+        assert not runner.is_alive()
+        assert pipeline.finished == pipeline.total == 10
+
+    def test_needs_a_stage(self):
+        with pytest.raises(ValueError):
+            StagedPipeline([])
+
+
+class TestYouTubePipeline:
+    @pytest.fixture
+    def youtube(self, tmp_path, monkeypatch):
+        import council.knowledge.snippets as snippets
+        import council.knowledge.youtube as youtube
+
+        monkeypatch.setattr(youtube, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(snippets, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(youtube, "get_video_metadata", lambda url: {"title": f"Talk {url[-1]}", "duration": 600})
+        monkeypatch.setattr(
+            youtube, "download_subtitles",
+            lambda url: None if url.endswith("0") else f"WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nLesson {url[-1]}.\n",
+        )
+        monkeypatch.setattr(
+            youtube, "vet_transcript",
+            lambda transcript, elder_id, title: (True, transcript) if "3" not in title else (False, "REJECT: off topic"),
+        )
+        return youtube
+
+    def test_saves_vetted_transcripts_per_elder_in_order(self, youtube, capsys):
+        progress = TaskProgress()
+        results = youtube.run_youtube_pipeline(
+            {"seneca": ["https://y/v1", "https://y/v0", "https://y/v2"], "cato": ["https://y/v3"]},
+            progress=progress,
+        )
+
+        assert [p.name for p in results["seneca"]] == ["Talk_1.txt", "Talk_2.txt"]
+        assert results["cato"] == []
+        assert "Lesson 2." in results["seneca"][1].read_text()
+
+        assert progress.progress == 1.0
+        assert [s["step"] for s in progress.substeps] == ["download", "clean", "vet", "save"]
+        assert progress.substeps[0]["dropped"] == 1 and progress.substeps[2]["dropped"] == 1
+
+        out = capsys.readouterr().out
+        assert "could not get transcript" in out and "rejected: REJECT: off topic" in out
+
+    def test_cancelled_progress_stops_pipeline(self, youtube):
+        progress = TaskProgress()
+        progress.cancel_event.set()
+
+        results = youtube.run_youtube_pipeline({"seneca": ["https://y/v1"]}, progress=progress, verbose=False)
+        assert results == {"seneca": []}
+
+    def test_task_manager_marks_cancelled_tasks(self):
+        from council.tasks import TaskStatus, get_task_manager
+
+        started, release = threading.Event(), threading.Event()
+
+        def task(progress):
+            started.set()
+            release.wait(5)
+            return "partial"
+
+        tm = get_task_manager()
+        task_id = tm.submit(task, task_id="cancel-test")
+        started.wait(5)
+        assert tm.cancel(task_id) and not tm.cancel("missing")
+        release.set()
+
+        for _ in range(100):
+            if tm.get_status(task_id).status != TaskStatus.RUNNING:
+                break
+            time.sleep(0.01)
+        assert tm.get_status(task_id).status == TaskStatus.CANCELLED
@@ -0,0 +1,183 @@
+"""Tests for the quantized, memory-mapped knowledge backend."""
+
+import numpy as np
+import pytest
+
+from council.knowledge.quantized import QuantizedClient, QuantizedCollection, where_to_sql
+
+
+def _random_vectors(n, dim=32, seed=0):
+    return np.random.RandomState(seed).randn(n, dim).astype(np.float32)
+
+
+@pytest.fixture(params=["int8", "float16"])
+def collection(tmp_path, request):
+    return QuantizedCollection(tmp_path / "elder_test", "elder_test", dtype=request.param)
+
+
+def _fill(collection, vectors):
+    collection.add(
+        ids=[f"c{i}" for i in range(len(vectors))],
+        documents=[f"doc {i}" for i in range(len(vectors))],
+        metadatas=[{"n": i, "even": i % 2 == 0, "source": f"s{i % 3}"} for i in range(len(vectors))],
+        embeddings=vectors,
+    )
+
+
+class TestWhereToSql:
+    def test_plain_equality(self):
+        sql, params = where_to_sql({"source": "letters"})
+        assert sql == "json_extract(metadata, ?) = ?"
+        assert params == ['$."source"', "letters"]
+
+    def test_nested_and_with_ranges(self):
+        sql, params = where_to_sql({"$and": [{"confidence": {"$gte": 0.5}}, {"confidence": {"$lt": 0.7}}]})
+        assert sql == "(json_extract(metadata, ?) >= ? AND json_extract(metadata, ?) < ?)"
+        assert params == ['$."confidence"', 0.5, '$."confidence"', 0.7]
+
+    def test_unknown_operator(self):
+        with pytest.raises(ValueError):
+            where_to_sql({"n": {"$regex": "x"}})
+
+
+class TestQuantizedCollection:
+    def test_results_match_exact_search(self, collection):
+        vectors = _random_vectors(300)
+        _fill(collection, vectors)
+        query = _random_vectors(1, seed=1)[0]
+
+        result = collection.query(query_embeddings=[query], n_results=5)
+
+        exact = np.argsort(((vectors - query) ** 2).sum(axis=1))[:5]
+        assert result["ids"][0] == [f"c{i}" for i in exact]
+        expected = ((vectors[exact] - query) ** 2).sum(axis=1)
+        assert result["distances"][0] == pytest.approx(expected.tolist(), rel=1e-5)
+
+    def test_where_filter(self, collection):
+        _fill(collection, _random_vectors(50))
+        result = collection.query(
+            query_embeddings=_random_vectors(1, seed=2), n_results=10,
+            where={"$and": [{"even": True}, {"n": {"$lt": 10}}]},
+        )
+        assert sorted(m["n"] for m in result["metadatas"][0]) == [0, 2, 4, 6, 8]
+
+    def test_query_texts_use_embedding_function(self, tmp_path):
+        vectors = _random_vectors(10)
+        collection = QuantizedCollection(
+            tmp_path / "c", "c", embedding_function=lambda texts: [vectors[3] for _ in texts]
+        )
+        _fill(collection, vectors)
+        assert collection.query(query_texts=["anything"], n_results=1)["ids"] == [["c3"]]
+
+    def test_upsert_overwrites_in_place(self, collection):
+        vectors = _random_vectors(5)
+        _fill(collection, vectors)
+        collection.upsert(ids=["c0"], documents=["new"], metadatas=[{"n": 99}], embeddings=[vectors[4]])
+
+        assert collection.count() == 5
+        got = collection.get(ids=["c0"], include=["documents", "metadatas", "embeddings"])
+        assert got["documents"] == ["new"]
+        assert got["metadatas"] == [{"n": 99}]
+        assert np.allclose(got["embeddings"][0], vectors[4])
+
+    def test_add_rejects_existing_ids(self, collection):
+        _fill(collection, _random_vectors(2))
+        with pytest.raises(ValueError):
+            collection.add(ids=["c1"], documents=["x"], embeddings=_random_vectors(1))
+
+    def test_update_metadata_and_get_paging(self, collection):
+        _fill(collection, _random_vectors(6))
+        collection.update(ids=["c2", "missing"], metadatas=[{"n": -1}, {"n": -2}])
+
+        page = collection.get(limit=2, offset=2)
+        assert page["ids"] == ["c2", "c3"]
+        assert page["metadatas"][0] == {"n": -1}
+        assert collection.get(where={"source": "s0"}, include=[])["ids"] == ["c0", "c3"]
+
+    def test_delete_hides_rows(self, collection):
+        vectors = _random_vectors(6)
+        _fill(collection, vectors)
+        collection.delete(where={"source": "s0"})
+        collection.delete(ids=["c1"])
+
+        assert collection.count() == 3
+        result = collection.query(query_embeddings=[vectors[0]], n_results=10)
+        assert sorted(result["ids"][0]) == ["c2", "c4", "c5"]
+
+        collection.add(ids=["new"], documents=["x"], embeddings=[vectors[0]])
+        assert collection.query(query_embeddings=[vectors[0]], n_results=1)["ids"] == [["new"]]
+
+    def test_persists_and_trims_torn_rows(self, tmp_path):
+        path = tmp_path / "elder_x"
+        vectors = _random_vectors(4)
+        collection = QuantizedCollection(path, "elder_x", metadata={"description": "x"})
+        _fill(collection, vectors)
+        collection.close()
+
+        # Simulate an interrupted append: vector bytes without records
+        with open(path / "vectors.bin", "ab") as f:
+            f.write(b"\0" * 100)
+
+        reopened = QuantizedCollection(path, "elder_x")
+        assert reopened.count() == 4
+        assert reopened.metadata == {"description": "x"}
+        assert (path / "vectors.bin").stat().st_size == 4 * (32 + 4)
+        assert reopened.query(query_embeddings=[vectors[2]], n_results=1)["ids"] == [["c2"]]
+
+
+class TestQuantizedClient:
+    def test_collection_lifecycle(self, tmp_path):
+        client = QuantizedClient(tmp_path)
+        collection = client.get_or_create_collection("elder_a", metadata={"k": "v"})
+        assert client.get_or_create_collection("elder_a") is collection
+        assert [c.name for c in client.list_collections()] == ["elder_a"]
+
+        client.delete_collection("elder_a")
+        assert client.list_collections() == []
+        with pytest.raises(ValueError):
+            client.delete_collection("elder_a")
+
+
+class TestStoreWithQuantizedBackend:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        import council.knowledge.store as store_mod
+        from council.knowledge.embeddings import HashingEmbeddingFunction
+
+        settings = {"knowledge_backend": "quantized", "embedding_cache_enabled": False, "dedup_enabled": False}
+        monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(
+            store_mod, "get_config_value", lambda key, default=None: settings.get(key, default)
+        )
+        return store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction())
+
+    def test_tiered_retrieval(self, store):
+        store.add_document("seneca", "time is the only thing we own", {"source": "letters", "type": "book"})
+        store.add_document("seneca", "time flies when we waste it", {"source": "clip", "type": "youtube", "audit_passed": "False"})
+
+        results = store.query_tiered("seneca", "time", n_results=5)
+        assert [r["metadata"]["source"] for r in results] == ["letters", "clip"]
+        assert store.query_tiered("seneca", "time", n_results=5, min_confidence=0.5)[0]["metadata"]["source"] == "letters"
+
+    def test_clear_elder(self, store):
+        store.add_document("seneca", "time is the only thing we own", {"source": "letters"})
+        store.clear_elder("seneca")
+        assert store.query("seneca", "time") == []
+
+    def test_dedup_index_is_reset_for_an_empty_collection(self, tmp_path, monkeypatch):
+        import council.knowledge.dedup as dedup_mod
+        import council.knowledge.store as store_mod
+        from council.knowledge.embeddings import HashingEmbeddingFunction
+
+        settings = {"knowledge_backend": "quantized", "embedding_cache_enabled": False}
+        monkeypatch.setattr(dedup_mod, "get_knowledge_dir", lambda: tmp_path)
+        monkeypatch.setattr(store_mod, "get_config_value", lambda key, default=None: settings.get(key, default))
+        text = "We suffer more often in imagination than in reality."
+
+        for backend_dir in ("first", "second"):
+            # Same dedup signatures, but the second store starts with no chunks
+            monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda d=backend_dir: tmp_path / d)
+            store = store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction())
+            assert store.add_document("seneca", text, {"source": "letters"}) == 1
+            assert store.add_document("seneca", text, {"source": "copy"}) == 0
+            assert store.get_collection("seneca").count() == 1
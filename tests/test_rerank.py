@@ -0,0 +1,105 @@
+"""Tests for MMR re-ranking and adjacent-chunk merging."""
+
+from council.knowledge.rerank import join_overlapping, merge_adjacent, mmr
+
+
+def _result(content, source="letters.txt", index=0):
+    return {"content": content, "metadata": {"source": source, "chunk_index": index}, "distance": 0.1}
+
+
+class TestMMR:
+    def test_pure_relevance_order(self):
+        query = [1.0, 0.0]
+        docs = [[0.0, 1.0], [1.0, 0.1], [1.0, 0.5]]
+        assert mmr(query, docs, k=3, lambda_mult=1.0) == [1, 2, 0]
+
+    def test_prefers_diverse_over_redundant(self):
+        query = [1.0, 1.0, 0.0]
+        near_copy_a = [1.0, 0.9, 0.0]
+        near_copy_b = [1.0, 0.91, 0.0]
+        different = [0.2, 1.0, 0.3]
+        order = mmr(query, [near_copy_a, near_copy_b, different], k=2, lambda_mult=0.5)
+        assert order[0] in (0, 1)
+        assert order[1] == 2
+
+    def test_k_larger_than_candidates(self):
+        assert sorted(mmr([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0]], k=10)) == [0, 1]
+
+    def test_empty_candidates(self):
+        assert mmr([1.0, 0.0], [], k=5) == []
+
+
+class TestMergeAdjacent:
+    def test_join_drops_shared_overlap(self):
+        first = "The first part of the passage. The shared overlap sentence here."
+        second = "The shared overlap sentence here. And then the passage continues."
+        assert join_overlapping(first, second) == (
+            "The first part of the passage. The shared overlap sentence here."
+            " And then the passage continues."
+        )
+
+    def test_join_without_overlap_uses_newline(self):
+        assert join_overlapping("alpha", "beta") == "alpha\nbeta"
+
+    def test_join_finds_overlap_that_is_not_a_prefix(self):
+        first = "Intro sentence. The shared overlap sentence is right here."
+        second = "  overlap sentence is right here. Then it goes on."
+        assert join_overlapping(first, second, min_overlap=10, overlap=40) == (
+            "Intro sentence. The shared overlap sentence is right here. Then it goes on."
+        )
+
+    def test_join_trims_configured_overlap(self):
+        first = "x" * 50
+        second = "shared text that the chunker repeated " + "fresh words follow"
+        assert join_overlapping(first, second, overlap=30) == "x" * 50 + "\nfresh words follow"
+
+    def test_bridging_chunk_joins_two_runs(self):
+        results = [
+            _result("run one ends with the first shared text", index=1),
+            _result("the second shared text opens run two of the passage", index=3),
+            _result("the first shared text bridges to the second shared text", index=2),
+            _result("unrelated", source="other.txt", index=3),
+            _result("opens run two of the passage and keeps going", index=4),
+        ]
+        merged = merge_adjacent(results)
+
+        assert [m["content"] for m in merged] == [
+            "run one ends with the first shared text bridges to the second shared text"
+            " opens run two of the passage and keeps going",
+            "unrelated",
+        ]
+        assert merged[0]["metadata"]["chunk_index"] == 1
+
+    def test_adjacent_chunks_of_same_source_are_merged(self):
+        results = [
+            _result("chunk two and the shared overlap text", index=2),
+            _result("unrelated", source="other.txt", index=3),
+            _result("chunk one then chunk two and the shared overlap text", index=1),
+            _result("the shared overlap text and chunk three", index=3),
+        ]
+        merged = merge_adjacent(results)
+
+        assert [m["content"] for m in merged] == [
+            "chunk one then chunk two and the shared overlap text and chunk three",
+            "unrelated",
+        ]
+        # Rank order of the best-ranked member is preserved
+        assert merged[0]["metadata"]["chunk_index"] == 2
+
+    def test_non_adjacent_chunks_are_kept_separate(self):
+        results = [_result("a", index=1), _result("b", index=3)]
+        assert len(merge_adjacent(results)) == 2
+
+    def test_chunks_of_different_parts_are_kept_separate(self):
+        results = [_result("end of part one", index=3), _result("start of part two", index=4)]
+        results[1]["metadata"]["part"] = 1
+        assert len(merge_adjacent(results)) == 2
+
+    def test_results_without_chunk_metadata_pass_through(self):
+        results = [{"content": "x", "metadata": {}}, {"content": "y", "metadata": {}}]
+        assert merge_adjacent(results) == results
+
+    def test_inputs_are_not_mutated(self):
+        results = [_result("first overlap words here", index=0), _result("overlap words here second", index=1)]
+        merge_adjacent(results)
+        assert results[0]["content"] == "first overlap words here"
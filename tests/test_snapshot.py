@@ -0,0 +1,148 @@
+"""Tests for knowledge snapshot export/import."""
+
+import json
+import zipfile
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+from council.knowledge.embeddings import HashingEmbeddingFunction
+from council.knowledge.snapshot import SnapshotError, export_elder, import_snapshot, read_manifest
+
+
+@pytest.fixture
+def make_store(tmp_path, monkeypatch):
+    """Factory for isolated KnowledgeStores, each with its own directory."""
+    import council.knowledge.dedup as dedup_mod
+    import council.knowledge.store as store_mod
+
+    def factory(name, dim=64, embedding_function=None):
+        root = tmp_path / name
+        monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: root)
+        monkeypatch.setattr(dedup_mod, "get_knowledge_dir", lambda: root)
+        monkeypatch.setattr(
+            store_mod, "get_config_value",
+            lambda key, default=None: False if key == "embedding_cache_enabled" else default,
+        )
+        store = store_mod.KnowledgeStore(
+            embedding_function=embedding_function or HashingEmbeddingFunction(dim=dim)
+        )
+        store.client  # bind the client to this directory before the next factory call
+        return store
+
+    return factory
+
+
+class CountingEmbedder(HashingEmbeddingFunction):
+    """Hashing embedder that records how many texts it embedded."""
+
+    def __init__(self, dim: int = 64):
+        super().__init__(dim)
+        self.texts = 0
+
+    def __call__(self, input):
+        self.texts += len(input)
+        return super().__call__(input)
+
+
+def _populate(store):
+    store.add_document("seneca", "It is not that we have a short time to live, but that we waste a lot of it.",
+                       {"source": "brevity", "type": "book"})
+    store.add_document("seneca", "Luck is what happens when preparation meets opportunity. " * 3,
+                       {"source": "letters", "type": "youtube", "audit_passed": True})
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("dtype", ["int8", "float16", "float32"])
+    def test_round_trip_without_reembedding(self, make_store, tmp_path, dtype):
+        source = make_store("a")
+        _populate(source)
+        path = export_elder(source, "seneca", tmp_path / "out", dtype=dtype)
+
+        embedder = CountingEmbedder()
+        target = make_store("b", embedding_function=embedder)
+        result = import_snapshot(target, path)
+
+        assert embedder.texts == 0
+        assert result["imported"] == result["count"] == 2
+
+        top = target.query("seneca", "waste time", n_results=1)
+        assert top[0]["metadata"]["source"] == "brevity"
+        assert {d["source"] for d in target.list_documents("seneca")} == {"brevity", "letters"}
+
+        letters = target.query("seneca", "luck", n_results=1, where={"audit_passed": True})
+        assert letters[0]["metadata"]["confidence"] == 0.8
+
+    def test_manifest_and_layout(self, make_store, tmp_path):
+        store = make_store("a", dim=32)
+        _populate(store)
+        path = export_elder(store, "seneca", tmp_path)
+
+        manifest = read_manifest(path)
+        assert manifest["count"] == 2
+        assert manifest["dim"] == 32
+        assert manifest["embedding_model"] == "hashing-32"
+        with zipfile.ZipFile(path) as zf:
+            assert {"embeddings.npy", "scales.npy", "texts.bin", "text_offsets.npy"} <= set(zf.namelist())
+
+    def test_import_is_idempotent(self, make_store, tmp_path):
+        source = make_store("a")
+        _populate(source)
+        path = export_elder(source, "seneca", tmp_path)
+
+        target = make_store("b")
+        assert import_snapshot(target, path)["imported"] == 2
+        assert import_snapshot(target, path)["imported"] == 0
+        assert target.get_collection("seneca").count() == 2
+
+    def test_imported_chunks_feed_dedup(self, make_store, tmp_path):
+        source = make_store("a")
+        _populate(source)
+        path = export_elder(source, "seneca", tmp_path)
+
+        target = make_store("b")
+        import_snapshot(target, path)
+        added = target.add_document(
+            "seneca", "It is not that we have a short time to live, but that we waste a lot of it.",
+            {"source": "again"},
+        )
+        assert added == 0
+
+    def test_digest_can_be_built_before_returning(self, make_store, tmp_path, monkeypatch):
+        source = make_store("a")
+        _populate(source)
+        path = export_elder(source, "seneca", tmp_path)
+
+        target = make_store("b")
+        built = []
+        monkeypatch.setattr(target, "build_digest", lambda elder_id: built.append(elder_id) or 1)
+        import_snapshot(target, path, elder_id="seneca_copy", digest_now=True)
+
+        assert built == ["seneca_copy"]
+        assert "seneca_copy" not in target._digest_timers
+
+    def test_rename_elder_on_import(self, make_store, tmp_path):
+        source = make_store("a")
+        _populate(source)
+        path = export_elder(source, "seneca", tmp_path)
+
+        target = make_store("b")
+        assert import_snapshot(target, path, elder_id="seneca_copy")["elder_id"] == "seneca_copy"
+        assert target.get_collection("seneca_copy").count() == 2
+
+    def test_embedding_model_mismatch_is_rejected(self, make_store, tmp_path):
+        source = make_store("a", dim=64)
+        _populate(source)
+        path = export_elder(source, "seneca", tmp_path)
+
+        target = make_store("b", dim=32)
+        with pytest.raises(SnapshotError, match="hashing-64"):
+            import_snapshot(target, path)
+
+    def test_rejects_non_snapshot(self, tmp_path):
+        bogus = tmp_path / "bogus.zip"
+        with zipfile.ZipFile(bogus, "w") as zf:
+            zf.writestr("manifest.json", json.dumps({"format": "something-else"}))
+        with pytest.raises(SnapshotError):
+            read_manifest(bogus)
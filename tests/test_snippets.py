@@ -0,0 +1,119 @@
+"""Tests for the per-elder knowledge snippet index."""
+
+import pytest
+
+import council.knowledge.snippets as snippets_mod
+from council.knowledge.snippets import (
+    SNIPPET_CHARS,
+    build_snippet_index,
+    get_snippet_index_path,
+    load_snippets,
+    remove_from_snippet_index,
+    update_snippet_index,
+)
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path, monkeypatch):
+    """Redirect knowledge storage to a temp directory."""
+    monkeypatch.setattr(snippets_mod, "get_knowledge_dir", lambda: tmp_path)
+    monkeypatch.setattr(snippets_mod, "_cache", {})
+    return tmp_path
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestBuildAndLoad:
+    def test_missing_elder_returns_empty(self, knowledge_dir):
+        assert load_snippets("nobody") == []
+        assert not get_snippet_index_path("nobody").exists()
+
+    def test_snippet_truncated_to_limit(self, knowledge_dir):
+        _write(knowledge_dir / "aurelius" / "Meditations.txt", "x" * (SNIPPET_CHARS * 5))
+        build_snippet_index("aurelius")
+
+        [(confidence, text)] = load_snippets("aurelius")
+        assert confidence == 0.7
+        assert text == "x" * SNIPPET_CHARS
+
+    def test_confidence_from_directory(self, knowledge_dir):
+        _write(knowledge_dir / "munger" / "sources" / "pasted.txt", "uploaded")
+        _write(knowledge_dir / "munger" / "youtube" / "talk.txt", "talk")
+
+        by_text = {text: conf for conf, text in load_snippets("munger")}
+        assert by_text == {"uploaded": 0.5, "talk": 0.7}
+
+    def test_ordering_and_limit_match_sorted_glob(self, knowledge_dir):
+        for name in ["c", "a", "e", "b", "f", "d"]:
+            _write(knowledge_dir / "seneca" / f"{name}.txt", name)
+
+        texts = [text for _, text in load_snippets("seneca", limit=5)]
+        assert texts == ["a", "b", "c", "d", "e"]
+
+    def test_lazy_build_reads_index_afterwards(self, knowledge_dir, monkeypatch):
+        _write(knowledge_dir / "franklin" / "autobiography.txt", "original")
+        assert load_snippets("franklin") == [(0.7, "original")]
+
+        # Unchanged files are served from the index without being re-read
+        monkeypatch.setattr(snippets_mod, "_cache", {})
+        monkeypatch.setattr(snippets_mod, "_make_entry", lambda *a: pytest.fail("file re-read"))
+        assert load_snippets("franklin") == [(0.7, "original")]
+
+    def test_picks_up_files_changed_behind_its_back(self, knowledge_dir):
+        first = _write(knowledge_dir / "franklin" / "a.txt", "first")
+        _write(knowledge_dir / "franklin" / "b.txt", "second")
+        assert load_snippets("franklin") == [(0.7, "first"), (0.7, "second")]
+
+        # Dropped into sources/, edited and deleted without update_snippet_index
+        _write(knowledge_dir / "franklin" / "sources" / "drop.txt", "dropped")
+        first.write_text("first, edited", encoding="utf-8")
+        (knowledge_dir / "franklin" / "b.txt").unlink()
+
+        assert load_snippets("franklin") == [(0.7, "first, edited"), (0.5, "dropped")]
+
+    def test_unreadable_file_does_not_force_rewrites(self, knowledge_dir, monkeypatch):
+        _write(knowledge_dir / "franklin" / "a.txt", "readable")
+        (knowledge_dir / "franklin" / "latin1.txt").write_bytes("caf\xe9".encode("latin-1"))
+        assert load_snippets("franklin") == [(0.7, "readable")]
+
+        monkeypatch.setattr(snippets_mod, "_cache", {})
+        monkeypatch.setattr(snippets_mod, "_write_index", lambda *a: pytest.fail("index rewritten"))
+        assert load_snippets("franklin") == [(0.7, "readable")]
+
+
+class TestUpdate:
+    def test_update_adds_and_replaces_entries(self, knowledge_dir):
+        first = _write(knowledge_dir / "buffett" / "letters" / "1990.txt", "old")
+        assert update_snippet_index(first)
+        second = _write(knowledge_dir / "buffett" / "letters" / "1991.txt", "next")
+        assert update_snippet_index(second)
+
+        _write(first, "new")
+        assert update_snippet_index(first)
+
+        assert load_snippets("buffett") == [(0.7, "new"), (0.7, "next")]
+
+    def test_update_ignores_files_outside_knowledge_dir(self, knowledge_dir, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("elsewhere") / "note.txt"
+        outside.write_text("nope", encoding="utf-8")
+        assert not update_snippet_index(outside)
+
+    def test_update_ignores_non_text_files(self, knowledge_dir):
+        pdf = knowledge_dir / "curie" / "sources" / "paper.pdf"
+        pdf.parent.mkdir(parents=True)
+        pdf.write_bytes(b"%PDF-1.4")
+        assert not update_snippet_index(pdf)
+
+    def test_remove_drops_entry(self, knowledge_dir):
+        kept = _write(knowledge_dir / "buffett" / "letters" / "1990.txt", "kept")
+        gone = _write(knowledge_dir / "buffett" / "letters" / "1991.txt", "gone")
+        update_snippet_index(kept)
+        update_snippet_index(gone)
+
+        assert remove_from_snippet_index(gone)
+        assert not remove_from_snippet_index(gone)
+        assert [e["path"] for e, _ in snippets_mod._read_index(get_snippet_index_path("buffett"))] == ["letters/1990.txt"]
@@ -0,0 +1,121 @@
+"""Tests for the local quote index and quote verification."""
+
+import pytest
+
+import council.knowledge.verify_quotes as verify_quotes
+from council.knowledge.quote_index import QuoteIndex, tokenize
+from council.tasks import TaskProgress
+
+MEDITATIONS = (
+    "Begin the morning by saying to thyself, I shall meet with the busy-body, the ungrateful, "
+    "arrogant, deceitful, envious, unsocial. You have power over your mind, not outside events. "
+    "Realize this, and you will find strength. The happiness of your life depends upon the "
+    "quality of your thoughts: therefore, guard accordingly."
+)
+
+
+class TestQuoteIndex:
+    @pytest.fixture
+    def index(self, tmp_path):
+        index = QuoteIndex()
+        index.add(tmp_path / "meditations.txt", MEDITATIONS)
+        index.add(tmp_path / "other.txt", "An unrelated text about the weather and the sea.")
+        return index
+
+    def test_tokenize(self):
+        assert tokenize("Don't—PANIC, it’s fine") == ["dont", "panic", "its", "fine"]
+
+    def test_verbatim_quote(self, index, tmp_path):
+        [match] = index.find("You have power over your mind - not outside events.")
+        assert match.path == tmp_path / "meditations.txt"
+        assert match.similarity == 1.0
+        assert match.excerpt == "you have power over your mind not outside events"
+
+    def test_tolerates_a_few_edited_words(self, index):
+        [match] = index.find("The happiness of one's life depends on the quality of your thoughts")
+        assert 0.8 <= match.similarity < 1.0
+
+    def test_unknown_or_short_quotes(self, index):
+        assert index.find("Be water, my friend, empty your mind") == []
+        assert index.find("Be water") == []
+
+    def test_build_indexes_text_files(self, tmp_path):
+        (tmp_path / "books").mkdir()
+        (tmp_path / "books" / "meditations.txt").write_text(MEDITATIONS)
+        (tmp_path / "notes.json").write_text("{}")
+        assert len(QuoteIndex.build(tmp_path)) == 1
+
+    def test_build_keeps_only_candidate_files(self, tmp_path):
+        (tmp_path / "meditations.txt").write_text(MEDITATIONS)
+        (tmp_path / "recipes.txt").write_text("Whisk the eggs and fold in the flour.")
+        (tmp_path / "skipped.txt").write_text(MEDITATIONS)
+
+        index = QuoteIndex.build(
+            tmp_path,
+            quotes=["You have power over your mind"],
+            paths=[tmp_path / "meditations.txt", tmp_path / "recipes.txt"],
+        )
+        assert index.paths == [tmp_path / "meditations.txt"]
+
+
+class TestVerifyElderQuotes:
+    @pytest.fixture
+    def elder(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(verify_quotes, "get_knowledge_dir", lambda: tmp_path)
+        root = tmp_path / "aurelius"
+        (root / "sources").mkdir(parents=True)
+        (root / "books").mkdir()
+        (root / "books" / "meditations.txt").write_text(MEDITATIONS)
+        (root / "sources" / "biography.txt").write_text(
+            'Marcus wrote: "You have power over your mind, not outside events." '
+            'He is also said to have written that "a life of duty is a life of meaning and of purpose".'
+        )
+        calls = []
+        monkeypatch.setattr(verify_quotes, "attribution_agent", lambda quotes, name: calls.append(("attribution", len(quotes))) or quotes)
+        monkeypatch.setattr(
+            verify_quotes, "skeptic_agent",
+            lambda quotes, name: calls.append(("skeptic", len(quotes))) or [q.update(verdict="uncertain") or q for q in quotes],
+        )
+        return root, calls
+
+    def _run(self, monkeypatch, quotes):
+        monkeypatch.setattr(verify_quotes, "extract_quotes", lambda text, name: [{"quote": q, "context": ""} for q in quotes])
+        return verify_quotes.verify_elder_quotes(elder_id="aurelius", elder_name="Marcus Aurelius", progress=TaskProgress())
+
+    def test_quotes_settled_locally_skip_the_agents(self, elder, monkeypatch):
+        root, calls = elder
+        results = self._run(monkeypatch, [
+            "You have power over your mind, not outside events",
+            "Fortune favours the bold and the brave always wins",
+        ])
+
+        assert calls == []
+        assert results["llm_calls"] == {"made": 1, "saved": 2}
+        assert results["settled_locally"] == 2
+        confirmed, invented = results["quotes"]
+        assert (confirmed["verdict"], confirmed["source"]) == ("confirmed", "books/meditations.txt")
+        assert invented["verdict"] == "disputed"
+        assert (root / "quote_verification.json").exists()
+
+    def test_only_ambiguous_quotes_reach_the_agents(self, elder, monkeypatch):
+        _, calls = elder
+        results = self._run(monkeypatch, [
+            "You have power over your mind, not outside events",
+            "A life of duty is a life of meaning and of purpose",
+        ])
+
+        assert calls == [("attribution", 1), ("skeptic", 1)]
+        assert results["llm_calls"] == {"made": 3, "saved": 0}
+        assert results["summary"] == {"confirmed": 1, "disputed": 0, "uncertain": 1}
+
+    def test_transcripts_never_confirm(self, elder, monkeypatch):
+        root, calls = elder
+        # Nested, so not among the files quotes are extracted from
+        (root / "youtube" / "talks").mkdir(parents=True)
+        (root / "youtube" / "talks" / "lecture.txt").write_text(
+            "As the host put it, a life of duty is a life of meaning and of purpose."
+        )
+        results = self._run(monkeypatch, ["A life of duty is a life of meaning and of purpose"])
+
+        assert calls == [("attribution", 1), ("skeptic", 1)]
+        assert results["settled_locally"] == 0
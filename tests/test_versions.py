@@ -0,0 +1,204 @@
+"""Tests for versioned collections and zero-downtime re-embedding."""
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+from council.knowledge.embeddings import HashingEmbeddingFunction
+from council.knowledge.versions import CollectionRegistry, collection_name, parse_collection_name
+
+
+class TestNames:
+    @pytest.mark.parametrize("elder_id,version,name", [
+        ("seneca", 0, "elder_seneca"),
+        ("seneca", 3, "elder_seneca__v3"),
+        ("sun_tzu", 12, "elder_sun_tzu__v12"),
+    ])
+    def test_round_trip(self, elder_id, version, name):
+        assert collection_name(elder_id, version) == name
+        assert parse_collection_name(name) == (elder_id, version)
+
+    def test_non_elder_collection(self):
+        assert parse_collection_name("something_else") is None
+
+
+class TestCollectionRegistry:
+    def test_build_swap_and_gc_lifecycle(self, tmp_path):
+        registry = CollectionRegistry(tmp_path / "collections.json")
+        assert registry.live("seneca") == 0
+
+        version = registry.begin("seneca", {"name": "x", "config": {}})
+        assert version == 1
+        assert registry.building("seneca") == 1
+        with pytest.raises(RuntimeError):
+            registry.begin("seneca", None)
+
+        assert registry.swap("seneca") == 0
+        assert registry.live("seneca") == 1
+        assert registry.spec("seneca", 1) == {"name": "x", "config": {}}
+        assert registry.collectable("seneca") == [0]
+        assert registry.collectable("seneca", grace=3600) == []
+
+        reloaded = CollectionRegistry(tmp_path / "collections.json")
+        assert reloaded.live("seneca") == 1
+        reloaded.forget("seneca", [0])
+        assert reloaded.collectable("seneca") == []
+        assert reloaded.begin("seneca", None) == 2
+
+    def test_abort_retires_partial_build(self, tmp_path):
+        registry = CollectionRegistry(tmp_path / "collections.json")
+        registry.begin("seneca", None)
+        assert registry.abort("seneca") == 1
+        assert registry.live("seneca") == 0
+        assert registry.collectable("seneca") == [1]
+
+    def test_sees_changes_made_by_another_registry(self, tmp_path):
+        ours = CollectionRegistry(tmp_path / "collections.json")
+        theirs = CollectionRegistry(tmp_path / "collections.json")
+        assert ours.live("seneca") == 0
+
+        theirs.begin("seneca", None)
+        assert ours.building("seneca") == 1
+        theirs.swap("seneca")
+        assert ours.live("seneca") == 1
+        assert ours.begin("seneca", None) == 2
+
+
+class HookedEmbedder(HashingEmbeddingFunction):
+    """Hashing embedder that runs a callback before embedding each batch."""
+
+    def __init__(self, dim=32, hook=None):
+        super().__init__(dim)
+        self.hook = hook
+
+    def __call__(self, input):
+        if self.hook is not None:
+            hook, self.hook = self.hook, None  # once, and never re-entrantly
+            hook()
+        return super().__call__(input)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    import council.knowledge.store as store_mod
+
+    monkeypatch.setattr(store_mod, "get_knowledge_dir", lambda: tmp_path)
+    monkeypatch.setattr(
+        store_mod, "get_config_value",
+        lambda key, default=None: False if key in ("embedding_cache_enabled", "dedup_enabled") else default,
+    )
+    return store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction(dim=64))
+
+
+def _populate(store):
+    store.add_document("seneca", "We suffer more often in imagination than in reality.", {"source": "a"})
+    store.add_document("seneca", "Luck is what happens when preparation meets opportunity.", {"source": "b"})
+
+
+class TestReembed:
+    def test_swaps_to_new_version_and_collects_old(self, store):
+        _populate(store)
+        result = store.reembed_elder("seneca", HashingEmbeddingFunction(dim=32), pause=0, grace=0)
+
+        assert result == {"elder_id": "seneca", "old_version": 0, "version": 1, "chunks": 2}
+        assert store.get_collection("seneca").name == "elder_seneca__v1"
+        assert store.embedding_function_for("seneca").dim == 32
+        assert store.query("seneca", "imagination", n_results=1)[0]["metadata"]["source"] == "a"
+        assert store.query_diverse("seneca", "luck", n_results=1)[0]["metadata"]["source"] == "b"
+
+        names = {c.name for c in store.client.list_collections()}
+        assert names == {"elder_seneca__v1"}
+
+    def test_queries_hit_live_version_and_writes_reach_both(self, store):
+        _populate(store)
+        seen = {}
+
+        def during_build():
+            seen["collection"] = store.get_collection("seneca").name
+            seen["results"] = store.query("seneca", "imagination", n_results=1)
+            store.add_document("seneca", "Begin at once to live.", {"source": "c"})
+
+        store.reembed_elder("seneca", HookedEmbedder(hook=during_build), pause=0, grace=0)
+
+        assert seen["collection"] == "elder_seneca"
+        assert seen["results"][0]["metadata"]["source"] == "a"
+        assert store.get_collection("seneca").count() == 3
+        assert store.query("seneca", "begin to live", n_results=1)[0]["metadata"]["source"] == "c"
+
+    def test_failed_build_leaves_live_version_untouched(self, store):
+        _populate(store)
+
+        def fail():
+            raise RuntimeError("model crashed")
+
+        with pytest.raises(RuntimeError):
+            store.reembed_elder("seneca", HookedEmbedder(hook=fail), pause=0)
+
+        assert store.registry.live("seneca") == 0
+        assert store.registry.building("seneca") is None
+        assert store.get_collection("seneca").count() == 2
+        assert {c.name for c in store.client.list_collections()} == {"elder_seneca"}
+
+    def test_new_store_rebuilds_version_embedding_function(self, store, tmp_path):
+        import council.knowledge.store as store_mod
+
+        _populate(store)
+        store.reembed_elder("seneca", HashingEmbeddingFunction(dim=32), pause=0, grace=0)
+
+        fresh = store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction(dim=64))
+        assert fresh.embedding_function_for("seneca").dim == 32
+        assert fresh.query_diverse("seneca", "luck", n_results=1)[0]["metadata"]["source"] == "b"
+
+    def test_source_removed_during_copy_is_not_carried_over(self, store):
+        _populate(store)
+        store.add_document("seneca", "Begin at once to live.", {"source": "c"})
+
+        def remove_first():
+            store.remove_source("seneca", "a")
+
+        result = store.reembed_elder("seneca", HookedEmbedder(hook=remove_first), batch_size=1, pause=0, grace=0)
+
+        assert result["chunks"] == 2
+        sources = {m["source"] for m in store.get_collection("seneca").get()["metadatas"]}
+        assert sources == {"b", "c"}
+
+    def test_other_store_follows_a_swap(self, store):
+        import council.knowledge.store as store_mod
+
+        _populate(store)
+        other = store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction(dim=64))
+        assert other.get_collection("seneca").name == "elder_seneca"
+
+        store.reembed_elder("seneca", HashingEmbeddingFunction(dim=32), pause=0, grace=3600)
+        assert other.get_collection("seneca").name == "elder_seneca__v1"
+        assert other.query("seneca", "imagination", n_results=1)[0]["metadata"]["source"] == "a"
+
+    def test_clear_elder_drops_every_version(self, store):
+        _populate(store)
+        store.reembed_elder("seneca", HashingEmbeddingFunction(dim=32), pause=0, grace=3600)
+        store.clear_elder("seneca")
+
+        assert store.client.list_collections() == []
+        assert store.registry.live("seneca") == 0
+
+    def test_changing_backend_keeps_existing_version_model(self, store):
+        import council.knowledge.store as store_mod
+
+        _populate(store)
+        assert store.registry.spec("seneca", 0) == {"name": "council-hashing", "config": {"dim": 64}}
+
+        switched = store_mod.KnowledgeStore(embedding_function=HashingEmbeddingFunction(dim=32))
+        assert switched.embedding_function_for("seneca").dim == 64
+        switched.add_document("seneca", "Begin at once to live.", {"source": "c"})
+        assert switched.query("seneca", "begin to live", n_results=1)[0]["metadata"]["source"] == "c"
+
+        switched.add_document("cato", "Nothing is so bitter.", {"source": "d"})
+        assert switched.embedding_function_for("cato").dim == 32
+
+    def test_unrecorded_collection_uses_its_persisted_model(self, store):
+        store.client.get_or_create_collection(
+            "elder_cato", embedding_function=HashingEmbeddingFunction(dim=16)
+        )
+        store.get_collection("cato")
+        assert store.registry.spec("cato", 0) == {"name": "council-hashing", "config": {"dim": 16}}
+        assert store.embedding_function_for("cato").dim == 16
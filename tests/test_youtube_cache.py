@@ -0,0 +1,142 @@
+"""Tests for the on-disk yt-dlp cache and the YouTube helpers that use it."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import council.knowledge.youtube as youtube
+import council.knowledge.youtube_cache as youtube_cache
+from council.knowledge.youtube_cache import YouTubeCache, video_id
+
+KNOWN = "https://www.youtube.com/watch?v=AAAAAAAAAAA"
+FOUND = "BBBBBBBBBBB"
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = YouTubeCache(tmp_path / "youtube_cache.sqlite")
+    monkeypatch.setattr(youtube_cache, "_cache", cache)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def ytdlp(monkeypatch):
+    """Fake yt-dlp: records every invocation."""
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        if args[1].startswith("ytsearch"):
+            return SimpleNamespace(returncode=0, stdout=f"{FOUND}\n", stderr="")
+        if "--dump-json" in args:
+            vid = video_id(args[-1])
+            info = {"id": vid, "title": f"Talk {vid[0]}", "channel": "Chan", "duration": 90, "formats": [{"huge": 1}]}
+            return SimpleNamespace(returncode=0, stdout=json.dumps(info), stderr="")
+        return SimpleNamespace(returncode=1, stdout="", stderr="unexpected")
+
+    monkeypatch.setattr(youtube.subprocess, "run", run)
+    return calls
+
+
+class TestYouTubeCache:
+    def test_put_get_and_max_age(self, cache):
+        cache.put("search", "3:stoicism", ["AAAAAAAAAAA"])
+
+        assert cache.get("search", "3:stoicism").value == ["AAAAAAAAAAA"]
+        assert cache.get("search", "3:stoicism", max_age=3600) is not None
+        assert cache.get("search", "3:stoicism", max_age=-1) is None
+        assert cache.get("metadata", "3:stoicism") is None
+        assert cache.stats() == {"search": 1}
+
+    def test_persists_and_clears(self, cache):
+        cache.put("metadata", "AAAAAAAAAAA", {"title": "x"})
+        reopened = YouTubeCache(cache.path)
+        assert reopened.get("metadata", "AAAAAAAAAAA").value == {"title": "x"}
+        assert reopened.clear("metadata") == 1
+        assert cache.get("metadata", "AAAAAAAAAAA") is None
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ?t=3", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://example.com/video", None),
+    ])
+    def test_video_id(self, url, expected):
+        assert video_id(url) == expected
+
+
+class TestCachedHelpers:
+    def test_metadata_fetched_once_and_trimmed(self, cache, ytdlp):
+        first = youtube.get_video_metadata(KNOWN)
+        second = youtube.get_video_metadata(KNOWN)
+
+        assert first == second == {"id": "AAAAAAAAAAA", "title": "Talk A", "channel": "Chan", "duration": 90}
+        assert len(ytdlp) == 1
+
+    def test_stale_metadata_is_refetched(self, cache, ytdlp):
+        youtube.get_video_metadata(KNOWN)
+        youtube.get_video_metadata(KNOWN, max_age=-1)
+        assert len(ytdlp) == 2
+
+    def test_search_cached_until_ttl(self, cache, ytdlp, monkeypatch):
+        assert youtube.search_youtube("stoicism", 3) == [f"https://www.youtube.com/watch?v={FOUND}"]
+        assert youtube.search_youtube("stoicism", 3) == [f"https://www.youtube.com/watch?v={FOUND}"]
+        assert len(ytdlp) == 1
+
+        monkeypatch.setattr(youtube, "get_config_value", lambda key, default=None: -1 if key == "youtube_search_ttl" else default)
+        youtube.search_youtube("stoicism", 3)
+        assert len(ytdlp) == 2
+
+    def test_subtitles_cached(self, cache, monkeypatch):
+        downloads = []
+        monkeypatch.setattr(youtube, "_download_subtitles", lambda url: downloads.append(url) or "WEBVTT\n\nhello")
+
+        assert youtube.download_subtitles(KNOWN) == youtube.download_subtitles(KNOWN) == "WEBVTT\n\nhello"
+        assert downloads == [KNOWN]
+
+
+class TestVideoLinks:
+    @pytest.fixture
+    def elder(self, monkeypatch):
+        monkeypatch.setitem(youtube.YOUTUBE_SOURCES, "testelder", {
+            "known_videos": [KNOWN],
+            "search_queries": ["test elder interview"],
+        })
+        refreshes = []
+        monkeypatch.setattr(youtube, "refresh_video_links_async", lambda elder_id, max_results=8: refreshes.append(elder_id))
+        return refreshes
+
+    def test_cached_only_never_spawns_and_refreshes_in_background(self, cache, ytdlp, elder):
+        assert youtube.get_video_links("testelder", cached_only=True) == []
+        assert ytdlp == []
+        assert elder == ["testelder"]
+
+        live = youtube.get_video_links("testelder")
+        assert [link["title"] for link in live] == ["Talk A", "Talk B"]
+        spawned = len(ytdlp)
+
+        cached = youtube.get_video_links("testelder", cached_only=True)
+        assert cached == live
+        assert len(ytdlp) == spawned
+        assert elder == ["testelder"]  # everything fresh, no second refresh
+
+    def test_refresh_runs_get_video_links_once_per_elder(self, cache, ytdlp, monkeypatch):
+        import threading
+
+        monkeypatch.setitem(youtube.YOUTUBE_SOURCES, "testelder", {"known_videos": [KNOWN]})
+        gate, calls = threading.Event(), []
+
+        def slow_links(elder_id, max_results=8, cached_only=False):
+            calls.append(elder_id)
+            gate.wait(5)
+            return []
+
+        monkeypatch.setattr(youtube, "get_video_links", slow_links)
+        assert youtube.refresh_video_links_async("testelder") is True
+        assert youtube.refresh_video_links_async("testelder") is False
+        gate.set()
+        youtube._refresh_executor.shutdown(wait=True)
+        youtube._refresh_executor = None
+        assert calls == ["testelder"]